@@ -0,0 +1,30 @@
+-- Migration: Add youtube_transcripts table
+-- Date: 2026-10-17
+-- Description:
+--   Durable store for fetched YouTube transcripts, keyed by video + language.
+--   Transcripts are fetched from YouTube once and served from this table afterwards.
+
+-- ============================================================================
+-- Step 1: Create youtube_transcripts table
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS youtube_transcripts (
+    video_id VARCHAR(20) NOT NULL,
+    language_code VARCHAR(20) NOT NULL,
+    language VARCHAR(100) NOT NULL DEFAULT '',
+    is_generated BOOLEAN NOT NULL DEFAULT false,
+    segments JSONB NOT NULL,
+    full_text TEXT NOT NULL,
+    available_languages JSONB NOT NULL DEFAULT '[]'::jsonb,
+    fetched_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (video_id, language_code)
+);
+
+-- Add comment
+COMMENT ON TABLE youtube_transcripts IS 'YouTube transcripts fetched once per video + language';
+COMMENT ON COLUMN youtube_transcripts.segments IS 'Transcript segments [{text, start, duration}]';
+COMMENT ON COLUMN youtube_transcripts.full_text IS 'Segment texts joined by newlines';
+COMMENT ON COLUMN youtube_transcripts.available_languages IS 'Language codes the video offered when fetched (used to pick a stored language without asking YouTube)';
+
+-- Migration rollback script (if needed):
+-- DROP TABLE IF EXISTS youtube_transcripts;
@@ -0,0 +1,41 @@
+-- Migration: Add youtube_transcript_segments table (transcript full-text search)
+-- Date: 2026-10-17
+-- Description:
+--   Stored transcripts split into segments for full-text search.
+--   search_terms holds lowercase ASCII words and character bigrams of other words
+--   (Korean particles stay attached to words, so bigrams make substring matches work
+--   with the 'simple' text search configuration).
+--   Existing transcripts are indexed by the workers.youtube_transcripts.index_transcripts task.
+
+-- ============================================================================
+-- Step 1: Create youtube_transcript_segments table
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS youtube_transcript_segments (
+    video_id VARCHAR(20) NOT NULL,
+    language_code VARCHAR(20) NOT NULL,
+    seq INTEGER NOT NULL,
+    start DOUBLE PRECISION NOT NULL,
+    duration DOUBLE PRECISION NOT NULL DEFAULT 0,
+    text TEXT NOT NULL,
+    search_terms TEXT NOT NULL,
+    PRIMARY KEY (video_id, language_code, seq),
+    FOREIGN KEY (video_id, language_code)
+        REFERENCES youtube_transcripts (video_id, language_code) ON DELETE CASCADE
+);
+
+-- ============================================================================
+-- Step 2: Full-text search index
+-- ============================================================================
+
+CREATE INDEX IF NOT EXISTS idx_youtube_transcript_segments_search
+    ON youtube_transcript_segments USING gin (to_tsvector('simple', search_terms));
+
+-- Add comment
+COMMENT ON TABLE youtube_transcript_segments IS 'Transcript segments indexed for full-text search';
+COMMENT ON COLUMN youtube_transcript_segments.seq IS 'Segment position in youtube_transcripts.segments';
+COMMENT ON COLUMN youtube_transcript_segments.search_terms IS 'Search tokens: ASCII words and character bigrams (see core.youtube.transcript_search)';
+
+-- Migration rollback script (if needed):
+-- DROP INDEX IF EXISTS idx_youtube_transcript_segments_search;
+-- DROP TABLE IF EXISTS youtube_transcript_segments;
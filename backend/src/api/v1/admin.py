@@ -3,13 +3,16 @@ Admin API endpoints for ClipPilot
 Handles OAuth configuration and other admin tasks
 """
 
-from typing import Annotated
+from typing import Annotated, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import redis
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database import get_db
+from src.core.youtube.key_pool import get_key_pool
+from src.core.youtube.quota_ledger import get_quota_ledger
 from src.middleware.auth import get_admin_user
 from src.models.oauth_config import OAuthConfig
 from src.models.user import User
@@ -154,3 +157,119 @@ async def get_youtube_oauth_config(
         created_at=config.created_at.isoformat(),
         updated_at=config.updated_at.isoformat(),
     )
+
+
+class YouTubeQuotaKeyUsage(BaseModel):
+    """API 키별 할당량 사용량"""
+
+    key_id: str
+    key_label: str
+    used: int
+    remaining: int
+    resources: Dict[str, int]
+
+
+class YouTubeQuotaUserUsage(BaseModel):
+    """사용자별 할당량 사용량"""
+
+    user_id: str
+    used: int
+
+
+class YouTubeQuotaReportResponse(BaseModel):
+    """Response model for YouTube API quota report"""
+
+    day: str
+    reset_at: str
+    daily_limit: int
+    user_daily_limit: int
+    reserve: int
+    total_used: int
+    keys: List[YouTubeQuotaKeyUsage]
+    top_users: List[YouTubeQuotaUserUsage]
+
+
+@router.get(
+    "/youtube/quota",
+    response_model=YouTubeQuotaReportResponse,
+    summary="YouTube API 할당량 사용 현황",
+    description="API 키별/사용자별/리소스별 YouTube Data API quota unit 사용량을 조회합니다",
+)
+async def get_youtube_quota_report(
+    admin_user: Annotated[User, Depends(get_admin_user)],
+    day: Optional[str] = Query(
+        None, pattern=r"^\d{4}-\d{2}-\d{2}$", description="기준 날짜 (PT, YYYY-MM-DD)"
+    ),
+) -> YouTubeQuotaReportResponse:
+    """
+    Get YouTube Data API quota usage report.
+
+    Args:
+        admin_user: Currently authenticated admin user
+        day: Quota day in Pacific time (default: today)
+
+    Returns:
+        YouTubeQuotaReportResponse: Quota usage per API key, user and resource
+
+    Raises:
+        HTTPException: If the quota ledger is unavailable
+    """
+    try:
+        report = get_quota_ledger().get_report(day)
+    except redis.RedisError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"error": {"code": "QUOTA_LEDGER_UNAVAILABLE", "message": str(e)}},
+        )
+
+    return YouTubeQuotaReportResponse(**report)
+
+
+class YouTubeAPIKeyStatus(BaseModel):
+    """API 키 풀의 키별 상태"""
+
+    key_id: str
+    key_label: str
+    used: int
+    remaining: int
+    cooldown_seconds: int
+    cooldown_reason: Optional[str] = None
+    last_error: Optional[str] = None
+    last_error_at: Optional[str] = None
+    error_count: int
+
+
+@router.get(
+    "/youtube/keys",
+    response_model=List[YouTubeAPIKeyStatus],
+    summary="YouTube API 키 풀 상태",
+    description="설정된 YouTube API 키별 사용량, 잔여 할당량, 쿨다운 상태를 조회합니다",
+)
+async def get_youtube_key_pool_status(
+    admin_user: Annotated[User, Depends(get_admin_user)],
+) -> List[YouTubeAPIKeyStatus]:
+    """
+    Get YouTube API key pool health and usage.
+
+    Args:
+        admin_user: Currently authenticated admin user
+
+    Returns:
+        List[YouTubeAPIKeyStatus]: Status of each configured API key
+
+    Raises:
+        HTTPException: If the key pool state is unavailable
+    """
+    key_pool = get_key_pool()
+    if key_pool is None:
+        return []
+
+    try:
+        statuses = key_pool.get_status()
+    except redis.RedisError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"error": {"code": "KEY_POOL_UNAVAILABLE", "message": str(e)}},
+        )
+
+    return [YouTubeAPIKeyStatus(**key_status) for key_status in statuses]
@@ -1,6 +1,6 @@
 """YouTube API 스키마 정의"""
 
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 from pydantic import BaseModel, Field, validator, ConfigDict
 
@@ -32,6 +32,11 @@ class SearchQuery(BaseModel):
     )
     min_view_count: Optional[int] = Field(None, ge=0, description="최소 조회수")
     min_subscribers: Optional[int] = Field(None, ge=0, description="최소 구독자 수")
+    shorts_only: bool = Field(False, description="쇼츠 영상(60초 이하)만 포함")
+    sort_by: str = Field(
+        "relevance",
+        description="결과 정렬 지표 (relevance, performance_ratio, engagement_rate, view_velocity)",
+    )
 
     @validator("video_duration")
     def validate_video_duration(cls, v):
@@ -50,6 +55,14 @@ class SearchQuery(BaseModel):
             raise ValueError(f"order는 {', '.join(valid_orders)} 중 하나여야 합니다.")
         return v
 
+    @validator("sort_by")
+    def validate_sort_by(cls, v):
+        """결과 정렬 지표 검증"""
+        valid_sorts = ["relevance", "performance_ratio", "engagement_rate", "view_velocity"]
+        if v not in valid_sorts:
+            raise ValueError(f"sort_by는 {', '.join(valid_sorts)} 중 하나여야 합니다.")
+        return v
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -88,13 +101,19 @@ class YouTubeSearchResult(BaseModel):
         None, description="채널 누적 조회수", alias="channelTotalViews"
     )
     performance_ratio: Optional[float] = Field(
-        None, description="성과도 배율 (영상 조회수 / 채널 평균 조회수)", alias="performanceRatio"
+        None, description="성과도 배율 (영상 조회수 / 채널 최근 업로드 조회수 중앙값)", alias="performanceRatio"
     )
     channel_contribution: Optional[float] = Field(
         None,
         description="채널 기여도 (영상 조회수 / 채널 누적 조회수 * 100)",
         alias="channelContribution",
     )
+    engagement_rate: Optional[float] = Field(
+        None, description="참여율 ((좋아요 + 댓글) / 조회수)", alias="engagementRate"
+    )
+    view_velocity: Optional[float] = Field(
+        None, description="게시 이후 시간당 조회수", alias="viewVelocity"
+    )
     cii: Optional[float] = Field(None, description="Channel Influence Index (선택)")
 
     model_config = ConfigDict(
@@ -120,6 +139,8 @@ class YouTubeSearchResult(BaseModel):
                 "channel_total_views": 5000000000,
                 "performance_ratio": 1.5,
                 "channel_contribution": 20.0,
+                "engagement_rate": 0.0105,
+                "view_velocity": 7150.0,
             }
         }
     )
@@ -161,6 +182,129 @@ class YouTubeSearchResponse(BaseModel):
     )
 
 
+class BatchSearchRequest(BaseModel):
+    """YouTube 배치 검색 요청 스키마 (검색어 × 국가 코드)"""
+
+    queries: List[str] = Field(
+        ..., min_length=1, max_length=20, description="검색 키워드 목록 (최대 20개)"
+    )
+    region_codes: List[str] = Field(
+        default_factory=list, max_length=5, description="국가 코드 목록 (KR, JP, US 등)"
+    )
+    published_after: Optional[datetime] = Field(None, description="업로드 시작 날짜")
+    published_before: Optional[datetime] = Field(None, description="업로드 종료 날짜")
+    video_duration: Optional[str] = Field(
+        None, description="영상 길이 (short, medium, long, any)"
+    )
+    order: str = Field(
+        "relevance",
+        description="정렬 기준 (relevance, date, viewCount, rating, title)",
+    )
+    min_view_count: Optional[int] = Field(None, ge=0, description="최소 조회수")
+    min_subscriber_count: Optional[int] = Field(None, ge=0, description="최소 구독자 수")
+    shorts_only: bool = Field(False, description="쇼츠 영상(60초 이하)만 포함")
+    max_results: int = Field(100, ge=1, le=500, description="병합 결과 최대 수")
+    sort_by: str = Field(
+        "relevance",
+        description=(
+            "결과 정렬 지표 (relevance: 병합 순위, performance_ratio, engagement_rate, "
+            "view_velocity)"
+        ),
+    )
+
+    @validator("queries")
+    def validate_queries(cls, v):
+        """검색어 공백 제거 및 검증"""
+        queries = [q.strip() for q in v if q and q.strip()]
+        if not queries:
+            raise ValueError("검색 키워드를 1개 이상 입력해야 합니다.")
+        if any(len(q) > 500 for q in queries):
+            raise ValueError("검색 키워드는 500자 이하여야 합니다.")
+        return queries
+
+    @validator("region_codes")
+    def validate_region_codes(cls, v):
+        """국가 코드 검증 (2자리, 대문자로 변환)"""
+        if any(len(code) != 2 for code in v):
+            raise ValueError("국가 코드는 2자리여야 합니다.")
+        return [code.upper() for code in v]
+
+    @validator("video_duration")
+    def validate_video_duration(cls, v):
+        """영상 길이 필터 검증"""
+        if v and v not in ["short", "medium", "long", "any"]:
+            raise ValueError(
+                "video_duration은 short, medium, long, any 중 하나여야 합니다."
+            )
+        return v
+
+    @validator("order")
+    def validate_order(cls, v):
+        """정렬 기준 검증"""
+        valid_orders = ["relevance", "date", "viewCount", "rating", "title"]
+        if v not in valid_orders:
+            raise ValueError(f"order는 {', '.join(valid_orders)} 중 하나여야 합니다.")
+        return v
+
+    @validator("sort_by")
+    def validate_sort_by(cls, v):
+        """결과 정렬 지표 검증"""
+        valid_sorts = ["relevance", "performance_ratio", "engagement_rate", "view_velocity"]
+        if v not in valid_sorts:
+            raise ValueError(f"sort_by는 {', '.join(valid_sorts)} 중 하나여야 합니다.")
+        return v
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "queries": ["React Tutorial", "React Hooks"],
+                "region_codes": ["KR", "JP", "US"],
+                "order": "viewCount",
+                "min_view_count": 10000,
+                "max_results": 100,
+            }
+        }
+
+
+class BatchSearchResult(YouTubeSearchResult):
+    """YouTube 배치 검색 결과 스키마 (병합 순위 정보 포함)"""
+
+    rank_score: float = Field(..., description="병합 순위 점수 (RRF)")
+    matched_queries: List[str] = Field(
+        default_factory=list, description="이 영상이 검색된 키워드 목록"
+    )
+    matched_regions: List[str] = Field(
+        default_factory=list, description="이 영상이 검색된 국가 코드 목록"
+    )
+
+
+class BatchSearchQueryStatus(BaseModel):
+    """배치 검색 조합별 상태 스키마"""
+
+    query: str = Field(..., description="검색 키워드")
+    region_code: Optional[str] = Field(None, description="국가 코드")
+    result_count: int = Field(..., description="검색된 영상 수 (필터 적용 전)")
+    error: Optional[str] = Field(None, description="실패 시 오류 메시지")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class BatchSearchResponse(BaseModel):
+    """YouTube 배치 검색 응답 스키마"""
+
+    videos: List[BatchSearchResult] = Field(..., description="병합된 검색 결과", alias="results")
+    total_results: int = Field(..., description="총 결과 수")
+    searches: List[BatchSearchQueryStatus] = Field(..., description="조합별 검색 상태")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
 class VideoDetail(BaseModel):
     """YouTube 영상 상세 정보 스키마"""
 
@@ -180,7 +324,7 @@ class VideoDetail(BaseModel):
     subscriber_count: Optional[int] = Field(None, description="채널 구독자 수")
     channel_total_videos: Optional[int] = Field(None, description="채널 총 영상 수")
     channel_total_views: Optional[int] = Field(None, description="채널 누적 조회수")
-    performance_ratio: Optional[float] = Field(None, description="성과도 배율 (영상 조회수 / 채널 평균 조회수)")
+    performance_ratio: Optional[float] = Field(None, description="성과도 배율 (영상 조회수 / 채널 최근 업로드 조회수 중앙값)")
     channel_contribution: Optional[float] = Field(None, description="채널 기여도 (영상 조회수 / 채널 누적 조회수 * 100)")
 
     model_config = ConfigDict(
@@ -206,6 +350,242 @@ class VideoDetail(BaseModel):
     )
 
 
+class VideoBatchRequest(BaseModel):
+    """YouTube 영상 일괄 조회 요청 스키마"""
+
+    ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="영상 ID 또는 YouTube URL 목록 (최대 500개)",
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ids": [
+                    "dQw4w9WgXcQ",
+                    "https://youtu.be/9bZkp7q19f0",
+                ]
+            }
+        }
+
+
+class VideoBatchItem(BaseModel):
+    """YouTube 영상 일괄 조회 항목 스키마 (입력 순서 유지)"""
+
+    input: str = Field(..., description="요청한 영상 ID 또는 URL")
+    video_id: Optional[str] = Field(None, description="해석된 영상 ID")
+    video: Optional[VideoDetail] = Field(None, description="영상 상세 정보 (실패 시 null)")
+    error: Optional[str] = Field(
+        None, description="실패 사유 (invalid_id: ID/URL 해석 실패, not_found: 영상 없음)"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class VideoBatchResponse(BaseModel):
+    """YouTube 영상 일괄 조회 응답 스키마"""
+
+    items: List[VideoBatchItem] = Field(..., description="입력 순서의 조회 결과")
+    found: int = Field(..., description="조회 성공 수")
+    failed: int = Field(..., description="조회 실패 수")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class VideoWatchResponse(BaseModel):
+    """영상 통계 감시 등록/해제 응답 스키마"""
+
+    video_ids: List[str] = Field(..., description="처리된 영상 ID 목록")
+    invalid: List[str] = Field(
+        default_factory=list, description="영상 ID로 해석할 수 없는 입력 목록"
+    )
+    changed: int = Field(..., description="새로 등록(해제 시 제거)된 영상 수")
+    watched_count: int = Field(..., description="요청 사용자의 감시 대상 영상 수")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class VideoStatsSnapshot(BaseModel):
+    """영상 통계 스냅샷 스키마"""
+
+    sampled_at: datetime = Field(..., description="수집 시각 (UTC)")
+    view_count: int = Field(..., description="조회수")
+    like_count: int = Field(..., description="좋아요 수")
+    comment_count: int = Field(..., description="댓글 수")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class VideoVelocity(BaseModel):
+    """영상 조회수 증가 속도 스키마"""
+
+    video_id: str = Field(..., description="YouTube 영상 ID")
+    snapshot_count: int = Field(..., description="보관 중인 스냅샷 수")
+    view_count: Optional[int] = Field(None, description="최근 스냅샷 조회수")
+    sampled_at: Optional[datetime] = Field(None, description="최근 스냅샷 수집 시각 (UTC)")
+    view_velocity: Optional[float] = Field(
+        None, description="최근 구간 시간당 조회수 증가량 (스냅샷 2개 이상)"
+    )
+    view_acceleration: Optional[float] = Field(
+        None, description="직전 구간 대비 시간당 속도 변화량 (스냅샷 3개 이상)"
+    )
+    history: Optional[List[VideoStatsSnapshot]] = Field(
+        None, description="시간순 스냅샷 목록 (include_history=true인 경우)"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class VideoVelocityResponse(BaseModel):
+    """영상 조회수 증가 속도 응답 스키마"""
+
+    videos: List[VideoVelocity] = Field(..., description="입력 순서의 영상별 속도")
+    total_results: int = Field(..., description="결과 수")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class SavedSearchCreateRequest(BaseModel):
+    """저장된 검색 생성 요청 스키마"""
+
+    name: str = Field(..., min_length=1, max_length=100, description="검색 이름")
+    query: str = Field(..., min_length=1, max_length=500, description="검색 키워드")
+    region_code: Optional[str] = Field(None, description="국가 코드 (KR, JP, US 등)")
+    video_duration: Optional[str] = Field(
+        None, description="영상 길이 (short, medium, long, any)"
+    )
+    order: str = Field(
+        "date",
+        description="정렬 기준 (relevance, date, viewCount, rating, title)",
+    )
+    interval: int = Field(
+        86400, ge=3600, le=604800, description="재실행 주기 (초, 1시간 ~ 7일)"
+    )
+
+    @validator("query")
+    def validate_query(cls, v):
+        """검색어 공백 제거 및 검증"""
+        if not v.strip():
+            raise ValueError("검색 키워드를 입력해야 합니다.")
+        return v.strip()
+
+    @validator("region_code")
+    def validate_region_code(cls, v):
+        """국가 코드 검증 (2자리, 대문자로 변환)"""
+        if v and len(v) != 2:
+            raise ValueError("국가 코드는 2자리여야 합니다.")
+        return v.upper() if v else v
+
+    @validator("video_duration")
+    def validate_video_duration(cls, v):
+        """영상 길이 필터 검증"""
+        if v and v not in ["short", "medium", "long", "any"]:
+            raise ValueError(
+                "video_duration은 short, medium, long, any 중 하나여야 합니다."
+            )
+        return v
+
+    @validator("order")
+    def validate_order(cls, v):
+        """정렬 기준 검증"""
+        valid_orders = ["relevance", "date", "viewCount", "rating", "title"]
+        if v not in valid_orders:
+            raise ValueError(f"order는 {', '.join(valid_orders)} 중 하나여야 합니다.")
+        return v
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "name": "AI 신규 영상",
+                "query": "AI 자동화",
+                "region_code": "KR",
+                "video_duration": "short",
+                "order": "date",
+                "interval": 21600,
+            }
+        }
+
+
+class SavedSearch(BaseModel):
+    """저장된 검색 스키마"""
+
+    id: str = Field(..., description="저장된 검색 ID")
+    name: str = Field(..., description="검색 이름")
+    query: str = Field(..., description="검색 키워드")
+    region_code: Optional[str] = Field(None, description="국가 코드")
+    video_duration: Optional[str] = Field(None, description="영상 길이")
+    order: str = Field(..., description="정렬 기준")
+    interval: int = Field(..., description="재실행 주기 (초)")
+    uses_own_api_key: bool = Field(..., description="사용자 YouTube API 키로 실행 여부")
+    created_at: datetime = Field(..., description="생성 시각 (UTC)")
+    last_run_at: Optional[datetime] = Field(None, description="마지막 실행 시각 (UTC)")
+    next_run_at: datetime = Field(..., description="다음 실행 예정 시각 (UTC)")
+    last_viewed_at: Optional[datetime] = Field(
+        None, description="마지막으로 결과를 확인한 시각 (UTC)"
+    )
+    last_error: Optional[str] = Field(None, description="마지막 실행 오류")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class SavedSearchListResponse(BaseModel):
+    """저장된 검색 목록 응답 스키마"""
+
+    saved_searches: List[SavedSearch] = Field(..., description="저장된 검색 목록")
+    total_results: int = Field(..., description="결과 수")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class SavedSearchResult(YouTubeSearchResult):
+    """저장된 검색 결과 스키마 (발견 시각 포함)"""
+
+    first_seen_at: datetime = Field(..., description="저장된 검색이 처음 발견한 시각 (UTC)")
+
+
+class SavedSearchResultsResponse(BaseModel):
+    """저장된 검색 신규 결과 응답 스키마"""
+
+    saved_search: SavedSearch = Field(..., description="저장된 검색")
+    videos: List[SavedSearchResult] = Field(
+        ..., description="최근 발견 순 영상 목록", alias="results"
+    )
+    total_results: int = Field(..., description="반환된 결과 수")
+    new_count: int = Field(..., description="기준 시각 이후 발견된 전체 영상 수")
+    since: Optional[datetime] = Field(None, description="기준 시각 (UTC, 전체 조회 시 없음)")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
 class Caption(BaseModel):
     """YouTube 자막 정보 스키마"""
 
@@ -250,6 +630,14 @@ class Comment(BaseModel):
     )
 
 
+class CommentThread(Comment):
+    """YouTube 댓글 스레드 스키마 (내보내기, 답글 포함)"""
+
+    replies: Optional[List[Comment]] = Field(
+        None, description="답글 목록 (include_replies=true일 때)"
+    )
+
+
 class CommentListResponse(BaseModel):
     """YouTube 댓글 목록 응답 스키마"""
 
@@ -334,3 +722,106 @@ class AvailableTranscriptsResponse(BaseModel):
         populate_by_name=True,
         alias_generator=to_camel,
     )
+
+
+class TranscriptHarvestRequest(BaseModel):
+    """자막 일괄 수집 요청 스키마"""
+
+    video_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="영상 ID 또는 YouTube URL 목록 (최대 500개)",
+    )
+    languages: Optional[List[str]] = Field(
+        None, max_length=10, description="선호 언어 목록 (기본값: ko, en)"
+    )
+
+    @validator("languages")
+    def validate_languages(cls, v):
+        """언어 코드 공백 제거 (빈 목록이면 기본값 사용)"""
+        if v is None:
+            return v
+        return [lang.strip() for lang in v if lang.strip()] or None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "video_ids": ["dQw4w9WgXcQ", "https://youtu.be/9bZkp7q19f0"],
+                "languages": ["ko", "en"],
+            }
+        }
+
+
+class TranscriptHarvestItem(BaseModel):
+    """영상별 자막 수집 결과 스키마"""
+
+    video_id: str = Field(..., description="영상 ID (해석 실패 시 요청한 입력)")
+    status: str = Field(
+        ...,
+        description=(
+            "수집 결과 (fetched: 수집, stored: 이미 저장됨, disabled: 자막 비활성화, "
+            "not_found: 요청 언어 자막 없음, video_unavailable: 영상 없음, "
+            "blocked: YouTube 요청 차단, failed: 기타 오류, invalid_id: ID/URL 해석 실패)"
+        ),
+    )
+    language_code: Optional[str] = Field(None, description="저장된 자막 언어 코드")
+    segments: Optional[int] = Field(None, description="수집한 자막 세그먼트 수")
+    error: Optional[str] = Field(None, description="오류 메시지")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class TranscriptHarvestJob(BaseModel):
+    """자막 일괄 수집 작업 스키마 (진행 상황 포함)"""
+
+    id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태 (queued, running, completed, failed)")
+    languages: List[str] = Field(..., description="선호 언어 목록")
+    total: int = Field(..., description="전체 입력 수")
+    processed: int = Field(..., description="처리된 입력 수")
+    counts: Dict[str, int] = Field(default_factory=dict, description="결과 상태별 영상 수")
+    items: List[TranscriptHarvestItem] = Field(
+        default_factory=list, description="입력 순서의 영상별 결과 (처리된 영상만)"
+    )
+    created_at: datetime = Field(..., description="생성 시각 (UTC)")
+    started_at: Optional[datetime] = Field(None, description="시작 시각 (UTC)")
+    finished_at: Optional[datetime] = Field(None, description="종료 시각 (UTC)")
+    error: Optional[str] = Field(None, description="작업 오류")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class TranscriptSearchHit(BaseModel):
+    """자막 검색 결과 스키마 (일치한 자막 세그먼트)"""
+
+    video_id: str = Field(..., description="YouTube 영상 ID")
+    language_code: str = Field(..., description="자막 언어 코드")
+    start: float = Field(..., description="세그먼트 시작 시간 (초)")
+    duration: float = Field(..., description="세그먼트 지속 시간 (초)")
+    snippet: str = Field(..., description="일치한 부분 주변 자막 텍스트")
+    url: str = Field(..., description="해당 시점 YouTube URL")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
+
+
+class TranscriptSearchResponse(BaseModel):
+    """자막 검색 응답 스키마"""
+
+    query: str = Field(..., description="검색어")
+    results: List[TranscriptSearchHit] = Field(..., description="검색 결과 (영상 ID, 세그먼트 순)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+        alias_generator=to_camel,
+    )
@@ -1,11 +1,14 @@
 """YouTube API 라우터"""
 
-from typing import Optional
-from datetime import datetime
+from typing import AsyncIterator, Optional
+from datetime import datetime, timezone
+from functools import partial
+import json
 import logging
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     Header,
     HTTPException,
@@ -13,28 +16,93 @@ from fastapi import (
     Request,
     status,
 )
+from fastapi.responses import JSONResponse, StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
 from src.api.v1.schemas.youtube import (
     SearchQuery,
+    BatchSearchRequest,
+    BatchSearchResponse,
+    BatchSearchQueryStatus,
     YouTubeSearchResponse,
-    YouTubeSearchResult,
     VideoDetail,
+    VideoBatchRequest,
+    VideoBatchResponse,
+    VideoWatchResponse,
+    VideoStatsSnapshot,
+    VideoVelocity,
+    VideoVelocityResponse,
+    SavedSearchCreateRequest,
+    SavedSearch,
+    SavedSearchListResponse,
+    SavedSearchResult,
+    SavedSearchResultsResponse,
     CaptionListResponse,
     Caption,
     CommentListResponse,
     Comment,
+    CommentThread,
     ChannelDetail,
     TranscriptResponse,
     TranscriptSegment,
     AvailableTranscriptsResponse,
     AvailableTranscript,
+    TranscriptHarvestRequest,
+    TranscriptHarvestItem,
+    TranscriptHarvestJob,
+    TranscriptSearchHit,
+    TranscriptSearchResponse,
+)
+from src.core.youtube.batch_search import run_batch_search
+from src.core.youtube.comment_export import (
+    CommentExportStore,
+    get_comment_export_store,
+    iter_comment_export,
+)
+from src.core.youtube.ranking import SORT_OPTIONS, SORT_RELEVANCE, rank_videos
+from src.core.youtube.saved_searches import (
+    SavedSearchStore,
+    get_saved_search_store,
+    key_fingerprint,
+)
+from src.core.youtube.search_cache import (
+    SearchResponseCache,
+    base_search_loader,
+    build_search_base_key,
+    get_search_response_cache,
+)
+from src.core.youtube.search_service import YouTubeSearchService, get_search_service
+from src.core.youtube.stats_timeseries import (
+    VideoStatsTimeSeries,
+    compute_velocity,
+    get_stats_timeseries,
+)
+from src.core.youtube.transcript_harvest import (
+    TranscriptHarvestStore,
+    get_transcript_harvest_store,
+    summarize_results,
+)
+from src.core.youtube.transcript_negative_cache import (
+    TranscriptNegativeCache,
+    get_transcript_negative_cache,
+)
+from src.core.youtube.transcript_search import (
+    TranscriptSearchIndex,
+    get_transcript_search_index,
 )
-from src.core.youtube.search_service import YouTubeSearchService
 from src.core.youtube.transcript_service import TranscriptService
-from src.core.youtube.exceptions import YouTubeAPIError, QuotaExceededError
-from src.core.cache import CacheService
+from src.core.youtube.transcript_store import TranscriptStore, get_transcript_store
+from src.core.youtube.utils import filter_videos, resolve_video_id, to_utc
+from src.core.youtube.video_record import DETAIL_FIELDS
+from src.core.youtube.exceptions import (
+    YouTubeAPIError,
+    QuotaExceededError,
+    QuotaBudgetExceededError,
+)
+from src.core.cache import CacheService, cache_service as shared_cache_service
+from src.core.encryption import get_encryption_service
+from src.config import settings
 from src.middleware.auth import get_current_user
 from src.models.user import User
 
@@ -46,11 +114,14 @@ limiter = Limiter(key_func=get_remote_address)
 
 # Dependency: YouTubeSearchService 인스턴스
 def get_youtube_service(
-    youtube_api_key: str | None = Header(None, alias="X-YouTube-API-Key")
+    youtube_api_key: str | None = Header(None, alias="X-YouTube-API-Key"),
+    current_user: User = Depends(get_current_user),
 ) -> YouTubeSearchService:
-    """YouTube 검색 서비스 의존성"""
+    """YouTube 검색 서비스 의존성 (API 키별 인스턴스 재사용, 사용자별 할당량 집계)"""
     try:
-        return YouTubeSearchService(api_key=youtube_api_key)
+        return get_search_service(youtube_api_key).for_user(
+            getattr(current_user, "id", None)
+        )
     except YouTubeAPIError as e:
         # 사용자 친화적인 메시지로 반환
         raise HTTPException(
@@ -59,108 +130,1047 @@ def get_youtube_service(
         )
 
 
-# Dependency: CacheService 인스턴스
-def get_cache_service() -> CacheService:
-    """캐시 서비스 의존성"""
-    return CacheService()
-
-
+# Dependency: CacheService 인스턴스
+def get_cache_service() -> CacheService:
+    """캐시 서비스 의존성 (Redis 커넥션 풀 공유)"""
+    return shared_cache_service
+
+
+# Dependency: 검색 응답 캐시 (stale-while-revalidate)
+def get_search_cache() -> SearchResponseCache:
+    """검색 응답 캐시 의존성"""
+    return get_search_response_cache()
+
+
+# Dependency: 영상 통계 시계열 (조회수 추이)
+def get_video_stats_timeseries() -> VideoStatsTimeSeries:
+    """영상 통계 시계열 의존성"""
+    return get_stats_timeseries()
+
+
+# Dependency: 댓글 내보내기 저장소
+def get_comment_exports() -> CommentExportStore:
+    """댓글 내보내기 저장소 의존성"""
+    return get_comment_export_store()
+
+
+# Dependency: 자막 저장소 (DB)
+def get_transcripts() -> TranscriptStore:
+    """자막 저장소 의존성"""
+    return get_transcript_store()
+
+
+# Dependency: 자막 없음 캐시 (자막 비활성화, 요청 언어 없음, 영상 없음)
+def get_transcript_unavailable_cache() -> TranscriptNegativeCache:
+    """자막 없음 캐시 의존성"""
+    return get_transcript_negative_cache()
+
+
+# Dependency: 자막 일괄 수집 작업 저장소
+def get_transcript_harvests() -> TranscriptHarvestStore:
+    """자막 일괄 수집 작업 저장소 의존성"""
+    return get_transcript_harvest_store()
+
+
+# Dependency: 저장된 자막 전문 검색
+def get_transcript_search() -> TranscriptSearchIndex:
+    """자막 검색 인덱스 의존성"""
+    return get_transcript_search_index()
+
+
+# Dependency: 저장된 검색 저장소
+def get_saved_searches() -> SavedSearchStore:
+    """저장된 검색 저장소 의존성"""
+    return get_saved_search_store()
+
+
+def _timestamp_to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+    """UNIX timestamp → UTC datetime (없거나 0이면 None)"""
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc) if timestamp else None
+
+
+def _saved_search_response(record: dict) -> SavedSearch:
+    """저장된 검색 레코드 → 응답 스키마 (암호화된 API 키 제외)"""
+    return SavedSearch(
+        id=record["id"],
+        name=record["name"],
+        query=record["query"],
+        region_code=record.get("region_code"),
+        video_duration=record.get("video_duration"),
+        order=record["order"],
+        interval=record["interval"],
+        uses_own_api_key=bool(record.get("api_key_encrypted")),
+        created_at=_timestamp_to_datetime(record["created_at"]),
+        last_run_at=_timestamp_to_datetime(record.get("last_run_at")),
+        next_run_at=_timestamp_to_datetime(record["next_run_at"]),
+        last_viewed_at=_timestamp_to_datetime(record.get("last_viewed_at")),
+        last_error=record.get("last_error"),
+    )
+
+
+def _get_owned_saved_search(store: SavedSearchStore, search_id: str, user: User) -> dict:
+    """요청 사용자의 저장된 검색 조회 (없거나 다른 사용자 소유면 404)"""
+    record = store.get(search_id)
+    if not record or record["user_id"] != str(getattr(user, "id", None)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="저장된 검색을 찾을 수 없습니다.",
+        )
+    return record
+
+
+def _harvest_job_response(
+    record: dict, results: dict, include_items: bool = True
+) -> TranscriptHarvestJob:
+    """자막 수집 작업 레코드 + 영상별 결과 → 응답 스키마 (입력 순서 유지)"""
+    order = record["video_ids"] + record["invalid"]
+    return TranscriptHarvestJob(
+        id=record["id"],
+        status=record["status"],
+        languages=record["languages"],
+        total=len(order),
+        processed=len(results),
+        counts=summarize_results(results),
+        items=[
+            TranscriptHarvestItem(video_id=video_id, **results[video_id])
+            for video_id in order
+            if video_id in results
+        ] if include_items else [],
+        created_at=_timestamp_to_datetime(record["created_at"]),
+        started_at=_timestamp_to_datetime(record.get("started_at")),
+        finished_at=_timestamp_to_datetime(record.get("finished_at")),
+        error=record.get("error"),
+    )
+
+
+def _ndjson_line(payload: dict) -> bytes:
+    """NDJSON 스트리밍 응답의 한 줄"""
+    return (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+async def _first_page_or_http_error(pages: AsyncIterator[list], action: str) -> list:
+    """
+    스트리밍 시작 전 첫 페이지 조회
+
+    응답 헤더를 보내기 전이므로 할당량/API 오류를 HTTP 상태 코드로 반환할 수 있습니다.
+
+    Args:
+        pages: 페이지 단위 비동기 이터레이터
+        action: 오류 메시지에 사용할 작업 이름
+
+    Returns:
+        list: 첫 페이지 (결과가 없으면 빈 목록)
+    """
+    try:
+        return await pages.__anext__()
+    except StopAsyncIteration:
+        return []
+    except QuotaBudgetExceededError as e:
+        logger.warning(f"YouTube 할당량 예산 부족 (scope={e.scope}): {action}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 3600))},
+        )
+    except QuotaExceededError as e:
+        logger.error(f"YouTube API 할당량 초과: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="YouTube API 할당량이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        )
+    except YouTubeAPIError as e:
+        logger.error(f"YouTube API 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"{action} 중 오류가 발생했습니다: {str(e)}",
+        )
+
+
+async def _chain_pages(first_page: list, pages: AsyncIterator[list]) -> AsyncIterator[list]:
+    """미리 조회한 첫 페이지와 나머지 페이지를 이어서 반환"""
+    yield first_page
+    async for page in pages:
+        yield page
+
+
+@router.get(
+    "/search",
+    response_model=YouTubeSearchResponse,
+    response_model_by_alias=True,
+    summary="YouTube 영상 검색",
+    description="키워드로 YouTube 영상을 검색하고 기본 정보를 반환합니다.",
+)
+@limiter.limit("10/minute")
+async def search_youtube_videos(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    query: str = Query(..., min_length=1, max_length=500, description="검색 키워드"),
+    max_results: int = Query(25, ge=25, le=50, description="최대 결과 수 (25~50)"),
+    region_code: Optional[str] = Query(
+        None, min_length=2, max_length=2, description="국가 코드 (KR, JP, US 등)"
+    ),
+    published_after: Optional[datetime] = Query(None, description="업로드 시작 날짜"),
+    published_before: Optional[datetime] = Query(None, description="업로드 종료 날짜"),
+    video_duration: Optional[str] = Query(
+        None, description="영상 길이 (short, medium, long, any)"
+    ),
+    order: str = Query(
+        "relevance",
+        description="정렬 기준 (relevance, date, viewCount, rating, title)",
+    ),
+    min_view_count: Optional[int] = Query(None, ge=0, description="최소 조회수"),
+    min_subscriber_count: Optional[int] = Query(
+        None, ge=0, description="최소 구독자 수"
+    ),
+    shorts_only: bool = Query(False, description="쇼츠 영상(60초 이하)만 포함"),
+    fill: bool = Query(
+        False, description="필터 적용 후 결과가 부족하면 다음 페이지를 추가 조회"
+    ),
+    sort_by: str = Query(
+        SORT_RELEVANCE,
+        pattern=f"^({'|'.join(SORT_OPTIONS)})$",
+        description="결과 정렬 지표 (relevance, performance_ratio, engagement_rate, view_velocity)",
+    ),
+    current_user: User = Depends(get_current_user),
+    youtube_service: YouTubeSearchService = Depends(get_youtube_service),
+    search_cache: SearchResponseCache = Depends(get_search_cache),
+):
+    """
+    YouTube 영상 검색 API
+
+    - **query**: 검색 키워드 (필수)
+    - **max_results**: 최대 결과 수 (25~50, 기본값: 25)
+    - **region_code**: 국가 코드 (예: KR, JP, US)
+    - **published_after**: 업로드 시작 날짜
+    - **published_before**: 업로드 종료 날짜
+    - **video_duration**: 영상 길이 (short, medium, long, any)
+    - **order**: 정렬 기준 (relevance, date, viewCount, rating, title)
+    - **min_view_count**: 최소 조회수 필터
+    - **min_subscriber_count**: 최소 구독자 수 필터
+    - **shorts_only**: 쇼츠 영상만 포함
+    - **fill**: 필터 통과 결과가 max_results보다 적으면 nextPageToken으로 추가 조회
+        (검색/필터 조합별 학습된 통과율로 페이지 크기 결정, 최대 3페이지)
+    - **sort_by**: 필터 통과 전체 결과를 지표 기준으로 정렬한 뒤 상위 max_results개 반환
+        (relevance는 YouTube 검색 순서 유지)
+
+    Rate Limit: 10 req/min
+    Cache: 15분 신선 + 1시간 stale 허용 (stale 결과는 즉시 반환 후 백그라운드 갱신,
+        동일 검색의 동시 요청은 YouTube API를 한 번만 호출)
+        기본 검색 조건(검색어, 국가, 1시간 단위 기간, 길이, 정렬)별로 50개 상위 결과를
+        캐시하고, 조회수/구독자 수/쇼츠 필터와 max_results는 캐시 결과에 로컬로 적용
+    """
+    try:
+        # 기본 검색 캐시 키 생성 (로컬 필터 제외, 기간은 버킷 단위)
+        cache_key, bucket_after, bucket_before = build_search_base_key(
+            query=query,
+            region_code=region_code,
+            published_after=published_after,
+            published_before=published_before,
+            video_duration=video_duration,
+            order=order,
+        )
+
+        load_search = base_search_loader(
+            youtube_service,
+            query=query,
+            region_code=region_code,
+            published_after=bucket_after,
+            published_before=bucket_before,
+            video_duration=video_duration,
+            order=order,
+        )
+
+        entry = search_cache.get(cache_key)
+        if entry is None:
+            # 캐시 미스: 동일 검색의 동시 요청은 하나의 API 호출 결과를 공유
+            entry = await search_cache.refresh(cache_key, load_search)
+        elif entry["stale"]:
+            # stale: 기존 결과를 즉시 반환하고 응답 후 갱신
+            logger.info(f"stale 검색 결과 반환 후 갱신 예약: query={query}")
+            background_tasks.add_task(
+                search_cache.refresh_in_background, cache_key, load_search
+            )
+        else:
+            logger.info(f"캐시된 검색 결과 반환: query={query}")
+
+        def apply_filters(found: list) -> list:
+            return filter_videos(
+                found,
+                min_view_count=min_view_count,
+                min_subscriber_count=min_subscriber_count,
+                shorts_only=shorts_only,
+                published_after=published_after,
+                published_before=published_before,
+            )
+
+        # 영상 ID 목록 → 영상별 레코드 캐시에서 조립 후 요청별 필터 적용
+        superset = await youtube_service.get_video_details(entry["video_ids"])
+        videos = apply_filters(superset)
+
+        # 적응형 추가 조회: 필터로 부족해진 결과를 다음 페이지로 채움
+        has_value_filters = bool(min_view_count or min_subscriber_count or shorts_only)
+        if (
+            fill
+            and has_value_filters
+            and len(videos) < max_results
+            and entry.get("next_page_token")
+        ):
+            filter_signature = {
+                "min_view_count": min_view_count,
+                "min_subscriber_count": min_subscriber_count,
+                "shorts_only": shorts_only,
+            }
+            pass_rate = search_cache.record_pass_rate(
+                cache_key, len(videos), len(superset), **filter_signature
+            )
+            extra, scanned = await youtube_service.fill_search_results(
+                query=query,
+                target=max_results - len(videos),
+                video_filter=apply_filters,
+                page_token=entry["next_page_token"],
+                pass_rate=pass_rate,
+                max_pages=settings.YOUTUBE_SEARCH_FILL_MAX_PAGES,
+                exclude_ids=entry["video_ids"],
+                region_code=region_code,
+                published_after=bucket_after,
+                published_before=bucket_before,
+                video_duration=video_duration,
+                order=order,
+                page_cache=partial(search_cache.get_page, cache_key),
+            )
+            search_cache.record_pass_rate(
+                cache_key, len(extra), scanned, **filter_signature
+            )
+            videos.extend(extra)
+
+        videos = rank_videos(videos, sort_by=sort_by, limit=max_results)
+
+        logger.info(
+            "YouTube 검색 성공: query=%s, results=%s, user_id=%s",
+            query,
+            len(videos),
+            getattr(current_user, "id", None),
+        )
+        # 영상 레코드를 camelCase로 바로 직렬화 (YouTubeSearchResponse 재검증 생략)
+        return JSONResponse({
+            "results": [video.to_response() for video in videos],
+            "totalResults": len(videos),
+            "query": query,
+        })
+
+    except QuotaBudgetExceededError as e:
+        # 예산 부족 시 캐시 전용 모드: 캐시된 검색만 제공하고 신규 검색은 차단
+        logger.warning(f"YouTube 할당량 예산 부족 (scope={e.scope}): query={query}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 3600))},
+        )
+    except QuotaExceededError as e:
+        logger.error(f"YouTube API 할당량 초과: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="YouTube API 할당량이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        )
+    except YouTubeAPIError as e:
+        logger.error(f"YouTube API 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"YouTube 검색 중 오류가 발생했습니다: {str(e)}",
+        )
+    except Exception as e:
+        logger.error(f"예상치 못한 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="검색 중 오류가 발생했습니다.",
+        )
+
+
+@router.post(
+    "/search/batch",
+    response_model=BatchSearchResponse,
+    response_model_by_alias=True,
+    summary="YouTube 배치 검색 (검색어 × 국가)",
+    description=(
+        "여러 검색어와 국가 코드 조합을 한 번에 검색하고 "
+        "중복을 제거한 결과를 병합 순위로 반환합니다."
+    ),
+)
+@limiter.limit("5/minute")
+async def batch_search_youtube_videos(
+    request: Request,
+    body: BatchSearchRequest,
+    current_user: User = Depends(get_current_user),
+    youtube_service: YouTubeSearchService = Depends(get_youtube_service),
+    search_cache: SearchResponseCache = Depends(get_search_cache),
+):
+    """
+    YouTube 배치 검색 API
+
+    - **queries**: 검색 키워드 목록 (최대 20개)
+    - **region_codes**: 국가 코드 목록 (최대 5개, 비어 있으면 국가 미지정)
+    - **max_results**: 병합 결과 최대 수 (기본값: 100)
+    - **sort_by**: 결과 정렬 지표 (기본값: relevance = 병합 순위)
+    - 나머지 필터는 /search와 동일
+
+    조합별 검색은 제한된 동시성으로 실행되고 /search와 같은 기본 검색 캐시를 공유합니다.
+    영상/채널 상세 조회는 모든 조합의 영상 ID 합집합에 대해 한 번만 수행합니다.
+
+    Rate Limit: 5 req/min
+    """
+    combinations = len(body.queries) * max(len(body.region_codes), 1)
+    if combinations > settings.YOUTUBE_BATCH_SEARCH_MAX_COMBINATIONS:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=(
+                f"검색어 × 국가 조합은 최대 {settings.YOUTUBE_BATCH_SEARCH_MAX_COMBINATIONS}개"
+                f"까지 요청할 수 있습니다. (요청: {combinations}개)"
+            ),
+        )
+
+    try:
+        videos, statuses = await run_batch_search(
+            youtube_service,
+            search_cache,
+            queries=body.queries,
+            region_codes=body.region_codes,
+            published_after=body.published_after,
+            published_before=body.published_before,
+            video_duration=body.video_duration,
+            order=body.order,
+        )
+        videos = filter_videos(
+            videos,
+            min_view_count=body.min_view_count,
+            min_subscriber_count=body.min_subscriber_count,
+            shorts_only=body.shorts_only,
+            published_after=body.published_after,
+            published_before=body.published_before,
+        )
+        videos = rank_videos(videos, sort_by=body.sort_by, limit=body.max_results)
+
+        logger.info(
+            "YouTube 배치 검색 성공: combinations=%s, results=%s, user_id=%s",
+            combinations,
+            len(videos),
+            getattr(current_user, "id", None),
+        )
+        return JSONResponse({
+            "results": [video.to_response() for video in videos],
+            "totalResults": len(videos),
+            "searches": [
+                BatchSearchQueryStatus(**item).model_dump(by_alias=True) for item in statuses
+            ],
+        })
+
+    except QuotaBudgetExceededError as e:
+        logger.warning(f"YouTube 할당량 예산 부족 (scope={e.scope}): batch search")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 3600))},
+        )
+    except QuotaExceededError as e:
+        logger.error(f"YouTube API 할당량 초과: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="YouTube API 할당량이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        )
+    except YouTubeAPIError as e:
+        logger.error(f"YouTube API 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"YouTube 검색 중 오류가 발생했습니다: {str(e)}",
+        )
+    except Exception as e:
+        logger.error(f"예상치 못한 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="검색 중 오류가 발생했습니다.",
+        )
+
+
+@router.get(
+    "/search/deep",
+    summary="YouTube 딥 검색 (NDJSON 스트리밍)",
+    description=(
+        "nextPageToken을 따라 최대 500개까지 검색하고 결과를 NDJSON으로 스트리밍합니다. "
+        "각 줄은 {\"type\": \"video\", \"data\": {...}}이며 마지막 줄은 "
+        "{\"type\": \"done\"} 또는 {\"type\": \"error\"}입니다."
+    ),
+)
+@limiter.limit("5/minute")
+async def deep_search_youtube_videos(
+    request: Request,
+    query: str = Query(..., min_length=1, max_length=500, description="검색 키워드"),
+    max_results: int = Query(
+        200,
+        ge=1,
+        le=settings.YOUTUBE_DEEP_SEARCH_MAX_RESULTS,
+        description="최대 결과 수 (필터 적용 전)",
+    ),
+    quota_budget: int = Query(
+        settings.YOUTUBE_DEEP_SEARCH_QUOTA_BUDGET,
+        ge=100,
+        description="검색에 사용할 최대 quota unit (search.list 1페이지 = 100)",
+    ),
+    region_code: Optional[str] = Query(
+        None, min_length=2, max_length=2, description="국가 코드 (KR, JP, US 등)"
+    ),
+    published_after: Optional[datetime] = Query(None, description="업로드 시작 날짜"),
+    published_before: Optional[datetime] = Query(None, description="업로드 종료 날짜"),
+    video_duration: Optional[str] = Query(
+        None, description="영상 길이 (short, medium, long, any)"
+    ),
+    order: str = Query(
+        "relevance",
+        description="정렬 기준 (relevance, date, viewCount, rating, title)",
+    ),
+    min_view_count: Optional[int] = Query(None, ge=0, description="최소 조회수"),
+    min_subscriber_count: Optional[int] = Query(
+        None, ge=0, description="최소 구독자 수"
+    ),
+    shorts_only: bool = Query(False, description="쇼츠 영상(60초 이하)만 포함"),
+    current_user: User = Depends(get_current_user),
+    youtube_service: YouTubeSearchService = Depends(get_youtube_service),
+):
+    """
+    YouTube 딥 검색 API (NDJSON 스트리밍)
+
+    - **query**: 검색 키워드 (필수)
+    - **max_results**: 최대 결과 수 (1~500, 기본값: 200)
+    - **quota_budget**: 검색 예산 (quota unit, 기본값: 1000 = 10페이지)
+    - 나머지 필터는 /search와 동일
+
+    검색 페이지마다 영상 상세 조회와 다음 페이지 검색을 동시에 진행하고,
+    필터를 통과한 영상을 페이지 단위로 바로 전송합니다.
+
+    Rate Limit: 5 req/min
+    """
+    pages = youtube_service.iter_search_pages(
+        query=query,
+        max_results=max_results,
+        quota_budget=quota_budget,
+        region_code=region_code,
+        published_after=published_after,
+        published_before=published_before,
+        video_duration=video_duration,
+        order=order,
+    )
+
+    def apply_filters(videos: list) -> list:
+        return filter_videos(
+            videos,
+            min_view_count=min_view_count,
+            min_subscriber_count=min_subscriber_count,
+            shorts_only=shorts_only,
+        )
+
+    # 첫 페이지는 응답 전에 조회하여 할당량/API 오류를 HTTP 상태 코드로 반환
+    first_page = await _first_page_or_http_error(pages, "YouTube 검색")
+
+    async def stream() -> AsyncIterator[bytes]:
+        total = 0
+        try:
+            async for page in _chain_pages(first_page, pages):
+                for video in apply_filters(page):
+                    total += 1
+                    yield _ndjson_line({
+                        "type": "video",
+                        "data": video.to_response(),
+                    })
+        except (QuotaExceededError, YouTubeAPIError) as e:
+            # 스트리밍 도중 오류는 상태 코드 대신 마지막 줄로 전달
+            logger.warning(f"YouTube 딥 검색 중단: query={query}, error={e}")
+            yield _ndjson_line({"type": "error", "detail": str(e), "total_results": total})
+            return
+        finally:
+            await pages.aclose()
+
+        logger.info(
+            "YouTube 딥 검색 성공: query=%s, results=%s, user_id=%s",
+            query,
+            total,
+            getattr(current_user, "id", None),
+        )
+        yield _ndjson_line({"type": "done", "total_results": total, "query": query})
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/videos:batch",
+    response_model=VideoBatchResponse,
+    response_model_by_alias=True,
+    summary="YouTube 영상 일괄 조회",
+    description="영상 ID 또는 URL 목록의 상세 정보를 한 번에 조회합니다 (최대 500개).",
+)
+@limiter.limit("30/minute")
+async def batch_get_video_details(
+    request: Request,
+    body: VideoBatchRequest,
+    current_user: User = Depends(get_current_user),
+    youtube_service: YouTubeSearchService = Depends(get_youtube_service),
+):
+    """
+    YouTube 영상 일괄 조회 API
+
+    - **ids**: 영상 ID 또는 YouTube URL 목록 (최대 500개)
+
+    영상 레코드 캐시에서 먼저 조회하고, 미스된 영상만 50개 단위로 나누어
+    videos.list를 동시에 호출합니다 (50개당 1 unit).
+    결과는 입력 순서대로 반환하며 항목별로 오류를 표시합니다.
+
+    Rate Limit: 30 req/min
+    Cache: 15분 TTL (검색과 공유하는 영상별 레코드 캐시)
+    """
+    try:
+        resolved = [resolve_video_id(value) for value in body.ids]
+        video_ids = [video_id for video_id in resolved if video_id]
+
+        videos = await youtube_service.get_video_details(video_ids)
+        videos_by_id = {video["video_id"]: video for video in videos}
+
+        # 영상 레코드를 camelCase로 바로 직렬화 (VideoBatchResponse 재검증 생략)
+        items = []
+        for value, video_id in zip(body.ids, resolved):
+            video = videos_by_id.get(video_id)
+            if video_id is None:
+                error = "invalid_id"
+            elif video is None:
+                error = "not_found"
+            else:
+                error = None
+            items.append({
+                "input": value,
+                "videoId": video_id,
+                "video": video.to_response(DETAIL_FIELDS) if video is not None else None,
+                "error": error,
+            })
+
+        found = sum(1 for item in items if item["video"] is not None)
+        logger.info(
+            f"YouTube 영상 일괄 조회 성공: requested={len(items)}, found={found}, "
+            f"user_id={getattr(current_user, 'id', None)}"
+        )
+        return JSONResponse({"items": items, "found": found, "failed": len(items) - found})
+
+    except QuotaBudgetExceededError as e:
+        logger.warning(f"YouTube 할당량 예산 부족 (scope={e.scope}): videos batch")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 3600))},
+        )
+    except QuotaExceededError as e:
+        logger.error(f"YouTube API 할당량 초과: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="YouTube API 할당량이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        )
+    except YouTubeAPIError as e:
+        logger.error(f"YouTube API 오류: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"영상 정보 조회 중 오류가 발생했습니다: {str(e)}",
+        )
+    except Exception as e:
+        logger.error(f"예상치 못한 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="영상 정보 조회 중 오류가 발생했습니다.",
+        )
+
+
+def _resolve_video_ids(ids: list) -> tuple:
+    """영상 ID/URL 입력 → (중복 없는 영상 ID 목록, 해석할 수 없는 입력 목록)"""
+    resolved = [resolve_video_id(value) for value in ids]
+    video_ids = list(dict.fromkeys(video_id for video_id in resolved if video_id))
+    invalid = [value for value, video_id in zip(ids, resolved) if video_id is None]
+    return video_ids, invalid
+
+
+@router.post(
+    "/videos:watch",
+    response_model=VideoWatchResponse,
+    response_model_by_alias=True,
+    summary="영상 통계 감시 등록",
+    description="영상을 조회수 추이 수집 대상에 추가합니다 (1시간마다 스냅샷).",
+)
+@limiter.limit("30/minute")
+async def watch_video_stats(
+    request: Request,
+    body: VideoBatchRequest,
+    current_user: User = Depends(get_current_user),
+    timeseries: VideoStatsTimeSeries = Depends(get_video_stats_timeseries),
+):
+    """
+    영상 통계 감시 등록 API
+
+    - **ids**: 영상 ID 또는 YouTube URL 목록 (최대 500개)
+
+    등록된 영상은 Celery beat 작업이 50개씩 묶어 videos.list로 통계를 수집합니다.
+    감시 목록은 사용자별이며, 여러 사용자가 감시하는 영상은 한 번만 수집합니다.
+
+    Rate Limit: 30 req/min
+    """
+    video_ids, invalid = _resolve_video_ids(body.ids)
+    user_id = str(getattr(current_user, "id", None))
+    try:
+        user_count = timeseries.watched_count(user_id)
+        if user_count + len(video_ids) > settings.YOUTUBE_STATS_MAX_WATCHED_PER_USER:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=(
+                    f"감시 대상 영상은 사용자당 최대 "
+                    f"{settings.YOUTUBE_STATS_MAX_WATCHED_PER_USER}개까지 등록할 수 있습니다. "
+                    f"(현재: {user_count}개)"
+                ),
+            )
+        if timeseries.watched_count() + len(video_ids) > settings.YOUTUBE_STATS_MAX_WATCHED:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="전체 감시 대상 영상 수가 한도에 도달했습니다. 잠시 후 다시 시도해주세요.",
+            )
+        added = timeseries.watch(user_id, video_ids)
+
+        logger.info(f"영상 통계 감시 등록: added={added}, user_id={user_id}")
+        return VideoWatchResponse(
+            video_ids=video_ids,
+            invalid=invalid,
+            changed=added,
+            watched_count=user_count + added,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"영상 통계 감시 등록 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="영상 감시 등록 중 오류가 발생했습니다.",
+        )
+
+
+@router.post(
+    "/videos:unwatch",
+    response_model=VideoWatchResponse,
+    response_model_by_alias=True,
+    summary="영상 통계 감시 해제",
+    description="영상을 조회수 추이 수집 대상에서 제거합니다.",
+)
+@limiter.limit("30/minute")
+async def unwatch_video_stats(
+    request: Request,
+    body: VideoBatchRequest,
+    current_user: User = Depends(get_current_user),
+    timeseries: VideoStatsTimeSeries = Depends(get_video_stats_timeseries),
+):
+    """
+    영상 통계 감시 해제 API
+
+    - **ids**: 영상 ID 또는 YouTube URL 목록 (최대 500개)
+
+    요청 사용자의 감시 목록에서만 제거하며, 다른 사용자가 감시 중인 영상은 계속 수집합니다.
+    기존 스냅샷은 보관 기간이 지나면 자동으로 삭제됩니다.
+
+    Rate Limit: 30 req/min
+    """
+    video_ids, invalid = _resolve_video_ids(body.ids)
+    user_id = str(getattr(current_user, "id", None))
+    try:
+        removed = timeseries.unwatch(user_id, video_ids)
+        return VideoWatchResponse(
+            video_ids=video_ids,
+            invalid=invalid,
+            changed=removed,
+            watched_count=timeseries.watched_count(user_id),
+        )
+    except Exception as e:
+        logger.error(f"영상 통계 감시 해제 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="영상 감시 해제 중 오류가 발생했습니다.",
+        )
+
+
+@router.post(
+    "/videos:velocity",
+    response_model=VideoVelocityResponse,
+    response_model_by_alias=True,
+    summary="영상 조회수 증가 속도 조회",
+    description="수집된 통계 스냅샷으로 영상별 시간당 조회수 증가량과 가속도를 반환합니다.",
+)
+@limiter.limit("30/minute")
+async def get_video_velocity(
+    request: Request,
+    body: VideoBatchRequest,
+    include_history: bool = Query(False, description="스냅샷 목록 포함"),
+    current_user: User = Depends(get_current_user),
+    timeseries: VideoStatsTimeSeries = Depends(get_video_stats_timeseries),
+):
+    """
+    영상 조회수 증가 속도 조회 API
+
+    - **ids**: 영상 ID 또는 YouTube URL 목록 (최대 500개)
+    - **include_history**: 시간순 스냅샷 목록 포함 여부
+
+    YouTube API를 호출하지 않고 저장된 스냅샷만 사용합니다 (Redis 파이프라인 1회).
+    감시 등록 후 스냅샷이 2개 이상 쌓여야 속도, 3개 이상이어야 가속도가 계산됩니다.
+
+    Rate Limit: 30 req/min
+    """
+    video_ids, _ = _resolve_video_ids(body.ids)
+    try:
+        series = timeseries.get_series(video_ids)
+
+        videos = []
+        for video_id in video_ids:
+            points = series.get(video_id, [])
+            latest = points[-1] if points else None
+            videos.append(
+                VideoVelocity(
+                    video_id=video_id,
+                    snapshot_count=len(points),
+                    view_count=latest["view_count"] if latest else None,
+                    sampled_at=(
+                        datetime.fromtimestamp(latest["timestamp"], tz=timezone.utc)
+                        if latest
+                        else None
+                    ),
+                    history=(
+                        [
+                            VideoStatsSnapshot(
+                                sampled_at=datetime.fromtimestamp(
+                                    point["timestamp"], tz=timezone.utc
+                                ),
+                                view_count=point["view_count"],
+                                like_count=point["like_count"],
+                                comment_count=point["comment_count"],
+                            )
+                            for point in points
+                        ]
+                        if include_history
+                        else None
+                    ),
+                    **compute_velocity(points),
+                )
+            )
+
+        return VideoVelocityResponse(videos=videos, total_results=len(videos))
+
+    except Exception as e:
+        logger.error(f"영상 조회수 증가 속도 조회 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="조회수 추이 조회 중 오류가 발생했습니다.",
+        )
+
+
+@router.post(
+    "/saved-searches",
+    response_model=SavedSearch,
+    response_model_by_alias=True,
+    status_code=status.HTTP_201_CREATED,
+    summary="검색 저장",
+    description="검색을 저장하고 주기적으로 다시 실행하여 새로 게시된 영상을 수집합니다.",
+)
+@limiter.limit("10/minute")
+async def create_saved_search(
+    request: Request,
+    body: SavedSearchCreateRequest,
+    youtube_api_key: str | None = Header(None, alias="X-YouTube-API-Key"),
+    current_user: User = Depends(get_current_user),
+    youtube_service: YouTubeSearchService = Depends(get_youtube_service),
+    store: SavedSearchStore = Depends(get_saved_searches),
+):
+    """
+    검색 저장 API
+
+    - **name**: 검색 이름
+    - **query**: 검색 키워드
+    - **region_code / video_duration / order**: 검색 필터
+    - **interval**: 재실행 주기 (초, 1시간 ~ 7일)
+
+    X-YouTube-API-Key 헤더를 지정하면 해당 키를 암호화하여 저장하고 재실행에 사용합니다.
+    저장 직후 첫 실행이 예약되며, 이후에는 마지막 실행 시각 이후 게시된 영상만 조회합니다.
+
+    Rate Limit: 10 req/min
+    """
+    user_id = str(getattr(current_user, "id", None))
+    try:
+        if store.count_for_user(user_id) >= settings.YOUTUBE_SAVED_SEARCH_MAX_PER_USER:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=(
+                    f"검색은 최대 {settings.YOUTUBE_SAVED_SEARCH_MAX_PER_USER}개까지 "
+                    "저장할 수 있습니다."
+                ),
+            )
+
+        record = store.create(
+            user_id=user_id,
+            name=body.name,
+            query=body.query,
+            interval=max(body.interval, settings.YOUTUBE_SAVED_SEARCH_MIN_INTERVAL),
+            region_code=body.region_code,
+            video_duration=body.video_duration,
+            order=body.order,
+            api_key_encrypted=(
+                get_encryption_service().encrypt(youtube_api_key) if youtube_api_key else None
+            ),
+            key_fingerprint=key_fingerprint(youtube_api_key),
+        )
+
+        logger.info(f"검색 저장: search_id={record['id']}, user_id={user_id}")
+        return _saved_search_response(record)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"검색 저장 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="검색 저장 중 오류가 발생했습니다.",
+        )
+
+
+@router.get(
+    "/saved-searches",
+    response_model=SavedSearchListResponse,
+    response_model_by_alias=True,
+    summary="저장된 검색 목록 조회",
+    description="사용자의 저장된 검색 목록을 반환합니다.",
+)
+@limiter.limit("30/minute")
+async def list_saved_searches(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    store: SavedSearchStore = Depends(get_saved_searches),
+):
+    """
+    저장된 검색 목록 조회 API
+
+    Rate Limit: 30 req/min
+    """
+    try:
+        records = store.list_for_user(str(getattr(current_user, "id", None)))
+        return SavedSearchListResponse(
+            saved_searches=[_saved_search_response(record) for record in records],
+            total_results=len(records),
+        )
+    except Exception as e:
+        logger.error(f"저장된 검색 목록 조회 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="저장된 검색 목록 조회 중 오류가 발생했습니다.",
+        )
+
+
+@router.delete(
+    "/saved-searches/{search_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="저장된 검색 삭제",
+    description="저장된 검색과 수집된 결과를 삭제합니다.",
+)
+@limiter.limit("30/minute")
+async def delete_saved_search(
+    request: Request,
+    search_id: str,
+    current_user: User = Depends(get_current_user),
+    store: SavedSearchStore = Depends(get_saved_searches),
+):
+    """
+    저장된 검색 삭제 API
+
+    - **search_id**: 저장된 검색 ID
+
+    Rate Limit: 30 req/min
+    """
+    try:
+        store.delete(_get_owned_saved_search(store, search_id, current_user))
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"저장된 검색 삭제 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="저장된 검색 삭제 중 오류가 발생했습니다.",
+        )
+
+
 @router.get(
-    "/search",
-    response_model=YouTubeSearchResponse,
+    "/saved-searches/{search_id}/results",
+    response_model=SavedSearchResultsResponse,
     response_model_by_alias=True,
-    summary="YouTube 영상 검색",
-    description="키워드로 YouTube 영상을 검색하고 기본 정보를 반환합니다.",
+    summary="저장된 검색 신규 결과 조회",
+    description="마지막으로 확인한 이후 새로 발견된 영상만 반환합니다.",
 )
-@limiter.limit("10/minute")
-async def search_youtube_videos(
+@limiter.limit("30/minute")
+async def get_saved_search_results(
     request: Request,
-    query: str = Query(..., min_length=1, max_length=500, description="검색 키워드"),
-    max_results: int = Query(25, ge=25, le=50, description="최대 결과 수 (25~50)"),
-    region_code: Optional[str] = Query(
-        None, min_length=2, max_length=2, description="국가 코드 (KR, JP, US 등)"
-    ),
-    published_after: Optional[datetime] = Query(None, description="업로드 시작 날짜"),
-    published_before: Optional[datetime] = Query(None, description="업로드 종료 날짜"),
-    video_duration: Optional[str] = Query(
-        None, description="영상 길이 (short, medium, long, any)"
-    ),
-    order: str = Query(
-        "relevance",
-        description="정렬 기준 (relevance, date, viewCount, rating, title)",
-    ),
-    min_view_count: Optional[int] = Query(None, ge=0, description="최소 조회수"),
-    min_subscriber_count: Optional[int] = Query(
-        None, ge=0, description="최소 구독자 수"
-    ),
+    search_id: str,
+    max_results: int = Query(50, ge=1, le=200, description="최대 결과 수"),
+    include_viewed: bool = Query(False, description="이미 확인한 결과까지 포함"),
+    mark_viewed: bool = Query(True, description="조회 후 확인한 것으로 표시"),
     current_user: User = Depends(get_current_user),
     youtube_service: YouTubeSearchService = Depends(get_youtube_service),
-    cache_service: CacheService = Depends(get_cache_service),
+    store: SavedSearchStore = Depends(get_saved_searches),
 ):
     """
-    YouTube 영상 검색 API
+    저장된 검색 신규 결과 조회 API
 
-    - **query**: 검색 키워드 (필수)
-    - **max_results**: 최대 결과 수 (25~50, 기본값: 25)
-    - **region_code**: 국가 코드 (예: KR, JP, US)
-    - **published_after**: 업로드 시작 날짜
-    - **published_before**: 업로드 종료 날짜
-    - **video_duration**: 영상 길이 (short, medium, long, any)
-    - **order**: 정렬 기준 (relevance, date, viewCount, rating, title)
-    - **min_view_count**: 최소 조회수 필터
-    - **min_subscriber_count**: 최소 구독자 수 필터
+    - **search_id**: 저장된 검색 ID
+    - **max_results**: 최대 결과 수 (신규 결과가 더 많으면 먼저 발견된 것부터, 최근 발견 순으로 정렬)
+    - **include_viewed**: true면 마지막 확인 시각과 관계없이 보관 중인 결과 전체에서 최근 발견 순으로 조회
+    - **mark_viewed**: true면 반환한 결과까지 확인한 것으로 표시 (반환하지 않은 신규 결과는 신규로 유지)
 
-    Rate Limit: 10 req/min
-    Cache: 15분 TTL
+    검색은 스케줄러가 실행하므로 이 API는 search.list를 호출하지 않습니다.
+    영상 상세 정보는 영상 레코드 캐시를 우선 사용합니다.
+
+    Rate Limit: 30 req/min
     """
     try:
-        # 캐시 키 생성 (모든 필터 파라미터 포함)
-        cache_key = (
-            f"youtube:search:{query}:{max_results}:{region_code}:"
-            f"{published_after}:{published_before}:{video_duration}:{order}:"
-            f"{min_view_count}:{min_subscriber_count}"
-        )
-
-        # 캐시 확인
-        cached_result = cache_service.get(cache_key)
-        if cached_result:
-            logger.info(f"캐시된 검색 결과 반환: query={query}")
-            return cached_result
-
-        # YouTube API 검색
-        videos = await youtube_service.search_videos(
-            query=query,
-            max_results=max_results,
-            region_code=region_code,
-            published_after=published_after,
-            published_before=published_before,
-            video_duration=video_duration,
-            order=order,
-            min_subscriber_count=min_subscriber_count,
+        record = _get_owned_saved_search(store, search_id, current_user)
+        last_viewed_at = record.get("last_viewed_at") or 0.0
+        since = 0.0 if include_viewed else last_viewed_at
+        # 신규 결과는 확인 시각 직후부터 골라야 나머지(더 최근 발견)를 신규로 남길 수 있음
+        found, new_count = store.results_since(
+            search_id, since, max_results, oldest_first=not include_viewed
         )
 
-        # 클라이언트 사이드 필터링 (최소 조회수)
-        if min_view_count:
-            videos = [v for v in videos if v.get("view_count", 0) >= min_view_count]
-
-        # 응답 구성
-        response = YouTubeSearchResponse(
-            videos=[YouTubeSearchResult(**video) for video in videos],
+        first_seen = dict(found)
+        videos = await youtube_service.get_video_details(list(first_seen))
+        videos.sort(key=lambda video: first_seen[video["video_id"]], reverse=True)
+
+        # include_viewed는 최근 발견 순이므로 보관 결과를 모두 반환한 경우에만 확인 표시
+        if mark_viewed and found and (not include_viewed or new_count <= len(found)):
+            viewed_at = max(score for _, score in found)
+            if viewed_at > last_viewed_at:
+                store.mark_viewed(search_id, viewed_at)
+                record["last_viewed_at"] = viewed_at
+
+        return SavedSearchResultsResponse(
+            saved_search=_saved_search_response(record),
+            videos=[
+                SavedSearchResult(
+                    **video,
+                    first_seen_at=_timestamp_to_datetime(first_seen[video["video_id"]]),
+                )
+                for video in videos
+            ],
             total_results=len(videos),
-            query=query,
+            new_count=new_count,
+            since=_timestamp_to_datetime(since),
         )
 
-        # 캐시 저장 (15분 TTL)
-        cache_service.set(cache_key, response.model_dump(by_alias=True), ttl=900)
-
-        logger.info(
-            "YouTube 검색 성공: query=%s, results=%s, user_id=%s",
-            query,
-            len(videos),
-            getattr(current_user, "id", None),
+    except QuotaBudgetExceededError as e:
+        logger.warning(f"YouTube 할당량 예산 부족 (scope={e.scope}): search_id={search_id}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 3600))},
         )
-        return response
-
     except QuotaExceededError as e:
         logger.error(f"YouTube API 할당량 초과: {e}")
         raise HTTPException(
@@ -171,13 +1181,15 @@ async def search_youtube_videos(
         logger.error(f"YouTube API 오류: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"YouTube 검색 중 오류가 발생했습니다: {str(e)}",
+            detail=f"저장된 검색 결과 조회 중 오류가 발생했습니다: {str(e)}",
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"예상치 못한 오류 발생: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="검색 중 오류가 발생했습니다.",
+            detail="저장된 검색 결과 조회 중 오류가 발생했습니다.",
         )
 
 
@@ -194,7 +1206,6 @@ async def get_video_details(
     video_id: str,
     current_user: dict = Depends(get_current_user),
     youtube_service: YouTubeSearchService = Depends(get_youtube_service),
-    cache_service: CacheService = Depends(get_cache_service),
 ):
     """
     YouTube 영상 상세 정보 조회 API
@@ -202,19 +1213,10 @@ async def get_video_details(
     - **video_id**: YouTube 영상 ID (필수)
 
     Rate Limit: 30 req/min
-    Cache: 15분 TTL
+    Cache: 15분 TTL (검색과 공유하는 영상별 레코드 캐시)
     """
     try:
-        # 캐시 키 생성
-        cache_key = f"youtube:video:{video_id}"
-
-        # 캐시 확인
-        cached_result = cache_service.get(cache_key)
-        if cached_result:
-            logger.info(f"캐시된 영상 정보 반환: video_id={video_id}")
-            return cached_result
-
-        # YouTube API 조회
+        # 영상 레코드 캐시 우선 조회, 미스 시 YouTube API 조회
         videos = await youtube_service.get_video_details([video_id])
 
         if not videos:
@@ -223,16 +1225,24 @@ async def get_video_details(
                 detail="영상을 찾을 수 없습니다.",
             )
 
-        video_detail = VideoDetail(**videos[0])
-
-        # 캐시 저장 (15분 TTL)
-        cache_service.set(cache_key, video_detail.model_dump(by_alias=True), ttl=900)
-
         logger.info(
             f"YouTube 영상 정보 조회 성공: video_id={video_id}, user_id={current_user['id']}"
         )
-        return video_detail
+        return JSONResponse(videos[0].to_response(DETAIL_FIELDS))
 
+    except QuotaBudgetExceededError as e:
+        logger.warning(f"YouTube 할당량 예산 부족 (scope={e.scope}): video_id={video_id}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 3600))},
+        )
+    except QuotaExceededError as e:
+        logger.error(f"YouTube API 할당량 초과: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="YouTube API 할당량이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        )
     except YouTubeAPIError as e:
         logger.error(f"YouTube API 오류: {e}")
         raise HTTPException(
@@ -262,6 +1272,7 @@ async def get_video_captions(
     video_id: str,
     current_user: dict = Depends(get_current_user),
     cache_service: CacheService = Depends(get_cache_service),
+    negative_cache: TranscriptNegativeCache = Depends(get_transcript_unavailable_cache),
 ):
     """
     YouTube 영상 자막 목록 조회 API
@@ -271,7 +1282,7 @@ async def get_video_captions(
     - **video_id**: YouTube 영상 ID (필수)
 
     Rate Limit: 30 req/min
-    Cache: 1시간 TTL
+    Cache: 1시간 TTL (자막 비활성화/영상 없음은 자막 없음 캐시 TTL 동안 YouTube 미호출)
     """
     try:
         # 캐시 키 생성
@@ -284,7 +1295,9 @@ async def get_video_captions(
             return cached_result
 
         # youtube-transcript-api로 자막 목록 조회
-        transcripts = await TranscriptService.get_available_transcripts(video_id)
+        transcripts = await TranscriptService.get_available_transcripts(
+            video_id, negative_cache
+        )
 
         response = AvailableTranscriptsResponse(
             video_id=video_id,
@@ -328,7 +1341,6 @@ async def get_video_comments(
     max_results: int = Query(20, ge=10, le=100, description="최대 결과 수 (10~100)"),
     current_user: dict = Depends(get_current_user),
     youtube_service: YouTubeSearchService = Depends(get_youtube_service),
-    cache_service: CacheService = Depends(get_cache_service),
 ):
     """
     YouTube 영상 댓글 조회 API
@@ -337,19 +1349,10 @@ async def get_video_comments(
     - **max_results**: 최대 결과 수 (10~100, 기본값: 20)
 
     Rate Limit: 30 req/min
-    Cache: 15분 TTL
+    Cache: 댓글 스레드 캐시 (만료 후 ETag 조건부 요청으로 재검증)
     """
     try:
-        # 캐시 키 생성
-        cache_key = f"youtube:comments:{video_id}:{max_results}"
-
-        # 캐시 확인
-        cached_result = cache_service.get(cache_key)
-        if cached_result:
-            logger.info(f"캐시된 댓글 정보 반환: video_id={video_id}")
-            return cached_result
-
-        # YouTube API 조회
+        # 댓글 스레드 캐시 우선 조회, 만료 시 ETag 재검증
         comments = await youtube_service.get_video_comments(video_id, max_results)
 
         response = CommentListResponse(
@@ -358,14 +1361,24 @@ async def get_video_comments(
             total_comments=len(comments),
         )
 
-        # 캐시 저장 (15분 TTL)
-        cache_service.set(cache_key, response.model_dump(by_alias=True), ttl=900)
-
         logger.info(
             f"YouTube 댓글 조회 성공: video_id={video_id}, comments={len(comments)}"
         )
         return response
 
+    except QuotaBudgetExceededError as e:
+        logger.warning(f"YouTube 할당량 예산 부족 (scope={e.scope}): video_id={video_id}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 3600))},
+        )
+    except QuotaExceededError as e:
+        logger.error(f"YouTube API 할당량 초과: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="YouTube API 할당량이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        )
     except YouTubeAPIError as e:
         logger.error(f"YouTube API 오류: {e}")
         raise HTTPException(
@@ -380,6 +1393,80 @@ async def get_video_comments(
         )
 
 
+@router.get(
+    "/videos/{video_id}/comments/export",
+    summary="YouTube 영상 댓글 전체 내보내기 (NDJSON 스트리밍)",
+    description=(
+        "commentThreads 페이지를 순회하여 영상의 모든 댓글(선택 시 답글 포함)을 NDJSON으로 스트리밍합니다. "
+        "완료된 내보내기는 보관되어 다음 요청은 API 호출 없이 제공됩니다."
+    ),
+)
+@limiter.limit("5/minute")
+async def export_video_comments(
+    request: Request,
+    video_id: str,
+    include_replies: bool = Query(False, description="답글 포함"),
+    order: str = Query(
+        "time", pattern="^(time|relevance)$", description="정렬 기준 (time, relevance)"
+    ),
+    current_user: User = Depends(get_current_user),
+    youtube_service: YouTubeSearchService = Depends(get_youtube_service),
+    export_store: CommentExportStore = Depends(get_comment_exports),
+):
+    """
+    YouTube 영상 댓글 전체 내보내기 API (NDJSON 스트리밍)
+
+    - **video_id**: YouTube 영상 ID (필수)
+    - **include_replies**: 답글 포함 여부 (기본값: false)
+    - **order**: 정렬 기준 (time: 최신순, relevance: 인기순)
+
+    한 줄에 댓글 스레드 하나씩 전송하며 마지막 줄은 {"type": "done"}입니다.
+    commentThreads/comments 페이지당 1 unit이 차감되며, 보관된 내보내기(1일)는 할당량을 사용하지 않습니다.
+
+    Rate Limit: 5 req/min
+    """
+    cached = bool(export_store.count(export_store.key(video_id, order, include_replies)))
+    pages = iter_comment_export(
+        youtube_service, export_store, video_id, include_replies=include_replies, order=order
+    )
+
+    # 첫 페이지는 응답 전에 조회하여 할당량/API 오류를 HTTP 상태 코드로 반환
+    first_page = await _first_page_or_http_error(pages, "댓글 내보내기")
+
+    async def stream() -> AsyncIterator[bytes]:
+        total = 0
+        try:
+            async for page in _chain_pages(first_page, pages):
+                for thread in page:
+                    total += 1
+                    yield _ndjson_line({
+                        "type": "comment",
+                        "data": CommentThread(**thread).model_dump(by_alias=True, mode="json"),
+                    })
+        except (QuotaExceededError, YouTubeAPIError) as e:
+            logger.warning(f"댓글 내보내기 중단: video_id={video_id}, error={e}")
+            yield _ndjson_line({"type": "error", "detail": str(e), "total_results": total})
+            return
+        finally:
+            await pages.aclose()
+
+        logger.info(
+            "댓글 내보내기 성공: video_id=%s, threads=%s, cached=%s, user_id=%s",
+            video_id,
+            total,
+            cached,
+            getattr(current_user, "id", None),
+        )
+        yield _ndjson_line({
+            "type": "done",
+            "total_results": total,
+            "video_id": video_id,
+            "cached": cached,
+        })
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/channels/{channel_id}",
     response_model=ChannelDetail,
@@ -424,6 +1511,19 @@ async def get_channel_details(
         logger.info(f"YouTube 채널 정보 조회 성공: channel_id={channel_id}")
         return response
 
+    except QuotaBudgetExceededError as e:
+        logger.warning(f"YouTube 할당량 예산 부족 (scope={e.scope}): channel_id={channel_id}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=e.message,
+            headers={"Retry-After": str(e.details.get("retry_after", 3600))},
+        )
+    except QuotaExceededError as e:
+        logger.error(f"YouTube API 할당량 초과: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="YouTube API 할당량이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+        )
     except YouTubeAPIError as e:
         logger.error(f"YouTube API 오류: {e}")
         raise HTTPException(
@@ -440,6 +1540,105 @@ async def get_channel_details(
         )
 
 
+@router.get(
+    "/channels/{channel_id}/uploads",
+    summary="YouTube 채널 업로드 영상 크롤링 (NDJSON 스트리밍)",
+    description=(
+        "채널 업로드 재생목록(playlistItems)을 최신순으로 순회하여 영상을 NDJSON으로 스트리밍합니다. "
+        "resume=true이면 이전 크롤링 이후 새로 게시된 영상만 조회합니다."
+    ),
+)
+@limiter.limit("5/minute")
+async def crawl_channel_uploads(
+    request: Request,
+    channel_id: str,
+    max_videos: int = Query(
+        500,
+        ge=1,
+        le=settings.YOUTUBE_CHANNEL_CRAWL_MAX_VIDEOS,
+        description="최대 영상 수",
+    ),
+    since: Optional[datetime] = Query(None, description="이 시각 이후 게시된 영상만 조회"),
+    resume: bool = Query(False, description="이전 크롤링 시점 이후 영상만 조회"),
+    current_user: User = Depends(get_current_user),
+    youtube_service: YouTubeSearchService = Depends(get_youtube_service),
+):
+    """
+    YouTube 채널 업로드 영상 크롤링 API (NDJSON 스트리밍)
+
+    - **channel_id**: YouTube 채널 ID (필수)
+    - **max_videos**: 최대 영상 수 (1~5000, 기본값: 500)
+    - **since**: 이 시각 이후 게시된 영상만 조회
+    - **resume**: 이전 크롤링 시점 이후 영상만 조회 (since보다 우선)
+
+    search.list(페이지당 100 unit) 대신 playlistItems.list(페이지당 1 unit)를 사용합니다.
+    이전 재개 시점까지(또는 재생목록 끝까지) 크롤링이 완료되면 가장 최신 영상의 게시 시각을
+    사용자별 재개 시점으로 저장합니다. max_videos에서 멈춘 크롤링은 재개 시점을 갱신하지 않습니다.
+
+    Rate Limit: 5 req/min
+    """
+    user_id = str(getattr(current_user, "id", None))
+    previous_cursor = youtube_service.get_crawl_cursor(channel_id, user_id)
+    if resume:
+        since = previous_cursor or since
+
+    # since가 이전 재개 시점보다 늦으면 그 사이 영상은 조회하지 않으므로 재개 시점을 옮기지 않음
+    covers_previous = (
+        previous_cursor is None or since is None or to_utc(since) <= previous_cursor
+    )
+
+    pages = youtube_service.iter_channel_uploads(
+        channel_id, published_after=since, max_videos=max_videos
+    )
+
+    # 첫 페이지는 응답 전에 조회하여 할당량/API 오류를 HTTP 상태 코드로 반환
+    first_page = await _first_page_or_http_error(pages, "채널 영상 조회")
+
+    async def stream() -> AsyncIterator[bytes]:
+        total = 0
+        latest_published_at = None
+        try:
+            async for page in _chain_pages(first_page, pages):
+                for video in page:
+                    total += 1
+                    published_at = video.get("published_at")
+                    if published_at and (
+                        latest_published_at is None or published_at > latest_published_at
+                    ):
+                        latest_published_at = published_at
+                    yield _ndjson_line({
+                        "type": "video",
+                        "data": video.to_response(),
+                    })
+        except (QuotaExceededError, YouTubeAPIError) as e:
+            # 중단된 크롤링은 재개 시점을 갱신하지 않음 (다음 resume에서 다시 조회)
+            logger.warning(f"채널 업로드 크롤링 중단: channel_id={channel_id}, error={e}")
+            yield _ndjson_line({"type": "error", "detail": str(e), "total_results": total})
+            return
+        finally:
+            await pages.aclose()
+
+        # max_videos에 도달하면 그 이후(더 오래된) 영상이 남아 있을 수 있으므로 완료로 보지 않음
+        completed = total < max_videos
+        if latest_published_at and completed and covers_previous:
+            youtube_service.save_crawl_cursor(channel_id, user_id, latest_published_at)
+
+        logger.info(
+            "채널 업로드 크롤링 성공: channel_id=%s, videos=%s, user_id=%s",
+            channel_id,
+            total,
+            getattr(current_user, "id", None),
+        )
+        yield _ndjson_line({
+            "type": "done",
+            "total_results": total,
+            "channel_id": channel_id,
+            "last_published_at": latest_published_at,
+        })
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/videos/{video_id}/transcript",
     response_model=TranscriptResponse,
@@ -453,7 +1652,8 @@ async def get_video_transcript(
     video_id: str,
     languages: Optional[str] = Query(None, description="선호 언어 (쉼표로 구분, 예: ko,en)"),
     current_user: dict = Depends(get_current_user),
-    cache_service: CacheService = Depends(get_cache_service),
+    transcript_store: TranscriptStore = Depends(get_transcripts),
+    negative_cache: TranscriptNegativeCache = Depends(get_transcript_unavailable_cache),
 ):
     """
     YouTube 영상 자막 다운로드 API
@@ -462,46 +1662,29 @@ async def get_video_transcript(
     - **languages**: 선호 언어 목록 (예: ko,en)
 
     Rate Limit: 30 req/min
-    Cache: 1시간 TTL
+    Storage: 영상 + 언어별로 DB에 영구 저장 (YouTube에서는 영상당 한 번만 조회)
+    Cache: 자막 비활성화/요청 언어 없음/영상 없음은 사유별 TTL 동안 YouTube 미호출 (404)
     """
     try:
         # 언어 목록 파싱
         language_list = None
         if languages:
-            language_list = [lang.strip() for lang in languages.split(",")]
-
-        # 캐시 키 생성
-        cache_key = f"youtube:transcript:{video_id}:{languages or 'default'}"
-
-        # 캐시 확인
-        cached_result = cache_service.get(cache_key)
-        if cached_result:
-            logger.info(f"캐시된 자막 반환: video_id={video_id}")
-            return cached_result
+            language_list = [lang.strip() for lang in languages.split(",") if lang.strip()]
 
-        # 자막 가져오기
-        transcript_segments = await TranscriptService.get_transcript(
-            video_id, language_list
+        # 저장된 자막 우선, 없으면 YouTube에서 한 번 조회 후 저장 (스레드에서 실행)
+        transcript = await TranscriptService.get_transcript(
+            video_id, language_list, store=transcript_store, negative_cache=negative_cache
         )
-        full_text = await TranscriptService.get_transcript_text(
-            video_id, language_list
-        )
-
-        # 실제 사용된 언어 추출 (첫 번째 세그먼트가 있는 경우)
-        detected_language = language_list[0] if language_list else "en"
 
         response = TranscriptResponse(
             video_id=video_id,
-            language=detected_language,
-            segments=[TranscriptSegment(**seg) for seg in transcript_segments],
-            full_text=full_text,
+            language=transcript["language_code"],
+            segments=[TranscriptSegment(**seg) for seg in transcript["segments"]],
+            full_text=transcript["full_text"],
         )
 
-        # 캐시 저장 (1시간 TTL)
-        cache_service.set(cache_key, response.model_dump(by_alias=True), ttl=3600)
-
         logger.info(
-            f"자막 다운로드 성공: video_id={video_id}, segments={len(transcript_segments)}"
+            f"자막 다운로드 성공: video_id={video_id}, segments={len(transcript['segments'])}"
         )
         return response
 
@@ -532,6 +1715,7 @@ async def get_available_transcripts(
     video_id: str,
     current_user: dict = Depends(get_current_user),
     cache_service: CacheService = Depends(get_cache_service),
+    negative_cache: TranscriptNegativeCache = Depends(get_transcript_unavailable_cache),
 ):
     """
     사용 가능한 자막 목록 조회 API
@@ -539,7 +1723,7 @@ async def get_available_transcripts(
     - **video_id**: YouTube 영상 ID (필수)
 
     Rate Limit: 30 req/min
-    Cache: 1시간 TTL
+    Cache: 1시간 TTL (자막 비활성화/영상 없음은 자막 없음 캐시 TTL 동안 YouTube 미호출)
     """
     try:
         # 캐시 키 생성
@@ -552,7 +1736,9 @@ async def get_available_transcripts(
             return cached_result
 
         # 사용 가능한 자막 목록 조회
-        transcripts = await TranscriptService.get_available_transcripts(video_id)
+        transcripts = await TranscriptService.get_available_transcripts(
+            video_id, negative_cache
+        )
 
         response = AvailableTranscriptsResponse(
             video_id=video_id,
@@ -579,3 +1765,162 @@ async def get_available_transcripts(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="자막 목록 조회 중 오류가 발생했습니다.",
         )
+
+
+@router.post(
+    "/transcripts/harvest",
+    response_model=TranscriptHarvestJob,
+    response_model_by_alias=True,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="자막 일괄 수집",
+    description="영상 목록(최대 500개)의 자막을 백그라운드 작업으로 수집하여 저장합니다.",
+)
+@limiter.limit("5/minute")
+async def create_transcript_harvest(
+    request: Request,
+    body: TranscriptHarvestRequest,
+    current_user: User = Depends(get_current_user),
+    store: TranscriptHarvestStore = Depends(get_transcript_harvests),
+):
+    """
+    자막 일괄 수집 작업 생성 API
+
+    - **video_ids**: 영상 ID 또는 YouTube URL 목록 (최대 500개, 중복 제거)
+    - **languages**: 선호 언어 목록 (기본값: ko, en)
+
+    Celery 작업이 제한된 동시성과 youtube.com 요청 간격을 지키며 자막을 수집합니다.
+    이미 저장된 자막은 YouTube를 호출하지 않습니다.
+    진행 상황과 영상별 결과는 GET /transcripts/harvest/{job_id}로 조회합니다.
+
+    Rate Limit: 5 req/min
+    """
+    video_ids, invalid = _resolve_video_ids(body.video_ids)
+    try:
+        from src.workers.youtube_transcripts import harvest_transcripts
+
+        record = store.create(
+            user_id=str(getattr(current_user, "id", None)),
+            video_ids=video_ids[:settings.YOUTUBE_TRANSCRIPT_HARVEST_MAX_VIDEOS],
+            languages=body.languages,
+            invalid=invalid,
+        )
+        harvest_transcripts.delay(record["id"])
+
+        logger.info(
+            f"자막 수집 작업 생성: job_id={record['id']}, videos={len(record['video_ids'])}, "
+            f"invalid={len(invalid)}"
+        )
+        return _harvest_job_response(record, store.results(record["id"]))
+
+    except Exception as e:
+        logger.error(f"자막 수집 작업 생성 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="자막 수집 작업 생성 중 오류가 발생했습니다.",
+        )
+
+
+@router.get(
+    "/transcripts/harvest/{job_id}",
+    response_model=TranscriptHarvestJob,
+    response_model_by_alias=True,
+    summary="자막 일괄 수집 진행 상황 조회",
+    description="자막 수집 작업의 진행 상황과 영상별 결과를 반환합니다.",
+)
+@limiter.limit("60/minute")
+async def get_transcript_harvest(
+    request: Request,
+    job_id: str,
+    include_items: bool = Query(True, description="영상별 결과 포함"),
+    current_user: User = Depends(get_current_user),
+    store: TranscriptHarvestStore = Depends(get_transcript_harvests),
+):
+    """
+    자막 일괄 수집 진행 상황 조회 API
+
+    - **job_id**: 작업 ID
+    - **include_items**: false면 상태별 개수만 반환 (진행률 폴링용)
+
+    Rate Limit: 60 req/min
+    """
+    try:
+        record = store.get(job_id)
+        if not record or record["user_id"] != str(getattr(current_user, "id", None)):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="자막 수집 작업을 찾을 수 없습니다.",
+            )
+        return _harvest_job_response(record, store.results(job_id), include_items)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"자막 수집 작업 조회 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="자막 수집 작업 조회 중 오류가 발생했습니다.",
+        )
+
+
+@router.get(
+    "/transcripts/search",
+    response_model=TranscriptSearchResponse,
+    response_model_by_alias=True,
+    summary="저장된 자막 전문 검색",
+    description="저장된 자막에서 검색어를 언급한 영상과 시점을 찾습니다.",
+)
+@limiter.limit("60/minute")
+async def search_transcripts(
+    request: Request,
+    q: str = Query(..., min_length=2, max_length=100, description="검색어 (단어는 모두 포함)"),
+    language: Optional[str] = Query(None, description="자막 언어 코드 필터 (예: ko)"),
+    video_id: Optional[str] = Query(None, description="영상 ID 필터"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 nextCursor"),
+    current_user: User = Depends(get_current_user),
+    search_index: TranscriptSearchIndex = Depends(get_transcript_search),
+):
+    """
+    저장된 자막 전문 검색 API
+
+    - **q**: 검색어 (한국어는 조사가 붙은 형태도 일치, 영문은 접두어 일치)
+    - **language**: 자막 언어 코드 필터
+    - **video_id**: 영상 ID 필터
+    - **limit**: 페이지 크기 (1-100)
+    - **cursor**: 다음 페이지 커서 (영상 ID, 세그먼트 순서 기준)
+
+    YouTube를 호출하지 않으며 저장된 자막(자막 다운로드, 일괄 수집)만 검색합니다.
+
+    Rate Limit: 60 req/min
+    """
+    try:
+        page = await search_index.search(
+            q, limit=limit, cursor=cursor, language_code=language, video_id=video_id
+        )
+        return TranscriptSearchResponse(
+            query=q,
+            results=[
+                TranscriptSearchHit(
+                    video_id=hit["video_id"],
+                    language_code=hit["language_code"],
+                    start=hit["start"],
+                    duration=hit["duration"],
+                    snippet=hit["snippet"],
+                    url=f"https://www.youtube.com/watch?v={hit['video_id']}&t={int(hit['start'])}s",
+                )
+                for hit in page["results"]
+            ],
+            next_cursor=page["next_cursor"],
+        )
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    except Exception as e:
+        logger.error(f"자막 검색 중 오류 발생: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="자막 검색 중 오류가 발생했습니다.",
+        )
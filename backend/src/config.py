@@ -42,12 +42,91 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str
     OPENAI_MODEL: str = "gpt-4o"
 
+    # 스크립트 생성 추가 컨텍스트 압축 (긴 YouTube 자막)
+    SCRIPT_CONTEXT_TOKEN_BUDGET: int = 3000  # additional_context 최대 토큰 수
+    SCRIPT_CONTEXT_PASSAGE_TOKENS: int = 150  # 관련도 순위를 매기는 구간 크기 (토큰)
+    SCRIPT_CONTEXT_CACHE_TTL: int = 604800  # 압축된 컨텍스트 캐시 기간 (7일)
+
     # YouTube API 설정 (개발 환경용 기본값)
     YOUTUBE_API_KEY: str = "placeholder-youtube-api-key"  # YouTube Data API v3 키
+    YOUTUBE_API_KEYS: str = ""  # 추가 YouTube Data API v3 키 (쉼표로 구분, 키 풀)
     YOUTUBE_CLIENT_ID: str = "placeholder-client-id"
     YOUTUBE_CLIENT_SECRET: str = "placeholder-secret"
     YOUTUBE_REDIRECT_URI: str = "http://localhost:8000/api/v1/channels/oauth/youtube/callback"
 
+    # YouTube Data API HTTP 클라이언트 설정 (httpx 커넥션 풀)
+    YOUTUBE_API_TIMEOUT: float = 10.0  # 요청 타임아웃 (초)
+    YOUTUBE_API_MAX_CONNECTIONS: int = 50  # 최대 동시 커넥션 수
+    YOUTUBE_API_MAX_KEEPALIVE: int = 20  # keep-alive 유지 커넥션 수
+    YOUTUBE_API_MAX_RETRIES: int = 3  # 일시적 오류(429/5xx) 재시도 횟수
+    YOUTUBE_CLIENT_CACHE_SIZE: int = 128  # 사용자 API 키별 클라이언트 LRU 보관 수
+
+    # YouTube 엔티티 캐시 TTL (초)
+    YOUTUBE_VIDEO_RECORD_TTL: int = 900  # 영상 레코드 (15분)
+    YOUTUBE_CHANNEL_STATS_TTL: int = 21600  # 채널 통계 (6시간)
+    YOUTUBE_COMMENT_THREADS_TTL: int = 900  # 댓글 스레드 (15분)
+    YOUTUBE_ETAG_RETENTION: int = 86400  # TTL 이후 ETag 재검증용 보관 기간 (1일)
+
+    # YouTube 채널 조회수 기준선 (최근 업로드 N개의 중앙값/평균, performance_ratio 분모)
+    YOUTUBE_CHANNEL_BASELINE_SIZE: int = 30  # 기준선 계산에 사용할 최근 업로드 수
+    YOUTUBE_CHANNEL_BASELINE_TTL: int = 86400  # 신선 기간 (1일)
+    YOUTUBE_CHANNEL_BASELINE_STALE_TTL: int = 604800  # 신선 기간 이후 갱신 전까지 사용하는 기간 (7일)
+    YOUTUBE_CHANNEL_BASELINE_CONCURRENCY: int = 4  # 백그라운드 갱신 동시 채널 수
+
+    # YouTube 검색 응답 캐시 (stale-while-revalidate, 초)
+    YOUTUBE_SEARCH_CACHE_TTL: int = 900  # 신선 기간 (15분)
+    YOUTUBE_SEARCH_STALE_TTL: int = 3600  # 신선 기간 이후 stale 응답 허용 기간 (1시간)
+    YOUTUBE_SEARCH_LOCK_TTL: int = 30  # 검색 갱신 락 만료 시간
+    YOUTUBE_SEARCH_DATE_BUCKET: int = 3600  # 검색 기간 경계 버킷 크기 (1시간 단위로 캐시 공유)
+    YOUTUBE_SEARCH_FILL_MAX_PAGES: int = 3  # 필터 결과 추가 조회 시 최대 search.list 호출 수
+
+    # YouTube 딥 검색 (nextPageToken 페이지 순회)
+    YOUTUBE_DEEP_SEARCH_MAX_RESULTS: int = 500  # 요청당 최대 결과 수
+    YOUTUBE_DEEP_SEARCH_QUOTA_BUDGET: int = 1000  # 요청당 기본 검색 예산 (quota unit, 10페이지)
+
+    # YouTube 배치 검색 (검색어 × 국가 코드)
+    YOUTUBE_BATCH_SEARCH_CONCURRENCY: int = 4  # 동시 search.list 호출 수
+    YOUTUBE_BATCH_SEARCH_MAX_COMBINATIONS: int = 30  # 요청당 최대 조합 수 (최대 3000 unit)
+
+    # YouTube 채널 업로드 크롤링 (playlistItems 페이지 순회, 페이지당 1 unit)
+    YOUTUBE_CHANNEL_CRAWL_MAX_VIDEOS: int = 5000  # 요청당 최대 영상 수
+
+    # YouTube 댓글 내보내기 (commentThreads/comments 페이지당 1 unit)
+    YOUTUBE_COMMENT_REPLY_CONCURRENCY: int = 8  # 동시 답글 조회 스레드 수
+    YOUTUBE_COMMENT_EXPORT_TTL: int = 86400  # 완료된 내보내기 보관 기간 (1일)
+
+    # YouTube 영상 통계 스냅샷 (조회수 추이, videos.list 50개당 1 unit)
+    YOUTUBE_STATS_SNAPSHOT_INTERVAL: int = 3600  # 스냅샷 주기 (초, Celery beat)
+    YOUTUBE_STATS_SNAPSHOT_RETENTION: int = 72  # 영상별 보관 스냅샷 수 (3일)
+    YOUTUBE_STATS_SNAPSHOT_CONCURRENCY: int = 8  # 동시 videos.list 호출 수
+    YOUTUBE_STATS_MAX_WATCHED: int = 100000  # 최대 감시 대상 영상 수 (시간당 2000 unit)
+    YOUTUBE_STATS_MAX_WATCHED_PER_USER: int = 1000  # 사용자별 최대 감시 영상 수
+
+    # YouTube 저장된 검색 (증분 재실행, search.list 1회 = 100 unit)
+    YOUTUBE_SAVED_SEARCH_TICK_INTERVAL: int = 60  # 실행 예정 검색 확인 주기 (초, Celery beat)
+    YOUTUBE_SAVED_SEARCH_MIN_INTERVAL: int = 3600  # 최소 재실행 주기 (초)
+    YOUTUBE_SAVED_SEARCH_MAX_PER_USER: int = 20  # 사용자당 최대 저장 검색 수
+    YOUTUBE_SAVED_SEARCH_MAX_RESULTS: int = 1000  # 검색별 보관 결과 수
+    YOUTUBE_SAVED_SEARCH_PER_KEY_LIMIT: int = 5  # 확인 주기마다 API 키별 최대 실행 수
+
+    # YouTube 자막 없음 캐시 (사유별 TTL, 저장된 자막은 영구 보관)
+    YOUTUBE_TRANSCRIPT_DISABLED_TTL: int = 21600  # 자막 비활성화 (6시간)
+    YOUTUBE_TRANSCRIPT_NOT_FOUND_TTL: int = 3600  # 요청 언어 자막 없음 (자동 생성 자막 추가 가능)
+    YOUTUBE_TRANSCRIPT_UNAVAILABLE_TTL: int = 1800  # 영상 없음/비공개 (일시적일 수 있음)
+
+    # YouTube 자막 일괄 수집 (youtube-transcript-api, Data API 할당량 미사용)
+    YOUTUBE_TRANSCRIPT_HARVEST_WORKERS: int = 4  # 동시 자막 조회 스레드 수
+    YOUTUBE_TRANSCRIPT_HARVEST_INTERVAL: float = 1.0  # youtube.com 요청 최소 간격 (초)
+    YOUTUBE_TRANSCRIPT_HARVEST_BLOCKED_BACKOFF: int = 60  # 요청 차단 시 호스트 대기 시간 (초)
+    YOUTUBE_TRANSCRIPT_HARVEST_BLOCKED_RETRIES: int = 2  # 요청 차단 영상 재시도 횟수 (대기 후 다시 조회)
+    YOUTUBE_TRANSCRIPT_HARVEST_MAX_VIDEOS: int = 500  # 작업당 최대 영상 수
+    YOUTUBE_TRANSCRIPT_HARVEST_TTL: int = 86400  # 작업 상태/결과 보관 기간 (1일)
+
+    # YouTube Data API 할당량 예산 (단위: quota unit, 매일 자정 PT 초기화)
+    YOUTUBE_DAILY_QUOTA: int = 10000  # API 키별 일일 할당량
+    YOUTUBE_USER_DAILY_QUOTA: int = 2000  # 사용자별 일일 사용 한도
+    YOUTUBE_QUOTA_RESERVE: int = 1000  # 잔여량이 이 값 미만이면 고비용 호출 차단 (캐시 전용)
+
     # Pexels API 설정 (개발 환경용 기본값)
     PEXELS_API_KEY: str = "placeholder-pexels-key"
 
@@ -71,6 +150,16 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
         return self.CORS_ORIGINS if isinstance(self.CORS_ORIGINS, list) else [self.CORS_ORIGINS]
 
+    @property
+    def youtube_api_keys_list(self) -> list[str]:
+        """YouTube API 키 풀 (YOUTUBE_API_KEY + YOUTUBE_API_KEYS, placeholder 제외)"""
+        keys: list[str] = []
+        for key in [self.YOUTUBE_API_KEY, *self.YOUTUBE_API_KEYS.split(",")]:
+            key = (key or "").strip()
+            if key and key != "placeholder-youtube-api-key" and key not in keys:
+                keys.append(key)
+        return keys
+
     # Sentry 설정 (선택적)
     SENTRY_DSN: Optional[str] = None
 
@@ -0,0 +1,334 @@
+"""
+Transcript context compression for ClipPilot
+Trims long YouTube transcripts passed as additional_context to a token budget
+"""
+
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional
+import hashlib
+import logging
+import math
+import re
+
+import tiktoken
+
+from ...config import settings
+from ..cache import CacheService, cache_service as default_cache_service
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_CACHE_KEY_PREFIX = "ai:script_context"
+
+# Separator inserted where skipped passages were removed
+GAP_MARKER = "(...)"
+
+# Lines that are only a caption sound tag, e.g. [음악], [Music], [박수]
+_NOISE_LINE = re.compile(r"^[\[(][^\])]{0,20}[\])]$")
+
+# Leading timestamps in pasted transcripts, e.g. "0:12", "01:02:03"
+_TIMESTAMP = re.compile(r"^\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?\s*")
+
+# Sentence boundaries for transcripts pasted as a single paragraph
+_SENTENCE_END = re.compile(r"(?<=[.!?。])\s+")
+
+_TERM = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+# Minimum characters for a rolling auto-caption overlap to be merged
+_MIN_OVERLAP = 6
+
+# Recent lines compared against for repeated auto-caption lines
+_DEDUPE_WINDOW = 3
+
+TokenCounter = Callable[[str], int]
+
+
+@lru_cache(maxsize=4)
+def _encoding(model: str) -> "tiktoken.Encoding":
+    """tiktoken encoding for model (falls back to o200k_base for unknown models)"""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def count_tokens(text: str, model: Optional[str] = None) -> int:
+    """
+    Count tokens with the tokenizer of the generation model
+
+    Args:
+        text: Text to count
+        model: OpenAI model name (defaults to settings.OPENAI_MODEL)
+
+    Returns:
+        Number of tokens
+    """
+    return len(_encoding(model or settings.OPENAI_MODEL).encode(text, disallowed_special=()))
+
+
+def _normalize_line(line: str) -> str:
+    return " ".join(_TIMESTAMP.sub("", line.strip()).split())
+
+
+def _overlap(previous: str, line: str) -> int:
+    """Length of the longest suffix of previous that prefixes line"""
+    for size in range(min(len(previous), len(line)), _MIN_OVERLAP - 1, -1):
+        if previous.endswith(line[:size]):
+            return size
+    return 0
+
+
+def dedupe_caption_lines(text: str) -> List[str]:
+    """
+    Clean transcript lines
+
+    Removes sound tags, timestamps and blank lines, drops lines repeated within the
+    last few lines, and merges rolling auto-caption lines that repeat the end of the
+    previous line.
+
+    Args:
+        text: Transcript text (one caption per line)
+
+    Returns:
+        Cleaned lines in original order
+    """
+    lines: List[str] = []
+    for raw in text.splitlines():
+        line = _normalize_line(raw)
+        if not line or _NOISE_LINE.match(line):
+            continue
+        if line in lines[-_DEDUPE_WINDOW:]:
+            continue
+        if lines:
+            overlap = _overlap(lines[-1], line)
+            if overlap:
+                line = line[overlap:].strip()
+                if not line:
+                    continue
+        lines.append(line)
+    return lines
+
+
+def _terms(text: str) -> List[str]:
+    """Search terms: ASCII words and Hangul character bigrams (particle-insensitive)"""
+    terms: List[str] = []
+    for word in _TERM.findall(text.lower()):
+        if word.isascii() or len(word) < 2:
+            terms.append(word)
+        else:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+def rank_passages(passages: List[str], query: str) -> List[float]:
+    """
+    BM25 relevance of each passage to the query
+
+    Args:
+        passages: Passage texts
+        query: Prompt text
+
+    Returns:
+        Score per passage (same order)
+    """
+    query_terms = set(_terms(query))
+    if not passages or not query_terms:
+        return [0.0] * len(passages)
+
+    k1, b = 1.2, 0.75
+    passage_terms = [Counter(_terms(passage)) for passage in passages]
+    lengths = [sum(terms.values()) for terms in passage_terms]
+    average_length = (sum(lengths) / len(lengths)) or 1.0
+    document_frequency = Counter(
+        term for terms in passage_terms for term in query_terms if term in terms
+    )
+
+    scores = []
+    for terms, length in zip(passage_terms, lengths):
+        score = 0.0
+        for term in query_terms:
+            frequency = terms.get(term)
+            if not frequency:
+                continue
+            df = document_frequency[term]
+            idf = math.log(1 + (len(passages) - df + 0.5) / (df + 0.5))
+            score += idf * frequency * (k1 + 1) / (
+                frequency + k1 * (1 - b + b * length / average_length)
+            )
+        scores.append(score)
+    return scores
+
+
+class TranscriptContextCompressor:
+    """Compresses long transcripts to the passages most relevant to a prompt"""
+
+    def __init__(
+        self,
+        cache: Optional[CacheService] = None,
+        token_budget: Optional[int] = None,
+        passage_tokens: Optional[int] = None,
+        cache_ttl: Optional[int] = None,
+        token_counter: Optional[TokenCounter] = None,
+    ):
+        """
+        Initialize transcript context compressor
+
+        Args:
+            cache: Cache service (defaults to shared CacheService)
+            token_budget: Max context tokens (defaults to settings.SCRIPT_CONTEXT_TOKEN_BUDGET)
+            passage_tokens: Target passage size (defaults to settings.SCRIPT_CONTEXT_PASSAGE_TOKENS)
+            cache_ttl: Compressed context cache TTL (defaults to settings.SCRIPT_CONTEXT_CACHE_TTL)
+            token_counter: Token counting function (defaults to tiktoken for OPENAI_MODEL)
+        """
+        self.cache = cache or default_cache_service
+        self.token_budget = token_budget or settings.SCRIPT_CONTEXT_TOKEN_BUDGET
+        self.passage_tokens = passage_tokens or settings.SCRIPT_CONTEXT_PASSAGE_TOKENS
+        self.cache_ttl = cache_ttl or settings.SCRIPT_CONTEXT_CACHE_TTL
+        self.count_tokens = token_counter or count_tokens
+
+    def cache_key(self, text: str, prompt: str) -> str:
+        """Cache key per transcript hash + prompt/budget hash"""
+        source = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        prompt_hash = hashlib.sha256(
+            f"{self.token_budget}:{self.passage_tokens}:{prompt}".encode("utf-8")
+        ).hexdigest()[:16]
+        return f"{CONTEXT_CACHE_KEY_PREFIX}:{source}:{prompt_hash}"
+
+    def _split_passages(self, lines: List[str]) -> List[Dict[str, Any]]:
+        """Merge cleaned lines into passages of about passage_tokens tokens"""
+        sentences = [
+            sentence
+            for line in lines
+            for sentence in _SENTENCE_END.split(line)
+            if sentence
+        ]
+
+        passages: List[Dict[str, Any]] = []
+        current: List[str] = []
+        current_tokens = 0
+        for sentence in sentences:
+            tokens = self.count_tokens(sentence)
+            if current and current_tokens + tokens > self.passage_tokens:
+                passages.append({"text": " ".join(current), "tokens": current_tokens})
+                current, current_tokens = [], 0
+            current.append(sentence)
+            # Joining adds one space per sentence
+            current_tokens += tokens + 1
+        if current:
+            passages.append({"text": " ".join(current), "tokens": current_tokens})
+        return passages
+
+    def _truncate(self, text: str, budget: int) -> str:
+        """Longest prefix of text within budget tokens (binary search on characters)"""
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.count_tokens(text[:middle]) <= budget:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low]
+
+    def _select(self, passages: List[Dict[str, Any]], prompt: str) -> List[int]:
+        """Highest-ranked passage indexes that fit the budget, in transcript order"""
+        scores = rank_passages([passage["text"] for passage in passages], prompt)
+        ranked = sorted(range(len(passages)), key=lambda i: (-scores[i], i))
+
+        # Reserve room for gap markers between non-adjacent passages
+        marker_tokens = self.count_tokens(f"\n{GAP_MARKER}\n")
+        selected: List[int] = []
+        used = 0
+        for index in ranked:
+            cost = passages[index]["tokens"] + marker_tokens
+            if used + cost <= self.token_budget:
+                selected.append(index)
+                used += cost
+        return sorted(selected)
+
+    def compress(self, text: str, prompt: str) -> Dict[str, Any]:
+        """
+        Compress transcript to the prompt-relevant passages within the token budget
+
+        Args:
+            text: Transcript text (one caption per line)
+            prompt: Script generation prompt used for relevance ranking
+
+        Returns:
+            Dict with:
+                - context: Compressed context
+                - tokens_before: Tokens of the cleaned transcript (None if not counted)
+                - tokens_after: Tokens of the compressed context (None if not counted)
+                - passages: Number of passages kept
+                - cached: Whether the result came from cache
+        """
+        if len(text.encode("utf-8")) <= self.token_budget:
+            # Every token is at least one UTF-8 byte, so short context (typical
+            # hand-written instructions) fits without tokenizing and is passed through
+            return {
+                "context": text,
+                "tokens_before": None,
+                "tokens_after": None,
+                "passages": 1,
+                "cached": False,
+            }
+
+        key = self.cache_key(text, prompt)
+        cached = self.cache.get(key)
+        if cached:
+            return {**cached, "cached": True}
+
+        lines = dedupe_caption_lines(text)
+        cleaned = "\n".join(lines)
+        tokens_before = self.count_tokens(cleaned)
+
+        if tokens_before <= self.token_budget:
+            context = cleaned
+            kept = 1
+        else:
+            passages = self._split_passages(lines)
+            selected = self._select(passages, prompt)
+            if not selected:
+                # A single passage larger than the budget: keep its beginning
+                selected = [0]
+                passages[0]["text"] = self._truncate(passages[0]["text"], self.token_budget)
+
+            parts: List[str] = []
+            for position, index in enumerate(selected):
+                if position and index != selected[position - 1] + 1:
+                    parts.append(GAP_MARKER)
+                parts.append(passages[index]["text"])
+            context = "\n".join(parts)
+            kept = len(selected)
+
+        result = {
+            "context": context,
+            "tokens_before": tokens_before,
+            "tokens_after": self.count_tokens(context),
+            "passages": kept,
+        }
+        self.cache.set(key, result, ttl=self.cache_ttl)
+
+        logger.info(
+            f"Compressed transcript context: "
+            f"tokens={result['tokens_before']}->{result['tokens_after']}, passages={kept}"
+        )
+        return {**result, "cached": False}
+
+
+# Global compressor instance
+_context_compressor: Optional[TranscriptContextCompressor] = None
+
+
+def get_context_compressor() -> TranscriptContextCompressor:
+    """
+    Get or create global TranscriptContextCompressor instance
+
+    Returns:
+        TranscriptContextCompressor instance
+    """
+    global _context_compressor
+
+    if _context_compressor is None:
+        _context_compressor = TranscriptContextCompressor()
+
+    return _context_compressor
@@ -6,6 +6,7 @@ Handles AI-powered script generation with OpenAI GPT-4o
 from typing import Dict, Any, Optional
 import logging
 
+from .context_compressor import get_context_compressor
 from .openai_client import get_openai_client
 from ...core.exceptions import ContentGenerationError
 
@@ -18,6 +19,7 @@ class ScriptGenerationService:
     def __init__(self):
         """Initialize script generation service"""
         self.openai_client = get_openai_client()
+        self.context_compressor = get_context_compressor()
 
     async def generate_script(
         self,
@@ -29,6 +31,9 @@ class ScriptGenerationService:
         """
         Generate video script from user prompt
 
+        Long additional_context (e.g. a full YouTube transcript) is compressed to the
+        passages most relevant to the prompt within SCRIPT_CONTEXT_TOKEN_BUDGET tokens.
+
         Args:
             prompt: User input prompt (10-2000 characters)
             video_length_sec: Target video length (15, 30, or 60 seconds)
@@ -67,6 +72,9 @@ class ScriptGenerationService:
                     "정책에 위배되는 콘텐츠는 생성할 수 없습니다."
                 )
 
+            if additional_context:
+                additional_context = self._compress_context(additional_context, prompt)
+
             # Generate script using OpenAI
             result = await self.openai_client.generate_script(
                 prompt=prompt,
@@ -108,6 +116,34 @@ class ScriptGenerationService:
                 "스크립트 생성 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
             )
 
+    def _compress_context(self, context: str, prompt: str) -> str:
+        """
+        Compress long additional context to the token budget
+
+        Falls back to the original context if compression fails, since a slower
+        generation is better than a failed one.
+
+        Args:
+            context: Additional context (transcript text)
+            prompt: User input prompt (relevance ranking)
+
+        Returns:
+            Context to send to OpenAI
+        """
+        try:
+            compressed = self.context_compressor.compress(context, prompt)
+        except Exception as e:
+            logger.warning(f"Context compression failed, using original context: {e}")
+            return context
+
+        if compressed["tokens_before"] is not None:
+            logger.info(
+                f"Additional context compressed: "
+                f"tokens={compressed['tokens_before']}->{compressed['tokens_after']}, "
+                f"cached={compressed['cached']}"
+            )
+        return compressed["context"]
+
     def _contains_inappropriate_content(self, text: str) -> bool:
         """
         Check if text contains inappropriate content (FR-014)
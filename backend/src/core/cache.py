@@ -7,7 +7,7 @@ YouTube API 응답 및 기타 데이터를 캐싱하기 위한 Redis 서비스
 import redis
 import json
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 from src.config import settings
 
 logger = logging.getLogger(__name__)
@@ -102,6 +102,90 @@ class CacheService:
             logger.error(f"캐시 저장 실패 (key={key}): {str(e)}")
             return False
 
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        여러 캐시 키를 한 번에 조회 (Redis MGET)
+
+        Args:
+            keys: 캐시 키 목록
+
+        Returns:
+            Dict[str, Any]: 캐시 히트된 키 → 값 매핑 (미스는 제외)
+        """
+        if not keys:
+            return {}
+
+        try:
+            values = self.client.mget(keys)
+        except redis.RedisError as e:
+            logger.error(f"캐시 일괄 조회 실패 (keys={len(keys)}): {str(e)}")
+            return {}
+
+        result: Dict[str, Any] = {}
+        for key, value in zip(keys, values):
+            if value is None:
+                continue
+            try:
+                result[key] = json.loads(value)
+            except json.JSONDecodeError:
+                result[key] = value
+        return result
+
+    def set_many(self, mapping: Dict[str, Any], ttl: int = None) -> bool:
+        """
+        여러 값을 한 번에 저장 (Redis 파이프라인)
+
+        Args:
+            mapping: 캐시 키 → 저장할 값
+            ttl: 만료 시간 (초, None이면 만료되지 않음)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if not mapping:
+            return True
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                if isinstance(value, (dict, list)):
+                    value = json.dumps(value, ensure_ascii=False)
+                if ttl:
+                    pipe.setex(key, ttl, value)
+                else:
+                    pipe.set(key, value)
+            pipe.execute()
+
+            logger.debug(f"캐시 일괄 저장 성공 (keys={len(mapping)}, ttl={ttl})")
+            return True
+        except redis.RedisError as e:
+            logger.error(f"캐시 일괄 저장 실패 (keys={len(mapping)}): {str(e)}")
+            return False
+
+    def expire_many(self, keys: List[str], ttl: int) -> bool:
+        """
+        여러 키의 만료 시간을 한 번에 갱신 (Redis 파이프라인, 값은 다시 쓰지 않음)
+
+        Args:
+            keys: 캐시 키 목록
+            ttl: 새 만료 시간 (초)
+
+        Returns:
+            bool: 갱신 성공 여부
+        """
+        if not keys:
+            return True
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key in keys:
+                pipe.expire(key, ttl)
+            pipe.execute()
+            return True
+        except redis.RedisError as e:
+            logger.error(f"캐시 만료 시간 갱신 실패 (keys={len(keys)}): {str(e)}")
+            return False
+
     def delete(self, key: str) -> bool:
         """
         캐시에서 값 삭제
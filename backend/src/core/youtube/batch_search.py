@@ -0,0 +1,178 @@
+"""
+YouTube 배치 검색
+
+여러 검색어 × 국가 코드 조합을 제한된 동시성으로 검색하고,
+모든 조합의 영상 ID 합집합에 대해 영상/채널 상세 조회를 한 번만 수행한 뒤
+결과를 병합·중복 제거·순위화합니다.
+
+순위는 Reciprocal Rank Fusion(RRF)으로 계산합니다.
+여러 조합에서 상위에 나온 영상일수록 점수가 높습니다.
+"""
+
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from src.config import settings
+from src.core.youtube.search_cache import (
+    SearchResponseCache,
+    base_search_loader,
+    build_search_base_key,
+)
+from src.core.youtube.search_service import YouTubeSearchService
+
+logger = logging.getLogger(__name__)
+
+# RRF 상수 (순위 차이에 대한 민감도, 일반적으로 60 사용)
+RRF_K = 60
+
+
+def rank_search_results(
+    results: Sequence[Tuple[str, Optional[str], List[str]]],
+) -> Dict[str, Dict[str, Any]]:
+    """
+    조합별 검색 결과를 RRF 점수로 병합
+
+    Args:
+        results: (검색어, 국가 코드, 영상 ID 목록) 목록
+
+    Returns:
+        Dict[str, Dict[str, Any]]: 영상 ID → {"rank_score", "matched_queries", "matched_regions"}
+            (점수 내림차순)
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    for query, region_code, video_ids in results:
+        for position, video_id in enumerate(video_ids, start=1):
+            entry = merged.setdefault(
+                video_id,
+                {"rank_score": 0.0, "matched_queries": [], "matched_regions": []},
+            )
+            entry["rank_score"] += 1.0 / (RRF_K + position)
+            if query not in entry["matched_queries"]:
+                entry["matched_queries"].append(query)
+            if region_code and region_code not in entry["matched_regions"]:
+                entry["matched_regions"].append(region_code)
+
+    return dict(
+        sorted(merged.items(), key=lambda item: item[1]["rank_score"], reverse=True)
+    )
+
+
+async def run_batch_search(
+    youtube_service: YouTubeSearchService,
+    search_cache: SearchResponseCache,
+    queries: Sequence[str],
+    region_codes: Sequence[Optional[str]] = (),
+    published_after: Optional[datetime] = None,
+    published_before: Optional[datetime] = None,
+    video_duration: Optional[str] = None,
+    order: str = "relevance",
+    concurrency: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    검색어 × 국가 코드 조합 배치 검색
+
+    각 조합은 /search와 같은 기본 검색 캐시를 사용하므로 캐시 히트 조합은 API를 호출하지 않습니다.
+    일부 조합이 실패해도 나머지 결과를 반환하며, 모든 조합이 실패하면 첫 오류를 전달합니다.
+
+    Args:
+        youtube_service: YouTube 검색 서비스
+        search_cache: 검색 응답 캐시
+        queries: 검색어 목록
+        region_codes: 국가 코드 목록 (비어 있으면 국가 미지정 1회)
+        published_after: 업로드 시작 날짜
+        published_before: 업로드 종료 날짜
+        video_duration: 영상 길이 (short, medium, long, any)
+        order: 정렬 기준
+        concurrency: 동시 검색 수 (기본값: settings.YOUTUBE_BATCH_SEARCH_CONCURRENCY)
+
+    Returns:
+        Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+            (순위순 영상 목록, 조합별 검색 상태 목록)
+
+    Raises:
+        QuotaExceededError: 모든 조합이 할당량 문제로 실패한 경우
+        YouTubeAPIError: 모든 조합이 API 오류로 실패한 경우
+    """
+    combinations = [
+        (query, region_code)
+        for query in dict.fromkeys(queries)
+        for region_code in (dict.fromkeys(region_codes) or [None])
+    ]
+    semaphore = asyncio.Semaphore(concurrency or settings.YOUTUBE_BATCH_SEARCH_CONCURRENCY)
+
+    async def search_one(query: str, region_code: Optional[str]) -> Dict[str, Any]:
+        cache_key, bucket_after, bucket_before = build_search_base_key(
+            query=query,
+            region_code=region_code,
+            published_after=published_after,
+            published_before=published_before,
+            video_duration=video_duration,
+            order=order,
+        )
+        entry = search_cache.get(cache_key)
+        if entry is not None:
+            return entry
+
+        async with semaphore:
+            return await search_cache.refresh(
+                cache_key,
+                base_search_loader(
+                    youtube_service,
+                    query=query,
+                    region_code=region_code,
+                    published_after=bucket_after,
+                    published_before=bucket_before,
+                    video_duration=video_duration,
+                    order=order,
+                ),
+            )
+
+    outcomes = await asyncio.gather(
+        *(search_one(query, region_code) for query, region_code in combinations),
+        return_exceptions=True,
+    )
+
+    statuses: List[Dict[str, Any]] = []
+    succeeded: List[Tuple[str, Optional[str], List[str]]] = []
+    errors: List[Exception] = []
+    for (query, region_code), outcome in zip(combinations, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning(
+                f"배치 검색 조합 실패: query={query}, region={region_code}, error={outcome}"
+            )
+            errors.append(outcome)
+            statuses.append({
+                "query": query,
+                "region_code": region_code,
+                "result_count": 0,
+                "error": str(outcome),
+            })
+            continue
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+        succeeded.append((query, region_code, outcome["video_ids"]))
+        statuses.append({
+            "query": query,
+            "region_code": region_code,
+            "result_count": len(outcome["video_ids"]),
+            "error": None,
+        })
+
+    if errors and not succeeded:
+        raise errors[0]
+
+    ranking = rank_search_results(succeeded)
+
+    # 모든 조합의 영상 ID 합집합에 대해 상세 조회 1회 (50개 단위 동시 조회)
+    videos = await youtube_service.get_video_details(list(ranking.keys()))
+    for video in videos:
+        video.update(ranking[video["video_id"]])
+
+    logger.info(
+        f"배치 검색 완료: combinations={len(combinations)}, failed={len(errors)}, "
+        f"unique_videos={len(videos)}"
+    )
+    return videos, statuses
@@ -4,13 +4,46 @@ YouTube API 클라이언트
 YouTube Data API v3와의 연동을 위한 클라이언트를 제공합니다.
 """
 
-from googleapiclient.discovery import build
+import json
+import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 from googleapiclient.errors import HttpError
 from src.config import settings
-import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def get_discovery_document(service_name: str = "youtube", version: str = "v3") -> Dict[str, Any]:
+    """
+    Discovery 문서 로드 (프로세스당 1회)
+
+    googleapiclient에 번들된 정적 discovery 문서를 한 번만 파싱하여 재사용합니다.
+
+    Args:
+        service_name: API 서비스 이름
+        version: API 버전
+
+    Returns:
+        Dict[str, Any]: 파싱된 discovery 문서
+
+    Raises:
+        FileNotFoundError: 번들된 discovery 문서가 없는 경우
+    """
+    content = get_static_doc(service_name, version)
+    if content is None:
+        raise FileNotFoundError(f"Discovery 문서를 찾을 수 없습니다: {service_name}.{version}")
+    logger.info(f"Discovery 문서 로드 완료: {service_name}.{version}")
+    return json.loads(content)
+
 
 class YouTubeClient:
     """YouTube Data API v3 클라이언트"""
@@ -30,12 +63,18 @@ class YouTubeClient:
         """YouTube API 클라이언트 인스턴스 (lazy loading)"""
         if self._client is None:
             try:
-                self._client = build(
-                    'youtube',
-                    'v3',
-                    developerKey=self.api_key,
-                    cache_discovery=False
-                )
+                try:
+                    self._client = build_from_document(
+                        get_discovery_document(),
+                        developerKey=self.api_key,
+                    )
+                except FileNotFoundError:
+                    self._client = build(
+                        'youtube',
+                        'v3',
+                        developerKey=self.api_key,
+                        cache_discovery=False
+                    )
                 logger.info("YouTube API 클라이언트 초기화 완료")
             except Exception as e:
                 logger.error(f"YouTube API 클라이언트 초기화 실패: {str(e)}")
@@ -52,15 +91,94 @@ class YouTubeClient:
         return self.client
 
 
-# 전역 클라이언트 인스턴스
-youtube_client = YouTubeClient()
+class YouTubeClientRegistry(Generic[T]):
+    """
+    API 키별 클라이언트 레지스트리 (프로세스 전역)
+
+    설정된 API 키(settings.YOUTUBE_API_KEY, YOUTUBE_API_KEYS)의 클라이언트는 항상 유지하고,
+    사용자가 전달한 API 키(X-YouTube-API-Key)의 클라이언트는 LRU 방식으로 제거합니다.
+    """
+
+    def __init__(self, factory: Callable[[str], T], max_size: Optional[int] = None):
+        """
+        레지스트리 초기화
+
+        Args:
+            factory: API 키로 클라이언트를 생성하는 함수
+            max_size: 사용자 API 키 클라이언트 최대 보관 수
+                (기본값: settings.YOUTUBE_CLIENT_CACHE_SIZE)
+        """
+        self.factory = factory
+        self.max_size = max_size or settings.YOUTUBE_CLIENT_CACHE_SIZE
+        self._default: Dict[str, T] = {}
+        self._clients: "OrderedDict[str, T]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, api_key: str) -> T:
+        """
+        API 키에 해당하는 클라이언트 반환 (없으면 생성)
+
+        Args:
+            api_key: YouTube Data API 키
+
+        Returns:
+            T: 캐시된 클라이언트
+
+        Raises:
+            factory에서 발생한 예외 (실패한 클라이언트는 캐시하지 않음)
+        """
+        with self._lock:
+            if api_key in self._default:
+                return self._default[api_key]
+            if api_key in self._clients:
+                self._clients.move_to_end(api_key)
+                return self._clients[api_key]
 
+        client = self.factory(api_key)
 
-def get_youtube_client() -> YouTubeClient:
+        with self._lock:
+            is_configured_key = (
+                api_key == settings.YOUTUBE_API_KEY
+                or api_key in settings.youtube_api_keys_list
+            )
+            if is_configured_key:
+                return self._default.setdefault(api_key, client)
+
+            existing = self._clients.get(api_key)
+            if existing is not None:
+                self._clients.move_to_end(api_key)
+                return existing
+
+            self._clients[api_key] = client
+            while len(self._clients) > self.max_size:
+                self._clients.popitem(last=False)
+            return client
+
+    def clear(self):
+        """모든 캐시된 클라이언트 제거"""
+        with self._lock:
+            self._default.clear()
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._default) + len(self._clients)
+
+
+# 전역 클라이언트 레지스트리
+youtube_client_registry: YouTubeClientRegistry[YouTubeClient] = YouTubeClientRegistry(
+    YouTubeClient
+)
+
+
+def get_youtube_client(api_key: Optional[str] = None) -> YouTubeClient:
     """
     YouTube 클라이언트 인스턴스 반환 (의존성 주입용)
 
+    Args:
+        api_key: YouTube Data API 키 (기본값: settings.YOUTUBE_API_KEY)
+
     Returns:
-        YouTubeClient: YouTube API 클라이언트
+        YouTubeClient: API 키별로 캐시된 YouTube API 클라이언트
     """
-    return youtube_client
+    return youtube_client_registry.get(api_key or settings.YOUTUBE_API_KEY)
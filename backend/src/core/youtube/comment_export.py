@@ -0,0 +1,170 @@
+"""
+YouTube 댓글 내보내기 (전체 댓글 스레드)
+
+commentThreads.list 페이지를 순회하며 댓글을 페이지 단위로 내보내고,
+끝까지 완료된 내보내기만 Redis LIST에 보관하여 같은 영상의 다음 내보내기는 API 호출 없이 제공합니다.
+
+- 작성 중: 임시 키에 페이지마다 RPUSH (응답 스트리밍과 동시에 저장, 전체를 메모리에 모으지 않음)
+- 완료: RENAME으로 임시 키를 내보내기 키로 교체 (중단된 내보내기는 노출되지 않음)
+- 재사용: LRANGE로 일정 개수씩 읽어 스트리밍
+"""
+
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import uuid4
+
+from src.config import settings
+from src.core.cache import CacheService, cache_service as default_cache_service
+from src.core.youtube.search_service import YouTubeSearchService
+
+logger = logging.getLogger(__name__)
+
+EXPORT_KEY_PREFIX = "youtube:comment_export"
+
+# 작성 중인 내보내기 임시 키 만료 시간 (중단된 내보내기 자동 정리)
+BUILDING_TTL = 3600
+
+# 보관된 내보내기를 읽을 때 한 번에 가져오는 댓글 스레드 수
+READ_BATCH_SIZE = 500
+
+
+class CommentExportStore:
+    """완료된 댓글 내보내기 저장소 (영상 + 정렬 + 답글 포함 여부별 Redis LIST)"""
+
+    def __init__(self, cache: Optional[CacheService] = None, ttl: Optional[int] = None):
+        """
+        댓글 내보내기 저장소 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            ttl: 완료된 내보내기 보관 기간 (초, 기본값: settings.YOUTUBE_COMMENT_EXPORT_TTL)
+        """
+        self.cache = cache or default_cache_service
+        self.ttl = ttl or settings.YOUTUBE_COMMENT_EXPORT_TTL
+
+    def key(self, video_id: str, order: str, include_replies: bool) -> str:
+        """내보내기 키"""
+        scope = "replies" if include_replies else "threads"
+        return f"{EXPORT_KEY_PREFIX}:{video_id}:{order}:{scope}"
+
+    def count(self, key: str) -> int:
+        """보관된 댓글 스레드 수 (없으면 0)"""
+        return self.cache.client.llen(key)
+
+    async def iter_pages(
+        self, key: str, batch_size: int = READ_BATCH_SIZE
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        보관된 내보내기를 배치 단위로 읽기 (LRANGE)
+
+        Args:
+            key: 내보내기 키
+            batch_size: 배치 크기
+
+        Yields:
+            List[Dict[str, Any]]: 댓글 레코드 배치
+        """
+        start = 0
+        while True:
+            lines = self.cache.client.lrange(key, start, start + batch_size - 1)
+            if not lines:
+                return
+            yield [json.loads(line) for line in lines]
+            start += len(lines)
+
+    def begin(self, key: str) -> str:
+        """내보내기 작성 시작 (임시 키 반환)"""
+        return f"{key}:building:{uuid4().hex}"
+
+    def append(self, building_key: str, page: List[Dict[str, Any]]) -> None:
+        """작성 중인 내보내기에 페이지 추가 (RPUSH + EXPIRE)"""
+        pipe = self.cache.client.pipeline(transaction=False)
+        pipe.rpush(building_key, *(json.dumps(item, ensure_ascii=False) for item in page))
+        pipe.expire(building_key, BUILDING_TTL)
+        pipe.execute()
+
+    def commit(self, building_key: str, key: str) -> None:
+        """완료된 내보내기 보관 (임시 키 → 내보내기 키)"""
+        pipe = self.cache.client.pipeline(transaction=True)
+        pipe.rename(building_key, key)
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def discard(self, building_key: str) -> None:
+        """중단된 내보내기 삭제"""
+        self.cache.delete(building_key)
+
+
+async def iter_comment_export(
+    youtube_service: YouTubeSearchService,
+    store: CommentExportStore,
+    video_id: str,
+    include_replies: bool = False,
+    order: str = "time",
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    영상 댓글 전체 내보내기 (보관된 내보내기가 있으면 재사용)
+
+    API로 조회하는 경우 페이지를 내보내는 동시에 임시 키에 저장하고,
+    마지막 페이지까지 완료되었을 때만 보관합니다.
+
+    Args:
+        youtube_service: YouTube 검색 서비스
+        store: 댓글 내보내기 저장소
+        video_id: 영상 ID
+        include_replies: 답글 포함 여부
+        order: 정렬 기준 (time, relevance)
+
+    Yields:
+        List[Dict[str, Any]]: 페이지별 댓글 레코드 목록
+
+    Raises:
+        YouTubeAPIError: YouTube API 오류
+        QuotaExceededError: API 할당량 초과
+    """
+    key = store.key(video_id, order, include_replies)
+    if store.count(key):
+        logger.info(f"보관된 댓글 내보내기 반환: video_id={video_id}")
+        async for page in store.iter_pages(key):
+            yield page
+        return
+
+    building_key = store.begin(key)
+    pages = youtube_service.iter_comment_threads(
+        video_id, include_replies=include_replies, order=order
+    )
+    completed = False
+    threads = 0
+    try:
+        async for page in pages:
+            store.append(building_key, page)
+            threads += len(page)
+            yield page
+        completed = True
+    finally:
+        await pages.aclose()
+        if completed and threads:
+            store.commit(building_key, key)
+            logger.info(f"댓글 내보내기 보관: video_id={video_id}, threads={threads}")
+        else:
+            store.discard(building_key)
+
+
+# 전역 댓글 내보내기 저장소 인스턴스
+_comment_export_store: Optional[CommentExportStore] = None
+
+
+def get_comment_export_store() -> CommentExportStore:
+    """
+    전역 댓글 내보내기 저장소 반환
+
+    Returns:
+        CommentExportStore: 댓글 내보내기 저장소
+    """
+    global _comment_export_store
+
+    if _comment_export_store is None:
+        _comment_export_store = CommentExportStore()
+
+    return _comment_export_store
@@ -0,0 +1,315 @@
+"""
+YouTube 엔티티 캐시
+
+검색/상세 조회 엔드포인트가 공유하는 엔티티(영상 레코드, 채널 통계, 댓글 스레드, 채널 조회수 기준선) 단위 Redis 캐시입니다.
+여러 ID를 MGET 한 번으로 조회하고, 미스된 ID만 YouTube API로 요청할 수 있게 합니다.
+
+레코드는 YouTube 응답의 ETag와 함께 저장하며 TTL 이후에도 보관 기간(YOUTUBE_ETAG_RETENTION) 동안 유지합니다.
+신선 여부는 TTL짜리 마커 키로 판단하고, 마커가 만료된 레코드는 If-None-Match로 재검증합니다.
+304 응답이면 레코드를 다시 파싱/직렬화하지 않고 마커와 만료 시간만 갱신합니다.
+"""
+
+import logging
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import redis
+
+from src.config import settings
+from src.core.cache import CacheService, cache_service as default_cache_service
+from src.core.youtube.video_record import VideoRecord
+
+logger = logging.getLogger(__name__)
+
+
+class RevalidatingStore:
+    """ETag 재검증을 지원하는 엔티티 캐시 (ID → 레코드)"""
+
+    KEY_PREFIX = "youtube:entity"
+
+    def __init__(
+        self,
+        cache: Optional[CacheService] = None,
+        ttl: int = 900,
+        retention: Optional[int] = None,
+    ):
+        """
+        엔티티 캐시 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            ttl: 신선 기간 (초)
+            retention: 신선 기간 이후 재검증용 보관 기간 (초, 기본값: settings.YOUTUBE_ETAG_RETENTION)
+        """
+        self.cache = cache or default_cache_service
+        self.ttl = ttl
+        self.retention = (
+            settings.YOUTUBE_ETAG_RETENTION if retention is None else retention
+        )
+
+    def _key(self, entity_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{entity_id}"
+
+    def _fresh_key(self, entity_id: str) -> str:
+        return f"{self.KEY_PREFIX}:fresh:{entity_id}"
+
+    def get_many(self, entity_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        신선한 레코드 일괄 조회 (MGET 1회)
+
+        Args:
+            entity_ids: 엔티티 ID 목록
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 캐시 히트된 ID → 레코드
+        """
+        fresh, _ = self.get_with_stale(entity_ids)
+        return fresh
+
+    def get_with_stale(
+        self, entity_ids: Iterable[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+        """
+        신선한 레코드와 재검증 대상 레코드 일괄 조회 (MGET 1회)
+
+        Args:
+            entity_ids: 엔티티 ID 목록
+
+        Returns:
+            Tuple[Dict, Dict]: (신선한 ID → 레코드, TTL이 지났지만 ETag가 있는 ID → 레코드)
+        """
+        entity_ids = list(entity_ids)
+        keys = [self._key(eid) for eid in entity_ids]
+        fresh_keys = [self._fresh_key(eid) for eid in entity_ids]
+        cached = self.cache.get_many(keys + fresh_keys)
+
+        fresh: Dict[str, Dict[str, Any]] = {}
+        stale: Dict[str, Dict[str, Any]] = {}
+        for eid in entity_ids:
+            record = cached.get(self._key(eid))
+            if record is None:
+                continue
+            if self._fresh_key(eid) in cached:
+                fresh[eid] = record
+            elif record.get("etag"):
+                stale[eid] = record
+        return fresh, stale
+
+    def set_many(
+        self, records: Dict[str, Dict[str, Any]], etag: Optional[str] = None
+    ) -> bool:
+        """
+        레코드 일괄 저장
+
+        Args:
+            records: ID → 레코드
+            etag: 레코드를 받은 응답의 ETag (재검증용, 레코드에 함께 저장)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        if not records:
+            return True
+        if etag:
+            records = {eid: {**record, "etag": etag} for eid, record in records.items()}
+        saved = self.cache.set_many(
+            {self._key(eid): record for eid, record in records.items()},
+            ttl=self.ttl + self.retention,
+        )
+        self.cache.set_many({self._fresh_key(eid): 1 for eid in records}, ttl=self.ttl)
+        return saved
+
+    def touch(self, entity_ids: Iterable[str]) -> bool:
+        """
+        304 Not Modified 응답 후 레코드를 다시 쓰지 않고 신선 기간만 갱신
+
+        Args:
+            entity_ids: 재검증된 엔티티 ID 목록
+
+        Returns:
+            bool: 갱신 성공 여부
+        """
+        entity_ids = list(entity_ids)
+        self.cache.expire_many(
+            [self._key(eid) for eid in entity_ids], self.ttl + self.retention
+        )
+        return self.cache.set_many(
+            {self._fresh_key(eid): 1 for eid in entity_ids}, ttl=self.ttl
+        )
+
+
+class VideoRecordStore(RevalidatingStore):
+    """영상 ID별 레코드(VideoRecord 기본 필드) 캐시"""
+
+    KEY_PREFIX = "youtube:video_record"
+
+    def __init__(self, cache: Optional[CacheService] = None, ttl: Optional[int] = None):
+        """
+        영상 레코드 캐시 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            ttl: 만료 시간 (초, 기본값: settings.YOUTUBE_VIDEO_RECORD_TTL)
+        """
+        super().__init__(cache, ttl or settings.YOUTUBE_VIDEO_RECORD_TTL)
+
+    def get_with_stale(
+        self, entity_ids: Iterable[str]
+    ) -> Tuple[Dict[str, VideoRecord], Dict[str, VideoRecord]]:
+        """
+        신선한 레코드와 재검증 대상 레코드 일괄 조회 (MGET 1회, VideoRecord로 변환)
+
+        Args:
+            entity_ids: 영상 ID 목록
+
+        Returns:
+            Tuple[Dict, Dict]: (신선한 ID → 레코드, TTL이 지났지만 ETag가 있는 ID → 레코드)
+        """
+        fresh, stale = super().get_with_stale(entity_ids)
+        return (
+            {vid: VideoRecord.from_cache(data) for vid, data in fresh.items()},
+            {vid: VideoRecord.from_cache(data) for vid, data in stale.items()},
+        )
+
+    def set_many(
+        self, records: Dict[str, VideoRecord], etag: Optional[str] = None
+    ) -> bool:
+        """
+        레코드 일괄 저장 (기본 필드만 저장, 요청별 지표 필드 제외)
+
+        Args:
+            records: 영상 ID → 레코드
+            etag: 레코드를 받은 응답의 ETag
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        return super().set_many(
+            {vid: record.to_cache() for vid, record in records.items()}, etag=etag
+        )
+
+
+class ChannelStatsStore(RevalidatingStore):
+    """채널 ID별 통계(구독자 수, 누적 조회수, 영상 수) 캐시"""
+
+    KEY_PREFIX = "youtube:channel_stats"
+
+    def __init__(self, cache: Optional[CacheService] = None, ttl: Optional[int] = None):
+        """
+        채널 통계 캐시 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            ttl: 만료 시간 (초, 기본값: settings.YOUTUBE_CHANNEL_STATS_TTL)
+        """
+        super().__init__(cache, ttl or settings.YOUTUBE_CHANNEL_STATS_TTL)
+
+
+class CommentThreadStore(RevalidatingStore):
+    """영상별 댓글 스레드 목록 캐시 (키: 영상 ID + 조회 개수)"""
+
+    KEY_PREFIX = "youtube:comment_threads"
+
+    def __init__(self, cache: Optional[CacheService] = None, ttl: Optional[int] = None):
+        """
+        댓글 스레드 캐시 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            ttl: 만료 시간 (초, 기본값: settings.YOUTUBE_COMMENT_THREADS_TTL)
+        """
+        super().__init__(cache, ttl or settings.YOUTUBE_COMMENT_THREADS_TTL)
+
+
+class ChannelBaselineStore:
+    """
+    채널 ID별 최근 업로드 조회수 기준선 캐시 (중앙값/평균)
+
+    신선 기간(TTL)이 지난 기준선도 stale 기간 동안 보관하여 백그라운드 갱신 중에 사용합니다.
+    """
+
+    KEY_PREFIX = "youtube:channel_baseline"
+
+    def __init__(
+        self,
+        cache: Optional[CacheService] = None,
+        ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        lock_ttl: int = 300,
+    ):
+        """
+        채널 기준선 캐시 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            ttl: 신선 기간 (초, 기본값: settings.YOUTUBE_CHANNEL_BASELINE_TTL)
+            stale_ttl: 신선 기간 이후 보관 기간 (초, 기본값: settings.YOUTUBE_CHANNEL_BASELINE_STALE_TTL)
+            lock_ttl: 갱신 점유 만료 시간 (초)
+        """
+        self.cache = cache or default_cache_service
+        self.ttl = ttl or settings.YOUTUBE_CHANNEL_BASELINE_TTL
+        self.stale_ttl = stale_ttl or settings.YOUTUBE_CHANNEL_BASELINE_STALE_TTL
+        self.lock_ttl = lock_ttl
+
+    def _key(self, channel_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{channel_id}"
+
+    def get_many(self, channel_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        기준선 일괄 조회 (MGET 1회)
+
+        Args:
+            channel_ids: 채널 ID 목록
+
+        Returns:
+            Dict[str, Dict[str, Any]]: 채널 ID → 기준선
+                ({"median_views", "mean_views", "sample_size", "stale", ...})
+        """
+        channel_ids = list(channel_ids)
+        cached = self.cache.get_many([self._key(cid) for cid in channel_ids])
+
+        now = time.time()
+        baselines: Dict[str, Dict[str, Any]] = {}
+        for cid in channel_ids:
+            baseline = cached.get(self._key(cid))
+            if baseline is None:
+                continue
+            baselines[cid] = {**baseline, "stale": now >= baseline.get("fresh_until", 0)}
+        return baselines
+
+    def set(self, channel_id: str, baseline: Dict[str, Any]) -> bool:
+        """
+        기준선 저장
+
+        Args:
+            channel_id: 채널 ID
+            baseline: {"median_views", "mean_views", "sample_size"}
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        return self.cache.set(
+            self._key(channel_id),
+            {**baseline, "fresh_until": time.time() + self.ttl},
+            ttl=self.ttl + self.stale_ttl,
+        )
+
+    def claim_refresh(self, channel_id: str) -> bool:
+        """
+        기준선 갱신 점유 (SET NX, 여러 워커가 같은 채널을 동시에 갱신하지 않도록)
+
+        Args:
+            channel_id: 채널 ID
+
+        Returns:
+            bool: 점유 성공 여부 (Redis 장애 시 True)
+        """
+        try:
+            return bool(
+                self.cache.client.set(
+                    f"{self.KEY_PREFIX}:refreshing:{channel_id}", 1, nx=True, ex=self.lock_ttl
+                )
+            )
+        except redis.RedisError as e:
+            logger.warning(f"채널 기준선 갱신 점유 실패 (channel_id={channel_id}): {str(e)}")
+            return True
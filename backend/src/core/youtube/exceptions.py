@@ -33,6 +33,20 @@ class QuotaExceededError(YouTubeAPIError):
         )
 
 
+class QuotaBudgetExceededError(QuotaExceededError):
+    """내부 할당량 예산 초과 에러 (YouTube API 호출 전 차단)"""
+
+    def __init__(
+        self,
+        message: str = "YouTube API 일일 할당량 예산이 부족합니다.",
+        scope: str = "key",
+        retry_after: int = 3600,
+    ):
+        super().__init__(message)
+        self.scope = scope
+        self.details = {"retry_after": retry_after, "scope": scope}
+
+
 class InvalidAPIKeyError(YouTubeAPIError):
     """잘못된 API 키 에러"""
 
@@ -65,6 +79,53 @@ class ChannelNotFoundError(YouTubeAPIError):
         )
 
 
+class TranscriptUnavailableError(YouTubeAPIError):
+    """자막을 받을 수 없는 영상 에러 (자막 비활성화, 요청 언어 없음, 영상 없음)"""
+
+    # reason 값
+    DISABLED = "disabled"
+    NOT_FOUND = "not_found"
+    VIDEO_UNAVAILABLE = "video_unavailable"
+
+    def __init__(self, message: str, video_id: str, reason: str):
+        super().__init__(
+            message=message,
+            status_code=404,
+            details={"video_id": video_id, "reason": reason}
+        )
+        self.reason = reason
+
+
+class TranscriptRequestBlockedError(YouTubeAPIError):
+    """YouTube가 자막 요청을 차단한 에러 (요청 과다, IP 차단)"""
+
+    def __init__(self, message: str = "YouTube가 자막 요청을 일시적으로 차단했습니다."):
+        super().__init__(
+            message=message,
+            status_code=429,
+            details={"retry_after": 60}
+        )
+
+
+class YouTubeHTTPError(YouTubeAPIError):
+    """YouTube Data API HTTP 응답 에러 (비동기 클라이언트용)"""
+
+    QUOTA_REASONS = ("quotaExceeded", "dailyLimitExceeded")
+
+    def __init__(self, message: str, status_code: int, reason: str = ""):
+        super().__init__(
+            message=message,
+            status_code=status_code,
+            details={"reason": reason}
+        )
+        self.reason = reason
+
+    @property
+    def is_quota_exceeded(self) -> bool:
+        """할당량 초과로 인한 에러인지 여부"""
+        return self.reason in self.QUOTA_REASONS
+
+
 def handle_youtube_api_error(error: HttpError) -> YouTubeAPIError:
     """
     Google API HttpError를 YouTubeAPIError로 변환
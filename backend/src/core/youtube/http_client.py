@@ -0,0 +1,254 @@
+"""
+YouTube Data API 비동기 HTTP 클라이언트
+
+googleapiclient의 동기 `.execute()` 대신 httpx.AsyncClient를 사용하여
+이벤트 루프를 블로킹하지 않고 YouTube Data API v3를 호출합니다.
+커넥션 풀(keep-alive)은 프로세스 전역에서 공유됩니다.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set, Tuple
+
+import httpx
+
+from src.config import settings
+from src.core.youtube.exceptions import YouTubeHTTPError
+
+logger = logging.getLogger(__name__)
+
+YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# 재시도 대상 HTTP 상태 코드 (일시적 오류)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class YouTubeHTTPClient:
+    """YouTube Data API v3 비동기 HTTP 클라이언트 (커넥션 풀 공유)"""
+
+    def __init__(
+        self,
+        base_url: str = YOUTUBE_API_BASE_URL,
+        timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_factor: float = 0.5,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """
+        HTTP 클라이언트 초기화
+
+        Args:
+            base_url: YouTube Data API 기본 URL
+            timeout: 요청 타임아웃 (초, 기본값: settings.YOUTUBE_API_TIMEOUT)
+            max_connections: 최대 동시 커넥션 수
+            max_keepalive_connections: keep-alive 유지 커넥션 수
+            max_retries: 일시적 오류 재시도 횟수
+            backoff_factor: 재시도 대기 시간 계수 (초, 지수 증가)
+            transport: httpx 트랜스포트 (테스트용)
+        """
+        self.base_url = base_url
+        self.timeout = timeout or settings.YOUTUBE_API_TIMEOUT
+        self.max_connections = max_connections or settings.YOUTUBE_API_MAX_CONNECTIONS
+        self.max_keepalive_connections = (
+            max_keepalive_connections or settings.YOUTUBE_API_MAX_KEEPALIVE
+        )
+        self.max_retries = (
+            settings.YOUTUBE_API_MAX_RETRIES if max_retries is None else max_retries
+        )
+        self.backoff_factor = backoff_factor
+        self._transport = transport
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._closing: Set[asyncio.Task] = set()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """httpx.AsyncClient 인스턴스 (lazy loading, 이벤트 루프별 1개)"""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and not self._client.is_closed:
+                # 이전 루프의 커넥션 풀은 닫지 않으면 소켓이 남으므로 정리
+                task = loop.create_task(self._discard(self._client))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+            # 커넥션 풀은 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+            transport = self._transport or httpx.AsyncHTTPTransport(
+                retries=self.max_retries,  # 연결 실패 재시도
+            )
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(self.timeout, connect=min(self.timeout, 5.0)),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                    keepalive_expiry=30.0,
+                ),
+                transport=transport,
+                headers={"Accept": "application/json"},
+            )
+            self._loop = loop
+        return self._client
+
+    async def get(
+        self,
+        resource: str,
+        params: Dict[str, Any],
+        api_key: str,
+    ) -> Dict[str, Any]:
+        """
+        YouTube Data API GET 요청
+
+        Args:
+            resource: 리소스 경로 (예: "search", "videos", "channels")
+            params: 쿼리 파라미터 (YouTube Data API 파라미터 이름 그대로)
+            api_key: YouTube Data API 키
+
+        Returns:
+            JSON 응답 딕셔너리
+
+        Raises:
+            YouTubeHTTPError: 4xx/5xx 응답 또는 네트워크 오류
+        """
+        payload, _ = await self.get_conditional(resource, params, api_key)
+        return payload
+
+    async def get_conditional(
+        self,
+        resource: str,
+        params: Dict[str, Any],
+        api_key: str,
+        etag: Optional[str] = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        YouTube Data API 조건부 GET 요청 (If-None-Match)
+
+        Args:
+            resource: 리소스 경로 (예: "search", "videos", "channels")
+            params: 쿼리 파라미터 (YouTube Data API 파라미터 이름 그대로)
+            api_key: YouTube Data API 키
+            etag: 캐시된 응답의 ETag (지정 시 If-None-Match 헤더 전송)
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], Optional[str]]:
+                (JSON 응답, 응답 ETag) - 304 Not Modified이면 (None, etag)
+
+        Raises:
+            YouTubeHTTPError: 4xx/5xx 응답 또는 네트워크 오류
+        """
+        query = {k: v for k, v in params.items() if v is not None}
+        query["key"] = api_key
+        headers = {"If-None-Match": etag} if etag else None
+
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.get(
+                    f"/{resource}", params=query, headers=headers
+                )
+            except httpx.TimeoutException as e:
+                if attempt < self.max_retries:
+                    attempt += 1
+                    await self._backoff(attempt)
+                    continue
+                logger.error(f"YouTube API 요청 타임아웃: resource={resource}")
+                raise YouTubeHTTPError(
+                    f"YouTube API 요청 시간이 초과되었습니다: {e}", status_code=504
+                )
+            except httpx.HTTPError as e:
+                logger.error(f"YouTube API 요청 실패: resource={resource}, error={e}")
+                raise YouTubeHTTPError(
+                    f"YouTube API 요청 중 오류가 발생했습니다: {e}", status_code=502
+                )
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < self.max_retries:
+                attempt += 1
+                logger.warning(
+                    f"YouTube API 일시적 오류, 재시도 {attempt}/{self.max_retries}: "
+                    f"resource={resource}, status={response.status_code}"
+                )
+                await self._backoff(attempt, response.headers.get("Retry-After"))
+                continue
+
+            if response.status_code == 304 and etag:
+                return None, response.headers.get("ETag") or etag
+
+            if response.is_error:
+                raise self._to_error(response)
+
+            payload = response.json()
+            return payload, response.headers.get("ETag") or payload.get("etag")
+
+    async def close(self):
+        """커넥션 풀 종료"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._loop = None
+
+    @staticmethod
+    async def _discard(client: httpx.AsyncClient):
+        """이전 이벤트 루프에서 만든 클라이언트 종료 (이미 닫힌 루프의 커넥션 오류는 무시)"""
+        try:
+            await client.aclose()
+        except Exception as e:
+            logger.debug(f"이전 이벤트 루프의 HTTP 클라이언트 종료 실패: {e}")
+
+    async def _backoff(self, attempt: int, retry_after: Optional[str] = None):
+        """재시도 전 대기 (Retry-After 헤더 우선, 없으면 지수 백오프)"""
+        delay = self.backoff_factor * (2 ** (attempt - 1))
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        await asyncio.sleep(min(delay, 10.0))
+
+    @staticmethod
+    def _to_error(response: httpx.Response) -> YouTubeHTTPError:
+        """에러 응답 → YouTubeHTTPError 변환"""
+        reason = ""
+        message = response.text
+        try:
+            error = response.json().get("error", {})
+            message = error.get("message", message)
+            reason = (error.get("errors") or [{}])[0].get("reason", "")
+        except ValueError:
+            pass
+
+        logger.error(
+            f"YouTube API 오류 응답: status={response.status_code}, reason={reason}, "
+            f"message={message}"
+        )
+        return YouTubeHTTPError(
+            message=f"<HttpError {response.status_code}: {message}>",
+            status_code=response.status_code,
+            reason=reason,
+        )
+
+
+# 전역 HTTP 클라이언트 인스턴스
+_http_client: Optional[YouTubeHTTPClient] = None
+
+
+def get_youtube_http_client() -> YouTubeHTTPClient:
+    """
+    전역 YouTube HTTP 클라이언트 반환 (커넥션 풀 공유)
+
+    Returns:
+        YouTubeHTTPClient: YouTube Data API HTTP 클라이언트
+    """
+    global _http_client
+
+    if _http_client is None:
+        _http_client = YouTubeHTTPClient()
+
+    return _http_client
+
+
+async def close_youtube_http_client():
+    """전역 YouTube HTTP 클라이언트 종료 (애플리케이션 종료 시, Celery task 종료 시)"""
+    if _http_client is not None:
+        await _http_client.close()
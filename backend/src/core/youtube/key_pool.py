@@ -0,0 +1,168 @@
+"""
+YouTube Data API 키 풀
+
+설정된 여러 API 키 중 오늘 잔여 할당량이 가장 많은 키를 골라 사용하고,
+quotaExceeded(403)를 받은 키는 다음 초기화(자정 PT)까지 쿨다운시킵니다.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import redis
+
+from src.config import settings
+from src.core.cache import cache_service
+from src.core.youtube.quota_ledger import (
+    PACIFIC_TZ,
+    YouTubeQuotaLedger,
+    api_key_fingerprint,
+    api_key_label,
+    get_quota_ledger,
+    next_reset_at,
+)
+
+logger = logging.getLogger(__name__)
+
+# 할당량 외 오류(잘못된 키 등)로 제외할 때의 쿨다운 (초)
+ERROR_COOLDOWN_SECONDS = 3600
+
+
+class YouTubeAPIKeyPool:
+    """할당량 기반 YouTube API 키 풀"""
+
+    KEY_PREFIX = "youtube:key_pool"
+
+    def __init__(
+        self,
+        api_keys: List[str],
+        quota_ledger: Optional[YouTubeQuotaLedger] = None,
+        redis_client: Optional[redis.Redis] = None,
+    ):
+        """
+        키 풀 초기화
+
+        Args:
+            api_keys: YouTube Data API 키 목록 (설정 순서가 동률 시 우선순위)
+            quota_ledger: 할당량 원장 (기본값: 전역 원장)
+            redis_client: Redis 클라이언트 (기본값: 전역 CacheService 클라이언트)
+        """
+        self.api_keys = list(api_keys)
+        self.quota_ledger = quota_ledger or get_quota_ledger()
+        self._redis = redis_client
+
+    @property
+    def redis(self) -> redis.Redis:
+        """Redis 클라이언트 (lazy loading)"""
+        if self._redis is None:
+            self._redis = cache_service.client
+        return self._redis
+
+    def _cooldown_key(self, api_key: str) -> str:
+        return f"{self.KEY_PREFIX}:cooldown:{api_key_fingerprint(api_key)}"
+
+    def _health_key(self, api_key: str) -> str:
+        return f"{self.KEY_PREFIX}:health:{api_key_fingerprint(api_key)}"
+
+    def candidates(self) -> List[str]:
+        """
+        호출에 사용할 API 키 후보 (잔여 할당량 많은 순, 쿨다운 키 제외)
+
+        Returns:
+            List[str]: API 키 목록 (Redis 장애 시 설정 순서 그대로)
+        """
+        if len(self.api_keys) <= 1:
+            return list(self.api_keys)
+
+        used = self.quota_ledger.get_used_many(self.api_keys)
+        try:
+            cooldowns = self.redis.mget([self._cooldown_key(key) for key in self.api_keys])
+        except redis.RedisError as e:
+            logger.warning(f"API 키 쿨다운 조회 실패: {str(e)}")
+            cooldowns = [None] * len(self.api_keys)
+
+        available = [
+            key for key, cooldown in zip(self.api_keys, cooldowns) if cooldown is None
+        ]
+        # sorted는 안정 정렬이므로 사용량이 같으면 설정 순서 유지
+        return sorted(available, key=lambda key: used.get(key, 0))
+
+    def mark_cooldown(self, api_key: str, reason: str, seconds: Optional[int] = None):
+        """
+        API 키를 일정 시간 풀에서 제외
+
+        Args:
+            api_key: YouTube Data API 키
+            reason: 제외 사유 (YouTube 에러 reason)
+            seconds: 쿨다운 시간 (기본값: 다음 할당량 초기화까지)
+        """
+        now = datetime.now(tz=PACIFIC_TZ)
+        if seconds is None:
+            seconds = max(60, int((next_reset_at(now) - now).total_seconds()))
+
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.set(self._cooldown_key(api_key), reason, ex=seconds)
+            pipe.hset(
+                self._health_key(api_key),
+                mapping={"last_error": reason, "last_error_at": now.isoformat()},
+            )
+            pipe.hincrby(self._health_key(api_key), "error_count", 1)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"API 키 쿨다운 기록 실패: {str(e)}")
+            return
+
+        logger.warning(
+            f"YouTube API 키 쿨다운: key={api_key_label(api_key)}, reason={reason}, "
+            f"seconds={seconds}"
+        )
+
+    def get_status(self) -> List[Dict[str, Any]]:
+        """
+        키별 상태 조회 (관리자용)
+
+        Returns:
+            List[Dict[str, Any]]: 키별 사용량, 잔여량, 쿨다운, 최근 오류
+        """
+        used = self.quota_ledger.get_used_many(self.api_keys)
+        statuses = []
+        for api_key in self.api_keys:
+            cooldown_ttl = self.redis.ttl(self._cooldown_key(api_key))
+            health = self.redis.hgetall(self._health_key(api_key))
+            key_used = used.get(api_key, 0)
+            statuses.append({
+                "key_id": api_key_fingerprint(api_key),
+                "key_label": api_key_label(api_key),
+                "used": key_used,
+                "remaining": max(0, self.quota_ledger.daily_limit - key_used),
+                "cooldown_seconds": max(0, cooldown_ttl or 0),
+                "cooldown_reason": self.redis.get(self._cooldown_key(api_key)),
+                "last_error": health.get("last_error"),
+                "last_error_at": health.get("last_error_at"),
+                "error_count": int(health.get("error_count", 0)),
+            })
+        return statuses
+
+
+# 전역 키 풀 인스턴스
+_key_pool: Optional[YouTubeAPIKeyPool] = None
+
+
+def get_key_pool() -> Optional[YouTubeAPIKeyPool]:
+    """
+    설정된 API 키로 구성한 전역 키 풀 반환
+
+    Returns:
+        Optional[YouTubeAPIKeyPool]: 키 풀 (설정된 키가 없으면 None)
+    """
+    global _key_pool
+
+    if _key_pool is None:
+        api_keys = settings.youtube_api_keys_list
+        if not api_keys:
+            return None
+        _key_pool = YouTubeAPIKeyPool(api_keys)
+        logger.info(f"YouTube API 키 풀 구성: {len(api_keys)}개")
+
+    return _key_pool
@@ -0,0 +1,338 @@
+"""
+YouTube Data API 할당량 원장
+
+API 키별/사용자별 quota unit 사용량을 Redis 카운터로 집계합니다.
+YouTube 할당량은 매일 자정(태평양 시간)에 초기화되므로 카운터도 PT 날짜 단위로 관리합니다.
+
+호출 전에 비용만큼 먼저 차감(INCRBY)하고, 예산을 초과하면 되돌린 뒤 차단하므로
+여러 API 워커가 동시에 호출해도 예산을 넘지 않습니다.
+"""
+
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+import redis
+
+from src.config import settings
+from src.core.cache import cache_service
+from src.core.youtube.exceptions import QuotaBudgetExceededError
+
+logger = logging.getLogger(__name__)
+
+PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
+
+# YouTube Data API v3 리소스별 호출 비용 (quota unit)
+QUOTA_UNIT_COSTS: Dict[str, int] = {
+    "search": 100,
+    "videos": 1,
+    "channels": 1,
+    "playlistItems": 1,
+    "commentThreads": 1,
+    "comments": 1,
+    "captions": 50,
+}
+
+# 이 비용 이상의 호출은 잔여 예산이 적을 때 차단 (캐시 전용 모드)
+EXPENSIVE_CALL_UNITS = 100
+
+# 카운터 보관 기간 (리포트 조회용으로 하루 더 보관)
+COUNTER_TTL_SECONDS = 2 * 24 * 3600
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """
+    할당량 기준 날짜 (태평양 시간 YYYY-MM-DD)
+
+    Args:
+        now: 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        str: PT 기준 날짜
+    """
+    now = now or datetime.now(tz=PACIFIC_TZ)
+    return now.astimezone(PACIFIC_TZ).strftime("%Y-%m-%d")
+
+
+def next_reset_at(now: Optional[datetime] = None) -> datetime:
+    """다음 할당량 초기화 시각 (다음 날 자정 PT)"""
+    now = (now or datetime.now(tz=PACIFIC_TZ)).astimezone(PACIFIC_TZ)
+    tomorrow = (now + timedelta(days=1)).date()
+    return datetime(tomorrow.year, tomorrow.month, tomorrow.day, tzinfo=PACIFIC_TZ)
+
+
+def api_key_fingerprint(api_key: str) -> str:
+    """API 키 식별자 (Redis 키에 원본 API 키를 남기지 않기 위한 해시)"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+
+def api_key_label(api_key: str) -> str:
+    """관리자 화면 표시용 API 키 라벨 (끝 4자리)"""
+    return f"...{api_key[-4:]}" if len(api_key) > 4 else "****"
+
+
+class YouTubeQuotaLedger:
+    """YouTube Data API 할당량 원장 (Redis)"""
+
+    KEY_PREFIX = "youtube:quota"
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.Redis] = None,
+        daily_limit: Optional[int] = None,
+        user_daily_limit: Optional[int] = None,
+        reserve: Optional[int] = None,
+    ):
+        """
+        할당량 원장 초기화
+
+        Args:
+            redis_client: Redis 클라이언트 (기본값: 전역 CacheService 클라이언트)
+            daily_limit: API 키별 일일 할당량
+            user_daily_limit: 사용자별 일일 사용 한도
+            reserve: 고비용 호출 차단 기준 잔여량
+        """
+        self._redis = redis_client
+        self.daily_limit = daily_limit or settings.YOUTUBE_DAILY_QUOTA
+        self.user_daily_limit = user_daily_limit or settings.YOUTUBE_USER_DAILY_QUOTA
+        self.reserve = settings.YOUTUBE_QUOTA_RESERVE if reserve is None else reserve
+
+    @property
+    def redis(self) -> redis.Redis:
+        """Redis 클라이언트 (lazy loading)"""
+        if self._redis is None:
+            self._redis = cache_service.client
+        return self._redis
+
+    def _key_counter(self, day: str, api_key: str) -> str:
+        return f"{self.KEY_PREFIX}:{day}:key:{api_key_fingerprint(api_key)}"
+
+    def _user_counter(self, day: str, user_id: str) -> str:
+        return f"{self.KEY_PREFIX}:{day}:user:{user_id}"
+
+    def _resource_counter(self, day: str, api_key: str) -> str:
+        return f"{self.KEY_PREFIX}:{day}:resources:{api_key_fingerprint(api_key)}"
+
+    def _labels_key(self, day: str) -> str:
+        return f"{self.KEY_PREFIX}:{day}:keys"
+
+    def charge(
+        self, api_key: str, resource: str, user_id: Optional[str] = None
+    ) -> int:
+        """
+        API 호출 전 할당량 차감 (예산 초과 시 되돌리고 차단)
+
+        Args:
+            api_key: YouTube Data API 키
+            resource: 호출할 리소스 (search, videos, channels 등)
+            user_id: 요청 사용자 ID (선택, 서버 키 호출만 지정하며 사용자 한도에 집계)
+
+        Returns:
+            int: 차감한 quota unit
+
+        Raises:
+            QuotaBudgetExceededError: API 키 또는 사용자 예산 부족
+        """
+        units = QUOTA_UNIT_COSTS.get(resource, 1)
+        day = quota_day()
+        key_counter = self._key_counter(day, api_key)
+        resource_counter = self._resource_counter(day, api_key)
+        user_counter = self._user_counter(day, user_id) if user_id else None
+        labels_key = self._labels_key(day)
+
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.incrby(key_counter, units)
+            if user_counter:
+                pipe.incrby(user_counter, units)
+                pipe.expire(user_counter, COUNTER_TTL_SECONDS)
+            pipe.hincrby(resource_counter, resource, units)
+            pipe.expire(key_counter, COUNTER_TTL_SECONDS)
+            pipe.expire(resource_counter, COUNTER_TTL_SECONDS)
+            # 키 라벨도 날짜별로 보관하여 사용자 지정 키가 쌓이지 않도록 함
+            pipe.hset(labels_key, api_key_fingerprint(api_key), api_key_label(api_key))
+            pipe.expire(labels_key, COUNTER_TTL_SECONDS)
+            results = pipe.execute()
+        except redis.RedisError as e:
+            # 원장 장애 시 API 호출은 허용 (fail-open)
+            logger.warning(f"할당량 원장 기록 실패 (resource={resource}): {str(e)}")
+            return units
+
+        key_total = int(results[0])
+        user_total = int(results[1]) if user_counter else 0
+
+        # 고비용 호출은 예비 할당량을 남겨두고 차단
+        key_limit = self.daily_limit
+        if units >= EXPENSIVE_CALL_UNITS:
+            key_limit -= self.reserve
+
+        scope = None
+        if key_total > key_limit:
+            scope = "key"
+        elif user_counter and user_total > self.user_daily_limit:
+            scope = "user"
+
+        if scope is None:
+            return units
+
+        self._rollback(key_counter, resource_counter, resource, units, user_counter)
+        logger.warning(
+            f"YouTube 할당량 예산 초과로 호출 차단: scope={scope}, resource={resource}, "
+            f"key_used={key_total - units}/{self.daily_limit}, user_id={user_id}"
+        )
+        retry_after = int((next_reset_at() - datetime.now(tz=PACIFIC_TZ)).total_seconds())
+        if scope == "user":
+            message = "오늘 사용할 수 있는 YouTube 검색 한도를 모두 사용했습니다."
+        else:
+            message = "YouTube API 할당량이 부족하여 캐시된 결과만 제공합니다."
+        raise QuotaBudgetExceededError(message, scope=scope, retry_after=retry_after)
+
+    def _rollback(
+        self,
+        key_counter: str,
+        resource_counter: str,
+        resource: str,
+        units: int,
+        user_counter: Optional[str],
+    ):
+        """차단된 호출의 차감분 되돌리기"""
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.decrby(key_counter, units)
+            pipe.hincrby(resource_counter, resource, -units)
+            if user_counter:
+                pipe.decrby(user_counter, units)
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"할당량 원장 롤백 실패: {str(e)}")
+
+    def mark_exhausted(self, api_key: str):
+        """
+        YouTube가 quotaExceeded를 반환한 API 키를 오늘 소진 상태로 기록
+
+        Args:
+            api_key: YouTube Data API 키
+        """
+        key_counter = self._key_counter(quota_day(), api_key)
+        try:
+            used = int(self.redis.get(key_counter) or 0)
+            if used < self.daily_limit:
+                self.redis.set(key_counter, self.daily_limit, ex=COUNTER_TTL_SECONDS)
+            logger.warning(f"YouTube API 키 할당량 소진 기록: key={api_key_label(api_key)}")
+        except redis.RedisError as e:
+            logger.warning(f"할당량 소진 기록 실패: {str(e)}")
+
+    def get_used(self, api_key: str) -> int:
+        """
+        오늘 API 키 사용량 조회
+
+        Args:
+            api_key: YouTube Data API 키
+
+        Returns:
+            int: 사용한 quota unit (조회 실패 시 0)
+        """
+        try:
+            return int(self.redis.get(self._key_counter(quota_day(), api_key)) or 0)
+        except redis.RedisError as e:
+            logger.warning(f"할당량 사용량 조회 실패: {str(e)}")
+            return 0
+
+    def get_used_many(self, api_keys: List[str]) -> Dict[str, int]:
+        """
+        여러 API 키의 오늘 사용량 일괄 조회 (MGET 1회)
+
+        Args:
+            api_keys: YouTube Data API 키 목록
+
+        Returns:
+            Dict[str, int]: API 키 → 사용한 quota unit (조회 실패 시 빈 딕셔너리)
+        """
+        if not api_keys:
+            return {}
+
+        day = quota_day()
+        try:
+            values = self.redis.mget([self._key_counter(day, key) for key in api_keys])
+        except redis.RedisError as e:
+            logger.warning(f"할당량 사용량 일괄 조회 실패: {str(e)}")
+            return {}
+        return {key: int(value or 0) for key, value in zip(api_keys, values)}
+
+    def get_remaining(self, api_key: str) -> int:
+        """오늘 API 키 잔여 할당량"""
+        return max(0, self.daily_limit - self.get_used(api_key))
+
+    def get_report(self, day: Optional[str] = None, top_users: int = 20) -> Dict[str, Any]:
+        """
+        할당량 사용 리포트 (관리자용)
+
+        Args:
+            day: 기준 날짜 (PT, 기본값: 오늘)
+            top_users: 사용량 상위 사용자 수
+
+        Returns:
+            Dict[str, Any]: 키별/사용자별/리소스별 사용량
+        """
+        day = day or quota_day()
+        prefix = f"{self.KEY_PREFIX}:{day}"
+
+        labels = self.redis.hgetall(self._labels_key(day))
+
+        keys: List[Dict[str, Any]] = []
+        for counter in self.redis.scan_iter(match=f"{prefix}:key:*", count=500):
+            fingerprint = counter.rsplit(":", 1)[-1]
+            used = int(self.redis.get(counter) or 0)
+            resources = {
+                resource: int(units)
+                for resource, units in self.redis.hgetall(
+                    f"{prefix}:resources:{fingerprint}"
+                ).items()
+            }
+            keys.append({
+                "key_id": fingerprint,
+                "key_label": labels.get(fingerprint, fingerprint),
+                "used": used,
+                "remaining": max(0, self.daily_limit - used),
+                "resources": resources,
+            })
+
+        users: List[Dict[str, Any]] = []
+        for counter in self.redis.scan_iter(match=f"{prefix}:user:*", count=500):
+            users.append({
+                "user_id": counter.rsplit(":", 1)[-1],
+                "used": int(self.redis.get(counter) or 0),
+            })
+        users.sort(key=lambda u: u["used"], reverse=True)
+
+        return {
+            "day": day,
+            "reset_at": next_reset_at().isoformat(),
+            "daily_limit": self.daily_limit,
+            "user_daily_limit": self.user_daily_limit,
+            "reserve": self.reserve,
+            "total_used": sum(k["used"] for k in keys),
+            "keys": sorted(keys, key=lambda k: k["used"], reverse=True),
+            "top_users": users[:top_users],
+        }
+
+
+# 전역 할당량 원장 인스턴스
+_quota_ledger: Optional[YouTubeQuotaLedger] = None
+
+
+def get_quota_ledger() -> YouTubeQuotaLedger:
+    """
+    전역 할당량 원장 반환
+
+    Returns:
+        YouTubeQuotaLedger: 할당량 원장
+    """
+    global _quota_ledger
+
+    if _quota_ledger is None:
+        _quota_ledger = YouTubeQuotaLedger()
+
+    return _quota_ledger
@@ -0,0 +1,157 @@
+"""
+YouTube 영상 순위 계산
+
+캐시된 영상 레코드에서 정렬 지표 하나를 열(column) 배열로 한 번에 계산하고,
+전체 정렬 없이 상위 k개만 선택합니다 (heapq, O(n log k)).
+
+- performance_ratio: 영상 조회수 / 채널 최근 업로드 조회수 중앙값
+- engagement_rate: (좋아요 + 댓글) / 조회수
+- view_velocity: 게시 이후 시간당 조회수
+
+값을 계산할 수 없는 영상은 -inf로 두어 가장 뒤로 보내며, 반환할 영상에만 지표 값을 채웁니다.
+"""
+
+import heapq
+import math
+from array import array
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+# 정렬 기준 (relevance는 입력 순서 유지)
+SORT_RELEVANCE = "relevance"
+RANKING_METRICS = ("performance_ratio", "engagement_rate", "view_velocity")
+SORT_OPTIONS = (SORT_RELEVANCE, *RANKING_METRICS)
+
+# 게시 직후 영상의 시간당 조회수가 과대 계산되지 않도록 하는 최소 경과 시간
+MIN_VELOCITY_HOURS = 1.0
+
+MISSING = -math.inf
+
+
+def _published_timestamp(published_at: Optional[str]) -> float:
+    """게시 시각(RFC 3339) → UNIX timestamp (파싱 실패 시 NaN)"""
+    try:
+        published = datetime.fromisoformat(published_at)
+    except (TypeError, ValueError):
+        return math.nan
+    if published.tzinfo is None:
+        published = published.replace(tzinfo=timezone.utc)
+    return published.timestamp()
+
+
+def compute_metric(
+    videos: Sequence[Dict[str, Any]], metric: str, now: Optional[datetime] = None
+) -> array:
+    """
+    영상 목록 전체에 대해 지표 하나를 열 배열로 계산
+
+    Args:
+        videos: 영상 레코드 목록 (get_video_details 결과)
+        metric: 지표 이름 (performance_ratio, engagement_rate, view_velocity)
+        now: view_velocity 기준 시각 (기본값: 현재 UTC)
+
+    Returns:
+        array: 영상별 지표 값 (입력 순서, 계산 불가 시 -inf)
+
+    Raises:
+        ValueError: 지원하지 않는 지표
+    """
+    if metric == "performance_ratio":
+        values = [video.get("performance_ratio") for video in videos]
+        return array("d", [MISSING if value is None else value for value in values])
+
+    views = array("d", [video.get("view_count") or 0 for video in videos])
+
+    if metric == "engagement_rate":
+        likes = array("d", [video.get("like_count") or 0 for video in videos])
+        comments = array("d", [video.get("comment_count") or 0 for video in videos])
+        return array(
+            "d",
+            [
+                (like + comment) / view if view > 0 else MISSING
+                for like, comment, view in zip(likes, comments, views)
+            ],
+        )
+
+    if metric == "view_velocity":
+        now_ts = (now or datetime.now(timezone.utc)).timestamp()
+        published = array(
+            "d", [_published_timestamp(video.get("published_at")) for video in videos]
+        )
+        return array(
+            "d",
+            [
+                view / max((now_ts - ts) / 3600, MIN_VELOCITY_HOURS) if ts == ts else MISSING
+                for view, ts in zip(views, published)
+            ],
+        )
+
+    raise ValueError(f"지원하지 않는 지표입니다: {metric}")
+
+
+def top_k_indices(values: Sequence[float], k: Optional[int] = None) -> List[int]:
+    """
+    값이 큰 순서로 상위 k개 인덱스 선택 (동점은 입력 순서 유지)
+
+    Args:
+        values: 지표 값 배열
+        k: 선택할 개수 (None이면 전체 정렬)
+
+    Returns:
+        List[int]: 상위 인덱스 목록 (내림차순)
+    """
+    indices = range(len(values))
+    if k is None or k >= len(values):
+        return sorted(indices, key=values.__getitem__, reverse=True)
+    return heapq.nlargest(k, indices, key=values.__getitem__)
+
+
+def annotate_metrics(
+    videos: Sequence[Dict[str, Any]], now: Optional[datetime] = None
+) -> None:
+    """
+    영상 레코드에 engagement_rate/view_velocity 값 채우기 (계산 불가 시 None)
+
+    Args:
+        videos: 응답으로 반환할 영상 레코드 목록
+        now: view_velocity 기준 시각 (기본값: 현재 UTC)
+    """
+    for name in ("engagement_rate", "view_velocity"):
+        for video, value in zip(videos, compute_metric(videos, name, now=now)):
+            video[name] = None if value == MISSING else value
+
+
+def rank_videos(
+    videos: Sequence[Dict[str, Any]],
+    sort_by: str = SORT_RELEVANCE,
+    limit: Optional[int] = None,
+    now: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    영상 목록 순위 계산
+
+    sort_by 지표 기준 상위 limit개를 반환하고, 반환 영상에 engagement_rate/view_velocity를 채웁니다.
+
+    Args:
+        videos: 영상 레코드 목록
+        sort_by: 정렬 기준 (relevance, performance_ratio, engagement_rate, view_velocity)
+        limit: 반환할 최대 개수 (None이면 전체)
+        now: view_velocity 기준 시각 (기본값: 현재 UTC)
+
+    Returns:
+        List[Dict[str, Any]]: 정렬된 영상 목록 (relevance면 입력 순서)
+
+    Raises:
+        ValueError: 지원하지 않는 정렬 기준
+    """
+    if sort_by not in SORT_OPTIONS:
+        raise ValueError(f"sort_by는 {', '.join(SORT_OPTIONS)} 중 하나여야 합니다.")
+
+    if sort_by == SORT_RELEVANCE:
+        ranked = list(videos[:limit] if limit is not None else videos)
+    else:
+        values = compute_metric(videos, sort_by, now=now)
+        ranked = [videos[i] for i in top_k_indices(values, limit)]
+
+    annotate_metrics(ranked, now=now)
+    return ranked
@@ -0,0 +1,447 @@
+"""
+YouTube 저장된 검색 (증분 재실행 + 신규 결과)
+
+사용자가 저장한 검색을 스케줄러가 주기적으로 `publishedAfter = 마지막 실행 시각`으로 다시 실행하고,
+새로 발견한 영상을 결과 집합에 병합합니다. API는 사용자가 마지막으로 확인한 이후의 신규 영상만 반환합니다.
+
+- 검색 정의: JSON 레코드 (사용자 API 키는 암호화하여 저장)
+- 실행 예정 시각: Redis ZSET (score = next_run_at)
+- 결과 집합: 검색별 Redis ZSET (member = 영상 ID, score = 처음 발견한 시각)
+- 마지막 확인 시각: Redis ZSET (member = 검색 ID, ZADD GT로 증가만 허용)
+
+검색 정의는 스케줄러만 갱신하며, 사용자 확인 상태는 별도 키에 두어 서로 덮어쓰지 않습니다.
+스케줄러는 레코드가 남아 있을 때만 갱신(SET XX)하여 실행 중 삭제된 검색을 되살리지 않습니다.
+
+실행할 검색은 API 키별로 묶고, 키마다 한 번에 실행하는 개수를 제한하여
+여러 검색이 동시에 실행 예정이 되어도 한 키의 할당량을 1분 안에 소진하지 않도록 합니다.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from src.config import settings
+from src.core.cache import CacheService, cache_service as default_cache_service
+from src.core.youtube.exceptions import QuotaBudgetExceededError
+from src.core.youtube.search_service import YouTubeSearchService, get_search_service
+
+logger = logging.getLogger(__name__)
+
+SAVED_SEARCH_KEY_PREFIX = "youtube:saved_search"
+USER_SEARCHES_KEY_PREFIX = "youtube:saved_searches:user"
+DUE_KEY = "youtube:saved_searches:due"
+RESULTS_KEY_PREFIX = "youtube:saved_search:results"
+VIEWED_KEY = "youtube:saved_searches:viewed"
+
+# 서버 키 풀로 실행하는 검색의 키 식별자
+POOL_KEY_FINGERPRINT = "pool"
+
+# YouTube 검색 색인 지연을 고려해 마지막 실행 시각보다 조금 앞부터 다시 조회 (중복은 ZADD NX로 제거)
+INCREMENTAL_OVERLAP = timedelta(hours=1)
+
+# 실행 실패 시 재시도 대기 시간 (초)
+RETRY_DELAY = 900
+
+# 한 번의 실행에서 발견한 영상의 발견 시각 간격 (초)
+# 영상마다 발견 시각이 달라야 마지막 확인 시각 이후의 결과를 중복/누락 없이 나눌 수 있음
+FOUND_AT_STEP = 0.001
+
+ServiceFactory = Callable[[Dict[str, Any]], YouTubeSearchService]
+
+
+def key_fingerprint(api_key: Optional[str]) -> str:
+    """API 키 식별자 (원문 대신 해시 앞부분, 키가 없으면 서버 키 풀)"""
+    if not api_key:
+        return POOL_KEY_FINGERPRINT
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+class SavedSearchStore:
+    """저장된 검색 정의, 실행 일정, 결과 집합 저장소"""
+
+    def __init__(
+        self,
+        cache: Optional[CacheService] = None,
+        max_results: Optional[int] = None,
+    ):
+        """
+        저장된 검색 저장소 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            max_results: 검색별 보관 결과 수 (기본값: settings.YOUTUBE_SAVED_SEARCH_MAX_RESULTS)
+        """
+        self.cache = cache or default_cache_service
+        self.max_results = max_results or settings.YOUTUBE_SAVED_SEARCH_MAX_RESULTS
+
+    def _key(self, search_id: str) -> str:
+        return f"{SAVED_SEARCH_KEY_PREFIX}:{search_id}"
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{USER_SEARCHES_KEY_PREFIX}:{user_id}"
+
+    def _results_key(self, search_id: str) -> str:
+        return f"{RESULTS_KEY_PREFIX}:{search_id}"
+
+    def create(
+        self,
+        user_id: str,
+        name: str,
+        query: str,
+        interval: int,
+        region_code: Optional[str] = None,
+        video_duration: Optional[str] = None,
+        order: str = "relevance",
+        api_key_encrypted: Optional[str] = None,
+        key_fingerprint: str = POOL_KEY_FINGERPRINT,
+    ) -> Dict[str, Any]:
+        """
+        검색 저장 (즉시 실행 예정으로 등록)
+
+        Args:
+            user_id: 사용자 ID
+            name: 검색 이름
+            query: 검색 키워드
+            interval: 재실행 주기 (초)
+            region_code: 국가 코드
+            video_duration: 영상 길이 (short, medium, long, any)
+            order: 정렬 기준
+            api_key_encrypted: 암호화된 사용자 YouTube API 키 (없으면 서버 키 풀)
+            key_fingerprint: API 키 식별자 (스케줄러가 키별로 묶는 데 사용)
+
+        Returns:
+            Dict[str, Any]: 저장된 검색 레코드
+        """
+        now = time.time()
+        record = {
+            "id": uuid4().hex,
+            "user_id": str(user_id),
+            "name": name,
+            "query": " ".join(query.split()),
+            "region_code": region_code,
+            "video_duration": video_duration,
+            "order": order,
+            "interval": interval,
+            "api_key_encrypted": api_key_encrypted,
+            "key_fingerprint": key_fingerprint,
+            "created_at": now,
+            "last_run_at": None,
+            "next_run_at": now,
+            "last_error": None,
+        }
+        self.cache.set(self._key(record["id"]), record)
+        self.cache.client.sadd(self._user_key(record["user_id"]), record["id"])
+        self.cache.client.zadd(DUE_KEY, {record["id"]: now})
+        record["last_viewed_at"] = 0.0
+        return record
+
+    def get(self, search_id: str) -> Optional[Dict[str, Any]]:
+        """저장된 검색 레코드 조회 (마지막 확인 시각 포함)"""
+        record = self.cache.get(self._key(search_id))
+        if record:
+            record["last_viewed_at"] = self.cache.client.zscore(VIEWED_KEY, search_id) or 0.0
+        return record
+
+    def mark_viewed(self, search_id: str, viewed_at: float) -> None:
+        """
+        마지막 확인 시각 갱신 (이전 값보다 클 때만, ZADD GT)
+
+        Args:
+            search_id: 저장된 검색 ID
+            viewed_at: 확인한 마지막 결과의 발견 시각
+        """
+        self.cache.client.zadd(VIEWED_KEY, {search_id: viewed_at}, gt=True)
+
+    def list_for_user(self, user_id: str) -> List[Dict[str, Any]]:
+        """
+        사용자의 저장된 검색 목록 (생성 순)
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            List[Dict[str, Any]]: 저장된 검색 레코드 목록
+        """
+        search_ids = list(self.cache.client.smembers(self._user_key(str(user_id))))
+        records = self.cache.get_many([self._key(sid) for sid in search_ids])
+        viewed = self.cache.client.zmscore(VIEWED_KEY, search_ids) if search_ids else []
+        for search_id, viewed_at in zip(search_ids, viewed):
+            if self._key(search_id) in records:
+                records[self._key(search_id)]["last_viewed_at"] = viewed_at or 0.0
+        return sorted(records.values(), key=lambda record: record["created_at"])
+
+    def count_for_user(self, user_id: str) -> int:
+        """사용자의 저장된 검색 수"""
+        return self.cache.client.scard(self._user_key(str(user_id)))
+
+    def delete(self, record: Dict[str, Any]) -> None:
+        """저장된 검색과 결과 집합 삭제"""
+        self.cache.client.srem(self._user_key(record["user_id"]), record["id"])
+        self.cache.client.zrem(DUE_KEY, record["id"])
+        self.cache.client.zrem(VIEWED_KEY, record["id"])
+        self.cache.delete(self._results_key(record["id"]))
+        self.cache.delete(self._key(record["id"]))
+
+    def due(self, now: float, limit: int) -> List[Dict[str, Any]]:
+        """
+        실행 예정 시각이 지난 검색 조회 (예정 시각 순)
+
+        Args:
+            now: 기준 시각 (UNIX timestamp)
+            limit: 최대 개수
+
+        Returns:
+            List[Dict[str, Any]]: 저장된 검색 레코드 목록
+        """
+        search_ids = self.cache.client.zrangebyscore(DUE_KEY, 0, now, start=0, num=limit)
+        records = self.cache.get_many([self._key(sid) for sid in search_ids])
+        return [records[self._key(sid)] for sid in search_ids if self._key(sid) in records]
+
+    def schedule(self, record: Dict[str, Any], run_at: float) -> bool:
+        """
+        실행 결과(last_run_at, last_error)와 다음 실행 예정 시각 저장
+
+        레코드와 실행 일정이 남아 있을 때만 갱신합니다 (SET XX, ZADD XX).
+        실행 중 삭제된 검색은 되살리지 않고 실행 중 추가된 결과 집합을 정리합니다.
+
+        Args:
+            record: 저장된 검색 레코드
+            run_at: 다음 실행 예정 시각
+
+        Returns:
+            bool: 갱신 여부 (삭제된 검색이면 False)
+        """
+        record["next_run_at"] = run_at
+        stored = {key: value for key, value in record.items() if key != "last_viewed_at"}
+        if not self.cache.client.set(
+            self._key(record["id"]), json.dumps(stored, ensure_ascii=False), xx=True
+        ):
+            logger.info(f"삭제된 저장된 검색 실행 결과 폐기: search_id={record['id']}")
+            self.cache.delete(self._results_key(record["id"]))
+            return False
+        self.cache.client.zadd(DUE_KEY, {record["id"]: run_at}, xx=True)
+        return True
+
+    def merge_results(self, search_id: str, video_ids: List[str], found_at: float) -> int:
+        """
+        결과 집합에 영상 병합 (이미 있는 영상은 처음 발견한 시각 유지)
+
+        영상마다 발견 시각을 FOUND_AT_STEP씩 늘려 같은 실행에서 발견한 영상도 순서가 정해지도록 합니다.
+
+        Args:
+            search_id: 저장된 검색 ID
+            video_ids: 검색된 영상 ID 목록 (검색 결과 순)
+            found_at: 발견 시각 (UNIX timestamp)
+
+        Returns:
+            int: 새로 추가된 영상 수
+        """
+        if not video_ids:
+            return 0
+        key = self._results_key(search_id)
+        # 검색 결과 앞쪽(상위) 영상이 더 최근 발견으로 정렬되도록 역순으로 시각 부여
+        count = len(video_ids)
+        pipe = self.cache.client.pipeline(transaction=False)
+        pipe.zadd(
+            key,
+            {
+                video_id: found_at + (count - index) * FOUND_AT_STEP
+                for index, video_id in enumerate(video_ids)
+            },
+            nx=True,
+        )
+        # 오래된 결과부터 제거하여 최근 max_results개만 보관
+        pipe.zremrangebyrank(key, 0, -self.max_results - 1)
+        added, _ = pipe.execute()
+        return added
+
+    def results_since(
+        self, search_id: str, since: float, limit: int, oldest_first: bool = False
+    ) -> Tuple[List[Tuple[str, float]], int]:
+        """
+        기준 시각 이후 발견된 영상 조회
+
+        Args:
+            search_id: 저장된 검색 ID
+            since: 기준 시각 (UNIX timestamp, 이 시각 이후 발견된 영상만)
+            limit: 최대 개수
+            oldest_first: True면 기준 시각 직후부터 limit개 (확인 표시용, 나머지는 더 최근 결과),
+                False면 최근 발견 순으로 limit개
+
+        Returns:
+            Tuple[List[Tuple[str, float]], int]: ([(영상 ID, 발견 시각)], 기준 시각 이후 전체 개수)
+        """
+        key = self._results_key(search_id)
+        pipe = self.cache.client.pipeline(transaction=False)
+        if oldest_first:
+            pipe.zrangebyscore(key, f"({since}", "+inf", start=0, num=limit, withscores=True)
+        else:
+            pipe.zrevrangebyscore(key, "+inf", f"({since}", start=0, num=limit, withscores=True)
+        pipe.zcount(key, f"({since}", "+inf")
+        results, total = pipe.execute()
+        return [(video_id, score) for video_id, score in results], total
+
+
+async def run_saved_search(
+    youtube_service: YouTubeSearchService,
+    store: SavedSearchStore,
+    record: Dict[str, Any],
+    now: Optional[float] = None,
+) -> int:
+    """
+    저장된 검색 1회 증분 실행 (search.list 1회)
+
+    마지막 실행 시각 이후 게시된 영상만 조회하여 결과 집합에 병합하고 다음 실행을 예약합니다.
+
+    Args:
+        youtube_service: YouTube 검색 서비스 (검색 소유자의 API 키)
+        store: 저장된 검색 저장소
+        record: 저장된 검색 레코드
+        now: 실행 시각 (기본값: 현재)
+
+    Returns:
+        int: 새로 발견한 영상 수
+
+    Raises:
+        QuotaExceededError: API 할당량 초과
+        YouTubeAPIError: YouTube API 오류
+    """
+    now = now or time.time()
+    published_after = None
+    if record.get("last_run_at"):
+        published_after = (
+            datetime.fromtimestamp(record["last_run_at"], tz=timezone.utc) - INCREMENTAL_OVERLAP
+        )
+
+    video_ids, _ = await youtube_service.search_video_ids(
+        query=record["query"],
+        region_code=record.get("region_code"),
+        published_after=published_after,
+        video_duration=record.get("video_duration"),
+        order=record.get("order") or "relevance",
+    )
+    added = store.merge_results(record["id"], video_ids, now)
+
+    record["last_run_at"] = now
+    record["last_error"] = None
+    store.schedule(record, now + record["interval"])
+    return added
+
+
+def default_service_factory(record: Dict[str, Any]) -> YouTubeSearchService:
+    """저장된 검색 소유자의 API 키(없으면 서버 키 풀)로 검색 서비스 생성"""
+    api_key = None
+    if record.get("api_key_encrypted"):
+        from src.core.encryption import get_encryption_service
+
+        api_key = get_encryption_service().decrypt(record["api_key_encrypted"])
+    return get_search_service(api_key).for_user(record["user_id"])
+
+
+async def run_due_saved_searches(
+    store: SavedSearchStore,
+    service_factory: ServiceFactory = default_service_factory,
+    now: Optional[float] = None,
+    per_key_limit: Optional[int] = None,
+    batch_size: int = 500,
+) -> Dict[str, int]:
+    """
+    실행 예정 시각이 지난 저장된 검색을 API 키별로 묶어 실행
+
+    키마다 예정 시각이 이른 검색부터 per_key_limit개만 실행하고,
+    나머지는 다음 주기로 미룹니다 (search.list 1회 = 100 unit).
+    키 예산이 부족하면 그 키의 남은 검색을, 사용자 예산이 부족하면
+    그 사용자의 검색만 예산이 회복되는 시각으로 미룹니다.
+    같은 키의 검색은 순서대로 실행하고, 키 사이에는 동시에 실행합니다.
+
+    Args:
+        store: 저장된 검색 저장소
+        service_factory: 검색 레코드 → YouTube 검색 서비스
+        now: 기준 시각 (기본값: 현재)
+        per_key_limit: 키별 1회 실행 개수 (기본값: settings.YOUTUBE_SAVED_SEARCH_PER_KEY_LIMIT)
+        batch_size: 한 번에 조회할 실행 예정 검색 수
+
+    Returns:
+        Dict[str, int]: {"due", "executed", "deferred", "failed", "new_videos"}
+    """
+    now = now or time.time()
+    per_key_limit = per_key_limit or settings.YOUTUBE_SAVED_SEARCH_PER_KEY_LIMIT
+
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+    for record in store.due(now, batch_size):
+        groups.setdefault(record.get("key_fingerprint", POOL_KEY_FINGERPRINT), []).append(record)
+
+    summary = {"due": 0, "executed": 0, "deferred": 0, "failed": 0, "new_videos": 0}
+
+    async def run_group(records: List[Dict[str, Any]]):
+        summary["due"] += len(records)
+        summary["deferred"] += max(len(records) - per_key_limit, 0)
+        # 사용자 일일 예산이 부족한 사용자 → 예산이 회복되는 시각
+        user_retry_at: Dict[str, float] = {}
+        for record in records[:per_key_limit]:
+            if record["user_id"] in user_retry_at:
+                store.schedule(record, user_retry_at[record["user_id"]])
+                summary["failed"] += 1
+                continue
+            try:
+                summary["new_videos"] += await run_saved_search(
+                    service_factory(record), store, record, now
+                )
+                summary["executed"] += 1
+            except QuotaBudgetExceededError as e:
+                if e.scope == "user":
+                    # 해당 사용자의 검색만 미루고 같은 키의 다른 사용자 검색은 계속 실행
+                    logger.warning(
+                        f"저장된 검색 사용자 예산 부족: user_id={record['user_id']}"
+                    )
+                    user_retry_at[record["user_id"]] = now + e.details.get("retry_after", 3600)
+                    store.schedule(record, user_retry_at[record["user_id"]])
+                    summary["failed"] += 1
+                    continue
+                # 이 키의 예산이 부족하면 남은 검색은 예산이 회복되는 시각으로 미룸
+                logger.warning(
+                    f"저장된 검색 실행 중단 (할당량 예산 부족): key={record['key_fingerprint']}"
+                )
+                retry_at = now + e.details.get("retry_after", 3600)
+                for pending in records[records.index(record):per_key_limit]:
+                    store.schedule(pending, retry_at)
+                    summary["failed"] += 1
+                return
+            except Exception as e:
+                logger.warning(f"저장된 검색 실행 실패: search_id={record['id']}, error={e}")
+                record["last_error"] = str(e)
+                store.schedule(record, now + RETRY_DELAY)
+                summary["failed"] += 1
+
+    await asyncio.gather(*(run_group(records) for records in groups.values()))
+
+    logger.info(
+        f"저장된 검색 실행: keys={len(groups)}, executed={summary['executed']}, "
+        f"deferred={summary['deferred']}, failed={summary['failed']}, "
+        f"new_videos={summary['new_videos']}"
+    )
+    return summary
+
+
+# 전역 저장된 검색 저장소 인스턴스
+_saved_search_store: Optional[SavedSearchStore] = None
+
+
+def get_saved_search_store() -> SavedSearchStore:
+    """
+    전역 저장된 검색 저장소 반환
+
+    Returns:
+        SavedSearchStore: 저장된 검색 저장소
+    """
+    global _saved_search_store
+
+    if _saved_search_store is None:
+        _saved_search_store = SavedSearchStore()
+
+    return _saved_search_store
@@ -0,0 +1,422 @@
+"""
+YouTube 검색 응답 캐시 (stale-while-revalidate + single-flight)
+
+검색 결과(영상 ID 목록)를 신선 기간(fresh TTL) 이후에도 stale 기간 동안 보관하여
+만료 직후에도 즉시 응답하고, 갱신은 키당 하나의 작업만 수행합니다.
+
+- 같은 워커의 동시 요청: 진행 중인 asyncio 작업을 공유 (사용자 예산/API 키 오류는 공유하지 않음)
+- 다른 워커의 동시 요청: Redis 락(SET NX)을 얻지 못하면 갱신 결과를 기다림
+- 필터 결과 추가 조회(fill) 페이지: 기본 검색 키 + 페이지 토큰별로 같은 방식으로 캐시
+
+캐시 키는 YouTube에 전달되는 기본 검색 조건만으로 구성합니다(상위 결과 집합).
+조회수/구독자 수/쇼츠 필터와 정확한 기간 경계는 캐시된 결과에 로컬로 적용합니다.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+from uuid import uuid4
+
+import redis
+
+from src.config import settings
+from src.core.cache import CacheService, cache_service as default_cache_service
+from src.core.youtube.exceptions import InvalidAPIKeyError, QuotaBudgetExceededError
+from src.core.youtube.utils import MAX_IDS_PER_REQUEST, bucket_datetime, build_cache_key
+
+logger = logging.getLogger(__name__)
+
+# 락 소유자만 삭제하는 Lua 스크립트 (compare-and-delete)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+SearchLoader = Callable[[], Awaitable[Dict[str, Any]]]
+
+# 기본 검색은 항상 search.list 최대치로 조회 (25개/50개 요청 모두 100 unit)
+SEARCH_SUPERSET_SIZE = MAX_IDS_PER_REQUEST
+
+
+def normalize_search_query(query: str) -> str:
+    """검색어 정규화 (앞뒤 공백 제거, 연속 공백 축약, 대소문자 통일)"""
+    return " ".join(query.split()).casefold()
+
+
+def build_search_base_key(
+    query: str,
+    region_code: Optional[str] = None,
+    published_after: Optional[datetime] = None,
+    published_before: Optional[datetime] = None,
+    video_duration: Optional[str] = None,
+    order: str = "relevance",
+    bucket_seconds: Optional[int] = None,
+) -> Tuple[str, Optional[datetime], Optional[datetime]]:
+    """
+    기본 검색 캐시 키 생성
+
+    로컬 필터(최소 조회수/구독자 수, 쇼츠)와 max_results는 키에서 제외하고,
+    기간 경계는 버킷 단위로 넓혀 같은 상위 결과를 공유하도록 합니다.
+
+    Args:
+        query: 검색 키워드
+        region_code: 국가 코드
+        published_after: 업로드 시작 날짜
+        published_before: 업로드 종료 날짜
+        video_duration: 영상 길이 (short, medium, long, any)
+        order: 정렬 기준
+        bucket_seconds: 기간 버킷 크기 (기본값: settings.YOUTUBE_SEARCH_DATE_BUCKET)
+
+    Returns:
+        Tuple[str, Optional[datetime], Optional[datetime]]:
+            (캐시 키, 버킷 시작 날짜, 버킷 종료 날짜) - 버킷 날짜로 YouTube API를 호출
+    """
+    bucket_seconds = bucket_seconds or settings.YOUTUBE_SEARCH_DATE_BUCKET
+    after = bucket_datetime(published_after, bucket_seconds)
+    before = bucket_datetime(published_before, bucket_seconds, round_up=True)
+
+    cache_key = build_cache_key(
+        "youtube:search",
+        q=normalize_search_query(query),
+        region=region_code.upper() if region_code else None,
+        after=int(after.timestamp()) if after else None,
+        before=int(before.timestamp()) if before else None,
+        duration=video_duration if video_duration != "any" else None,
+        order=order,
+    )
+    return cache_key, after, before
+
+
+def base_search_loader(
+    youtube_service: Any,
+    query: str,
+    region_code: Optional[str] = None,
+    published_after: Optional[datetime] = None,
+    published_before: Optional[datetime] = None,
+    video_duration: Optional[str] = None,
+    order: str = "relevance",
+) -> SearchLoader:
+    """
+    기본 검색(필터 없는 상위 결과 집합) loader 생성
+
+    Args:
+        youtube_service: YouTubeSearchService
+        query: 검색 키워드
+        region_code: 국가 코드
+        published_after: 버킷 시작 날짜 (build_search_base_key 반환값)
+        published_before: 버킷 종료 날짜 (build_search_base_key 반환값)
+        video_duration: 영상 길이
+        order: 정렬 기준
+
+    Returns:
+        SearchLoader: 영상 ID 목록과 다음 페이지 토큰을 반환하는 함수
+    """
+
+    async def load() -> Dict[str, Any]:
+        video_ids, next_page_token = await youtube_service.search_video_ids(
+            query=query,
+            max_results=SEARCH_SUPERSET_SIZE,
+            region_code=region_code,
+            published_after=published_after,
+            published_before=published_before,
+            video_duration=video_duration,
+            order=order,
+        )
+        # 영상 ID 목록과 쿼리 메타데이터만 저장 (영상 정보는 영상별 레코드 캐시)
+        return {
+            "video_ids": video_ids,
+            "next_page_token": next_page_token,
+            "query": query,
+            "total_results": len(video_ids),
+        }
+
+    return load
+
+
+class SearchResponseCache:
+    """검색 응답 캐시 (stale-while-revalidate)"""
+
+    LOCK_PREFIX = "youtube:search_lock"
+    PAGE_PREFIX = "youtube:search_page"
+    PASS_RATE_PREFIX = "youtube:search_pass_rate"
+    # 필터 통과율 지수이동평균 가중치 / 보관 기간
+    PASS_RATE_ALPHA = 0.3
+    PASS_RATE_TTL = 7 * 24 * 3600
+
+    def __init__(
+        self,
+        cache: Optional[CacheService] = None,
+        fresh_ttl: Optional[int] = None,
+        stale_ttl: Optional[int] = None,
+        lock_ttl: Optional[int] = None,
+        wait_timeout: float = 10.0,
+        poll_interval: float = 0.1,
+    ):
+        """
+        검색 응답 캐시 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            fresh_ttl: 신선 기간 (초, 기본값: settings.YOUTUBE_SEARCH_CACHE_TTL)
+            stale_ttl: 신선 기간 이후 stale 응답 허용 기간 (초)
+            lock_ttl: 갱신 락 만료 시간 (초)
+            wait_timeout: 다른 워커의 갱신을 기다리는 최대 시간 (초)
+            poll_interval: 갱신 결과 확인 간격 (초)
+        """
+        self.cache = cache or default_cache_service
+        self.fresh_ttl = fresh_ttl or settings.YOUTUBE_SEARCH_CACHE_TTL
+        self.stale_ttl = stale_ttl or settings.YOUTUBE_SEARCH_STALE_TTL
+        self.lock_ttl = lock_ttl or settings.YOUTUBE_SEARCH_LOCK_TTL
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시된 검색 결과 조회
+
+        Args:
+            key: 검색 캐시 키
+
+        Returns:
+            Optional[Dict[str, Any]]: {"video_ids", "query", ..., "stale": bool} (없으면 None)
+        """
+        entry = self.cache.get(key)
+        if not isinstance(entry, dict) or "video_ids" not in entry:
+            return None
+        entry["stale"] = time.time() >= entry.get("fresh_until", float("inf"))
+        return entry
+
+    def set(self, key: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        검색 결과 저장 (fresh_ttl + stale_ttl 동안 보관)
+
+        Args:
+            key: 검색 캐시 키
+            payload: {"video_ids": [...], "query": ..., "total_results": ...}
+
+        Returns:
+            Dict[str, Any]: 저장된 항목
+        """
+        entry = {
+            **payload,
+            "cached_at": datetime.utcnow().isoformat(),
+            "fresh_until": time.time() + self.fresh_ttl,
+        }
+        self.cache.set(key, entry, ttl=self.fresh_ttl + self.stale_ttl)
+        entry["stale"] = False
+        return entry
+
+    def _pass_rate_key(
+        self,
+        key: str,
+        min_view_count: Optional[int],
+        min_subscriber_count: Optional[int],
+        shorts_only: bool,
+    ) -> str:
+        return build_cache_key(
+            f"{self.PASS_RATE_PREFIX}:{key}",
+            views=min_view_count or None,
+            subscribers=min_subscriber_count or None,
+            shorts=shorts_only or None,
+        )
+
+    def get_pass_rate(
+        self,
+        key: str,
+        min_view_count: Optional[int] = None,
+        min_subscriber_count: Optional[int] = None,
+        shorts_only: bool = False,
+    ) -> Optional[float]:
+        """
+        검색/필터 조합의 학습된 필터 통과율 조회
+
+        Args:
+            key: 기본 검색 캐시 키
+            min_view_count: 최소 조회수
+            min_subscriber_count: 최소 구독자 수
+            shorts_only: 쇼츠만 포함 여부
+
+        Returns:
+            Optional[float]: 통과율 (0~1, 기록이 없으면 None)
+        """
+        entry = self.cache.get(
+            self._pass_rate_key(key, min_view_count, min_subscriber_count, shorts_only)
+        )
+        return entry.get("rate") if isinstance(entry, dict) else None
+
+    def record_pass_rate(
+        self,
+        key: str,
+        passed: int,
+        scanned: int,
+        min_view_count: Optional[int] = None,
+        min_subscriber_count: Optional[int] = None,
+        shorts_only: bool = False,
+    ) -> Optional[float]:
+        """
+        필터 통과 관측치를 지수이동평균으로 반영
+
+        Args:
+            key: 기본 검색 캐시 키
+            passed: 필터를 통과한 영상 수
+            scanned: 필터를 적용한 영상 수
+            min_view_count: 최소 조회수
+            min_subscriber_count: 최소 구독자 수
+            shorts_only: 쇼츠만 포함 여부
+
+        Returns:
+            Optional[float]: 갱신된 통과율 (관측치가 없으면 None)
+        """
+        if scanned <= 0:
+            return None
+        rate_key = self._pass_rate_key(key, min_view_count, min_subscriber_count, shorts_only)
+        observed = passed / scanned
+        entry = self.cache.get(rate_key)
+        if isinstance(entry, dict) and entry.get("rate") is not None:
+            rate = (1 - self.PASS_RATE_ALPHA) * entry["rate"] + self.PASS_RATE_ALPHA * observed
+            samples = entry.get("samples", 0) + 1
+        else:
+            rate, samples = observed, 1
+        self.cache.set(rate_key, {"rate": rate, "samples": samples}, ttl=self.PASS_RATE_TTL)
+        return rate
+
+    async def get_page(
+        self, key: str, page_token: str, loader: SearchLoader
+    ) -> Dict[str, Any]:
+        """
+        기본 검색 다음 페이지 조회 (필터 결과 추가 조회용, 페이지 토큰별 캐시 + single-flight)
+
+        같은 검색/필터 조합의 반복 요청이 search.list(100 unit)를 다시 호출하지 않도록
+        기본 검색 결과와 같은 TTL로 보관합니다. stale 페이지는 재사용하지 않고 갱신합니다.
+
+        Args:
+            key: 기본 검색 캐시 키
+            page_token: 페이지 토큰
+            loader: 페이지를 조회하여 {"video_ids", "next_page_token"}을 반환하는 함수
+
+        Returns:
+            Dict[str, Any]: {"video_ids": [...], "next_page_token": ..., "stale": False}
+        """
+        page_key = f"{self.PAGE_PREFIX}:{key}:{page_token}"
+        entry = self.get(page_key)
+        if entry is None or entry["stale"]:
+            entry = await self.refresh(page_key, loader)
+        return entry
+
+    async def refresh(self, key: str, loader: SearchLoader) -> Dict[str, Any]:
+        """
+        검색 결과 갱신 (single-flight)
+
+        같은 키의 갱신이 이미 진행 중이면 새로 호출하지 않고 그 결과를 기다립니다.
+        진행 중인 갱신이 그 호출자의 예산/API 키 문제로 실패한 경우에는
+        기다리던 호출자가 자신의 loader로 다시 갱신합니다.
+
+        Args:
+            key: 검색 캐시 키
+            loader: YouTube API 검색을 수행하고 payload를 반환하는 함수
+
+        Returns:
+            Dict[str, Any]: 갱신된 캐시 항목
+        """
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._refresh_across_workers(key, loader))
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda done: self._forget(key, done))
+            return await asyncio.shield(inflight)
+
+        logger.info(f"진행 중인 검색 갱신 대기: key={key}")
+        try:
+            return await asyncio.shield(inflight)
+        except (QuotaBudgetExceededError, InvalidAPIKeyError) as e:
+            # 다른 사용자의 일일 예산/키 문제는 공유하지 않음
+            logger.info(f"공유 검색 갱신이 호출자 한정 오류로 실패, 직접 갱신: key={key}, error={e}")
+            self._forget(key, inflight)
+            return await self.refresh(key, loader)
+
+    def _forget(self, key: str, inflight: asyncio.Future):
+        """완료된 갱신 작업을 진행 중 목록에서 제거 (이후 시작된 작업은 유지)"""
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+
+    async def refresh_in_background(self, key: str, loader: SearchLoader):
+        """stale 응답 반환 후 백그라운드 갱신 (오류는 로그만 남김)"""
+        try:
+            await self.refresh(key, loader)
+            logger.info(f"stale 검색 결과 백그라운드 갱신 완료: key={key}")
+        except Exception as e:
+            logger.warning(f"stale 검색 결과 백그라운드 갱신 실패: key={key}, error={e}")
+
+    async def _refresh_across_workers(
+        self, key: str, loader: SearchLoader
+    ) -> Dict[str, Any]:
+        """Redis 락을 얻은 워커만 YouTube API를 호출하고 나머지는 결과를 기다림"""
+        lock_key = f"{self.LOCK_PREFIX}:{key}"
+        token = uuid4().hex
+
+        if self._acquire_lock(lock_key, token):
+            try:
+                return self.set(key, await loader())
+            finally:
+                self._release_lock(lock_key, token)
+
+        previous = self.get(key)
+        previous_cached_at = previous.get("cached_at") if previous else None
+        logger.info(f"다른 워커의 검색 갱신 대기: key={key}")
+
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            entry = self.get(key)
+            if entry and entry.get("cached_at") != previous_cached_at:
+                return entry
+            if not self._lock_exists(lock_key):
+                break
+
+        # 락 소유 워커가 실패했거나 시간 초과: 직접 조회
+        logger.warning(f"검색 갱신 대기 실패, 직접 조회: key={key}")
+        return self.set(key, await loader())
+
+    def _acquire_lock(self, lock_key: str, token: str) -> bool:
+        try:
+            return bool(self.cache.client.set(lock_key, token, nx=True, ex=self.lock_ttl))
+        except redis.RedisError as e:
+            # Redis 장애 시 워커 간 조율 없이 진행
+            logger.warning(f"검색 갱신 락 획득 실패 (lock={lock_key}): {str(e)}")
+            return True
+
+    def _release_lock(self, lock_key: str, token: str):
+        try:
+            self.cache.client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, token)
+        except redis.RedisError as e:
+            logger.warning(f"검색 갱신 락 해제 실패 (lock={lock_key}): {str(e)}")
+
+    def _lock_exists(self, lock_key: str) -> bool:
+        try:
+            return self.cache.client.exists(lock_key) > 0
+        except redis.RedisError:
+            return False
+
+
+# 전역 검색 응답 캐시 인스턴스
+_search_response_cache: Optional[SearchResponseCache] = None
+
+
+def get_search_response_cache() -> SearchResponseCache:
+    """
+    전역 검색 응답 캐시 반환
+
+    Returns:
+        SearchResponseCache: 검색 응답 캐시
+    """
+    global _search_response_cache
+
+    if _search_response_cache is None:
+        _search_response_cache = SearchResponseCache()
+
+    return _search_response_cache
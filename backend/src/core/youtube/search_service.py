@@ -1,24 +1,161 @@
 """YouTube 검색 서비스"""
 
-from typing import Optional, List, Dict, Any
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 from datetime import datetime
+from functools import partial
+import asyncio
+import copy
 import logging
-
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
+import math
+import statistics
 
 from src.config import settings
-from src.core.youtube.exceptions import YouTubeAPIError, QuotaExceededError
-from src.core.youtube.utils import parse_iso8601_duration
+from src.core.cache import CacheService, cache_service as default_cache_service
+from src.core.youtube.exceptions import (
+    YouTubeAPIError,
+    YouTubeHTTPError,
+    QuotaExceededError,
+    QuotaBudgetExceededError,
+)
+from src.core.youtube.key_pool import (
+    ERROR_COOLDOWN_SECONDS,
+    YouTubeAPIKeyPool,
+    get_key_pool,
+)
+from src.core.youtube.quota_ledger import (
+    QUOTA_UNIT_COSTS,
+    YouTubeQuotaLedger,
+    get_quota_ledger,
+)
+from src.core.youtube.client import YouTubeClientRegistry
+from src.core.youtube.entity_cache import (
+    ChannelBaselineStore,
+    ChannelStatsStore,
+    CommentThreadStore,
+    RevalidatingStore,
+    VideoRecordStore,
+)
+from src.core.youtube.http_client import get_youtube_http_client
+from src.core.youtube.video_record import VideoRecord
+from src.core.youtube.utils import (
+    MAX_IDS_PER_REQUEST,
+    chunked,
+    parse_published_at,
+    to_utc,
+)
 
 logger = logging.getLogger(__name__)
 
+# 키 풀에서 해당 키만 제외하고 다음 키로 재시도할 오류 reason
+KEY_ERROR_REASONS = ("keyInvalid", "keyExpired", "ipRefererBlocked", "accessNotConfigured")
+
+# 채널 업로드 재생목록 ID / 크롤링 재개 시점 캐시
+UPLOADS_PLAYLIST_KEY_PREFIX = "youtube:uploads_playlist"
+UPLOADS_PLAYLIST_TTL = 7 * 24 * 3600
+CRAWL_CURSOR_KEY_PREFIX = "youtube:channel_crawl"
+CRAWL_CURSOR_TTL = 90 * 24 * 3600
+
+# 채널 기준선 백그라운드 갱신 중인 채널 / 실행 중인 태스크 (프로세스 단위, GC 방지용 참조 유지)
+_baseline_refreshing: Set[str] = set()
+_background_tasks: Set["asyncio.Task[None]"] = set()
+
+# 적응형 추가 조회 페이지 크기 (통과율 추정 오차를 고려한 여유 배율)
+MIN_FILL_PAGE_SIZE = 10
+MIN_PASS_RATE = 0.02
+FILL_SAFETY_MARGIN = 1.25
+
+
+def estimate_fill_page_size(needed: int, pass_rate: Optional[float]) -> int:
+    """
+    필요한 필터 통과 영상 수와 통과율로 다음 search.list 페이지 크기 추정
+
+    Args:
+        needed: 추가로 필요한 필터 통과 영상 수
+        pass_rate: 필터 통과율 (0~1, 없으면 최대 페이지)
+
+    Returns:
+        int: 페이지 크기 (10~50)
+    """
+    if not pass_rate:
+        return MAX_IDS_PER_REQUEST
+    estimate = math.ceil(needed / max(pass_rate, MIN_PASS_RATE) * FILL_SAFETY_MARGIN)
+    return max(MIN_FILL_PAGE_SIZE, min(MAX_IDS_PER_REQUEST, estimate))
+
+
+def summarize_view_counts(view_counts: Sequence[int]) -> Dict[str, Any]:
+    """
+    최근 업로드 조회수 요약 (채널 기준선)
+
+    Args:
+        view_counts: 최근 업로드 영상 조회수 목록
+
+    Returns:
+        Dict[str, Any]: {"median_views", "mean_views", "sample_size"}
+    """
+    return {
+        "median_views": float(statistics.median(view_counts)),
+        "mean_views": statistics.fmean(view_counts),
+        "sample_size": len(view_counts),
+    }
+
+
+def comment_record(comment: Dict[str, Any], reply_count: int = 0) -> Dict[str, Any]:
+    """
+    comment 리소스 → 댓글 레코드
+
+    Args:
+        comment: YouTube comment 리소스 (topLevelComment 또는 답글)
+        reply_count: 답글 수 (스레드의 totalReplyCount)
+
+    Returns:
+        Dict[str, Any]: 댓글 레코드
+    """
+    snippet = comment.get("snippet", {})
+    return {
+        "comment_id": comment.get("id", ""),
+        "author": snippet.get("authorDisplayName", ""),
+        "author_channel_id": snippet.get("authorChannelId", {}).get("value", ""),
+        "text": snippet.get("textDisplay", ""),
+        "like_count": snippet.get("likeCount", 0),
+        "published_at": snippet.get("publishedAt", ""),
+        "reply_count": reply_count,
+    }
+
 
 class YouTubeSearchService:
     """YouTube 검색 서비스 클래스"""
 
-    def __init__(self, api_key: Optional[str] = None):
-        """YouTube API 클라이언트 초기화"""
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        cache: Optional[CacheService] = None,
+        quota_ledger: Optional[YouTubeQuotaLedger] = None,
+        key_pool: Optional[YouTubeAPIKeyPool] = None,
+        refresh_baselines: bool = True,
+        user_key: bool = False,
+    ):
+        """
+        YouTube API 클라이언트 초기화
+
+        Args:
+            api_key: YouTube Data API 키 (기본값: settings.YOUTUBE_API_KEY)
+            cache: 엔티티 캐시용 캐시 서비스 (기본값: 전역 CacheService)
+            quota_ledger: 할당량 원장 (기본값: 전역 원장)
+            key_pool: API 키 풀 (지정 시 호출마다 잔여 할당량이 가장 많은 키 사용)
+            refresh_baselines: 기준선이 없거나 오래된 채널을 백그라운드에서 갱신할지 여부
+            user_key: 사용자가 지정한 API 키 여부 (사용자 자신의 할당량이므로 사용자별 한도에 집계하지 않음)
+        """
         self.api_key = (api_key or settings.YOUTUBE_API_KEY or "").strip()
 
         if not self.api_key or self.api_key == "placeholder-youtube-api-key":
@@ -26,7 +163,97 @@ class YouTubeSearchService:
                 "유효한 YouTube API 키가 설정되지 않았습니다. 설정에서 API 키를 저장한 후 다시 시도해주세요."
             )
 
-        self.youtube = build("youtube", "v3", developerKey=self.api_key)
+        # 프로세스 전역 httpx 커넥션 풀 공유 (이벤트 루프 비블로킹)
+        self.http = get_youtube_http_client()
+
+        # 검색/상세 조회가 공유하는 엔티티 캐시 (영상 레코드, 채널 통계, 댓글 스레드)
+        self.cache = cache or default_cache_service
+        self.video_store = VideoRecordStore(cache)
+        self.channel_stats_store = ChannelStatsStore(cache)
+        self.comment_store = CommentThreadStore(cache)
+        self.baseline_store = ChannelBaselineStore(cache)
+        self.refresh_baselines = refresh_baselines
+
+        # API 키/사용자별 quota unit 원장
+        self.quota_ledger = quota_ledger or get_quota_ledger()
+        self.key_pool = key_pool
+        self.user_key = user_key
+        self.user_id: Optional[str] = None
+
+    def for_user(self, user_id: Optional[Any]) -> "YouTubeSearchService":
+        """
+        요청 사용자 기준으로 할당량을 집계하는 서비스 사본 반환
+
+        HTTP 클라이언트와 캐시는 원본과 공유합니다.
+
+        Args:
+            user_id: 요청 사용자 ID
+
+        Returns:
+            YouTubeSearchService: 사용자 ID가 지정된 서비스
+        """
+        service = copy.copy(self)
+        service.user_id = str(user_id) if user_id is not None else None
+        return service
+
+    async def _request(self, resource: str, **params: Any) -> Dict[str, Any]:
+        """
+        YouTube Data API 비동기 호출 (resource: search, videos, channels 등)
+
+        호출 전에 할당량 원장에서 비용을 차감하며, 예산이 부족하면
+        QuotaBudgetExceededError를 발생시켜 API를 호출하지 않습니다.
+        키 풀이 있으면 잔여 할당량이 많은 키부터 시도하고, 예산 부족이나
+        quotaExceeded가 발생한 키는 건너뛰어 다음 키로 재시도합니다.
+        """
+        payload, _ = await self._conditional_request(resource, None, **params)
+        return payload
+
+    async def _conditional_request(
+        self, resource: str, etag: Optional[str], **params: Any
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        YouTube Data API 조건부 호출 (If-None-Match)
+
+        _request와 같은 할당량/키 풀 처리를 하며, etag가 있으면 재검증 요청을 보냅니다.
+
+        Returns:
+            Tuple[Optional[Dict[str, Any]], Optional[str]]:
+                (JSON 응답, 응답 ETag) - 변경이 없으면(304) (None, etag)
+        """
+        api_keys = self.key_pool.candidates() if self.key_pool else [self.api_key]
+        last_error: Optional[YouTubeAPIError] = None
+        # 사용자별 한도는 서버 키 사용량에만 적용
+        user_id = None if self.user_key else self.user_id
+
+        for api_key in api_keys:
+            try:
+                self.quota_ledger.charge(api_key, resource, user_id=user_id)
+            except QuotaBudgetExceededError as e:
+                if e.scope == "user":
+                    raise
+                last_error = e
+                continue
+
+            try:
+                return await self.http.get_conditional(
+                    resource, params, api_key=api_key, etag=etag
+                )
+            except YouTubeHTTPError as e:
+                if e.is_quota_exceeded:
+                    self.quota_ledger.mark_exhausted(api_key)
+                    if self.key_pool:
+                        self.key_pool.mark_cooldown(api_key, e.reason)
+                    last_error = e
+                    continue
+                if self.key_pool and e.reason in KEY_ERROR_REASONS:
+                    self.key_pool.mark_cooldown(
+                        api_key, e.reason, seconds=ERROR_COOLDOWN_SECONDS
+                    )
+                    last_error = e
+                    continue
+                raise
+
+        raise last_error or QuotaBudgetExceededError()
 
     async def search_videos(
         self,
@@ -60,47 +287,19 @@ class YouTubeSearchService:
             QuotaExceededError: API 할당량 초과
         """
         try:
-            # 검색 파라미터 구성
-            search_params = {
-                "part": "id,snippet",
-                "q": query,
-                "type": "video",
-                "maxResults": min(max_results, 50),  # 최대 50개 제한
-                "order": order,
-                "videoEmbeddable": "true",  # 임베디드 가능한 영상만
-                "videoSyndicated": "true",  # 신디케이트 가능한 영상만
-            }
-
-            # 선택적 파라미터 추가
-            if region_code:
-                search_params["regionCode"] = region_code
-
-            if published_after:
-                # YouTube API는 RFC 3339 형식 필요 (UTC timezone: Z suffix)
-                # timezone-aware datetime의 경우 +00:00를 Z로 변환
-                timestamp = published_after.isoformat()
-                if timestamp.endswith('+00:00'):
-                    timestamp = timestamp[:-6] + 'Z'
-                elif not timestamp.endswith('Z'):
-                    timestamp += 'Z'
-                search_params["publishedAfter"] = timestamp
-
-            if published_before:
-                # YouTube API는 RFC 3339 형식 필요 (UTC timezone: Z suffix)
-                # timezone-aware datetime의 경우 +00:00를 Z로 변환
-                timestamp = published_before.isoformat()
-                if timestamp.endswith('+00:00'):
-                    timestamp = timestamp[:-6] + 'Z'
-                elif not timestamp.endswith('Z'):
-                    timestamp += 'Z'
-                search_params["publishedBefore"] = timestamp
-
-            if video_duration:
-                search_params["videoDuration"] = video_duration
+            search_params = self._build_search_params(
+                query=query,
+                max_results=max_results,
+                region_code=region_code,
+                published_after=published_after,
+                published_before=published_before,
+                video_duration=video_duration,
+                order=order,
+            )
 
             # YouTube API 호출
             logger.info(f"YouTube 검색 시작: query={query}, max_results={max_results}")
-            search_response = self.youtube.search().list(**search_params).execute()
+            search_response = await self._request("search", **search_params)
 
             video_ids = [item["id"]["videoId"] for item in search_response.get("items", [])]
 
@@ -111,34 +310,343 @@ class YouTubeSearchService:
             # 영상 상세 정보 조회
             videos = await self.get_video_details(video_ids)
 
-            # 구독자 수 필터 적용
+            # 구독자 수 필터 적용 (상세 조회 시 가져온 채널 통계 재사용)
             if min_subscriber_count is not None:
-                videos = await self._filter_by_subscriber_count(
-                    videos, min_subscriber_count
-                )
+                videos = self._filter_by_subscriber_count(videos, min_subscriber_count)
 
             logger.info(f"YouTube 검색 완료: {len(videos)}개 영상")
             return videos
 
-        except HttpError as e:
-            if e.resp.status == 403:
+        except YouTubeHTTPError as e:
+            if e.status_code == 403:
                 logger.error("YouTube API 할당량 초과")
                 raise QuotaExceededError("YouTube API 할당량이 초과되었습니다.")
             logger.error(f"YouTube API 오류: {e}")
             raise YouTubeAPIError(f"YouTube API 오류: {e}")
+        except QuotaExceededError:
+            raise
         except Exception as e:
             logger.error(f"YouTube 검색 중 오류 발생: {e}")
             raise YouTubeAPIError(f"검색 중 오류가 발생했습니다: {e}")
 
-    async def get_video_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
+    def _build_search_params(
+        self,
+        query: str,
+        max_results: int = 25,
+        region_code: Optional[str] = None,
+        published_after: Optional[datetime] = None,
+        published_before: Optional[datetime] = None,
+        video_duration: Optional[str] = None,
+        order: str = "relevance",
+    ) -> Dict[str, Any]:
+        """search.list 요청 파라미터 구성"""
+        search_params = {
+            "part": "id,snippet",
+            "q": query,
+            "type": "video",
+            "maxResults": min(max_results, 50),  # 최대 50개 제한
+            "order": order,
+            "videoEmbeddable": "true",  # 임베디드 가능한 영상만
+            "videoSyndicated": "true",  # 신디케이트 가능한 영상만
+        }
+
+        # 선택적 파라미터 추가
+        if region_code:
+            search_params["regionCode"] = region_code
+
+        if published_after:
+            # YouTube API는 RFC 3339 형식 필요 (UTC timezone: Z suffix)
+            # timezone-aware datetime의 경우 +00:00를 Z로 변환
+            timestamp = published_after.isoformat()
+            if timestamp.endswith('+00:00'):
+                timestamp = timestamp[:-6] + 'Z'
+            elif not timestamp.endswith('Z'):
+                timestamp += 'Z'
+            search_params["publishedAfter"] = timestamp
+
+        if published_before:
+            # YouTube API는 RFC 3339 형식 필요 (UTC timezone: Z suffix)
+            # timezone-aware datetime의 경우 +00:00를 Z로 변환
+            timestamp = published_before.isoformat()
+            if timestamp.endswith('+00:00'):
+                timestamp = timestamp[:-6] + 'Z'
+            elif not timestamp.endswith('Z'):
+                timestamp += 'Z'
+            search_params["publishedBefore"] = timestamp
+
+        if video_duration:
+            search_params["videoDuration"] = video_duration
+
+        return search_params
+
+    async def iter_search_pages(
+        self,
+        query: str,
+        max_results: int = 200,
+        quota_budget: Optional[int] = None,
+        region_code: Optional[str] = None,
+        published_after: Optional[datetime] = None,
+        published_before: Optional[datetime] = None,
+        video_duration: Optional[str] = None,
+        order: str = "relevance",
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        nextPageToken을 따라 50개 이상의 검색 결과를 페이지 단위로 반환 (딥 검색)
+
+        한 페이지의 영상 상세 조회(videos.list)와 다음 페이지 검색(search.list)을
+        동시에 진행하므로 첫 페이지는 전체 조회가 끝나기 전에 반환됩니다.
+        페이지 간 중복 영상은 제외합니다.
+
+        Args:
+            query: 검색 키워드
+            max_results: 최대 결과 수
+            quota_budget: 검색에 사용할 최대 quota unit (search.list 1회 = 100 unit)
+            region_code: 국가 코드 (KR, JP, US 등)
+            published_after: 업로드 시작 날짜
+            published_before: 업로드 종료 날짜
+            video_duration: 영상 길이 (short, medium, long)
+            order: 정렬 기준 (relevance, date, viewCount, rating)
+
+        Yields:
+            List[Dict[str, Any]]: 페이지별 영상 정보 목록 (상세 정보 포함)
+
+        Raises:
+            YouTubeAPIError: YouTube API 오류
+            QuotaExceededError: API 할당량 초과
+        """
+        max_pages = -(-max_results // MAX_IDS_PER_REQUEST)
+        if quota_budget is not None:
+            max_pages = min(max_pages, quota_budget // QUOTA_UNIT_COSTS["search"])
+        if max_pages <= 0:
+            return
+
+        search_params = self._build_search_params(
+            query=query,
+            region_code=region_code,
+            published_after=published_after,
+            published_before=published_before,
+            video_duration=video_duration,
+            order=order,
+        )
+
+        def request_page(page_token: Optional[str]) -> "asyncio.Future[Dict[str, Any]]":
+            return asyncio.ensure_future(
+                self._search_page(search_params, page_token)
+            )
+
+        logger.info(
+            f"YouTube 딥 검색 시작: query={query}, max_results={max_results}, "
+            f"max_pages={max_pages}"
+        )
+        seen: set[str] = set()
+        remaining = max_results
+        pages_requested = 1
+        next_page = request_page(None)
+
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
+
+                video_ids = []
+                for item in response.get("items", []):
+                    video_id = item["id"]["videoId"]
+                    if video_id not in seen and len(video_ids) < remaining:
+                        seen.add(video_id)
+                        video_ids.append(video_id)
+                remaining -= len(video_ids)
+
+                # 다음 페이지 검색을 먼저 시작하고 현재 페이지 상세 조회와 병행
+                page_token = response.get("nextPageToken")
+                if page_token and remaining > 0 and pages_requested < max_pages:
+                    next_page = request_page(page_token)
+                    pages_requested += 1
+
+                if video_ids:
+                    yield await self.get_video_details(video_ids)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+        logger.info(
+            f"YouTube 딥 검색 완료: query={query}, results={len(seen)}, "
+            f"pages={pages_requested}"
+        )
+
+    async def search_video_ids(
+        self,
+        query: str,
+        max_results: int = MAX_IDS_PER_REQUEST,
+        page_token: Optional[str] = None,
+        region_code: Optional[str] = None,
+        published_after: Optional[datetime] = None,
+        published_before: Optional[datetime] = None,
+        video_duration: Optional[str] = None,
+        order: str = "relevance",
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        search.list 한 페이지의 영상 ID 목록 조회 (상세 조회 없음)
+
+        Args:
+            query: 검색 키워드
+            max_results: 페이지 크기 (최대 50)
+            page_token: 이전 응답의 nextPageToken
+            region_code: 국가 코드 (KR, JP, US 등)
+            published_after: 업로드 시작 날짜
+            published_before: 업로드 종료 날짜
+            video_duration: 영상 길이 (short, medium, long)
+            order: 정렬 기준 (relevance, date, viewCount, rating)
+
+        Returns:
+            Tuple[List[str], Optional[str]]: (영상 ID 목록, 다음 페이지 토큰)
+
+        Raises:
+            YouTubeAPIError: YouTube API 오류
+            QuotaExceededError: API 할당량 초과
+        """
+        search_params = self._build_search_params(
+            query=query,
+            region_code=region_code,
+            published_after=published_after,
+            published_before=published_before,
+            video_duration=video_duration,
+            order=order,
+        )
+        response = await self._search_page(search_params, page_token, max_results)
+        video_ids = [item["id"]["videoId"] for item in response.get("items", [])]
+        return video_ids, response.get("nextPageToken")
+
+    async def fill_search_results(
+        self,
+        query: str,
+        target: int,
+        video_filter: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]],
+        page_token: Optional[str],
+        pass_rate: Optional[float] = None,
+        max_pages: int = 3,
+        exclude_ids: Sequence[str] = (),
+        region_code: Optional[str] = None,
+        published_after: Optional[datetime] = None,
+        published_before: Optional[datetime] = None,
+        video_duration: Optional[str] = None,
+        order: str = "relevance",
+        page_cache: Optional[
+            Callable[
+                [str, Callable[[], Awaitable[Dict[str, Any]]]],
+                Awaitable[Dict[str, Any]],
+            ]
+        ] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        필터 통과 결과가 target개가 될 때까지 다음 페이지를 조회 (적응형 추가 조회)
+
+        학습된 필터 통과율로 다음 페이지 크기를 정하여 필요한 만큼만 상세 조회합니다.
+        search.list 호출은 max_pages 이내로 제한합니다.
+        page_cache가 있으면 페이지 토큰별로 캐시된 페이지를 먼저 사용합니다
+        (캐시된 페이지는 크기와 무관하게 재사용, 다음 토큰도 캐시된 값을 따름).
+
+        Args:
+            query: 검색 키워드
+            target: 추가로 필요한 필터 통과 영상 수
+            video_filter: 영상 목록 → 필터 통과 영상 목록
+            page_token: 시작 페이지 토큰 (캐시된 첫 페이지의 nextPageToken)
+            pass_rate: 이 검색/필터 조합의 필터 통과율 (없으면 50개씩 조회)
+            max_pages: search.list 최대 호출 수
+            exclude_ids: 이미 반환한 영상 ID (중복 제외)
+            region_code: 국가 코드 (KR, JP, US 등)
+            published_after: 업로드 시작 날짜
+            published_before: 업로드 종료 날짜
+            video_duration: 영상 길이 (short, medium, long)
+            order: 정렬 기준 (relevance, date, viewCount, rating)
+            page_cache: (페이지 토큰, 페이지 loader) → {"video_ids", "next_page_token"}
+                (SearchResponseCache.get_page, 기본값: 캐시 없이 조회)
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: (필터 통과 영상 목록, 검사한 영상 수)
+
+        Raises:
+            YouTubeAPIError: YouTube API 오류
+            QuotaExceededError: API 할당량 초과
+        """
+        search_params = self._build_search_params(
+            query=query,
+            region_code=region_code,
+            published_after=published_after,
+            published_before=published_before,
+            video_duration=video_duration,
+            order=order,
+        )
+        seen = set(exclude_ids)
+        passed: List[Dict[str, Any]] = []
+        scanned = 0
+        pages = 0
+
+        async def load_page(token: str, size: int) -> Dict[str, Any]:
+            response = await self._search_page(search_params, token, size)
+            return {
+                "video_ids": [item["id"]["videoId"] for item in response.get("items", [])],
+                "next_page_token": response.get("nextPageToken"),
+            }
+
+        while page_token and len(passed) < target and pages < max_pages:
+            page_size = estimate_fill_page_size(target - len(passed), pass_rate)
+            loader = partial(load_page, page_token, page_size)
+            page = await (page_cache(page_token, loader) if page_cache else loader())
+            pages += 1
+            page_token = page.get("next_page_token")
+
+            video_ids = []
+            for video_id in page["video_ids"]:
+                if video_id not in seen:
+                    seen.add(video_id)
+                    video_ids.append(video_id)
+            if not video_ids:
+                continue
+
+            videos = await self.get_video_details(video_ids)
+            scanned += len(videos)
+            passed.extend(video_filter(videos))
+
+        logger.info(
+            f"필터 결과 추가 조회: query={query}, pages={pages}, "
+            f"scanned={scanned}, passed={len(passed)}/{target}"
+        )
+        return passed, scanned
+
+    async def _search_page(
+        self,
+        search_params: Dict[str, Any],
+        page_token: Optional[str],
+        page_size: int = MAX_IDS_PER_REQUEST,
+    ) -> Dict[str, Any]:
+        """search.list 한 페이지 조회 (HTTP 오류는 서비스 예외로 변환)"""
+        try:
+            return await self._request(
+                "search",
+                **{
+                    **search_params,
+                    "maxResults": min(page_size, MAX_IDS_PER_REQUEST),
+                    "pageToken": page_token,
+                },
+            )
+        except YouTubeHTTPError as e:
+            if e.status_code == 403:
+                logger.error("YouTube API 할당량 초과")
+                raise QuotaExceededError("YouTube API 할당량이 초과되었습니다.")
+            logger.error(f"YouTube API 오류: {e}")
+            raise YouTubeAPIError(f"YouTube API 오류: {e}")
+
+    async def get_video_details(self, video_ids: List[str]) -> List[VideoRecord]:
         """
         YouTube 영상 상세 정보 조회
 
+        영상 레코드 캐시를 먼저 확인하고 미스된 ID만 videos.list로 조회합니다.
+
         Args:
             video_ids: 영상 ID 목록
 
         Returns:
-            영상 상세 정보 목록
+            List[VideoRecord]: 영상 레코드 목록 (채널 통계/성과 지표 포함)
 
         Raises:
             YouTubeAPIError: YouTube API 오류
@@ -147,95 +655,299 @@ class YouTubeSearchService:
             if not video_ids:
                 return []
 
-            # videos.list API 호출
-            videos_response = (
-                self.youtube.videos()
-                .list(
-                    part="snippet,contentDetails,statistics",
-                    id=",".join(video_ids),
-                )
-                .execute()
-            )
+            unique_ids = list(dict.fromkeys(video_ids))
+            records = await self._get_video_records(unique_ids)
 
-            videos = []
-            channel_ids: set[str] = set()
-            for item in videos_response.get("items", []):
-                video_data = self._parse_video_item(item)
-                channel_ids.add(video_data["channel_id"])
-                videos.append(video_data)
+            videos = [records[vid] for vid in unique_ids if vid in records]
+            channel_ids: set[str] = {video.channel_id for video in videos}
 
             # 채널 통계 조회 후 성과 지표 계산
             if channel_ids:
-                channel_stats = self._fetch_channel_stats(list(channel_ids))
+                channel_stats = await self._fetch_channel_stats(list(channel_ids))
+
+                # 최근 업로드 기준선 (캐시만 조회, 없거나 오래된 채널은 백그라운드 갱신)
+                baselines = self.baseline_store.get_many(channel_ids)
+                outdated = [
+                    cid for cid in channel_ids
+                    if cid not in baselines or baselines[cid]["stale"]
+                ]
+                if outdated and self.refresh_baselines:
+                    self.schedule_channel_baseline_refresh(outdated)
+
                 for video in videos:
-                    channel_id = video.get("channel_id")
+                    channel_id = video.channel_id
                     stats = channel_stats.get(channel_id, {})
                     channel_total_views = stats.get("viewCount", 0)
                     channel_video_count = max(stats.get("videoCount", 0), 1)
 
-                    video["subscriber_count"] = stats.get("subscriberCount")
-                    video["channel_total_videos"] = stats.get("videoCount")
-                    video["channel_total_views"] = channel_total_views
+                    video.subscriber_count = stats.get("subscriberCount")
+                    video.channel_total_videos = stats.get("videoCount")
+                    video.channel_total_views = channel_total_views
 
-                    # 성과도 배율: 영상 조회수 / 채널 평균 조회수
-                    channel_avg_views = (
-                        channel_total_views / channel_video_count
-                        if channel_video_count > 0
-                        else 0
-                    )
+                    # 성과도 배율: 영상 조회수 / 채널 최근 업로드 조회수 중앙값
+                    # (기준선이 아직 없으면 채널 누적 평균 조회수 사용)
+                    baseline = baselines.get(channel_id)
+                    if baseline:
+                        channel_avg_views = baseline["median_views"] or baseline["mean_views"]
+                    else:
+                        channel_avg_views = (
+                            channel_total_views / channel_video_count
+                            if channel_video_count > 0
+                            else 0
+                        )
                     if channel_avg_views > 0:
-                        video["performance_ratio"] = video["view_count"] / channel_avg_views
+                        video.performance_ratio = video.view_count / channel_avg_views
                     else:
-                        video["performance_ratio"] = None
+                        video.performance_ratio = None
 
                     # 채널 기여도: 영상 조회수 / 채널 누적 조회수 (비율)
                     if channel_total_views > 0:
-                        video["channel_contribution"] = (
-                            video["view_count"] / channel_total_views * 100
+                        video.channel_contribution = (
+                            video.view_count / channel_total_views * 100
                         )
                     else:
-                        video["channel_contribution"] = None
+                        video.channel_contribution = None
 
             return videos
 
-        except HttpError as e:
+        except YouTubeHTTPError as e:
+            if e.is_quota_exceeded:
+                logger.error("YouTube API 할당량 초과 (영상 상세 조회)")
+                raise QuotaExceededError("YouTube API 할당량이 초과되었습니다.")
             logger.error(f"YouTube API 오류 (영상 상세 조회): {e}")
             raise YouTubeAPIError(f"영상 정보 조회 중 오류가 발생했습니다: {e}")
+        except QuotaExceededError:
+            raise
         except Exception as e:
             logger.error(f"영상 상세 정보 조회 중 오류 발생: {e}")
             raise YouTubeAPIError(f"영상 정보 처리 중 오류가 발생했습니다: {e}")
 
-    def _fetch_channel_stats(self, channel_ids: List[str]) -> Dict[str, Dict[str, int]]:
-        """채널 통계를 조회하여 맵으로 반환"""
-        try:
-            response = (
-                self.youtube.channels()
-                .list(
-                    part="statistics",
-                    id=",".join(channel_ids),
-                )
-                .execute()
-            )
+    async def fetch_video_statistics(
+        self, video_ids: Sequence[str], concurrency: Optional[int] = None
+    ) -> Tuple[Dict[str, Dict[str, int]], List[str]]:
+        """
+        영상 통계 최신값 조회 (videos.list part=statistics, 캐시 미사용)
 
-            stats_map: Dict[str, Dict[str, int]] = {}
-            for item in response.get("items", []):
-                statistics = item.get("statistics", {}) or {}
-                stats_map[item["id"]] = {
-                    "subscriberCount": int(statistics.get("subscriberCount", 0)),
-                    "viewCount": int(statistics.get("viewCount", 0)),
-                    "videoCount": int(statistics.get("videoCount", 0)),
+        50개 단위로 나누어 제한된 동시성으로 호출합니다.
+        일부 청크가 할당량 부족으로 실패해도 성공한 청크의 통계는 반환합니다.
+
+        Args:
+            video_ids: 영상 ID 목록
+            concurrency: 동시 요청 수 (기본값: settings.YOUTUBE_STATS_SNAPSHOT_CONCURRENCY)
+
+        Returns:
+            Tuple[Dict[str, Dict[str, int]], List[str]]:
+                (영상 ID → {"view_count", "like_count", "comment_count"} (삭제/비공개 영상 제외),
+                 할당량 부족으로 조회하지 못한 영상 ID 목록)
+
+        Raises:
+            YouTubeAPIError: YouTube API 오류 (할당량 부족 제외)
+        """
+        semaphore = asyncio.Semaphore(
+            concurrency or settings.YOUTUBE_STATS_SNAPSHOT_CONCURRENCY
+        )
+        chunks = list(chunked(list(dict.fromkeys(video_ids))))
+
+        async def fetch_chunk(chunk: List[str]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._request("videos", part="statistics", id=",".join(chunk))
+
+        outcomes = await asyncio.gather(
+            *(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
+        )
+
+        stats: Dict[str, Dict[str, int]] = {}
+        skipped: List[str] = []
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, QuotaExceededError) or (
+                isinstance(outcome, YouTubeHTTPError) and outcome.is_quota_exceeded
+            ):
+                skipped.extend(chunk)
+                continue
+            if isinstance(outcome, YouTubeHTTPError):
+                logger.error(f"YouTube API 오류 (영상 통계 조회): {outcome}")
+                raise YouTubeAPIError(f"영상 통계 조회 중 오류가 발생했습니다: {outcome}")
+            if isinstance(outcome, BaseException):
+                raise outcome
+
+            for item in outcome.get("items", []):
+                counts = item.get("statistics", {})
+                stats[item["id"]] = {
+                    "view_count": int(counts.get("viewCount", 0)),
+                    "like_count": int(counts.get("likeCount", 0)),
+                    "comment_count": int(counts.get("commentCount", 0)),
                 }
+
+        if skipped:
+            logger.warning(
+                f"영상 통계 일부 미조회 (할당량 부족): fetched={len(video_ids) - len(skipped)}, "
+                f"skipped={len(skipped)}"
+            )
+        return stats, skipped
+
+    async def _get_video_records(self, video_ids: List[str]) -> Dict[str, VideoRecord]:
+        """
+        영상 레코드 조회 (캐시 우선, 미스된 ID만 videos.list)
+
+        Args:
+            video_ids: 중복 없는 영상 ID 목록
+
+        Returns:
+            Dict[str, VideoRecord]: 영상 ID → 레코드
+        """
+        # 영상 레코드 캐시 조회 (MGET 1회, TTL이 지난 레코드는 ETag 재검증 대상)
+        records, stale = self.video_store.get_with_stale(video_ids)
+        missing_ids = [vid for vid in video_ids if vid not in records]
+
+        # 미스된 영상만 videos.list 호출 (50개 단위, 동시 요청)
+        if missing_ids:
+            fetched, revalidated = await self._fetch_entities(
+                missing_ids, stale, self.video_store, self._fetch_video_chunk
+            )
+            records.update(fetched)
+            logger.info(
+                f"영상 정보 조회: 캐시 히트 {len(video_ids) - len(missing_ids)}개, "
+                f"재검증(304) {revalidated}개, API 조회 {len(fetched) - revalidated}개"
+            )
+        return records
+
+    async def _fetch_channel_stats(
+        self, channel_ids: List[str]
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        채널 통계를 조회하여 맵으로 반환
+
+        캐시(MGET)에서 먼저 조회하고, 미스된 채널만 50개 단위로
+        channels.list를 동시에 호출한 뒤 캐시에 저장합니다.
+
+        Args:
+            channel_ids: 채널 ID 목록
+
+        Returns:
+            채널 ID → {"subscriberCount", "viewCount", "videoCount"} 매핑
+        """
+        unique_ids = list(dict.fromkeys(cid for cid in channel_ids if cid))
+        stats_map, stale = self.channel_stats_store.get_with_stale(unique_ids)
+        missing_ids = [cid for cid in unique_ids if cid not in stats_map]
+
+        if not missing_ids:
             return stats_map
+
+        try:
+            fetched, revalidated = await self._fetch_entities(
+                missing_ids, stale, self.channel_stats_store, self._fetch_channel_chunk
+            )
         except Exception as e:
             logger.warning(f"채널 통계 조회 중 오류: {e}")
-            return {}
+            return stats_map
+
+        logger.info(
+            f"채널 통계 조회: 캐시 히트 {len(stats_map)}개, 재검증(304) {revalidated}개, "
+            f"API 조회 {len(fetched) - revalidated}개"
+        )
+
+        stats_map.update(fetched)
+        return stats_map
+
+    async def _fetch_entities(
+        self,
+        missing_ids: List[str],
+        stale: Dict[str, Dict[str, Any]],
+        store: RevalidatingStore,
+        fetch_chunk: Callable[
+            [List[str], Optional[str]],
+            Awaitable[Tuple[Optional[Dict[str, Dict[str, Any]]], Optional[str]]],
+        ],
+    ) -> Tuple[Dict[str, Dict[str, Any]], int]:
+        """
+        캐시 미스 엔티티를 50개 단위로 동시 조회 (ETag가 있으면 조건부 요청)
 
-    async def _filter_by_subscriber_count(
+        같은 응답으로 받은 레코드는 ETag가 같으므로 ETag별로 묶어 If-None-Match를 보내고,
+        304면 캐시 레코드를 그대로 사용하며 신선 기간만 갱신합니다.
+
+        Args:
+            missing_ids: 신선한 캐시가 없는 ID 목록
+            stale: 재검증 대상 ID → 캐시 레코드 (ETag 포함)
+            store: 엔티티 캐시
+            fetch_chunk: (ID 목록, ETag) → (ID → 레코드 또는 304면 None, 응답 ETag)
+
+        Returns:
+            Tuple[Dict[str, Dict[str, Any]], int]: (ID → 레코드, 304로 재사용한 레코드 수)
+        """
+        groups: Dict[Optional[str], List[str]] = {}
+        for entity_id in missing_ids:
+            etag = stale[entity_id]["etag"] if entity_id in stale else None
+            groups.setdefault(etag, []).append(entity_id)
+
+        requests = [
+            (chunk, etag)
+            for etag, ids in groups.items()
+            for chunk in chunked(ids)
+        ]
+        responses = await asyncio.gather(
+            *(fetch_chunk(chunk, etag) for chunk, etag in requests)
+        )
+
+        fetched: Dict[str, Dict[str, Any]] = {}
+        revalidated = 0
+        for (chunk, _), (chunk_records, response_etag) in zip(requests, responses):
+            if chunk_records is None:
+                # 304 Not Modified: 캐시 레코드 재사용
+                store.touch(chunk)
+                fetched.update({entity_id: stale[entity_id] for entity_id in chunk})
+                revalidated += len(chunk)
+                continue
+            store.set_many(chunk_records, etag=response_etag)
+            fetched.update(chunk_records)
+        return fetched, revalidated
+
+    async def _fetch_video_chunk(
+        self, video_ids: List[str], etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, VideoRecord]], Optional[str]]:
+        """videos.list 1회 조회 (최대 50개, 304면 None)"""
+        response, response_etag = await self._conditional_request(
+            "videos",
+            etag,
+            part="snippet,contentDetails,statistics",
+            id=",".join(video_ids),
+        )
+        if response is None:
+            return None, response_etag
+
+        records: Dict[str, VideoRecord] = {}
+        for item in response.get("items", []):
+            record = VideoRecord.from_api_item(item)
+            records[record.video_id] = record
+        return records, response_etag
+
+    async def _fetch_channel_chunk(
+        self, channel_ids: List[str], etag: Optional[str] = None
+    ) -> Tuple[Optional[Dict[str, Dict[str, Any]]], Optional[str]]:
+        """channels.list(statistics) 1회 조회 (최대 50개, 304면 None)"""
+        response, response_etag = await self._conditional_request(
+            "channels", etag, part="statistics", id=",".join(channel_ids)
+        )
+        if response is None:
+            return None, response_etag
+
+        records: Dict[str, Dict[str, Any]] = {}
+        for item in response.get("items", []):
+            statistics = item.get("statistics", {}) or {}
+            records[item["id"]] = {
+                "subscriberCount": int(statistics.get("subscriberCount", 0)),
+                "viewCount": int(statistics.get("viewCount", 0)),
+                "videoCount": int(statistics.get("videoCount", 0)),
+            }
+        return records, response_etag
+
+    def _filter_by_subscriber_count(
         self, videos: List[Dict[str, Any]], min_subscribers: int
     ) -> List[Dict[str, Any]]:
         """
         구독자 수로 영상 필터링
 
+        get_video_details에서 채워진 subscriber_count를 사용하므로 추가 API 호출이 없습니다.
+
         Args:
             videos: 영상 목록
             min_subscribers: 최소 구독자 수
@@ -243,48 +955,16 @@ class YouTubeSearchService:
         Returns:
             필터링된 영상 목록
         """
-        try:
-            # 채널 ID 추출
-            channel_ids = list(set(video["channel_id"] for video in videos))
-
-            if not channel_ids:
-                return []
-
-            # 채널 정보 조회
-            channels_response = (
-                self.youtube.channels()
-                .list(
-                    part="statistics",
-                    id=",".join(channel_ids),
-                )
-                .execute()
-            )
-
-            # 채널 ID → 구독자 수 매핑
-            channel_subscribers = {}
-            for item in channels_response.get("items", []):
-                channel_id = item["id"]
-                subscriber_count = int(
-                    item.get("statistics", {}).get("subscriberCount", 0)
-                )
-                channel_subscribers[channel_id] = subscriber_count
-
-            # 필터링
-            filtered_videos = [
-                video
-                for video in videos
-                if channel_subscribers.get(video["channel_id"], 0) >= min_subscribers
-            ]
-
-            logger.info(
-                f"구독자 수 필터 적용: {len(videos)}개 → {len(filtered_videos)}개"
-            )
-            return filtered_videos
-
-        except Exception as e:
-            logger.error(f"구독자 수 필터링 중 오류: {e}")
-            # 오류 발생 시 원본 반환
-            return videos
+        filtered_videos = [
+            video
+            for video in videos
+            if (video.get("subscriber_count") or 0) >= min_subscribers
+        ]
+
+        logger.info(
+            f"구독자 수 필터 적용: {len(videos)}개 → {len(filtered_videos)}개"
+        )
+        return filtered_videos
 
     async def get_video_captions(self, video_id: str) -> List[Dict[str, Any]]:
         """
@@ -300,13 +980,10 @@ class YouTubeSearchService:
             YouTubeAPIError: YouTube API 오류
         """
         try:
-            captions_response = (
-                self.youtube.captions()
-                .list(
-                    part="snippet",
-                    videoId=video_id,
-                )
-                .execute()
+            captions_response = await self._request(
+                "captions",
+                part="snippet",
+                videoId=video_id,
             )
 
             captions = []
@@ -322,8 +999,8 @@ class YouTubeSearchService:
 
             return captions
 
-        except HttpError as e:
-            if e.resp.status == 403:
+        except YouTubeHTTPError as e:
+            if e.status_code == 403:
                 # 자막이 비활성화된 경우
                 logger.warning(f"자막을 사용할 수 없습니다: video_id={video_id}")
                 return []
@@ -350,45 +1027,457 @@ class YouTubeSearchService:
             YouTubeAPIError: YouTube API 오류
         """
         try:
-            comments_response = (
-                self.youtube.commentThreads()
-                .list(
-                    part="snippet",
-                    videoId=video_id,
-                    maxResults=min(max_results, 100),
-                    order="relevance",  # 인기순
-                )
-                .execute()
+            # 댓글 스레드 캐시 (TTL이 지나면 ETag로 재검증)
+            cache_id = f"{video_id}:{max_results}"
+            fresh, stale = self.comment_store.get_with_stale([cache_id])
+            if cache_id in fresh:
+                return fresh[cache_id]["comments"]
+
+            etag = stale[cache_id]["etag"] if cache_id in stale else None
+            comments_response, response_etag = await self._conditional_request(
+                "commentThreads",
+                etag,
+                part="snippet",
+                videoId=video_id,
+                maxResults=min(max_results, 100),
+                order="relevance",  # 인기순
             )
 
-            comments = []
-            for item in comments_response.get("items", []):
-                top_comment = item.get("snippet", {}).get("topLevelComment", {})
-                snippet = top_comment.get("snippet", {})
-
-                comments.append({
-                    "comment_id": top_comment.get("id", ""),
-                    "author": snippet.get("authorDisplayName", ""),
-                    "author_channel_id": snippet.get("authorChannelId", {}).get("value", ""),
-                    "text": snippet.get("textDisplay", ""),
-                    "like_count": snippet.get("likeCount", 0),
-                    "published_at": snippet.get("publishedAt", ""),
-                    "reply_count": item.get("snippet", {}).get("totalReplyCount", 0),
-                })
+            if comments_response is None:
+                # 304 Not Modified: 캐시된 댓글 재사용
+                self.comment_store.touch([cache_id])
+                logger.info(f"댓글 재검증(304): video_id={video_id}")
+                return stale[cache_id]["comments"]
+
+            comments = [
+                comment_record(
+                    item.get("snippet", {}).get("topLevelComment", {}),
+                    item.get("snippet", {}).get("totalReplyCount", 0),
+                )
+                for item in comments_response.get("items", [])
+            ]
 
+            self.comment_store.set_many({cache_id: {"comments": comments}}, etag=response_etag)
             return comments
 
-        except HttpError as e:
-            if e.resp.status == 403:
+        except YouTubeHTTPError as e:
+            if e.is_quota_exceeded:
+                logger.error("YouTube API 할당량 초과 (댓글 조회)")
+                raise QuotaExceededError("YouTube API 할당량이 초과되었습니다.")
+            if e.status_code == 403:
                 # 댓글이 비활성화된 경우
                 logger.warning(f"댓글을 사용할 수 없습니다: video_id={video_id}")
                 return []
             logger.error(f"YouTube API 오류 (댓글 조회): {e}")
             raise YouTubeAPIError(f"댓글 정보 조회 중 오류가 발생했습니다: {e}")
+        except QuotaExceededError:
+            raise
         except Exception as e:
             logger.error(f"댓글 조회 중 오류 발생: {e}")
             raise YouTubeAPIError(f"댓글 정보 처리 중 오류가 발생했습니다: {e}")
 
+    async def _fetch_replies(self, parent_id: str) -> List[Dict[str, Any]]:
+        """
+        댓글 스레드의 답글 전체 조회 (comments.list 페이지 순회, 페이지당 1 unit)
+
+        Args:
+            parent_id: 최상위 댓글 ID
+
+        Returns:
+            List[Dict[str, Any]]: 답글 레코드 목록
+        """
+        replies: List[Dict[str, Any]] = []
+        page_token: Optional[str] = None
+        while True:
+            response = await self._request(
+                "comments",
+                part="snippet",
+                parentId=parent_id,
+                maxResults=100,
+                pageToken=page_token,
+            )
+            replies.extend(comment_record(item) for item in response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                return replies
+
+    async def iter_comment_threads(
+        self,
+        video_id: str,
+        include_replies: bool = False,
+        order: str = "time",
+        reply_concurrency: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        영상 댓글 스레드 전체 조회 (commentThreads.list 페이지 순회, 페이지당 1 unit)
+
+        다음 페이지 조회를 먼저 시작하고 현재 페이지의 답글 조회와 병행합니다.
+        commentThreads 응답에 포함된 답글(최대 5개)보다 답글이 많은 스레드만
+        comments.list로 나머지 답글을 제한된 동시성으로 조회합니다.
+
+        Args:
+            video_id: 영상 ID
+            include_replies: 답글 포함 여부 (스레드마다 "replies" 목록 추가)
+            order: 정렬 기준 (time: 최신순, relevance: 인기순)
+            reply_concurrency: 동시 답글 조회 수
+                (기본값: settings.YOUTUBE_COMMENT_REPLY_CONCURRENCY)
+
+        Yields:
+            List[Dict[str, Any]]: 페이지별 댓글 레코드 목록
+
+        Raises:
+            YouTubeAPIError: YouTube API 오류
+            QuotaExceededError: API 할당량 초과
+        """
+        semaphore = asyncio.Semaphore(
+            reply_concurrency or settings.YOUTUBE_COMMENT_REPLY_CONCURRENCY
+        )
+
+        def request_page(page_token: Optional[str]) -> "asyncio.Future[Dict[str, Any]]":
+            return asyncio.ensure_future(
+                self._request(
+                    "commentThreads",
+                    part="snippet,replies" if include_replies else "snippet",
+                    videoId=video_id,
+                    maxResults=100,
+                    order=order,
+                    pageToken=page_token,
+                )
+            )
+
+        async def expand_replies(thread: Dict[str, Any], parent_id: str):
+            async with semaphore:
+                thread["replies"] = await self._fetch_replies(parent_id)
+
+        threads = 0
+        pages = 1
+        next_page = request_page(None)
+
+        try:
+            while next_page is not None:
+                try:
+                    response = await next_page
+                except YouTubeHTTPError as e:
+                    next_page = None
+                    if e.status_code == 403 and e.reason == "commentsDisabled":
+                        logger.warning(f"댓글을 사용할 수 없습니다: video_id={video_id}")
+                        return
+                    logger.error(f"YouTube API 오류 (댓글 스레드 순회): {e}")
+                    raise YouTubeAPIError(f"댓글 정보 조회 중 오류가 발생했습니다: {e}")
+
+                page_token = response.get("nextPageToken")
+                next_page = request_page(page_token) if page_token else None
+                if page_token:
+                    pages += 1
+
+                page: List[Dict[str, Any]] = []
+                pending = []
+                for item in response.get("items", []):
+                    snippet = item.get("snippet", {})
+                    top_comment = snippet.get("topLevelComment", {})
+                    reply_count = snippet.get("totalReplyCount", 0)
+                    thread = comment_record(top_comment, reply_count)
+                    if include_replies:
+                        inline = item.get("replies", {}).get("comments", [])
+                        if len(inline) < reply_count:
+                            pending.append(expand_replies(thread, top_comment.get("id", "")))
+                        else:
+                            # 인라인 답글은 최신순이 아니므로 게시 시각 순으로 정렬
+                            thread["replies"] = sorted(
+                                (comment_record(reply) for reply in inline),
+                                key=lambda reply: reply["published_at"],
+                            )
+                    page.append(thread)
+
+                if pending:
+                    try:
+                        await asyncio.gather(*pending)
+                    except YouTubeHTTPError as e:
+                        logger.error(f"YouTube API 오류 (답글 조회): {e}")
+                        raise YouTubeAPIError(f"답글 조회 중 오류가 발생했습니다: {e}")
+
+                threads += len(page)
+                if page:
+                    yield page
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+        logger.info(
+            f"댓글 스레드 조회 완료: video_id={video_id}, threads={threads}, pages={pages}"
+        )
+
+    async def get_uploads_playlist_id(self, channel_id: str) -> str:
+        """
+        채널의 업로드 재생목록 ID 조회 (channels.list contentDetails, 캐시 7일)
+
+        Args:
+            channel_id: 채널 ID
+
+        Returns:
+            str: 업로드 재생목록 ID (UU...)
+
+        Raises:
+            YouTubeAPIError: 채널을 찾을 수 없거나 API 오류
+        """
+        cache_key = f"{UPLOADS_PLAYLIST_KEY_PREFIX}:{channel_id}"
+        playlist_id = self.cache.get(cache_key)
+        if playlist_id:
+            return playlist_id
+
+        try:
+            response = await self._request(
+                "channels", part="contentDetails", id=channel_id
+            )
+        except YouTubeHTTPError as e:
+            logger.error(f"YouTube API 오류 (업로드 재생목록 조회): {e}")
+            raise YouTubeAPIError(f"채널 정보 조회 중 오류가 발생했습니다: {e}")
+
+        items = response.get("items", [])
+        playlist_id = (
+            items[0].get("contentDetails", {}).get("relatedPlaylists", {}).get("uploads")
+            if items
+            else None
+        )
+        if not playlist_id:
+            raise YouTubeAPIError("채널을 찾을 수 없습니다.")
+
+        self.cache.set(cache_key, playlist_id, ttl=UPLOADS_PLAYLIST_TTL)
+        return playlist_id
+
+    async def iter_channel_uploads(
+        self,
+        channel_id: str,
+        published_after: Optional[datetime] = None,
+        max_videos: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        채널 업로드 영상 전체 조회 (playlistItems.list, 페이지당 1 unit)
+
+        search.list(페이지당 100 unit) 대신 업로드 재생목록을 최신순으로 순회합니다.
+        한 페이지의 영상 상세 조회(videos.list)와 다음 페이지 조회를 동시에 진행하며,
+        published_after 이전에 게시된 영상에 도달하면 중단합니다(증분 크롤링).
+
+        Args:
+            channel_id: 채널 ID
+            published_after: 이 시각 이후 게시된 영상만 조회 (이전 크롤링 시점)
+            max_videos: 최대 영상 수 (기본값: 제한 없음)
+
+        Yields:
+            List[Dict[str, Any]]: 페이지별 영상 정보 목록 (최신순, 상세 정보 포함)
+
+        Raises:
+            YouTubeAPIError: YouTube API 오류
+            QuotaExceededError: API 할당량 초과
+        """
+        playlist_id = await self.get_uploads_playlist_id(channel_id)
+        after = to_utc(published_after) if published_after else None
+
+        def request_page(page_token: Optional[str]) -> "asyncio.Future[Dict[str, Any]]":
+            return asyncio.ensure_future(
+                self._request(
+                    "playlistItems",
+                    part="contentDetails",
+                    playlistId=playlist_id,
+                    maxResults=MAX_IDS_PER_REQUEST,
+                    pageToken=page_token,
+                )
+            )
+
+        logger.info(
+            f"채널 업로드 크롤링 시작: channel_id={channel_id}, "
+            f"published_after={published_after}, max_videos={max_videos}"
+        )
+        crawled = 0
+        pages = 1
+        next_page = request_page(None)
+
+        try:
+            while next_page is not None:
+                try:
+                    response = await next_page
+                except YouTubeHTTPError as e:
+                    logger.error(f"YouTube API 오류 (업로드 재생목록 순회): {e}")
+                    raise YouTubeAPIError(f"채널 영상 조회 중 오류가 발생했습니다: {e}")
+                next_page = None
+
+                video_ids = []
+                reached_cursor = False
+                for item in response.get("items", []):
+                    details = item.get("contentDetails", {})
+                    published = parse_published_at(details.get("videoPublishedAt", ""))
+                    if after and published and published <= after:
+                        reached_cursor = True
+                        break
+                    if max_videos is not None and crawled + len(video_ids) >= max_videos:
+                        reached_cursor = True
+                        break
+                    video_ids.append(details["videoId"])
+
+                # 다음 페이지 조회를 먼저 시작하고 현재 페이지 상세 조회와 병행
+                page_token = response.get("nextPageToken")
+                if page_token and not reached_cursor:
+                    next_page = request_page(page_token)
+                    pages += 1
+
+                if video_ids:
+                    crawled += len(video_ids)
+                    yield await self.get_video_details(video_ids)
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+        logger.info(
+            f"채널 업로드 크롤링 완료: channel_id={channel_id}, videos={crawled}, pages={pages}"
+        )
+
+    async def compute_channel_baseline(
+        self, channel_id: str, sample_size: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        채널 최근 업로드 조회수 기준선 계산 및 저장
+
+        업로드 재생목록(playlistItems.list)에서 최근 영상 ID를 모은 뒤
+        videos.list로 조회수를 가져옵니다 (영상 레코드 캐시 공유).
+
+        Args:
+            channel_id: 채널 ID
+            sample_size: 최근 업로드 수 (기본값: settings.YOUTUBE_CHANNEL_BASELINE_SIZE)
+
+        Returns:
+            Optional[Dict[str, Any]]: {"median_views", "mean_views", "sample_size"}
+                (업로드 영상이 없으면 None)
+
+        Raises:
+            YouTubeAPIError: YouTube API 오류
+            QuotaExceededError: API 할당량 초과
+        """
+        sample_size = sample_size or settings.YOUTUBE_CHANNEL_BASELINE_SIZE
+        playlist_id = await self.get_uploads_playlist_id(channel_id)
+
+        video_ids: List[str] = []
+        page_token: Optional[str] = None
+        try:
+            while len(video_ids) < sample_size:
+                response = await self._request(
+                    "playlistItems",
+                    part="contentDetails",
+                    playlistId=playlist_id,
+                    maxResults=min(sample_size - len(video_ids), MAX_IDS_PER_REQUEST),
+                    pageToken=page_token,
+                )
+                video_ids.extend(
+                    item["contentDetails"]["videoId"] for item in response.get("items", [])
+                )
+                page_token = response.get("nextPageToken")
+                if not page_token:
+                    break
+        except YouTubeHTTPError as e:
+            logger.error(f"YouTube API 오류 (채널 기준선 조회): {e}")
+            raise YouTubeAPIError(f"채널 영상 조회 중 오류가 발생했습니다: {e}")
+
+        records = await self._get_video_records(list(dict.fromkeys(video_ids[:sample_size])))
+        view_counts = [record["view_count"] for record in records.values()]
+        if not view_counts:
+            return None
+
+        baseline = summarize_view_counts(view_counts)
+        self.baseline_store.set(channel_id, baseline)
+        logger.info(
+            f"채널 기준선 갱신: channel_id={channel_id}, "
+            f"median={baseline['median_views']:.0f}, sample={baseline['sample_size']}"
+        )
+        return baseline
+
+    async def refresh_channel_baselines(self, channel_ids: Sequence[str]):
+        """
+        채널 기준선 일괄 갱신 (제한된 동시성, 채널별 오류는 기록만)
+
+        다른 워커가 갱신 중인 채널은 건너뜁니다.
+
+        Args:
+            channel_ids: 채널 ID 목록
+        """
+        semaphore = asyncio.Semaphore(settings.YOUTUBE_CHANNEL_BASELINE_CONCURRENCY)
+
+        async def refresh_one(channel_id: str):
+            if not self.baseline_store.claim_refresh(channel_id):
+                return
+            async with semaphore:
+                try:
+                    await self.compute_channel_baseline(channel_id)
+                except Exception as e:
+                    logger.warning(f"채널 기준선 갱신 실패: channel_id={channel_id}, error={e}")
+
+        await asyncio.gather(*(refresh_one(cid) for cid in channel_ids))
+
+    def schedule_channel_baseline_refresh(self, channel_ids: Sequence[str]):
+        """
+        채널 기준선 갱신을 백그라운드 태스크로 예약 (요청 응답을 기다리게 하지 않음)
+
+        같은 프로세스에서 이미 갱신 중인 채널은 제외합니다.
+
+        Args:
+            channel_ids: 기준선이 없거나 오래된 채널 ID 목록
+        """
+        pending = [cid for cid in channel_ids if cid not in _baseline_refreshing]
+        if not pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        _baseline_refreshing.update(pending)
+        task = loop.create_task(self.refresh_channel_baselines(pending))
+        _background_tasks.add(task)
+
+        def on_done(done: "asyncio.Task[None]"):
+            _background_tasks.discard(done)
+            _baseline_refreshing.difference_update(pending)
+
+        task.add_done_callback(on_done)
+
+    def _crawl_cursor_key(self, channel_id: str, user_id: str) -> str:
+        return f"{CRAWL_CURSOR_KEY_PREFIX}:{user_id}:{channel_id}"
+
+    def get_crawl_cursor(self, channel_id: str, user_id: str) -> Optional[datetime]:
+        """
+        채널 크롤링 재개 시점 조회 (사용자가 마지막으로 끝까지 크롤링한 최신 영상의 게시 시각)
+
+        Args:
+            channel_id: 채널 ID
+            user_id: 사용자 ID (재개 시점은 사용자별)
+
+        Returns:
+            Optional[datetime]: 재개 시점 (기록이 없으면 None)
+        """
+        cursor = self.cache.get(self._crawl_cursor_key(channel_id, user_id))
+        if not isinstance(cursor, dict):
+            return None
+        return parse_published_at(cursor.get("last_published_at", ""))
+
+    def save_crawl_cursor(self, channel_id: str, user_id: str, last_published_at: str):
+        """
+        채널 크롤링 재개 시점 저장
+
+        이전 재개 시점(또는 since)까지, 혹은 재생목록 끝까지 크롤링한 경우에만 호출해야 합니다.
+        중간에 멈춘 크롤링으로 저장하면 나머지 영상이 다음 재개에서 빠집니다.
+
+        Args:
+            channel_id: 채널 ID
+            user_id: 사용자 ID
+            last_published_at: 크롤링한 영상 중 가장 최신 게시 시각 (RFC 3339)
+        """
+        self.cache.set(
+            self._crawl_cursor_key(channel_id, user_id),
+            {
+                "last_published_at": last_published_at,
+                "crawled_at": datetime.utcnow().isoformat(),
+            },
+            ttl=CRAWL_CURSOR_TTL,
+        )
+
     async def get_channel_details(self, channel_id: str) -> Dict[str, Any]:
         """
         YouTube 채널 상세 정보 조회
@@ -403,13 +1492,10 @@ class YouTubeSearchService:
             YouTubeAPIError: YouTube API 오류
         """
         try:
-            channels_response = (
-                self.youtube.channels()
-                .list(
-                    part="snippet,statistics,brandingSettings",
-                    id=channel_id,
-                )
-                .execute()
+            channels_response = await self._request(
+                "channels",
+                part="snippet,statistics,brandingSettings",
+                id=channel_id,
             )
 
             items = channels_response.get("items", [])
@@ -429,6 +1515,15 @@ class YouTubeSearchService:
                 or thumbnails.get("default", {}).get("url")
             )
 
+            # 검색 경로와 공유하는 채널 통계 캐시 갱신
+            self.channel_stats_store.set_many({
+                item["id"]: {
+                    "subscriberCount": int(statistics.get("subscriberCount", 0)),
+                    "viewCount": int(statistics.get("viewCount", 0)),
+                    "videoCount": int(statistics.get("videoCount", 0)),
+                }
+            })
+
             return {
                 "channel_id": item["id"],
                 "title": snippet.get("title", ""),
@@ -443,52 +1538,53 @@ class YouTubeSearchService:
                 "country": snippet.get("country", ""),
             }
 
-        except HttpError as e:
+        except YouTubeHTTPError as e:
+            if e.is_quota_exceeded:
+                logger.error("YouTube API 할당량 초과 (채널 조회)")
+                raise QuotaExceededError("YouTube API 할당량이 초과되었습니다.")
             logger.error(f"YouTube API 오류 (채널 조회): {e}")
             raise YouTubeAPIError(f"채널 정보 조회 중 오류가 발생했습니다: {e}")
+        except QuotaExceededError:
+            raise
         except Exception as e:
             logger.error(f"채널 조회 중 오류 발생: {e}")
             raise YouTubeAPIError(f"채널 정보 처리 중 오류가 발생했습니다: {e}")
 
-    def _parse_video_item(self, item: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        YouTube API 응답 → 표준 포맷 변환
 
-        Args:
-            item: YouTube API videos.list 응답 아이템
 
-        Returns:
-            표준 포맷 영상 정보
-        """
-        snippet = item.get("snippet", {})
-        content_details = item.get("contentDetails", {})
-        statistics = item.get("statistics", {})
-
-        # ISO 8601 duration 파싱
-        duration_iso = content_details.get("duration", "PT0S")
-        duration_seconds = parse_iso8601_duration(duration_iso)
-
-        # 썸네일 선택 (우선순위: maxres > high > medium > default)
-        thumbnails = snippet.get("thumbnails", {})
-        thumbnail_url = (
-            thumbnails.get("maxres", {}).get("url")
-            or thumbnails.get("high", {}).get("url")
-            or thumbnails.get("medium", {}).get("url")
-            or thumbnails.get("default", {}).get("url")
-        )
+# 전역 검색 서비스 레지스트리 (API 키별 인스턴스 재사용)
+def _create_search_service(api_key: str) -> YouTubeSearchService:
+    """설정된 키 풀에 속한 키면 키 풀을 사용하고, 그 외에는 사용자 지정 키로 서비스 생성"""
+    key_pool = get_key_pool()
+    if key_pool is not None and api_key in key_pool.api_keys:
+        return YouTubeSearchService(api_key=api_key, key_pool=key_pool)
+    return YouTubeSearchService(api_key=api_key, user_key=True)
 
-        return {
-            "video_id": item["id"],
-            "title": snippet.get("title", ""),
-            "description": snippet.get("description", ""),
-            "channel_id": snippet.get("channelId", ""),
-            "channel_title": snippet.get("channelTitle", ""),
-            "published_at": snippet.get("publishedAt", ""),
-            "thumbnail_url": thumbnail_url,
-            "duration": duration_seconds,
-            "view_count": int(statistics.get("viewCount", 0)),
-            "like_count": int(statistics.get("likeCount", 0)),
-            "comment_count": int(statistics.get("commentCount", 0)),
-            "tags": snippet.get("tags", []),
-            "category_id": snippet.get("categoryId", ""),
-        }
+
+_search_service_registry: YouTubeClientRegistry[YouTubeSearchService] = (
+    YouTubeClientRegistry(_create_search_service)
+)
+
+
+def get_search_service(api_key: Optional[str] = None) -> YouTubeSearchService:
+    """
+    API 키별로 캐시된 YouTubeSearchService 반환
+
+    API 키를 지정하지 않으면 설정된 키 풀(YOUTUBE_API_KEY + YOUTUBE_API_KEYS)을 사용합니다.
+
+    Args:
+        api_key: YouTube Data API 키 (사용자 지정 키)
+
+    Returns:
+        YouTubeSearchService: 검색 서비스 인스턴스
+
+    Raises:
+        YouTubeAPIError: 유효한 API 키가 없는 경우
+    """
+    normalized_key = (api_key or "").strip()
+    if not normalized_key:
+        pool_keys = settings.youtube_api_keys_list
+        normalized_key = (
+            pool_keys[0] if pool_keys else (settings.YOUTUBE_API_KEY or "").strip()
+        )
+    return _search_service_registry.get(normalized_key)
@@ -0,0 +1,317 @@
+"""
+YouTube 영상 통계 시계열 (조회수 추이)
+
+감시 대상 영상 ID는 Redis SET에, 영상별 통계 스냅샷은 Redis LIST에 추가 전용으로 저장합니다.
+스냅샷 한 개는 "timestamp:조회수:좋아요:댓글" 문자열이며 최근 N개만 보관합니다(RPUSH + LTRIM).
+저장/조회는 파이프라인으로 묶어 영상 수만큼 왕복하지 않습니다.
+
+감시는 사용자별 SET에 기록하고 영상별 감시자 수(HASH)를 함께 관리합니다.
+전체 감시 대상 SET에는 첫 감시자가 등록할 때 추가하고 마지막 감시자가 해제할 때 제거합니다
+(Lua 스크립트로 원자적으로 처리하여 다른 사용자의 감시를 해제하지 않음).
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from src.config import settings
+from src.core.cache import CacheService, cache_service as default_cache_service
+from src.core.youtube.search_service import YouTubeSearchService
+
+logger = logging.getLogger(__name__)
+
+WATCHED_KEY = "youtube:stats:watched"
+WATCHERS_KEY = "youtube:stats:watchers"
+USER_WATCHED_KEY_PREFIX = "youtube:stats:watched:user"
+SERIES_KEY_PREFIX = "youtube:stats:series"
+
+# 사용자 감시 목록에 새로 추가된 영상만 감시자 수 증가, 첫 감시자면 전체 감시 대상에 추가
+# KEYS: 사용자 감시 SET, 감시자 수 HASH, 전체 감시 대상 SET / ARGV: 영상 ID
+WATCH_SCRIPT = """
+local added = 0
+for _, video_id in ipairs(ARGV) do
+    if redis.call("sadd", KEYS[1], video_id) == 1 then
+        added = added + 1
+        if redis.call("hincrby", KEYS[2], video_id, 1) == 1 then
+            redis.call("sadd", KEYS[3], video_id)
+        end
+    end
+end
+return added
+"""
+
+# 사용자 감시 목록에서 제거된 영상만 감시자 수 감소, 마지막 감시자면 전체 감시 대상에서 제거
+UNWATCH_SCRIPT = """
+local removed = 0
+for _, video_id in ipairs(ARGV) do
+    if redis.call("srem", KEYS[1], video_id) == 1 then
+        removed = removed + 1
+        if redis.call("hincrby", KEYS[2], video_id, -1) <= 0 then
+            redis.call("hdel", KEYS[2], video_id)
+            redis.call("srem", KEYS[3], video_id)
+        end
+    end
+end
+return removed
+"""
+
+# 파이프라인 1회에 묶는 영상 수
+PIPELINE_BATCH_SIZE = 1000
+
+
+def compute_velocity(points: Sequence[Dict[str, int]]) -> Dict[str, Optional[float]]:
+    """
+    최근 스냅샷으로 조회수 증가 속도/가속도 계산
+
+    Args:
+        points: 시간순 스냅샷 목록 ({"timestamp", "view_count", ...})
+
+    Returns:
+        Dict[str, Optional[float]]:
+            view_velocity: 마지막 구간의 시간당 조회수 증가량 (스냅샷 2개 이상)
+            view_acceleration: 직전 구간 대비 시간당 속도 변화량 (스냅샷 3개 이상)
+    """
+
+    def velocity(older: Dict[str, int], newer: Dict[str, int]) -> Optional[float]:
+        hours = (newer["timestamp"] - older["timestamp"]) / 3600
+        if hours <= 0:
+            return None
+        return (newer["view_count"] - older["view_count"]) / hours
+
+    result: Dict[str, Optional[float]] = {"view_velocity": None, "view_acceleration": None}
+    if len(points) < 2:
+        return result
+
+    result["view_velocity"] = velocity(points[-2], points[-1])
+    if len(points) >= 3 and result["view_velocity"] is not None:
+        previous = velocity(points[-3], points[-2])
+        span_hours = (points[-1]["timestamp"] - points[-3]["timestamp"]) / 2 / 3600
+        if previous is not None and span_hours > 0:
+            result["view_acceleration"] = (result["view_velocity"] - previous) / span_hours
+    return result
+
+
+class VideoStatsTimeSeries:
+    """감시 대상 영상 목록과 영상별 통계 스냅샷 저장소"""
+
+    def __init__(
+        self,
+        cache: Optional[CacheService] = None,
+        retention: Optional[int] = None,
+        interval: Optional[int] = None,
+    ):
+        """
+        통계 시계열 저장소 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            retention: 영상별 보관 스냅샷 수 (기본값: settings.YOUTUBE_STATS_SNAPSHOT_RETENTION)
+            interval: 스냅샷 주기 (초, 기본값: settings.YOUTUBE_STATS_SNAPSHOT_INTERVAL)
+        """
+        self.cache = cache or default_cache_service
+        self.retention = retention or settings.YOUTUBE_STATS_SNAPSHOT_RETENTION
+        self.interval = interval or settings.YOUTUBE_STATS_SNAPSHOT_INTERVAL
+
+    @property
+    def series_ttl(self) -> int:
+        """스냅샷 만료 시간 (감시 해제 후 보관 기간이 지나면 자동 삭제)"""
+        return self.retention * self.interval * 2
+
+    def _key(self, video_id: str) -> str:
+        return f"{SERIES_KEY_PREFIX}:{video_id}"
+
+    def _user_key(self, user_id: str) -> str:
+        return f"{USER_WATCHED_KEY_PREFIX}:{user_id}"
+
+    def watch(self, user_id: str, video_ids: Iterable[str]) -> int:
+        """
+        사용자 감시 대상 영상 추가
+
+        Args:
+            user_id: 사용자 ID
+            video_ids: 영상 ID 목록
+
+        Returns:
+            int: 사용자 감시 목록에 새로 추가된 영상 수
+        """
+        video_ids = list(video_ids)
+        if not video_ids:
+            return 0
+        return self.cache.client.eval(
+            WATCH_SCRIPT, 3, self._user_key(user_id), WATCHERS_KEY, WATCHED_KEY, *video_ids
+        )
+
+    def unwatch(self, user_id: str, video_ids: Iterable[str]) -> int:
+        """
+        사용자 감시 대상 영상 제거
+
+        다른 사용자가 감시 중인 영상은 전체 감시 대상에 남습니다.
+        기존 스냅샷은 만료 시간까지 유지됩니다.
+
+        Args:
+            user_id: 사용자 ID
+            video_ids: 영상 ID 목록
+
+        Returns:
+            int: 사용자 감시 목록에서 제거된 영상 수
+        """
+        video_ids = list(video_ids)
+        if not video_ids:
+            return 0
+        return self.cache.client.eval(
+            UNWATCH_SCRIPT, 3, self._user_key(user_id), WATCHERS_KEY, WATCHED_KEY, *video_ids
+        )
+
+    def watched_count(self, user_id: Optional[str] = None) -> int:
+        """
+        감시 대상 영상 수
+
+        Args:
+            user_id: 사용자 ID (없으면 전체 감시 대상 수)
+        """
+        return self.cache.client.scard(self._user_key(user_id) if user_id else WATCHED_KEY)
+
+    def iter_watched(self, batch_size: int = 5000) -> Iterator[List[str]]:
+        """
+        감시 대상 영상 ID를 배치 단위로 순회 (SSCAN, 전체 목록을 한 번에 읽지 않음)
+
+        Args:
+            batch_size: 배치 크기
+
+        Yields:
+            List[str]: 영상 ID 배치
+        """
+        batch: List[str] = []
+        for video_id in self.cache.client.sscan_iter(WATCHED_KEY, count=batch_size):
+            batch.append(video_id)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def append(
+        self, snapshots: Dict[str, Dict[str, int]], sampled_at: Optional[datetime] = None
+    ) -> int:
+        """
+        영상별 통계 스냅샷 추가 (RPUSH + LTRIM + EXPIRE, 파이프라인)
+
+        Args:
+            snapshots: 영상 ID → {"view_count", "like_count", "comment_count"}
+            sampled_at: 수집 시각 (기본값: 현재 UTC)
+
+        Returns:
+            int: 저장한 스냅샷 수
+        """
+        timestamp = int((sampled_at or datetime.now(timezone.utc)).timestamp())
+        items = list(snapshots.items())
+
+        for start in range(0, len(items), PIPELINE_BATCH_SIZE):
+            pipe = self.cache.client.pipeline(transaction=False)
+            for video_id, stats in items[start:start + PIPELINE_BATCH_SIZE]:
+                key = self._key(video_id)
+                pipe.rpush(
+                    key,
+                    f"{timestamp}:{stats['view_count']}:{stats['like_count']}:"
+                    f"{stats['comment_count']}",
+                )
+                pipe.ltrim(key, -self.retention, -1)
+                pipe.expire(key, self.series_ttl)
+            pipe.execute()
+        return len(items)
+
+    def get_series(self, video_ids: Sequence[str]) -> Dict[str, List[Dict[str, int]]]:
+        """
+        영상별 스냅샷 조회 (LRANGE, 파이프라인 1회)
+
+        Args:
+            video_ids: 영상 ID 목록
+
+        Returns:
+            Dict[str, List[Dict[str, int]]]: 영상 ID → 시간순 스냅샷 목록
+                ({"timestamp", "view_count", "like_count", "comment_count"})
+        """
+        pipe = self.cache.client.pipeline(transaction=False)
+        for video_id in video_ids:
+            pipe.lrange(self._key(video_id), 0, -1)
+        raw_series = pipe.execute()
+
+        series: Dict[str, List[Dict[str, int]]] = {}
+        for video_id, entries in zip(video_ids, raw_series):
+            points: List[Dict[str, Any]] = []
+            for entry in entries:
+                timestamp, views, likes, comments = (int(x) for x in entry.split(":"))
+                points.append({
+                    "timestamp": timestamp,
+                    "view_count": views,
+                    "like_count": likes,
+                    "comment_count": comments,
+                })
+            series[video_id] = points
+        return series
+
+
+async def run_stats_snapshot(
+    youtube_service: YouTubeSearchService,
+    timeseries: VideoStatsTimeSeries,
+    batch_size: int = 5000,
+) -> Dict[str, Any]:
+    """
+    감시 대상 영상 전체의 통계 스냅샷 수집
+
+    SSCAN 배치마다 videos.list(50개당 1 unit)를 제한된 동시성으로 호출하고
+    배치 결과를 파이프라인으로 저장합니다. 할당량이 부족하면 배치 중 조회에 성공한 청크까지
+    저장하고 중단합니다.
+
+    Args:
+        youtube_service: YouTube 검색 서비스 (서버 키 풀)
+        timeseries: 통계 시계열 저장소
+        batch_size: 배치당 영상 수
+
+    Returns:
+        Dict[str, Any]: {"requested", "stored", "missing", "quota_exhausted"}
+    """
+    sampled_at = datetime.now(timezone.utc)
+    requested = stored = 0
+    quota_exhausted = False
+
+    for video_ids in timeseries.iter_watched(batch_size):
+        snapshots, skipped = await youtube_service.fetch_video_statistics(video_ids)
+        requested += len(video_ids) - len(skipped)
+        stored += timeseries.append(snapshots, sampled_at=sampled_at)
+        if skipped:
+            logger.warning(
+                f"영상 통계 스냅샷 중단 (할당량 부족): stored={stored}, skipped={len(skipped)}"
+            )
+            quota_exhausted = True
+            break
+
+    logger.info(
+        f"영상 통계 스냅샷 완료: requested={requested}, stored={stored}, "
+        f"quota_exhausted={quota_exhausted}"
+    )
+    return {
+        "requested": requested,
+        "stored": stored,
+        "missing": requested - stored,
+        "quota_exhausted": quota_exhausted,
+    }
+
+
+# 전역 통계 시계열 인스턴스
+_stats_timeseries: Optional[VideoStatsTimeSeries] = None
+
+
+def get_stats_timeseries() -> VideoStatsTimeSeries:
+    """
+    전역 영상 통계 시계열 저장소 반환
+
+    Returns:
+        VideoStatsTimeSeries: 통계 시계열 저장소
+    """
+    global _stats_timeseries
+
+    if _stats_timeseries is None:
+        _stats_timeseries = VideoStatsTimeSeries()
+
+    return _stats_timeseries
@@ -0,0 +1,339 @@
+"""
+YouTube 자막 일괄 수집 작업
+
+검색 결과 등에서 고른 영상 목록(최대 500개)의 자막을 Celery 작업 하나로 수집하여 자막 저장소에 저장합니다.
+
+- 동시성: 워커 N개가 영상 목록을 나눠 처리 (자막 조회는 스레드에서 실행되므로 동시 스레드 수 = N)
+- 호스트별 요청 간격: youtube.com 요청 시작 시각을 최소 간격 이상 벌리고, 차단되면 일정 시간 대기
+- 진행 상황: 작업 레코드(JSON)와 영상별 결과(Redis HASH)를 저장하여 API에서 조회
+
+이미 저장된 자막은 YouTube를 호출하지 않으며, 워커가 재시작되면 결과가 없거나 차단된 영상만 이어서 처리합니다.
+요청이 차단된 영상은 호스트 대기 시간 이후 목록 끝에서 다시 조회합니다 (최대 재시도 횟수까지).
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from src.config import settings
+from src.core.cache import CacheService, cache_service as default_cache_service
+from src.core.youtube.exceptions import (
+    TranscriptRequestBlockedError,
+    TranscriptUnavailableError,
+    YouTubeAPIError,
+)
+from src.core.youtube.transcript_negative_cache import (
+    TranscriptNegativeCache,
+    get_transcript_negative_cache,
+)
+from src.core.youtube.transcript_service import DEFAULT_LANGUAGES, TranscriptService
+from src.core.youtube.transcript_store import TranscriptStore, get_transcript_store
+
+logger = logging.getLogger(__name__)
+
+HARVEST_KEY_PREFIX = "youtube:transcript_harvest"
+
+# youtube-transcript-api가 요청하는 호스트
+TRANSCRIPT_HOST = "www.youtube.com"
+
+# 작업 상태
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+# 영상별 결과 상태
+RESULT_FETCHED = "fetched"  # YouTube에서 받아 저장
+RESULT_STORED = "stored"  # 이미 저장된 자막
+RESULT_BLOCKED = "blocked"  # YouTube 요청 차단 (재시작 시 다시 조회)
+RESULT_FAILED = "failed"  # 기타 오류
+RESULT_INVALID_ID = "invalid_id"  # 영상 ID/URL 해석 실패
+# 자막 없음: TranscriptUnavailableError.reason (disabled, not_found, video_unavailable)
+
+
+class HostPacer:
+    """호스트별 요청 간격 조절 (요청 시작 시각을 최소 간격 이상 벌림)"""
+
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: 같은 호스트 요청 사이의 최소 간격 (초)
+        """
+        self.interval = interval
+        self._next_slot: Dict[str, float] = {}
+        self._resume_at: Dict[str, float] = {}
+
+    async def wait(self, host: str) -> None:
+        """호스트의 다음 요청 차례까지 대기 (대기 중 요청이 중단되면 재개 후 차례를 다시 받음)"""
+        while True:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, 0.0))
+            self._next_slot[host] = slot + self.interval
+            if slot > now:
+                await asyncio.sleep(slot - now)
+            if self._resume_at.get(host, 0.0) <= time.monotonic():
+                return
+
+    def backoff(self, host: str, seconds: float) -> None:
+        """호스트 요청을 일정 시간 중단 (차단 응답 후)"""
+        resume_at = time.monotonic() + seconds
+        self._resume_at[host] = max(self._resume_at.get(host, 0.0), resume_at)
+        self._next_slot[host] = max(self._next_slot.get(host, 0.0), resume_at)
+
+
+class TranscriptHarvestStore:
+    """자막 일괄 수집 작업 레코드와 영상별 결과 저장소"""
+
+    def __init__(self, cache: Optional[CacheService] = None, ttl: Optional[int] = None):
+        """
+        자막 수집 작업 저장소 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            ttl: 작업 상태/결과 보관 기간 (초, 기본값: settings.YOUTUBE_TRANSCRIPT_HARVEST_TTL)
+        """
+        self.cache = cache or default_cache_service
+        self.ttl = ttl or settings.YOUTUBE_TRANSCRIPT_HARVEST_TTL
+
+    def _key(self, job_id: str) -> str:
+        return f"{HARVEST_KEY_PREFIX}:{job_id}"
+
+    def _results_key(self, job_id: str) -> str:
+        return f"{HARVEST_KEY_PREFIX}:{job_id}:results"
+
+    def create(
+        self,
+        user_id: str,
+        video_ids: List[str],
+        languages: Optional[List[str]] = None,
+        invalid: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        수집 작업 생성 (해석할 수 없는 입력은 invalid_id 결과로 바로 기록)
+
+        Args:
+            user_id: 요청 사용자 ID
+            video_ids: 수집할 영상 ID 목록 (중복 제거된 순서)
+            languages: 선호 언어 목록 (기본값: ['ko', 'en'])
+            invalid: 영상 ID로 해석할 수 없는 입력 목록
+
+        Returns:
+            Dict[str, Any]: 작업 레코드
+        """
+        record = {
+            "id": uuid4().hex,
+            "user_id": user_id,
+            "video_ids": video_ids,
+            "invalid": invalid or [],
+            "languages": languages or DEFAULT_LANGUAGES,
+            "status": STATUS_QUEUED,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+            "error": None,
+        }
+        self.save(record)
+        for value in record["invalid"]:
+            self.record_result(record["id"], value, {"status": RESULT_INVALID_ID})
+        return record
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 레코드 조회"""
+        return self.cache.get(self._key(job_id))
+
+    def save(self, record: Dict[str, Any]) -> bool:
+        """작업 레코드 저장"""
+        return self.cache.set(self._key(record["id"]), record, ttl=self.ttl)
+
+    def record_result(self, job_id: str, video_id: str, result: Dict[str, Any]) -> None:
+        """영상별 결과 기록 (HSET + EXPIRE)"""
+        key = self._results_key(job_id)
+        pipe = self.cache.client.pipeline(transaction=False)
+        pipe.hset(key, video_id, json.dumps(result, ensure_ascii=False))
+        pipe.expire(key, self.ttl)
+        pipe.execute()
+
+    def results(self, job_id: str) -> Dict[str, Dict[str, Any]]:
+        """영상별 결과 전체 조회 (영상 ID → 결과)"""
+        raw = self.cache.client.hgetall(self._results_key(job_id))
+        return {video_id: json.loads(value) for video_id, value in raw.items()}
+
+
+def summarize_results(results: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+    """결과 상태별 영상 수"""
+    return dict(Counter(result["status"] for result in results.values()))
+
+
+async def harvest_transcript(
+    video_id: str,
+    languages: List[str],
+    transcript_store: TranscriptStore,
+    pacer: HostPacer,
+    blocked_backoff: float,
+    negative_cache: TranscriptNegativeCache,
+) -> Dict[str, Any]:
+    """
+    영상 1개 자막 수집
+
+    저장된 자막이나 자막 없음 캐시 기록이 있으면 YouTube를 호출하지 않고,
+    없으면 호스트 차례를 기다려 조회한 뒤 저장합니다.
+
+    Args:
+        video_id: YouTube 영상 ID
+        languages: 선호 언어 목록
+        transcript_store: 자막 저장소
+        pacer: 호스트별 요청 간격 조절기
+        blocked_backoff: 요청 차단 시 호스트 대기 시간 (초)
+        negative_cache: 자막 없음 캐시
+
+    Returns:
+        Dict[str, Any]: 영상별 결과 (status, language_code, segments, error)
+    """
+    try:
+        stored = await transcript_store.find(video_id, languages)
+    except Exception as e:
+        logger.warning(f"저장된 자막 조회 실패: video_id={video_id}, error={e}")
+        stored = None
+    if stored:
+        return {"status": RESULT_STORED, "language_code": stored["language_code"]}
+
+    cached_error = negative_cache.get(video_id, languages)
+    if cached_error:
+        return {"status": cached_error.reason}
+
+    await pacer.wait(TRANSCRIPT_HOST)
+    try:
+        record = await TranscriptService.fetch_transcript(video_id, languages, negative_cache)
+    except TranscriptUnavailableError as e:
+        return {"status": e.reason}
+    except TranscriptRequestBlockedError as e:
+        pacer.backoff(TRANSCRIPT_HOST, blocked_backoff)
+        return {"status": RESULT_BLOCKED, "error": e.message}
+    except YouTubeAPIError as e:
+        return {"status": RESULT_FAILED, "error": e.message}
+
+    try:
+        await transcript_store.save(record)
+    except Exception as e:
+        logger.warning(f"자막 저장 실패: video_id={video_id}, error={e}")
+    return {
+        "status": RESULT_FETCHED,
+        "language_code": record["language_code"],
+        "segments": len(record["segments"]),
+    }
+
+
+async def run_transcript_harvest(
+    job_id: str,
+    store: TranscriptHarvestStore,
+    transcript_store: Optional[TranscriptStore] = None,
+    workers: Optional[int] = None,
+    pacer: Optional[HostPacer] = None,
+    blocked_backoff: Optional[float] = None,
+    negative_cache: Optional[TranscriptNegativeCache] = None,
+    blocked_retries: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    자막 일괄 수집 작업 실행
+
+    Args:
+        job_id: 작업 ID
+        store: 자막 수집 작업 저장소
+        transcript_store: 자막 저장소 (기본값: 전역 TranscriptStore)
+        workers: 동시 조회 수 (기본값: settings.YOUTUBE_TRANSCRIPT_HARVEST_WORKERS)
+        pacer: 호스트별 요청 간격 조절기 (기본값: settings.YOUTUBE_TRANSCRIPT_HARVEST_INTERVAL)
+        blocked_backoff: 요청 차단 시 호스트 대기 시간
+            (기본값: settings.YOUTUBE_TRANSCRIPT_HARVEST_BLOCKED_BACKOFF)
+        negative_cache: 자막 없음 캐시 (기본값: 전역 TranscriptNegativeCache)
+        blocked_retries: 요청 차단 영상 재시도 횟수
+            (기본값: settings.YOUTUBE_TRANSCRIPT_HARVEST_BLOCKED_RETRIES)
+
+    Returns:
+        Dict[str, int]: 결과 상태별 영상 수
+    """
+    record = store.get(job_id)
+    if not record:
+        logger.warning(f"자막 수집 작업을 찾을 수 없음: job_id={job_id}")
+        return {}
+
+    transcript_store = transcript_store or get_transcript_store()
+    negative_cache = negative_cache or get_transcript_negative_cache()
+    workers = workers or settings.YOUTUBE_TRANSCRIPT_HARVEST_WORKERS
+    pacer = pacer or HostPacer(settings.YOUTUBE_TRANSCRIPT_HARVEST_INTERVAL)
+    if blocked_backoff is None:
+        blocked_backoff = settings.YOUTUBE_TRANSCRIPT_HARVEST_BLOCKED_BACKOFF
+    if blocked_retries is None:
+        blocked_retries = settings.YOUTUBE_TRANSCRIPT_HARVEST_BLOCKED_RETRIES
+
+    # 재시작된 작업은 결과가 없거나 차단된 영상만 처리
+    done = {
+        video_id
+        for video_id, result in store.results(job_id).items()
+        if result["status"] != RESULT_BLOCKED
+    }
+    pending = deque(video_id for video_id in record["video_ids"] if video_id not in done)
+    attempts: Counter = Counter()
+
+    record["status"] = STATUS_RUNNING
+    record["started_at"] = record.get("started_at") or time.time()
+    store.save(record)
+    logger.info(
+        f"자막 수집 시작: job_id={job_id}, videos={len(record['video_ids'])}, "
+        f"remaining={len(record['video_ids']) - len(done)}, workers={workers}"
+    )
+
+    async def worker():
+        # 워커들이 같은 큐를 공유하므로 영상마다 한 워커만 처리
+        while pending:
+            video_id = pending.popleft()
+            attempts[video_id] += 1
+            result = await harvest_transcript(
+                video_id,
+                record["languages"],
+                transcript_store,
+                pacer,
+                blocked_backoff,
+                negative_cache,
+            )
+            store.record_result(job_id, video_id, result)
+            if result["status"] == RESULT_BLOCKED and attempts[video_id] <= blocked_retries:
+                # 호스트 대기 시간이 지난 뒤 다시 조회
+                pending.append(video_id)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(workers)))
+    except Exception as e:
+        logger.error(f"자막 수집 실패: job_id={job_id}, error={e}", exc_info=True)
+        record["status"] = STATUS_FAILED
+        record["error"] = str(e)
+    else:
+        record["status"] = STATUS_COMPLETED
+    record["finished_at"] = time.time()
+    store.save(record)
+
+    summary = summarize_results(store.results(job_id))
+    logger.info(f"자막 수집 종료: job_id={job_id}, status={record['status']}, results={summary}")
+    return summary
+
+
+# 전역 자막 수집 작업 저장소 인스턴스
+_transcript_harvest_store: Optional[TranscriptHarvestStore] = None
+
+
+def get_transcript_harvest_store() -> TranscriptHarvestStore:
+    """
+    전역 자막 수집 작업 저장소 반환
+
+    Returns:
+        TranscriptHarvestStore: 자막 수집 작업 저장소
+    """
+    global _transcript_harvest_store
+
+    if _transcript_harvest_store is None:
+        _transcript_harvest_store = TranscriptHarvestStore()
+
+    return _transcript_harvest_store
@@ -0,0 +1,117 @@
+"""
+자막 없음 캐시 (negative cache)
+
+자막이 비활성화된 영상, 요청 언어의 자막이 없는 영상, 사용할 수 없는 영상은 조회해도 같은 결과이므로
+사유별로 짧은 TTL 동안 기록하고, 그 사이의 요청은 YouTube를 호출하지 않고 같은 에러로 응답합니다.
+
+- disabled, video_unavailable: 영상 단위 (언어와 무관)
+- not_found: 영상 + 선호 언어 목록 단위 (다른 언어 요청은 영향 없음)
+"""
+
+import logging
+from typing import Dict, Optional, Sequence
+
+from src.config import settings
+from src.core.cache import CacheService, cache_service as default_cache_service
+from src.core.youtube.exceptions import TranscriptUnavailableError
+
+logger = logging.getLogger(__name__)
+
+NEGATIVE_KEY_PREFIX = "youtube:transcript:unavailable"
+
+
+class TranscriptNegativeCache:
+    """자막 없음 사유별 캐시"""
+
+    def __init__(
+        self,
+        cache: Optional[CacheService] = None,
+        ttls: Optional[Dict[str, int]] = None,
+    ):
+        """
+        자막 없음 캐시 초기화
+
+        Args:
+            cache: 캐시 서비스 (기본값: 전역 CacheService)
+            ttls: 사유 → TTL (초, 기본값: settings.YOUTUBE_TRANSCRIPT_*_TTL)
+        """
+        self.cache = cache or default_cache_service
+        self.ttls = ttls or {
+            TranscriptUnavailableError.DISABLED: settings.YOUTUBE_TRANSCRIPT_DISABLED_TTL,
+            TranscriptUnavailableError.NOT_FOUND: settings.YOUTUBE_TRANSCRIPT_NOT_FOUND_TTL,
+            TranscriptUnavailableError.VIDEO_UNAVAILABLE: (
+                settings.YOUTUBE_TRANSCRIPT_UNAVAILABLE_TTL
+            ),
+        }
+
+    def _video_key(self, video_id: str) -> str:
+        return f"{NEGATIVE_KEY_PREFIX}:{video_id}"
+
+    def _languages_key(self, video_id: str, languages: Sequence[str]) -> str:
+        return f"{NEGATIVE_KEY_PREFIX}:{video_id}:{','.join(languages)}"
+
+    def get(
+        self, video_id: str, languages: Optional[Sequence[str]] = None
+    ) -> Optional[TranscriptUnavailableError]:
+        """
+        기록된 자막 없음 에러 조회
+
+        Args:
+            video_id: YouTube 영상 ID
+            languages: 선호 언어 목록 (없으면 영상 단위 기록만 확인)
+
+        Returns:
+            Optional[TranscriptUnavailableError]: 기록된 에러 (없으면 None)
+        """
+        keys = [self._video_key(video_id)]
+        if languages:
+            keys.append(self._languages_key(video_id, languages))
+        hits = self.cache.get_many(keys)
+        entry = next((hits[key] for key in keys if key in hits), None)
+        if not entry:
+            return None
+        return TranscriptUnavailableError(entry["message"], video_id, entry["reason"])
+
+    def record(
+        self, error: TranscriptUnavailableError, languages: Optional[Sequence[str]] = None
+    ) -> bool:
+        """
+        자막 없음 에러 기록 (사유별 TTL)
+
+        Args:
+            error: 자막 없음 에러
+            languages: 요청한 선호 언어 목록 (not_found 기록에 사용)
+
+        Returns:
+            bool: 저장 성공 여부
+        """
+        video_id = error.details["video_id"]
+        if error.reason == TranscriptUnavailableError.NOT_FOUND:
+            if not languages:
+                return False
+            key = self._languages_key(video_id, languages)
+        else:
+            key = self._video_key(video_id)
+        ttl = self.ttls.get(error.reason)
+        if not ttl:
+            return False
+        return self.cache.set(key, {"reason": error.reason, "message": error.message}, ttl=ttl)
+
+
+# 전역 자막 없음 캐시 인스턴스
+_transcript_negative_cache: Optional[TranscriptNegativeCache] = None
+
+
+def get_transcript_negative_cache() -> TranscriptNegativeCache:
+    """
+    전역 자막 없음 캐시 반환
+
+    Returns:
+        TranscriptNegativeCache: 자막 없음 캐시
+    """
+    global _transcript_negative_cache
+
+    if _transcript_negative_cache is None:
+        _transcript_negative_cache = TranscriptNegativeCache()
+
+    return _transcript_negative_cache
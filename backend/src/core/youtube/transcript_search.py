@@ -0,0 +1,321 @@
+"""
+YouTube 자막 전문 검색 (저장된 자막 세그먼트)
+
+"X를 언급한 영상"을 YouTube 호출 없이 찾기 위해 저장된 자막을 세그먼트 단위로 색인합니다.
+
+한국어는 단어에 조사가 붙어 'simple' 사전의 단어 일치로는 찾을 수 없으므로 세그먼트 텍스트를 n-gram 토큰으로 저장하고
+Postgres GIN 인덱스(to_tsvector('simple', search_terms))로 검색합니다.
+
+- 영문/숫자 단어: 소문자 단어 그대로 (검색 시 접두어 일치)
+- 한글 등 그 외 문자 단어: 2글자 n-gram 뒤에 마지막 글자 (1글자 단어는 그대로)
+- 검색어: 단어마다 n-gram을 인접 위치(<->)로 묶어 단어 안 부분 문자열과 일치시키고, 단어끼리는 AND
+- 1글자 검색어: 접두어 일치(자:*) - 단어의 모든 글자는 n-gram의 첫 글자이거나 마지막 글자 토큰이므로 빠짐없이 일치
+
+결과는 (video_id, language_code, seq) 순서의 keyset 페이지네이션으로 반환합니다 (OFFSET 미사용).
+Postgres 외 DB(로컬 SQLite 등)에서는 같은 조건을 세그먼트 텍스트 LIKE로 검색합니다.
+"""
+
+import base64
+import json
+import logging
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, exists, func, insert, literal_column, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.models.youtube_transcript import YouTubeTranscript, YouTubeTranscriptSegment
+
+logger = logging.getLogger(__name__)
+
+# 영문/숫자 단어 또는 그 외 문자(한글 등) 단어
+_WORD = re.compile(r"[0-9a-z]+|[^\W\d_a-z]+")
+
+# 텍스트 검색 설정 (인덱스 식과 같은 리터럴이어야 GIN 인덱스 사용)
+_SIMPLE = literal_column("'simple'")
+
+# 스니펫 길이 (문자)
+SNIPPET_LENGTH = 120
+
+# 검색어 최대 단어 수
+MAX_QUERY_WORDS = 8
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall(text.lower())
+
+
+def _bigrams(word: str) -> List[str]:
+    if word.isascii() or len(word) < 2:
+        return [word]
+    return [word[i:i + 2] for i in range(len(word) - 1)]
+
+
+def _word_tokens(word: str) -> List[str]:
+    # 마지막 글자는 어떤 n-gram의 첫 글자도 아니므로 1글자 검색어용 토큰을 덧붙임
+    if word.isascii() or len(word) < 2:
+        return [word]
+    return _bigrams(word) + [word[-1]]
+
+
+def search_tokens(text: str) -> str:
+    """
+    세그먼트 텍스트 → 검색 토큰 문자열 (search_terms 컬럼 값)
+
+    Args:
+        text: 세그먼트 텍스트
+
+    Returns:
+        str: 공백으로 구분한 토큰 (단어 순서 유지, 단어 안 n-gram은 연속 위치)
+    """
+    return " ".join(token for word in _words(text) for token in _word_tokens(word))
+
+
+def query_words(query: str) -> List[str]:
+    """검색어 단어 목록 (중복 제거, 최대 MAX_QUERY_WORDS개)"""
+    return list(dict.fromkeys(_words(query)))[:MAX_QUERY_WORDS]
+
+
+def build_tsquery(words: List[str]) -> str:
+    """
+    검색어 단어 → to_tsquery('simple', ...) 식
+
+    Examples:
+        >>> build_tsquery(["ai", "자막생성", "자"])
+        "ai:* & (자막 <-> 막생 <-> 생성) & 자:*"
+    """
+    parts = []
+    for word in words:
+        if word.isascii() or len(word) < 2:
+            parts.append(f"{word}:*")
+        else:
+            parts.append(f"({' <-> '.join(_bigrams(word))})")
+    return " & ".join(parts)
+
+
+def encode_cursor(video_id: str, language_code: str, seq: int) -> str:
+    """마지막 결과 위치 → 페이지 커서"""
+    payload = json.dumps([video_id, language_code, seq], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str, int]:
+    """
+    페이지 커서 → 마지막 결과 위치
+
+    Raises:
+        ValueError: 커서 형식이 올바르지 않은 경우
+    """
+    try:
+        video_id, language_code, seq = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return str(video_id), str(language_code), int(seq)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def make_snippet(text: str, words: List[str], length: int = SNIPPET_LENGTH) -> str:
+    """첫 번째로 일치한 검색어 주변의 텍스트 (길면 말줄임)"""
+    if len(text) <= length:
+        return text
+    lowered = text.lower()
+    position = min((lowered.find(word) for word in words if word in lowered), default=0)
+    start = max(0, min(position - length // 3, len(text) - length))
+    snippet = text[start:start + length]
+    return ("…" if start else "") + snippet + ("…" if start + length < len(text) else "")
+
+
+def segment_rows(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """자막 레코드 → 세그먼트 색인 행 목록"""
+    return [
+        {
+            "video_id": record["video_id"],
+            "language_code": record["language_code"],
+            "seq": seq,
+            "start": float(segment["start"]),
+            "duration": float(segment.get("duration") or 0.0),
+            "text": segment["text"],
+            "search_terms": search_tokens(segment["text"]),
+        }
+        for seq, segment in enumerate(record["segments"])
+        if segment.get("text")
+    ]
+
+
+async def replace_segments(session: AsyncSession, record: Dict[str, Any]) -> int:
+    """
+    자막의 세그먼트 색인 교체 (호출한 세션의 트랜잭션에서 실행)
+
+    Args:
+        session: 비동기 세션 (자막 행이 먼저 flush되어 있어야 함)
+        record: 자막 레코드 (video_id, language_code, segments)
+
+    Returns:
+        int: 색인한 세그먼트 수
+    """
+    Segment = YouTubeTranscriptSegment
+    await session.execute(
+        delete(Segment).where(
+            Segment.video_id == record["video_id"],
+            Segment.language_code == record["language_code"],
+        )
+    )
+    rows = segment_rows(record)
+    if rows:
+        await session.execute(insert(Segment), rows)
+    return len(rows)
+
+
+class TranscriptSearchIndex:
+    """저장된 자막 세그먼트 전문 검색"""
+
+    def __init__(self, session_factory: Optional[async_sessionmaker[AsyncSession]] = None):
+        """
+        자막 검색 인덱스 초기화
+
+        Args:
+            session_factory: 비동기 세션 팩토리 (기본값: src.core.database.AsyncSessionLocal)
+        """
+        if session_factory is None:
+            from src.core.database import AsyncSessionLocal
+
+            session_factory = AsyncSessionLocal
+        self.session_factory = session_factory
+
+    def _match(self, dialect: str, words: List[str]):
+        """검색 조건 (Postgres: GIN 인덱스 tsquery, 그 외: 텍스트 LIKE)"""
+        Segment = YouTubeTranscriptSegment
+        if dialect == "postgresql":
+            return func.to_tsvector(_SIMPLE, Segment.search_terms).op("@@")(
+                func.to_tsquery(_SIMPLE, build_tsquery(words))
+            )
+        return and_(*(Segment.text.ilike(f"%{word}%") for word in words))
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        language_code: Optional[str] = None,
+        video_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        자막 세그먼트 검색
+
+        Args:
+            query: 검색어
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor
+            language_code: 자막 언어 필터
+            video_id: 영상 필터
+
+        Returns:
+            Dict[str, Any]:
+                results: [{"video_id", "language_code", "seq", "start", "duration", "snippet"}]
+                next_cursor: 다음 페이지 커서 (마지막 페이지면 None)
+
+        Raises:
+            ValueError: 커서 형식이 올바르지 않은 경우
+        """
+        words = query_words(query)
+        if not words:
+            return {"results": [], "next_cursor": None}
+
+        Segment = YouTubeTranscriptSegment
+        key = (Segment.video_id, Segment.language_code, Segment.seq)
+        async with self.session_factory() as session:
+            stmt = (
+                select(*key, Segment.start, Segment.duration, Segment.text)
+                .where(self._match(session.bind.dialect.name, words))
+                .order_by(*key)
+                .limit(limit + 1)
+            )
+            if cursor:
+                stmt = stmt.where(tuple_(*key) > tuple_(*decode_cursor(cursor)))
+            if language_code:
+                stmt = stmt.where(Segment.language_code == language_code)
+            if video_id:
+                stmt = stmt.where(Segment.video_id == video_id)
+            rows = (await session.execute(stmt)).all()
+
+        page = rows[:limit]
+        last = page[-1] if len(rows) > limit else None
+        return {
+            "results": [
+                {
+                    "video_id": row.video_id,
+                    "language_code": row.language_code,
+                    "seq": row.seq,
+                    "start": row.start,
+                    "duration": row.duration,
+                    "snippet": make_snippet(row.text, words),
+                }
+                for row in page
+            ],
+            "next_cursor": (
+                encode_cursor(last.video_id, last.language_code, last.seq) if last else None
+            ),
+        }
+
+    async def backfill(self, batch_size: int = 100) -> int:
+        """
+        세그먼트 색인이 없는 저장된 자막 색인 (색인 도입 이전 자막)
+
+        Args:
+            batch_size: 트랜잭션당 자막 수
+
+        Returns:
+            int: 색인한 자막 수
+        """
+        Segment = YouTubeTranscriptSegment
+        key = (YouTubeTranscript.video_id, YouTubeTranscript.language_code)
+        missing = ~exists().where(
+            Segment.video_id == YouTubeTranscript.video_id,
+            Segment.language_code == YouTubeTranscript.language_code,
+        )
+        indexed = 0
+        last: Optional[Tuple[str, str]] = None
+        while True:
+            async with self.session_factory() as session:
+                # 텍스트 없는 자막은 색인 행이 생기지 않으므로 기본 키 순서로 건너뛰며 진행
+                stmt = select(YouTubeTranscript).where(missing).order_by(*key).limit(batch_size)
+                if last:
+                    stmt = stmt.where(tuple_(*key) > tuple_(*last))
+                transcripts = (await session.execute(stmt)).scalars().all()
+                indexable = [t for t in transcripts if any(s.get("text") for s in t.segments)]
+                for transcript in indexable:
+                    await replace_segments(
+                        session,
+                        {
+                            "video_id": transcript.video_id,
+                            "language_code": transcript.language_code,
+                            "segments": transcript.segments,
+                        },
+                    )
+                await session.commit()
+
+            indexed += len(indexable)
+            if len(transcripts) < batch_size:
+                break
+            last = (transcripts[-1].video_id, transcripts[-1].language_code)
+
+        logger.info(f"자막 검색 색인 백필 완료: transcripts={indexed}")
+        return indexed
+
+
+# 전역 자막 검색 인덱스 인스턴스
+_transcript_search_index: Optional[TranscriptSearchIndex] = None
+
+
+def get_transcript_search_index() -> TranscriptSearchIndex:
+    """
+    전역 자막 검색 인덱스 반환
+
+    Returns:
+        TranscriptSearchIndex: 자막 검색 인덱스
+    """
+    global _transcript_search_index
+
+    if _transcript_search_index is None:
+        _transcript_search_index = TranscriptSearchIndex()
+
+    return _transcript_search_index
@@ -1,5 +1,6 @@
 """YouTube 자막 다운로드 서비스"""
 
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional
 from youtube_transcript_api import YouTubeTranscriptApi
@@ -7,65 +8,191 @@ from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
     VideoUnavailable,
+    RequestBlocked,
 )
 
-from src.core.youtube.exceptions import YouTubeAPIError
+from src.core.youtube.exceptions import (
+    YouTubeAPIError,
+    TranscriptUnavailableError,
+    TranscriptRequestBlockedError,
+)
+from src.core.youtube.transcript_negative_cache import (
+    TranscriptNegativeCache,
+    get_transcript_negative_cache,
+)
+from src.core.youtube.transcript_store import TranscriptStore, get_transcript_store
 
 logger = logging.getLogger(__name__)
 
+# 선호 언어를 지정하지 않았을 때의 기본 언어
+DEFAULT_LANGUAGES = ["ko", "en"]
+
 
 class TranscriptService:
     """YouTube 자막 추출 서비스"""
 
     @staticmethod
-    async def get_transcript(
-        video_id: str, languages: Optional[List[str]] = None
-    ) -> List[Dict[str, Any]]:
+    def _fetch_transcript_sync(video_id: str, languages: List[str]) -> Dict[str, Any]:
+        """
+        YouTube에서 자막 1회 조회 (동기, 스레드에서 실행)
+
+        자막 목록을 한 번 조회하여 선호 언어 자막을 받고, 영상이 제공하는 언어 목록도 함께 반환합니다.
+
+        Args:
+            video_id: YouTube 영상 ID
+            languages: 선호 언어 목록
+
+        Returns:
+            Dict[str, Any]: 자막 레코드 (저장소 형식)
+        """
+        transcript_list = YouTubeTranscriptApi().list(video_id)
+        transcript = transcript_list.find_transcript(languages)
+        segments = transcript.fetch().to_raw_data()
+        return {
+            "video_id": video_id,
+            "language_code": transcript.language_code,
+            "language": transcript.language,
+            "is_generated": transcript.is_generated,
+            "segments": segments,
+            "full_text": "\n".join(segment["text"] for segment in segments),
+            "available_languages": list(
+                dict.fromkeys(t.language_code for t in transcript_list)
+            ),
+        }
+
+    @staticmethod
+    async def fetch_transcript(
+        video_id: str,
+        languages: Optional[List[str]] = None,
+        negative_cache: Optional[TranscriptNegativeCache] = None,
+    ) -> Dict[str, Any]:
         """
-        YouTube 영상의 자막 가져오기
+        YouTube에서 자막 조회 (저장소 미사용, 이벤트 루프를 막지 않도록 스레드에서 실행)
+
+        자막 없음(비활성화, 요청 언어 없음, 영상 없음)은 사유별 TTL 동안 캐시하고,
+        캐시된 영상은 YouTube를 호출하지 않고 같은 에러를 발생시킵니다.
 
         Args:
             video_id: YouTube 영상 ID
             languages: 선호 언어 목록 (기본값: ['ko', 'en'])
+            negative_cache: 자막 없음 캐시 (기본값: 전역 TranscriptNegativeCache)
 
         Returns:
-            자막 세그먼트 목록 [{"text": str, "start": float, "duration": float}]
+            Dict[str, Any]: 자막 레코드
+                (video_id, language_code, language, is_generated, segments, full_text,
+                available_languages)
 
         Raises:
-            YouTubeAPIError: 자막을 가져올 수 없는 경우
+            TranscriptUnavailableError: 자막 비활성화, 요청 언어 없음, 영상 없음
+            TranscriptRequestBlockedError: YouTube가 요청을 차단한 경우
+            YouTubeAPIError: 그 외 자막을 가져올 수 없는 경우
         """
-        if languages is None:
-            languages = ["ko", "en"]
+        languages = languages or DEFAULT_LANGUAGES
+        negative_cache = negative_cache or get_transcript_negative_cache()
+
+        cached_error = negative_cache.get(video_id, languages)
+        if cached_error:
+            logger.info(f"자막 없음 캐시 적중: video_id={video_id}, reason={cached_error.reason}")
+            raise cached_error
 
         try:
-            # 자막 가져오기
-            transcript_list = YouTubeTranscriptApi.get_transcript(
-                video_id, languages=languages
+            record = await asyncio.to_thread(
+                TranscriptService._fetch_transcript_sync, video_id, languages
             )
 
             logger.info(
-                f"자막 가져오기 성공: video_id={video_id}, segments={len(transcript_list)}"
+                f"자막 가져오기 성공: video_id={video_id}, "
+                f"language={record['language_code']}, segments={len(record['segments'])}"
             )
-            return transcript_list
+            return record
 
         except TranscriptsDisabled:
             logger.warning(f"자막이 비활성화됨: video_id={video_id}")
-            raise YouTubeAPIError("이 영상은 자막이 비활성화되어 있습니다.")
+            error = TranscriptUnavailableError(
+                "이 영상은 자막이 비활성화되어 있습니다.",
+                video_id,
+                TranscriptUnavailableError.DISABLED,
+            )
         except NoTranscriptFound:
             logger.warning(f"요청한 언어의 자막을 찾을 수 없음: video_id={video_id}")
-            raise YouTubeAPIError(
-                f"요청한 언어({', '.join(languages)})의 자막을 찾을 수 없습니다."
+            error = TranscriptUnavailableError(
+                f"요청한 언어({', '.join(languages)})의 자막을 찾을 수 없습니다.",
+                video_id,
+                TranscriptUnavailableError.NOT_FOUND,
             )
         except VideoUnavailable:
             logger.warning(f"영상을 사용할 수 없음: video_id={video_id}")
-            raise YouTubeAPIError("영상을 사용할 수 없습니다.")
+            error = TranscriptUnavailableError(
+                "영상을 사용할 수 없습니다.",
+                video_id,
+                TranscriptUnavailableError.VIDEO_UNAVAILABLE,
+            )
+        except RequestBlocked:
+            logger.warning(f"자막 요청 차단됨: video_id={video_id}")
+            raise TranscriptRequestBlockedError()
         except Exception as e:
             logger.error(f"자막 가져오기 실패: video_id={video_id}, error={e}")
             raise YouTubeAPIError(f"자막을 가져오는 중 오류가 발생했습니다: {str(e)}")
 
+        negative_cache.record(error, languages)
+        raise error
+
+    @staticmethod
+    async def get_transcript(
+        video_id: str,
+        languages: Optional[List[str]] = None,
+        store: Optional[TranscriptStore] = None,
+        negative_cache: Optional[TranscriptNegativeCache] = None,
+    ) -> Dict[str, Any]:
+        """
+        YouTube 영상의 자막 가져오기 (저장된 자막 우선)
+
+        저장된 자막이 있으면 YouTube를 호출하지 않고, 없으면 한 번 조회하여 저장합니다.
+        자막 없음 캐시에 기록된 영상은 YouTube를 호출하지 않고 에러를 발생시킵니다.
+
+        Args:
+            video_id: YouTube 영상 ID
+            languages: 선호 언어 목록 (기본값: ['ko', 'en'])
+            store: 자막 저장소 (기본값: 전역 TranscriptStore)
+            negative_cache: 자막 없음 캐시 (기본값: 전역 TranscriptNegativeCache)
+
+        Returns:
+            Dict[str, Any]: 자막 레코드
+                segments: [{"text": str, "start": float, "duration": float}]
+                full_text: 자막 전체 텍스트 (줄바꿈으로 구분)
+
+        Raises:
+            TranscriptUnavailableError: 자막 비활성화, 요청 언어 없음, 영상 없음
+            YouTubeAPIError: 자막을 가져올 수 없는 경우
+        """
+        languages = languages or DEFAULT_LANGUAGES
+        store = store or get_transcript_store()
+
+        try:
+            stored = await store.find(video_id, languages)
+        except Exception as e:
+            # 저장소 장애 시에도 YouTube 조회로 응답
+            logger.warning(f"저장된 자막 조회 실패: video_id={video_id}, error={e}")
+            stored = None
+        if stored:
+            logger.info(
+                f"저장된 자막 반환: video_id={video_id}, language={stored['language_code']}"
+            )
+            return stored
+
+        record = await TranscriptService.fetch_transcript(video_id, languages, negative_cache)
+        try:
+            await store.save(record)
+        except Exception as e:
+            logger.warning(f"자막 저장 실패: video_id={video_id}, error={e}")
+        return record
+
     @staticmethod
     async def get_transcript_text(
-        video_id: str, languages: Optional[List[str]] = None
+        video_id: str,
+        languages: Optional[List[str]] = None,
+        store: Optional[TranscriptStore] = None,
+        negative_cache: Optional[TranscriptNegativeCache] = None,
     ) -> str:
         """
         YouTube 영상의 자막을 텍스트로 변환
@@ -73,6 +200,8 @@ class TranscriptService:
         Args:
             video_id: YouTube 영상 ID
             languages: 선호 언어 목록 (기본값: ['ko', 'en'])
+            store: 자막 저장소 (기본값: 전역 TranscriptStore)
+            negative_cache: 자막 없음 캐시 (기본값: 전역 TranscriptNegativeCache)
 
         Returns:
             자막 전체 텍스트 (줄바꿈으로 구분)
@@ -80,24 +209,36 @@ class TranscriptService:
         Raises:
             YouTubeAPIError: 자막을 가져올 수 없는 경우
         """
-        transcript = await TranscriptService.get_transcript(video_id, languages)
-
-        # 자막 텍스트만 추출하여 결합
-        text_lines = [segment["text"] for segment in transcript]
-        full_text = "\n".join(text_lines)
-
-        logger.info(
-            f"자막 텍스트 변환 성공: video_id={video_id}, length={len(full_text)}"
+        transcript = await TranscriptService.get_transcript(
+            video_id, languages, store, negative_cache
         )
-        return full_text
+        return transcript["full_text"]
 
     @staticmethod
-    async def get_available_transcripts(video_id: str) -> List[Dict[str, Any]]:
+    def _list_transcripts_sync(video_id: str) -> List[Dict[str, Any]]:
+        """자막 목록 조회 (동기, 스레드에서 실행, 수동 생성 자막 우선)"""
+        transcripts = list(YouTubeTranscriptApi().list(video_id))
+        return [
+            {
+                "language": transcript.language,
+                "language_code": transcript.language_code,
+                "is_generated": transcript.is_generated,
+            }
+            for transcript in sorted(transcripts, key=lambda t: t.is_generated)
+        ]
+
+    @staticmethod
+    async def get_available_transcripts(
+        video_id: str, negative_cache: Optional[TranscriptNegativeCache] = None
+    ) -> List[Dict[str, Any]]:
         """
         YouTube 영상의 사용 가능한 자막 목록 조회
 
+        자막 비활성화/영상 없음 캐시에 기록된 영상은 YouTube를 호출하지 않습니다.
+
         Args:
             video_id: YouTube 영상 ID
+            negative_cache: 자막 없음 캐시 (기본값: 전역 TranscriptNegativeCache)
 
         Returns:
             사용 가능한 자막 목록 [{"language": str, "language_code": str, "is_generated": bool}]
@@ -105,32 +246,19 @@ class TranscriptService:
         Raises:
             YouTubeAPIError: 자막 목록을 가져올 수 없는 경우
         """
+        negative_cache = negative_cache or get_transcript_negative_cache()
+
+        cached_error = negative_cache.get(video_id)
+        if cached_error:
+            logger.info(f"자막 없음 캐시 적중: video_id={video_id}, reason={cached_error.reason}")
+            if cached_error.reason == TranscriptUnavailableError.DISABLED:
+                return []
+            raise cached_error
+
         try:
-            transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
-
-            available = []
-
-            # 수동 생성 자막
-            for transcript in transcript_list:
-                if not transcript.is_generated:
-                    available.append(
-                        {
-                            "language": transcript.language,
-                            "language_code": transcript.language_code,
-                            "is_generated": False,
-                        }
-                    )
-
-            # 자동 생성 자막
-            for transcript in transcript_list:
-                if transcript.is_generated:
-                    available.append(
-                        {
-                            "language": transcript.language,
-                            "language_code": transcript.language_code,
-                            "is_generated": True,
-                        }
-                    )
+            available = await asyncio.to_thread(
+                TranscriptService._list_transcripts_sync, video_id
+            )
 
             logger.info(
                 f"사용 가능한 자막 목록 조회 성공: video_id={video_id}, count={len(available)}"
@@ -139,10 +267,23 @@ class TranscriptService:
 
         except TranscriptsDisabled:
             logger.warning(f"자막이 비활성화됨: video_id={video_id}")
+            negative_cache.record(
+                TranscriptUnavailableError(
+                    "이 영상은 자막이 비활성화되어 있습니다.",
+                    video_id,
+                    TranscriptUnavailableError.DISABLED,
+                )
+            )
             return []
         except VideoUnavailable:
             logger.warning(f"영상을 사용할 수 없음: video_id={video_id}")
-            raise YouTubeAPIError("영상을 사용할 수 없습니다.")
+            error = TranscriptUnavailableError(
+                "영상을 사용할 수 없습니다.",
+                video_id,
+                TranscriptUnavailableError.VIDEO_UNAVAILABLE,
+            )
+            negative_cache.record(error)
+            raise error
         except Exception as e:
             logger.error(f"자막 목록 조회 실패: video_id={video_id}, error={e}")
             raise YouTubeAPIError(f"자막 목록 조회 중 오류가 발생했습니다: {str(e)}")
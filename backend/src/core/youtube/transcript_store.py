@@ -0,0 +1,164 @@
+"""
+YouTube 자막 영구 저장소 (youtube_transcripts 테이블)
+
+자막은 거의 바뀌지 않으므로 YouTube에서 한 번 받은 자막을 영상 + 언어별로 DB에 저장하고
+이후 요청은 저장된 자막으로 응답합니다.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.youtube.transcript_search import replace_segments
+from src.models.youtube_transcript import YouTubeTranscript
+
+logger = logging.getLogger(__name__)
+
+
+def select_language(
+    preferences: Sequence[str], available: Sequence[str]
+) -> Optional[str]:
+    """
+    선호 언어 목록에서 영상이 제공하는 첫 번째 언어 선택 (youtube_transcript_api find_transcript와 같은 순서)
+
+    Args:
+        preferences: 선호 언어 코드 목록
+        available: 영상이 제공하는 자막 언어 코드 목록
+
+    Returns:
+        Optional[str]: 선택된 언어 코드 (없으면 None)
+    """
+    available_set = set(available)
+    return next((code for code in preferences if code in available_set), None)
+
+
+def transcript_to_dict(row: YouTubeTranscript) -> Dict[str, Any]:
+    """저장된 자막 행 → 자막 레코드"""
+    return {
+        "video_id": row.video_id,
+        "language_code": row.language_code,
+        "language": row.language,
+        "is_generated": row.is_generated,
+        "segments": row.segments,
+        "full_text": row.full_text,
+        "available_languages": row.available_languages,
+        "fetched_at": row.fetched_at,
+    }
+
+
+class TranscriptStore:
+    """영상 + 언어별 자막 저장소"""
+
+    def __init__(self, session_factory: Optional[async_sessionmaker[AsyncSession]] = None):
+        """
+        자막 저장소 초기화
+
+        Args:
+            session_factory: 비동기 세션 팩토리 (기본값: src.core.database.AsyncSessionLocal)
+        """
+        if session_factory is None:
+            from src.core.database import AsyncSessionLocal
+
+            session_factory = AsyncSessionLocal
+        self.session_factory = session_factory
+
+    async def get_for_video(self, video_id: str) -> List[Dict[str, Any]]:
+        """
+        영상의 저장된 자막 전체 조회 (언어별, 최근 저장 순)
+
+        Args:
+            video_id: YouTube 영상 ID
+
+        Returns:
+            List[Dict[str, Any]]: 자막 레코드 목록
+        """
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(YouTubeTranscript)
+                .where(YouTubeTranscript.video_id == video_id)
+                .order_by(YouTubeTranscript.fetched_at.desc())
+            )
+            return [transcript_to_dict(row) for row in result.scalars()]
+
+    async def find(
+        self, video_id: str, languages: Sequence[str]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        선호 언어 기준으로 저장된 자막 조회
+
+        저장 시 함께 기록한 영상의 제공 언어 목록으로 YouTube가 고를 언어를 계산하고,
+        그 언어의 자막이 저장되어 있을 때만 해당 행 하나를 읽어 반환합니다.
+
+        Args:
+            video_id: YouTube 영상 ID
+            languages: 선호 언어 코드 목록
+
+        Returns:
+            Optional[Dict[str, Any]]: 자막 레코드 (해당 언어가 저장되지 않았으면 None)
+        """
+        async with self.session_factory() as session:
+            # 언어 선택에는 언어 코드와 제공 언어 목록만 필요 (segments/full_text 제외)
+            result = await session.execute(
+                select(YouTubeTranscript.language_code, YouTubeTranscript.available_languages)
+                .where(YouTubeTranscript.video_id == video_id)
+                .order_by(YouTubeTranscript.fetched_at.desc())
+            )
+            stored = result.all()
+            if not stored:
+                return None
+            chosen = select_language(languages, stored[0].available_languages)
+            if chosen not in {row.language_code for row in stored}:
+                return None
+            row = await session.get(YouTubeTranscript, (video_id, chosen))
+            return transcript_to_dict(row) if row is not None else None
+
+    async def save(self, record: Dict[str, Any]) -> None:
+        """
+        자막 저장 (같은 영상 + 언어는 덮어씀, 검색 색인도 같은 트랜잭션에서 교체)
+
+        Args:
+            record: 자막 레코드 (video_id, language_code, language, is_generated,
+                segments, full_text, available_languages)
+        """
+        async with self.session_factory() as session:
+            await session.merge(
+                YouTubeTranscript(
+                    video_id=record["video_id"],
+                    language_code=record["language_code"],
+                    language=record["language"],
+                    is_generated=record["is_generated"],
+                    segments=record["segments"],
+                    full_text=record["full_text"],
+                    available_languages=record["available_languages"],
+                    fetched_at=datetime.now(timezone.utc),
+                )
+            )
+            # 세그먼트 색인은 자막 행을 참조하므로 자막 행을 먼저 반영
+            await session.flush()
+            await replace_segments(session, record)
+            await session.commit()
+        logger.info(
+            f"자막 저장: video_id={record['video_id']}, language={record['language_code']}"
+        )
+
+
+# 전역 자막 저장소 인스턴스
+_transcript_store: Optional[TranscriptStore] = None
+
+
+def get_transcript_store() -> TranscriptStore:
+    """
+    전역 자막 저장소 반환
+
+    Returns:
+        TranscriptStore: 자막 저장소
+    """
+    global _transcript_store
+
+    if _transcript_store is None:
+        _transcript_store = TranscriptStore()
+
+    return _transcript_store
@@ -5,12 +5,20 @@ YouTube API 관련 유틸리티 함수를 제공합니다.
 """
 
 import re
-from datetime import timedelta
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TypeVar
 import logging
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# videos.list / channels.list 1회 호출당 최대 ID 수
+MAX_IDS_PER_REQUEST = 50
+
+# YouTube 영상 ID 형식 (11자)
+VIDEO_ID_PATTERN = re.compile(r'[\w-]{11}')
+
 
 def parse_iso8601_duration(duration_str: str) -> int:
     """
@@ -170,6 +178,7 @@ def get_video_id_from_url(url: str) -> Optional[str]:
         r'(?:youtube\.com/watch\?v=)([\w-]+)',
         r'(?:youtu\.be/)([\w-]+)',
         r'(?:youtube\.com/embed/)([\w-]+)',
+        r'(?:youtube\.com/shorts/)([\w-]+)',
     ]
 
     for pattern in patterns:
@@ -181,6 +190,30 @@ def get_video_id_from_url(url: str) -> Optional[str]:
     return None
 
 
+def resolve_video_id(value: str) -> Optional[str]:
+    """
+    영상 ID 또는 YouTube URL을 영상 ID로 변환
+
+    Args:
+        value: 영상 ID(11자) 또는 YouTube URL
+
+    Returns:
+        Optional[str]: Video ID (해석 실패 시 None)
+
+    Examples:
+        >>> resolve_video_id("dQw4w9WgXcQ")
+        "dQw4w9WgXcQ"
+        >>> resolve_video_id("https://youtu.be/dQw4w9WgXcQ")
+        "dQw4w9WgXcQ"
+    """
+    value = (value or "").strip()
+    if VIDEO_ID_PATTERN.fullmatch(value):
+        return value
+    if not value:
+        return None
+    return get_video_id_from_url(value)
+
+
 def build_cache_key(prefix: str, **kwargs) -> str:
     """
     캐시 키 생성 헬퍼 함수
@@ -201,3 +234,128 @@ def build_cache_key(prefix: str, **kwargs) -> str:
         if v is not None:
             key_parts.append(f"{k}={v}")
     return ":".join(key_parts)
+
+
+def chunked(items: Sequence[T], size: int = MAX_IDS_PER_REQUEST) -> Iterator[List[T]]:
+    """
+    목록을 size 단위로 분할
+
+    YouTube Data API의 videos.list / channels.list는 1회 호출에 최대 50개 ID를 받습니다.
+
+    Args:
+        items: 분할할 목록
+        size: 청크 크기 (기본값: 50)
+
+    Returns:
+        Iterator[List[T]]: 청크 목록
+
+    Examples:
+        >>> list(chunked(["a", "b", "c"], 2))
+        [["a", "b"], ["c"]]
+    """
+    for start in range(0, len(items), size):
+        yield list(items[start:start + size])
+
+
+def to_utc(value: datetime) -> datetime:
+    """datetime을 UTC로 변환 (timezone이 없으면 UTC로 간주)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def bucket_datetime(
+    value: Optional[datetime], bucket_seconds: int, round_up: bool = False
+) -> Optional[datetime]:
+    """
+    날짜를 bucket_seconds 단위 경계로 맞춤 (UTC)
+
+    검색 기간 경계를 버킷 단위로 넓혀 몇 초 차이의 요청이 같은 캐시를 쓰도록 합니다.
+    시작 날짜는 내림(round_up=False), 종료 날짜는 올림(round_up=True)하여
+    원래 기간을 포함하는 상위 기간을 만듭니다.
+
+    Args:
+        value: 기준 날짜 (timezone이 없으면 UTC로 간주)
+        bucket_seconds: 버킷 크기 (초)
+        round_up: True면 다음 경계로 올림
+
+    Returns:
+        Optional[datetime]: 버킷 경계 날짜 (UTC, 입력이 None이면 None)
+
+    Examples:
+        >>> bucket_datetime(datetime(2025, 1, 1, 10, 30), 3600)
+        datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
+    """
+    if value is None:
+        return None
+    timestamp = to_utc(value).timestamp()
+    bucket_start = timestamp - timestamp % bucket_seconds
+    if round_up and bucket_start < timestamp:
+        bucket_start += bucket_seconds
+    return datetime.fromtimestamp(bucket_start, tz=timezone.utc)
+
+
+def parse_published_at(published_at: str) -> Optional[datetime]:
+    """
+    YouTube publishedAt(RFC 3339) 문자열을 datetime으로 변환
+
+    Args:
+        published_at: 예: 2025-01-01T00:00:00Z
+
+    Returns:
+        Optional[datetime]: UTC datetime (파싱 실패 시 None)
+    """
+    try:
+        parsed = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
+    return to_utc(parsed)
+
+
+def filter_videos(
+    videos: List[Dict[str, Any]],
+    min_view_count: Optional[int] = None,
+    min_subscriber_count: Optional[int] = None,
+    shorts_only: bool = False,
+    published_after: Optional[datetime] = None,
+    published_before: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """
+    영상 목록에 검색 필터를 로컬로 적용 (순서 유지)
+
+    캐시된 상위 검색 결과에서 요청별 필터를 적용할 때 사용하며 API를 호출하지 않습니다.
+
+    Args:
+        videos: 영상 정보 목록 (get_video_details 결과)
+        min_view_count: 최소 조회수
+        min_subscriber_count: 최소 구독자 수
+        shorts_only: 쇼츠 영상만 포함
+        published_after: 업로드 시작 날짜 (버킷 이전의 원래 값)
+        published_before: 업로드 종료 날짜 (버킷 이전의 원래 값)
+
+    Returns:
+        List[Dict[str, Any]]: 필터를 통과한 영상 목록
+    """
+    after = to_utc(published_after) if published_after else None
+    before = to_utc(published_before) if published_before else None
+
+    filtered = []
+    for video in videos:
+        if min_view_count and (video.get("view_count") or 0) < min_view_count:
+            continue
+        if (
+            min_subscriber_count is not None
+            and (video.get("subscriber_count") or 0) < min_subscriber_count
+        ):
+            continue
+        if shorts_only and not is_shorts_video(video.get("duration") or 0):
+            continue
+        if after or before:
+            published = parse_published_at(video.get("published_at", ""))
+            if published is not None:
+                if after and published < after:
+                    continue
+                if before and published > before:
+                    continue
+        filtered.append(video)
+    return filtered
@@ -0,0 +1,208 @@
+"""
+YouTube 영상 레코드
+
+videos.list 응답을 한 번만 파싱한 고정 필드(__slots__) 레코드입니다.
+캐시에는 API에서 받은 기본 필드만 snake_case로, 응답에는 Pydantic 검증 없이 camelCase로 바로 직렬화합니다.
+
+기존 dict 기반 코드(필터, 순위 계산, 스키마 생성)와 호환되도록 video["view_count"], video.get(...),
+**video 형태의 접근도 지원하며, 정의되지 않은 키(배치 검색 순위 정보 등)는 extras에 보관합니다.
+"""
+
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+
+from src.core.youtube.utils import parse_iso8601_duration
+
+# videos.list에서 파싱하여 캐시에 저장하는 필드
+BASE_FIELDS: Tuple[str, ...] = (
+    "video_id",
+    "title",
+    "description",
+    "channel_id",
+    "channel_title",
+    "published_at",
+    "thumbnail_url",
+    "duration",
+    "view_count",
+    "like_count",
+    "comment_count",
+    "tags",
+    "category_id",
+)
+
+# 요청마다 채널 통계/순위 계산으로 채우는 필드 (캐시하지 않음)
+METRIC_FIELDS: Tuple[str, ...] = (
+    "subscriber_count",
+    "channel_total_videos",
+    "channel_total_views",
+    "performance_ratio",
+    "channel_contribution",
+    "engagement_rate",
+    "view_velocity",
+    "cii",
+)
+
+FIELDS: Tuple[str, ...] = BASE_FIELDS + METRIC_FIELDS
+
+# 영상 상세 응답(VideoDetail) 필드
+DETAIL_FIELDS: Tuple[str, ...] = FIELDS[:FIELDS.index("channel_contribution") + 1]
+
+_FIELD_SET = frozenset(FIELDS)
+
+# 응답/keys()에 포함하지 않는 캐시 메타데이터 (ETag 재검증용)
+_META_FIELDS = frozenset(("etag",))
+_ACCESSIBLE = _FIELD_SET | _META_FIELDS
+
+_DEFAULTS: Dict[str, Any] = {
+    "title": "",
+    "description": "",
+    "channel_id": "",
+    "channel_title": "",
+    "published_at": "",
+    "duration": 0,
+    "view_count": 0,
+    "like_count": 0,
+    "comment_count": 0,
+    "category_id": "",
+}
+
+
+def _to_camel(name: str) -> str:
+    """snake_case를 camelCase로 변환"""
+    head, *rest = name.split("_")
+    return head + "".join(part.title() for part in rest)
+
+
+# 필드 이름 → 응답 키 (camelCase, 미리 계산)
+_CAMEL: Dict[str, str] = {name: _to_camel(name) for name in FIELDS}
+
+
+def _pick_thumbnail(thumbnails: Mapping[str, Any]) -> Optional[str]:
+    """썸네일 선택 (우선순위: maxres > high > medium > default)"""
+    for size in ("maxres", "high", "medium", "default"):
+        url = thumbnails.get(size, {}).get("url")
+        if url:
+            return url
+    return None
+
+
+class VideoRecord:
+    """YouTube 영상 레코드 (고정 필드)"""
+
+    __slots__ = FIELDS + ("etag", "extras")
+
+    def __init__(self, **fields: Any):
+        """
+        영상 레코드 생성
+
+        Args:
+            **fields: 필드 값 (지정하지 않은 기본 필드는 빈 값, 지표 필드는 None)
+        """
+        for name in FIELDS:
+            setattr(self, name, fields.pop(name, _DEFAULTS.get(name)))
+        if self.tags is None:
+            self.tags = []
+        self.etag: Optional[str] = fields.pop("etag", None)
+        self.extras: Optional[Dict[str, Any]] = fields or None
+
+    @classmethod
+    def from_api_item(cls, item: Mapping[str, Any]) -> "VideoRecord":
+        """
+        videos.list 응답 아이템 → 영상 레코드
+
+        Args:
+            item: YouTube API videos.list 응답 아이템 (snippet, contentDetails, statistics)
+
+        Returns:
+            VideoRecord: 영상 레코드
+        """
+        snippet = item.get("snippet", {})
+        statistics = item.get("statistics", {})
+        return cls(
+            video_id=item["id"],
+            title=snippet.get("title", ""),
+            description=snippet.get("description", ""),
+            channel_id=snippet.get("channelId", ""),
+            channel_title=snippet.get("channelTitle", ""),
+            published_at=snippet.get("publishedAt", ""),
+            thumbnail_url=_pick_thumbnail(snippet.get("thumbnails", {})),
+            duration=parse_iso8601_duration(
+                item.get("contentDetails", {}).get("duration", "PT0S")
+            ),
+            view_count=int(statistics.get("viewCount", 0)),
+            like_count=int(statistics.get("likeCount", 0)),
+            comment_count=int(statistics.get("commentCount", 0)),
+            tags=snippet.get("tags", []),
+            category_id=snippet.get("categoryId", ""),
+        )
+
+    @classmethod
+    def from_cache(cls, data: Mapping[str, Any]) -> "VideoRecord":
+        """캐시에 저장된 기본 필드와 ETag → 영상 레코드 (다른 키는 무시)"""
+        record = cls(**{name: data[name] for name in BASE_FIELDS if name in data})
+        record.etag = data.get("etag")
+        return record
+
+    def to_cache(self) -> Dict[str, Any]:
+        """캐시에 저장할 기본 필드 (snake_case)"""
+        return {name: getattr(self, name) for name in BASE_FIELDS}
+
+    def to_response(self, fields: Tuple[str, ...] = FIELDS) -> Dict[str, Any]:
+        """
+        API 응답용 camelCase dict (YouTubeSearchResult 직렬화 결과와 같은 키)
+
+        Args:
+            fields: 포함할 필드 (기본값: 검색 결과 전체 필드)
+
+        Returns:
+            Dict[str, Any]: camelCase 키 dict (extras 포함)
+        """
+        response = {_CAMEL[name]: getattr(self, name) for name in fields}
+        if self.extras:
+            response.update((_to_camel(key), value) for key, value in self.extras.items())
+        return response
+
+    # dict 호환 접근 (필터/순위 계산/스키마 생성 코드 공용)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _ACCESSIBLE:
+            return getattr(self, key)
+        if self.extras and key in self.extras:
+            return self.extras[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _ACCESSIBLE:
+            setattr(self, key, value)
+        else:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_SET or bool(self.extras and key in self.extras)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.keys())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> Tuple[str, ...]:
+        return FIELDS + tuple(self.extras) if self.extras else FIELDS
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        for key, value in values.items():
+            self[key] = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, VideoRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in FIELDS) and (
+            (self.extras or {}) == (other.extras or {})
+        )
+
+    def __repr__(self) -> str:
+        return f"VideoRecord(video_id={self.video_id!r}, title={self.title!r})"
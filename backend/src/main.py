@@ -8,6 +8,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.core.redis_client import get_redis
+from src.core.youtube.http_client import close_youtube_http_client
 from src.api import router as api_router
 
 # .env 파일 로드
@@ -29,6 +30,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     print("Shutting down ClipPilot API...")
     await redis_client.close()
+    await close_youtube_http_client()
 
 
 app = FastAPI(
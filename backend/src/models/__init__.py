@@ -10,6 +10,7 @@ from .template import Template
 from .job import Job, JobStatus
 from .usage_log import UsageLog
 from .oauth_config import OAuthConfig
+from .youtube_transcript import YouTubeTranscript, YouTubeTranscriptSegment
 
 __all__ = [
     "Base",
@@ -28,4 +29,6 @@ __all__ = [
     "JobStatus",
     "UsageLog",
     "OAuthConfig",
+    "YouTubeTranscript",
+    "YouTubeTranscriptSegment",
 ]
@@ -0,0 +1,111 @@
+"""
+YouTubeTranscript models for ClipPilot
+Durable store of fetched YouTube transcripts (one row per video + language)
+and their segments indexed for full-text search
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Float,
+    ForeignKeyConstraint,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    literal_column,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+# Postgres에서는 JSONB (TOAST 압축), 그 외 DB에서는 JSON
+JSONType = JSON().with_variant(JSONB, "postgresql")
+
+
+class YouTubeTranscript(Base):
+    """
+    YouTube transcript fetched once and reused for every later request
+
+    Attributes:
+        video_id: YouTube video ID
+        language_code: Transcript language code (ko, en, ...)
+        language: Transcript language name
+        is_generated: Whether the transcript is auto-generated
+        segments: Transcript segments [{"text", "start", "duration"}]
+        full_text: Segment texts joined by newlines
+        available_languages: Language codes the video offered when fetched
+        fetched_at: When the transcript was fetched from YouTube
+    """
+
+    __tablename__ = "youtube_transcripts"
+
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    language_code: Mapped[str] = mapped_column(String(20), primary_key=True)
+    language: Mapped[str] = mapped_column(String(100), nullable=False, default="")
+    is_generated: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    segments: Mapped[list] = mapped_column(JSONType, nullable=False)
+    full_text: Mapped[str] = mapped_column(Text, nullable=False)
+    available_languages: Mapped[list] = mapped_column(JSONType, nullable=False, default=list)
+    fetched_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"YouTubeTranscript(video_id={self.video_id}, language_code={self.language_code}, "
+            f"segments={len(self.segments or [])})"
+        )
+
+
+class YouTubeTranscriptSegment(Base):
+    """
+    Transcript segment indexed for full-text search
+
+    search_terms holds the n-gram tokens of text (see core.youtube.transcript_search),
+    indexed in Postgres with a GIN index on to_tsvector('simple', search_terms).
+
+    Attributes:
+        video_id: YouTube video ID
+        language_code: Transcript language code
+        seq: Segment position in the transcript
+        start: Segment start time (seconds)
+        duration: Segment duration (seconds)
+        text: Segment text
+        search_terms: Space-separated search tokens (words, character bigrams and each word's last character)
+    """
+
+    __tablename__ = "youtube_transcript_segments"
+    __table_args__ = (
+        ForeignKeyConstraint(
+            ["video_id", "language_code"],
+            ["youtube_transcripts.video_id", "youtube_transcripts.language_code"],
+            ondelete="CASCADE",
+        ),
+        Index(
+            "idx_youtube_transcript_segments_search",
+            func.to_tsvector(literal_column("'simple'"), literal_column("search_terms")),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    video_id: Mapped[str] = mapped_column(String(20), primary_key=True)
+    language_code: Mapped[str] = mapped_column(String(20), primary_key=True)
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    start: Mapped[float] = mapped_column(Float, nullable=False)
+    duration: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    search_terms: Mapped[str] = mapped_column(Text, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"YouTubeTranscriptSegment(video_id={self.video_id}, "
+            f"language_code={self.language_code}, seq={self.seq})"
+        )
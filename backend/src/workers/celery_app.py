@@ -8,6 +8,8 @@ import os
 from celery import Celery
 from kombu import Queue
 
+from src.config import settings
+
 # Redis connection
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 
@@ -16,7 +18,14 @@ celery_app = Celery(
     "clippilot",
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=["src.workers.generate", "src.workers.render", "src.workers.upload"],
+    include=[
+        "src.workers.generate",
+        "src.workers.render",
+        "src.workers.upload",
+        "src.workers.youtube_stats",
+        "src.workers.youtube_saved_searches",
+        "src.workers.youtube_transcripts",
+    ],
 )
 
 # Celery configuration
@@ -50,6 +59,9 @@ celery_app.conf.update(
         "generate_content": {"queue": "generation"},
         "workers.render.*": {"queue": "rendering"},
         "workers.upload.*": {"queue": "default"},
+        "workers.youtube_stats.*": {"queue": "default"},
+        "workers.youtube_saved_searches.*": {"queue": "default"},
+        "workers.youtube_transcripts.*": {"queue": "default"},
     },
     # Monitoring
     task_send_sent_event=True,
@@ -79,6 +91,20 @@ def setup_periodic_tasks(sender, **kwargs):
         name="cleanup-expired-jobs",
     )
 
+    # Snapshot watched YouTube video stats (view velocity time series)
+    sender.add_periodic_task(
+        float(settings.YOUTUBE_STATS_SNAPSHOT_INTERVAL),
+        sender.signature("workers.youtube_stats.snapshot_video_stats"),
+        name="snapshot-youtube-video-stats",
+    )
+
+    # Re-run due YouTube saved searches (incremental, batched per API key)
+    sender.add_periodic_task(
+        float(settings.YOUTUBE_SAVED_SEARCH_TICK_INTERVAL),
+        sender.signature("workers.youtube_saved_searches.run_due_saved_searches"),
+        name="run-youtube-saved-searches",
+    )
+
 
 @celery_app.task(bind=True)
 def cleanup_expired_jobs(self):
@@ -0,0 +1,36 @@
+"""
+YouTube 저장된 검색 Celery Task
+
+실행 예정 시각이 지난 저장된 검색을 API 키별로 묶어 증분 재실행하고
+새로 발견한 영상을 결과 집합에 병합합니다 (Celery beat, 1분 주기).
+"""
+
+import asyncio
+import logging
+from typing import Dict
+
+from .celery_app import celery_app
+from ..core.youtube.http_client import close_youtube_http_client
+from ..core.youtube.saved_searches import get_saved_search_store, run_due_saved_searches
+
+logger = logging.getLogger(__name__)
+
+
+async def _run() -> Dict[str, int]:
+    try:
+        return await run_due_saved_searches(get_saved_search_store())
+    finally:
+        # 이벤트 루프가 task마다 새로 만들어지므로 루프에 묶인 커넥션 풀 정리
+        await close_youtube_http_client()
+
+
+@celery_app.task(name="workers.youtube_saved_searches.run_due_saved_searches")
+def run_due_saved_searches_task() -> Dict[str, int]:
+    """
+    실행 예정 저장된 검색 증분 재실행
+
+    Returns:
+        Dict with run results (due, executed, deferred, failed, new_videos)
+    """
+    logger.info("저장된 검색 실행 시작")
+    return asyncio.run(_run())
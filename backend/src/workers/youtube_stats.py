@@ -0,0 +1,39 @@
+"""
+YouTube 영상 통계 스냅샷 Celery Task
+
+감시 대상 영상의 조회수/좋아요/댓글 수를 주기적으로 수집하여
+조회수 증가 속도/가속도 계산용 시계열에 추가합니다 (Celery beat, 1시간 주기).
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+from .celery_app import celery_app
+from ..core.youtube.http_client import close_youtube_http_client
+from ..core.youtube.search_service import get_search_service
+from ..core.youtube.stats_timeseries import get_stats_timeseries, run_stats_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+async def _snapshot() -> Dict[str, Any]:
+    try:
+        return await run_stats_snapshot(get_search_service(), get_stats_timeseries())
+    finally:
+        # 이벤트 루프가 task마다 새로 만들어지므로 루프에 묶인 커넥션 풀 정리
+        await close_youtube_http_client()
+
+
+@celery_app.task(name="workers.youtube_stats.snapshot_video_stats")
+def snapshot_video_stats() -> Dict[str, Any]:
+    """
+    감시 대상 영상 통계 스냅샷 수집
+
+    서버 API 키 풀로 videos.list를 호출합니다 (50개당 1 unit).
+
+    Returns:
+        Dict with snapshot results (requested, stored, missing, quota_exhausted)
+    """
+    logger.info("영상 통계 스냅샷 시작")
+    return asyncio.run(_snapshot())
@@ -0,0 +1,71 @@
+"""
+YouTube 자막 일괄 수집 Celery Task
+
+요청된 영상 목록의 자막을 제한된 동시성과 호스트별 요청 간격으로 수집하여
+자막 저장소에 저장하고, 영상별 결과를 작업 진행 상황으로 기록합니다.
+검색 색인 도입 이전에 저장된 자막의 세그먼트 색인(백필)도 여기서 실행합니다.
+"""
+
+import asyncio
+import logging
+from typing import Dict
+
+from .celery_app import celery_app
+from ..core.database import engine
+from ..core.youtube.transcript_harvest import (
+    get_transcript_harvest_store,
+    run_transcript_harvest,
+)
+from ..core.youtube.transcript_search import get_transcript_search_index
+
+logger = logging.getLogger(__name__)
+
+
+async def _harvest(job_id: str) -> Dict[str, int]:
+    try:
+        return await run_transcript_harvest(job_id, get_transcript_harvest_store())
+    finally:
+        # 이벤트 루프가 task마다 새로 만들어지므로 루프에 묶인 DB 커넥션 정리
+        await engine.dispose()
+
+
+async def _index() -> int:
+    try:
+        return await get_transcript_search_index().backfill()
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(
+    name="workers.youtube_transcripts.harvest_transcripts",
+    time_limit=3600,  # 500개 x 요청 간격 1초 + 여유
+    soft_time_limit=3540,
+)
+def harvest_transcripts(job_id: str) -> Dict[str, int]:
+    """
+    자막 일괄 수집 작업 실행
+
+    Args:
+        job_id: 자막 수집 작업 ID
+
+    Returns:
+        Dict with result counts per status (fetched, stored, disabled, not_found, ...)
+    """
+    logger.info(f"자막 수집 작업 시작: job_id={job_id}")
+    return asyncio.run(_harvest(job_id))
+
+
+@celery_app.task(
+    name="workers.youtube_transcripts.index_transcripts",
+    time_limit=3600,
+    soft_time_limit=3540,
+)
+def index_transcripts() -> Dict[str, int]:
+    """
+    저장된 자막 중 세그먼트 색인이 없는 자막 색인 (마이그레이션 004 이후 1회 실행)
+
+    Returns:
+        Dict with number of indexed transcripts
+    """
+    logger.info("자막 검색 색인 백필 시작")
+    return {"indexed": asyncio.run(_index())}
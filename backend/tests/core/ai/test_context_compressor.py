@@ -0,0 +1,121 @@
+"""
+TranscriptContextCompressor 단위 테스트
+
+테스트 범위:
+- 자동 생성 자막 정리 (반복 줄, 이어지는 줄 병합, 효과음 태그, 타임스탬프)
+- 프롬프트 관련 구간 선택 및 토큰 예산 준수
+- 영상 + 프롬프트별 압축 결과 캐시
+"""
+
+import pytest
+
+from src.core.ai.context_compressor import (
+    GAP_MARKER,
+    TranscriptContextCompressor,
+    dedupe_caption_lines,
+    rank_passages,
+)
+
+
+class FakeCache:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ttl=None):
+        self.store[key] = value
+        return True
+
+
+class WordCounter:
+    """공백 기준 단어 수를 토큰 수로 사용 (호출 횟수 기록)"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, text):
+        self.calls += 1
+        return len(text.split())
+
+
+def make_transcript():
+    filler = [f"오늘 날씨 이야기 {i}번째 문장입니다." for i in range(60)]
+    relevant = [
+        "인공지능 자동화 도구로 영상 편집 시간을 줄이는 방법입니다.",
+        "자동화 워크플로우를 만들면 인공지능이 자막을 생성합니다.",
+    ]
+    return "\n".join(filler[:30] + relevant + filler[30:])
+
+
+@pytest.fixture
+def counter():
+    return WordCounter()
+
+
+@pytest.fixture
+def compressor(counter):
+    return TranscriptContextCompressor(
+        cache=FakeCache(), token_budget=40, passage_tokens=12, token_counter=counter
+    )
+
+
+def test_dedupe_caption_lines():
+    text = "\n".join([
+        "00:01 안녕하세요 여러분",
+        "[음악]",
+        "안녕하세요 여러분 오늘은 AI 이야기",
+        "오늘은 AI 이야기",
+        "",
+        "0:05 다음 주제로 넘어갑니다",
+    ])
+
+    assert dedupe_caption_lines(text) == [
+        "안녕하세요 여러분",
+        "오늘은 AI 이야기",
+        "다음 주제로 넘어갑니다",
+    ]
+
+
+def test_rank_passages_matches_korean_particles():
+    scores = rank_passages(
+        ["날씨가 맑습니다", "인공지능이 자막을 만듭니다"], "인공지능 자막 생성"
+    )
+
+    assert scores[1] > scores[0] == 0.0
+
+
+def test_short_context_passed_through_without_tokenizer(compressor, counter):
+    result = compressor.compress("대상: 일반인", "AI 소개")
+
+    assert result["context"] == "대상: 일반인"
+    assert counter.calls == 0
+
+
+def test_long_transcript_compressed_to_budget(compressor):
+    result = compressor.compress(make_transcript(), "인공지능 자동화 영상 편집")
+
+    context = result["context"]
+    assert result["tokens_after"] <= 40 < result["tokens_before"]
+    assert "영상 편집 시간을 줄이는 방법" in context
+    assert "인공지능이 자막을 생성합니다" in context
+    assert context.index("영상 편집") < context.index("자막을 생성")
+    assert GAP_MARKER in context or context.startswith("오늘 날씨 이야기 0번째")
+    assert result["cached"] is False
+
+
+def test_compressed_context_cached_per_transcript_and_prompt(compressor, counter):
+    transcript = make_transcript()
+    first = compressor.compress(transcript, "인공지능 자동화")
+    calls = counter.calls
+
+    again = compressor.compress(transcript, "인공지능 자동화")
+    other_prompt = compressor.compress(transcript, "날씨 이야기")
+    other_transcript = compressor.compress(transcript + "\n새로 추가된 자막", "인공지능 자동화")
+
+    assert again == {**first, "cached": True}
+    assert other_prompt["cached"] is False
+    assert counter.calls > calls
+    assert other_transcript["cached"] is False
+    assert len(compressor.cache.store) == 3
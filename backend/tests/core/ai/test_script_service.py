@@ -8,11 +8,13 @@ ScriptGenerationService 단위 테스트
   - Tone 검증 (informative, fun, emotional)
   - 부적절한 콘텐츠 필터링 (FR-014)
   - OpenAI API 호출 및 비용 계산
+  - 긴 자막 컨텍스트 토큰 예산 압축
 """
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock, AsyncMock
 
+from src.core.ai.context_compressor import TranscriptContextCompressor
 from src.core.ai.script_service import ScriptGenerationService, get_script_service
 from src.core.exceptions import ContentGenerationError
 
@@ -111,6 +113,41 @@ class TestScriptGeneration:
             additional_context=additional_context
         )
 
+    @pytest.mark.asyncio
+    async def test_generate_script_compresses_long_transcript_context(
+        self, script_service, mock_openai_client
+    ):
+        """
+        긴 자막 컨텍스트 압축 테스트
+
+        Given: 토큰 예산을 넘는 자막 additional_context
+        When: generate_script() 호출
+        Then: 프롬프트 관련 구간만 예산 안으로 압축되어 OpenAI에 전달
+        """
+        # Given
+        script_service.context_compressor = TranscriptContextCompressor(
+            cache=Mock(get=Mock(return_value=None)),
+            token_budget=30,
+            passage_tokens=10,
+            token_counter=lambda text: len(text.split()),
+        )
+        lines = [f"관련 없는 잡담 {i}번째 줄입니다" for i in range(50)]
+        lines[25] = "드론 촬영 장비 추천과 드론 촬영 팁"
+        transcript = "\n".join(lines)
+
+        # When
+        await script_service.generate_script(
+            prompt="드론 촬영 입문",
+            video_length_sec=30,
+            tone="informative",
+            additional_context=transcript,
+        )
+
+        # Then
+        context = mock_openai_client.generate_script.call_args.kwargs["additional_context"]
+        assert "드론 촬영 장비 추천" in context
+        assert len(context.split()) <= 30 < len(transcript.split())
+
     @pytest.mark.asyncio
     async def test_generate_script_15_seconds(self, script_service):
         """
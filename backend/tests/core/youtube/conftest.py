@@ -0,0 +1,426 @@
+"""
+YouTube 모듈 테스트 공용 Redis 대체
+
+FakeRedis는 redis.Redis(decode_responses=True)의 인메모리 대체로, 모듈에서 사용하는 명령을
+실제 Redis와 같은 반환값/만료/타입 규칙으로 구현합니다.
+CacheService는 실제 구현에 FakeRedis 클라이언트를 연결하여 직렬화 경로까지 함께 검증합니다.
+
+Lua 스크립트(EVAL)는 모듈에 정의된 스크립트만 같은 동작의 Python 구현으로 실행하며,
+등록되지 않은 스크립트는 NotImplementedError로 실패시킵니다.
+"""
+
+import fnmatch
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+import redis
+
+from src.core.cache import CacheService
+from src.core.youtube.search_cache import RELEASE_LOCK_SCRIPT
+from src.core.youtube.stats_timeseries import UNWATCH_SCRIPT, WATCH_SCRIPT
+
+
+class _Hash(dict):
+    """HASH 값"""
+
+
+class _ZSet(dict):
+    """ZSET 값 (member → score)"""
+
+
+def _score_bound(value: Any) -> tuple:
+    """ZRANGEBYSCORE 경계값 → (score, exclusive)"""
+    if isinstance(value, str):
+        if value.startswith("("):
+            return float(value[1:]), True
+        if value in ("-inf", "+inf", "inf"):
+            return float(value), False
+    return float(value), False
+
+
+def _in_range(score: float, low: tuple, high: tuple) -> bool:
+    low_value, low_exclusive = low
+    high_value, high_exclusive = high
+    above = score > low_value if low_exclusive else score >= low_value
+    below = score < high_value if high_exclusive else score <= high_value
+    return above and below
+
+
+def _slice(items: list, start: int, end: int) -> list:
+    """LRANGE/ZRANGE 방식 인덱스 (end 포함, 음수는 끝에서부터)"""
+    length = len(items)
+    start = max(length + start, 0) if start < 0 else start
+    end = length + end if end < 0 else end
+    return items[start:end + 1] if start <= end else []
+
+
+class FakePipeline:
+    """명령을 모았다가 execute()에서 순서대로 실행"""
+
+    def __init__(self, redis_client: "FakeRedis"):
+        self.redis = redis_client
+        self.commands: List[tuple] = []
+
+    def __getattr__(self, name: str) -> Callable[..., "FakePipeline"]:
+        command = getattr(self.redis, name)
+
+        def queue(*args, **kwargs):
+            self.commands.append((command, args, kwargs))
+            return self
+        return queue
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.commands = []
+
+    def execute(self) -> list:
+        commands, self.commands = self.commands, []
+        return [command(*args, **kwargs) for command, args, kwargs in commands]
+
+
+class FakeRedis:
+    """redis.Redis(decode_responses=True) 인메모리 대체"""
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.expires_at: Dict[str, float] = {}
+        self.scripts: Dict[str, Callable[[List[str], List[str]], Any]] = {
+            RELEASE_LOCK_SCRIPT: self._release_lock,
+            WATCH_SCRIPT: self._watch,
+            UNWATCH_SCRIPT: self._unwatch,
+        }
+
+    # 키 공간 -----------------------------------------------------------------
+
+    def _purge(self, key: str) -> None:
+        expires_at = self.expires_at.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+
+    def _get(self, key: str, kind: type) -> Any:
+        self._purge(key)
+        value = self.data.get(key)
+        if value is not None and type(value) is not kind:
+            raise redis.ResponseError(
+                "WRONGTYPE Operation against a key holding the wrong kind of value"
+            )
+        return value
+
+    def _get_or_create(self, key: str, kind: type) -> Any:
+        value = self._get(key, kind)
+        if value is None:
+            value = self.data[key] = kind()
+        return value
+
+    def _drop_if_empty(self, key: str) -> None:
+        if key in self.data and not self.data[key]:
+            del self.data[key]
+            self.expires_at.pop(key, None)
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self)
+
+    def ping(self) -> bool:
+        return True
+
+    def exists(self, *keys: str) -> int:
+        for key in keys:
+            self._purge(key)
+        return sum(1 for key in keys if key in self.data)
+
+    def delete(self, *keys: str) -> int:
+        deleted = self.exists(*keys)
+        for key in keys:
+            self.data.pop(key, None)
+            self.expires_at.pop(key, None)
+        return deleted
+
+    def expire(self, key: str, seconds: int) -> bool:
+        if not self.exists(key):
+            return False
+        self.expires_at[key] = time.monotonic() + seconds
+        return True
+
+    def ttl(self, key: str) -> int:
+        if not self.exists(key):
+            return -2
+        if key not in self.expires_at:
+            return -1
+        return max(int(round(self.expires_at[key] - time.monotonic())), 0)
+
+    def rename(self, src: str, dst: str) -> bool:
+        if not self.exists(src):
+            raise redis.ResponseError("ERR no such key")
+        self.data[dst] = self.data.pop(src)
+        self.expires_at.pop(dst, None)
+        if src in self.expires_at:
+            self.expires_at[dst] = self.expires_at.pop(src)
+        return True
+
+    def keys(self, pattern: str = "*") -> List[str]:
+        for key in list(self.data):
+            self._purge(key)
+        return [key for key in self.data if fnmatch.fnmatchcase(key, pattern)]
+
+    def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None):
+        return iter(self.keys(match or "*"))
+
+    # STRING ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[str]:
+        return self._get(key, str)
+
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        return [self.get(key) for key in keys]
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ex: Optional[int] = None,
+        px: Optional[int] = None,
+        nx: bool = False,
+        xx: bool = False,
+    ) -> Optional[bool]:
+        exists = self.exists(key)
+        if (nx and exists) or (xx and not exists):
+            return None
+        self.data[key] = str(value)
+        self.expires_at.pop(key, None)
+        if ex is not None:
+            self.expire(key, ex)
+        elif px is not None:
+            self.expire(key, px / 1000)
+        return True
+
+    def setex(self, key: str, seconds: int, value: Any) -> bool:
+        return self.set(key, value, ex=seconds)
+
+    def incrby(self, key: str, amount: int = 1) -> int:
+        value = int(self.get(key) or 0) + amount
+        self.data[key] = str(value)
+        return value
+
+    def decrby(self, key: str, amount: int = 1) -> int:
+        return self.incrby(key, -amount)
+
+    # HASH --------------------------------------------------------------------
+
+    def hset(
+        self,
+        key: str,
+        field: Optional[str] = None,
+        value: Any = None,
+        mapping: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        items = dict(mapping or {})
+        if field is not None:
+            items[field] = value
+        hash_value = self._get_or_create(key, _Hash)
+        added = len(set(items) - set(hash_value))
+        hash_value.update({name: str(item) for name, item in items.items()})
+        return added
+
+    def hget(self, key: str, field: str) -> Optional[str]:
+        return (self._get(key, _Hash) or {}).get(field)
+
+    def hgetall(self, key: str) -> Dict[str, str]:
+        return dict(self._get(key, _Hash) or {})
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        hash_value = self._get_or_create(key, _Hash)
+        value = int(hash_value.get(field, 0)) + amount
+        hash_value[field] = str(value)
+        return value
+
+    def hdel(self, key: str, *fields: str) -> int:
+        hash_value = self._get(key, _Hash) or {}
+        deleted = sum(1 for field in fields if hash_value.pop(field, None) is not None)
+        self._drop_if_empty(key)
+        return deleted
+
+    # LIST --------------------------------------------------------------------
+
+    def rpush(self, key: str, *values: Any) -> int:
+        items = self._get_or_create(key, list)
+        items.extend(str(value) for value in values)
+        return len(items)
+
+    def lrange(self, key: str, start: int, end: int) -> List[str]:
+        return _slice(self._get(key, list) or [], start, end)
+
+    def ltrim(self, key: str, start: int, end: int) -> bool:
+        items = self._get(key, list)
+        if items is not None:
+            items[:] = _slice(items, start, end)
+            self._drop_if_empty(key)
+        return True
+
+    def llen(self, key: str) -> int:
+        return len(self._get(key, list) or [])
+
+    # SET ---------------------------------------------------------------------
+
+    def sadd(self, key: str, *values: Any) -> int:
+        members = self._get_or_create(key, set)
+        values = {str(value) for value in values}
+        added = len(values - members)
+        members.update(values)
+        return added
+
+    def srem(self, key: str, *values: Any) -> int:
+        members = self._get(key, set) or set()
+        values = {str(value) for value in values}
+        removed = len(members & values)
+        members.difference_update(values)
+        self._drop_if_empty(key)
+        return removed
+
+    def smembers(self, key: str) -> set:
+        return set(self._get(key, set) or ())
+
+    def sismember(self, key: str, value: Any) -> bool:
+        return str(value) in (self._get(key, set) or ())
+
+    def scard(self, key: str) -> int:
+        return len(self._get(key, set) or ())
+
+    def sscan_iter(self, key: str, match: Optional[str] = None, count: Optional[int] = None):
+        return iter(sorted(self.smembers(key)))
+
+    # ZSET --------------------------------------------------------------------
+
+    def zadd(
+        self,
+        key: str,
+        mapping: Dict[str, float],
+        nx: bool = False,
+        xx: bool = False,
+        ch: bool = False,
+        gt: bool = False,
+        lt: bool = False,
+    ) -> int:
+        zset = self._get_or_create(key, _ZSet)
+        added = changed = 0
+        for member, score in mapping.items():
+            score = float(score)
+            if member in zset:
+                if nx or (gt and score <= zset[member]) or (lt and score >= zset[member]):
+                    continue
+                if zset[member] != score:
+                    changed += 1
+                zset[member] = score
+            elif not xx:
+                zset[member] = score
+                added += 1
+        self._drop_if_empty(key)
+        return added + changed if ch else added
+
+    def zrem(self, key: str, *members: str) -> int:
+        zset = self._get(key, _ZSet) or {}
+        removed = sum(1 for member in members if zset.pop(member, None) is not None)
+        self._drop_if_empty(key)
+        return removed
+
+    def zscore(self, key: str, member: str) -> Optional[float]:
+        return (self._get(key, _ZSet) or {}).get(member)
+
+    def zmscore(self, key: str, members: List[str]) -> List[Optional[float]]:
+        return [self.zscore(key, member) for member in members]
+
+    def zcard(self, key: str) -> int:
+        return len(self._get(key, _ZSet) or {})
+
+    def _zsorted(self, key: str) -> List[tuple]:
+        zset = self._get(key, _ZSet) or {}
+        return sorted(zset.items(), key=lambda item: (item[1], item[0]))
+
+    def zcount(self, key: str, min: Any, max: Any) -> int:
+        low, high = _score_bound(min), _score_bound(max)
+        return sum(1 for _, score in self._zsorted(key) if _in_range(score, low, high))
+
+    def _zrange_by_score(self, items, low, high, start, num, withscores):
+        items = [(m, s) for m, s in items if _in_range(s, _score_bound(low), _score_bound(high))]
+        if start is not None and num is not None:
+            items = items[start:] if num < 0 else items[start:start + num]
+        return items if withscores else [member for member, _ in items]
+
+    def zrangebyscore(
+        self, key: str, min: Any, max: Any,
+        start: Optional[int] = None, num: Optional[int] = None, withscores: bool = False,
+    ) -> list:
+        return self._zrange_by_score(self._zsorted(key), min, max, start, num, withscores)
+
+    def zrevrangebyscore(
+        self, key: str, max: Any, min: Any,
+        start: Optional[int] = None, num: Optional[int] = None, withscores: bool = False,
+    ) -> list:
+        items = list(reversed(self._zsorted(key)))
+        return self._zrange_by_score(items, min, max, start, num, withscores)
+
+    def zremrangebyrank(self, key: str, start: int, end: int) -> int:
+        removed = _slice(self._zsorted(key), start, end)
+        zset = self._get(key, _ZSet) or {}
+        for member, _ in removed:
+            del zset[member]
+        self._drop_if_empty(key)
+        return len(removed)
+
+    # EVAL --------------------------------------------------------------------
+
+    def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        if script not in self.scripts:
+            raise NotImplementedError("FakeRedis에 등록되지 않은 Lua 스크립트입니다.")
+        keys = [str(key) for key in keys_and_args[:numkeys]]
+        args = [str(arg) for arg in keys_and_args[numkeys:]]
+        return self.scripts[script](keys, args)
+
+    def _release_lock(self, keys: List[str], args: List[str]) -> int:
+        # search_cache.RELEASE_LOCK_SCRIPT: 토큰이 같을 때만 삭제
+        if self.get(keys[0]) == args[0]:
+            return self.delete(keys[0])
+        return 0
+
+    def _watch(self, keys: List[str], args: List[str]) -> int:
+        # stats_timeseries.WATCH_SCRIPT
+        user_key, watchers_key, watched_key = keys
+        added = 0
+        for video_id in args:
+            if self.sadd(user_key, video_id) == 1:
+                added += 1
+                if self.hincrby(watchers_key, video_id, 1) == 1:
+                    self.sadd(watched_key, video_id)
+        return added
+
+    def _unwatch(self, keys: List[str], args: List[str]) -> int:
+        # stats_timeseries.UNWATCH_SCRIPT
+        user_key, watchers_key, watched_key = keys
+        removed = 0
+        for video_id in args:
+            if self.srem(user_key, video_id) == 1:
+                removed += 1
+                if self.hincrby(watchers_key, video_id, -1) <= 0:
+                    self.hdel(watchers_key, video_id)
+                    self.srem(watched_key, video_id)
+        return removed
+
+
+def make_fake_cache() -> CacheService:
+    """FakeRedis 클라이언트를 연결한 CacheService"""
+    cache = CacheService(redis_url="redis://fake")
+    cache._client = FakeRedis()
+    return cache
+
+
+@pytest.fixture
+def fake_cache() -> CacheService:
+    return make_fake_cache()
+
+
+@pytest.fixture
+def fake_redis(fake_cache) -> FakeRedis:
+    return fake_cache.client
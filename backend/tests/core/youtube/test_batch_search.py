@@ -0,0 +1,119 @@
+"""
+배치 검색 단위 테스트
+
+테스트 범위:
+- RRF 병합 순위
+- 조합별 search.list 1회, 합집합에 대한 videos.list/channels.list 1회
+- 일부 조합 실패 시 나머지 결과 반환
+"""
+
+from collections import Counter
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.youtube.batch_search import rank_search_results, run_batch_search
+from src.core.youtube.http_client import YouTubeHTTPClient
+from src.core.youtube.search_cache import SearchResponseCache
+from src.core.youtube.search_service import YouTubeSearchService
+
+
+# 검색어/국가별 search.list 결과
+SEARCH_RESULTS = {
+    ("react", "KR"): ["a", "b", "c"],
+    ("react", "JP"): ["b", "d"],
+    ("vue", "KR"): ["e", "b"],
+    ("vue", "JP"): ["f"],
+}
+
+
+@pytest.fixture
+def api_calls():
+    return Counter()
+
+
+@pytest.fixture
+def search_service(api_calls, fake_cache):
+    def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rsplit("/", 1)[-1]
+        api_calls[resource] += 1
+        if resource == "search":
+            params = request.url.params
+            if params["q"] == "broken":
+                return httpx.Response(400, json={"error": {"message": "bad request"}})
+            ids = SEARCH_RESULTS.get((params["q"], params.get("regionCode")), [])
+            return httpx.Response(200, json={"items": [{"id": {"videoId": i}} for i in ids]})
+        if resource == "videos":
+            ids = request.url.params["id"].split(",")
+            items = [
+                {
+                    "id": i,
+                    "snippet": {"channelId": "c1", "title": i, "publishedAt": "2025-01-01T00:00:00Z"},
+                    "contentDetails": {"duration": "PT1M"},
+                    "statistics": {"viewCount": "1000"},
+                }
+                for i in ids
+            ]
+            return httpx.Response(200, json={"items": items})
+        if resource == "channels":
+            stats = {"subscriberCount": "5000", "viewCount": "100000", "videoCount": "10"}
+            return httpx.Response(200, json={"items": [{"id": "c1", "statistics": stats}]})
+        return httpx.Response(404, json={"error": {"message": "not found"}})
+
+    ledger = MagicMock()
+    ledger.charge.return_value = 1
+    service = YouTubeSearchService(
+        api_key="test-key", cache=fake_cache, quota_ledger=ledger, refresh_baselines=False
+    )
+    service.http = YouTubeHTTPClient(
+        transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+    )
+    return service
+
+
+@pytest.fixture
+def search_cache(fake_cache):
+    return SearchResponseCache(cache=fake_cache, fresh_ttl=60, stale_ttl=60)
+
+
+def test_rank_search_results_prefers_repeated_hits():
+    ranking = rank_search_results([
+        ("react", "KR", ["a", "b"]),
+        ("react", "JP", ["b", "c"]),
+    ])
+
+    assert list(ranking) == ["b", "a", "c"]
+    assert ranking["b"]["matched_regions"] == ["KR", "JP"]
+    assert ranking["b"]["matched_queries"] == ["react"]
+
+
+@pytest.mark.asyncio
+async def test_batch_search_shares_single_detail_fetch(search_service, search_cache, api_calls):
+    videos, statuses = await run_batch_search(
+        search_service, search_cache, queries=["react", "vue"], region_codes=["KR", "JP"]
+    )
+
+    assert api_calls["search"] == 4
+    assert api_calls["videos"] == 1
+    assert api_calls["channels"] == 1
+    assert videos[0]["video_id"] == "b"
+    assert sorted(v["video_id"] for v in videos) == ["a", "b", "c", "d", "e", "f"]
+    assert all(status["error"] is None for status in statuses)
+
+    # 두 번째 배치는 기본 검색 캐시를 사용
+    await run_batch_search(
+        search_service, search_cache, queries=["react"], region_codes=["KR"]
+    )
+    assert api_calls["search"] == 4
+
+
+@pytest.mark.asyncio
+async def test_batch_search_reports_failed_combinations(search_service, search_cache):
+    videos, statuses = await run_batch_search(
+        search_service, search_cache, queries=["react", "broken"], region_codes=["KR"]
+    )
+
+    assert [v["video_id"] for v in videos] == ["a", "b", "c"]
+    failed = [status for status in statuses if status["error"]]
+    assert [status["query"] for status in failed] == ["broken"]
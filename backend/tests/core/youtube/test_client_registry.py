@@ -0,0 +1,75 @@
+"""
+YouTubeClientRegistry 단위 테스트
+
+테스트 범위:
+- API 키별 클라이언트 재사용
+- 사용자 API 키 LRU 제거
+- 기본 API 키 클라이언트 유지
+- 생성 실패 시 캐시하지 않음
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.core.youtube.client import YouTubeClientRegistry, get_discovery_document
+
+
+class TestYouTubeClientRegistry:
+    """YouTubeClientRegistry 테스트"""
+
+    def test_reuses_client_for_same_key(self):
+        """같은 API 키는 같은 인스턴스를 반환한다"""
+        created = []
+        registry = YouTubeClientRegistry(lambda key: created.append(key) or object(), max_size=2)
+
+        first = registry.get("user-key-1")
+        second = registry.get("user-key-1")
+
+        assert first is second
+        assert created == ["user-key-1"]
+
+    def test_evicts_least_recently_used_user_key(self):
+        """max_size 초과 시 가장 오래 사용하지 않은 사용자 키가 제거된다"""
+        created = []
+        registry = YouTubeClientRegistry(lambda key: created.append(key) or object(), max_size=2)
+
+        registry.get("user-key-1")
+        registry.get("user-key-2")
+        registry.get("user-key-1")  # key-1 최근 사용
+        registry.get("user-key-3")  # key-2 제거
+        registry.get("user-key-2")  # 재생성
+
+        assert created == ["user-key-1", "user-key-2", "user-key-3", "user-key-2"]
+        assert len(registry) == 2
+
+    def test_default_key_is_never_evicted(self):
+        """기본 API 키 클라이언트는 LRU 제거 대상이 아니다"""
+        created = []
+        registry = YouTubeClientRegistry(lambda key: created.append(key) or object(), max_size=1)
+
+        with patch("src.core.youtube.client.settings") as mock_settings:
+            mock_settings.YOUTUBE_API_KEY = "default-key"
+            default_client = registry.get("default-key")
+            registry.get("user-key-1")
+            registry.get("user-key-2")
+
+            assert registry.get("default-key") is default_client
+        assert created.count("default-key") == 1
+
+    def test_factory_error_is_not_cached(self):
+        """클라이언트 생성 실패는 캐시되지 않는다"""
+
+        def factory(key):
+            raise ValueError("invalid key")
+
+        registry = YouTubeClientRegistry(factory, max_size=2)
+
+        with pytest.raises(ValueError):
+            registry.get("bad-key")
+        assert len(registry) == 0
+
+
+def test_discovery_document_loaded_once():
+    """Discovery 문서는 한 번만 파싱되어 재사용된다"""
+    assert get_discovery_document() is get_discovery_document()
+    assert get_discovery_document()["name"] == "youtube"
@@ -0,0 +1,130 @@
+"""
+댓글 내보내기 단위 테스트
+
+테스트 범위:
+- commentThreads 페이지 순회와 답글 확장 (인라인 답글이 부족한 스레드만 comments.list)
+- 완료된 내보내기 보관 및 재사용 (API 호출 없음)
+- 중단된 내보내기는 보관하지 않음
+"""
+
+from collections import Counter
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.youtube.comment_export import CommentExportStore, iter_comment_export
+from src.core.youtube.http_client import YouTubeHTTPClient
+from src.core.youtube.search_service import YouTubeSearchService
+
+THREAD_COUNT = 250
+
+
+def comment(comment_id):
+    return {
+        "id": comment_id,
+        "snippet": {
+            "authorDisplayName": "author",
+            "authorChannelId": {"value": "UCauthor"},
+            "textDisplay": f"text {comment_id}",
+            "likeCount": 1,
+            "publishedAt": "2025-01-01T00:00:00Z",
+        },
+    }
+
+
+@pytest.fixture
+def api_calls():
+    return Counter()
+
+
+@pytest.fixture
+def youtube_service(api_calls):
+    # t0: 답글 8개 (인라인 5개 → comments.list), t1: 답글 3개 (인라인으로 충분)
+    reply_counts = {"t0": 8, "t1": 3}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rsplit("/", 1)[-1]
+        api_calls[resource] += 1
+        params = request.url.params
+        if resource == "commentThreads":
+            if params["videoId"] == "disabled":
+                error = {"code": 403, "errors": [{"reason": "commentsDisabled"}]}
+                return httpx.Response(403, json={"error": error})
+            start = int(params.get("pageToken") or 0)
+            items = []
+            for i in range(start, min(start + 100, THREAD_COUNT)):
+                thread_id = f"t{i}"
+                count = reply_counts.get(thread_id, 0)
+                item = {"snippet": {"topLevelComment": comment(thread_id), "totalReplyCount": count}}
+                if count and "replies" in params["part"]:
+                    inline = [comment(f"{thread_id}.r{j}") for j in range(min(count, 5))]
+                    item["replies"] = {"comments": inline}
+                items.append(item)
+            body = {"items": items}
+            if start + 100 < THREAD_COUNT:
+                body["nextPageToken"] = str(start + 100)
+            return httpx.Response(200, json=body)
+        if resource == "comments":
+            parent = params["parentId"]
+            items = [comment(f"{parent}.r{j}") for j in range(reply_counts[parent])]
+            return httpx.Response(200, json={"items": items})
+        return httpx.Response(404, json={"error": {"message": "not found"}})
+
+    ledger = MagicMock()
+    ledger.charge.return_value = 1
+    service = YouTubeSearchService(
+        api_key="test-key", cache=MagicMock(), quota_ledger=ledger, refresh_baselines=False
+    )
+    service.http = YouTubeHTTPClient(
+        transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+    )
+    return service
+
+
+@pytest.fixture
+def store(fake_cache):
+    return CommentExportStore(cache=fake_cache)
+
+
+@pytest.mark.asyncio
+async def test_iter_comment_threads_expands_replies(youtube_service, api_calls):
+    pages = [
+        page async for page in youtube_service.iter_comment_threads("v1", include_replies=True)
+    ]
+
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert len(pages[0][0]["replies"]) == 8
+    assert len(pages[0][1]["replies"]) == 3
+    assert pages[0][2]["replies"] == []
+    # 인라인 답글이 부족한 스레드만 comments.list 호출
+    assert api_calls == {"commentThreads": 3, "comments": 1}
+
+
+@pytest.mark.asyncio
+async def test_completed_export_served_from_storage(youtube_service, store, api_calls):
+    first = [c async for page in iter_comment_export(youtube_service, store, "v1") for c in page]
+    calls_after_first = sum(api_calls.values())
+    second = [c async for page in iter_comment_export(youtube_service, store, "v1") for c in page]
+
+    assert len(first) == THREAD_COUNT
+    assert second == first
+    assert sum(api_calls.values()) == calls_after_first
+    assert "replies" not in first[0]
+
+
+@pytest.mark.asyncio
+async def test_interrupted_export_not_stored(youtube_service, store):
+    pages = iter_comment_export(youtube_service, store, "v1")
+    await pages.__anext__()
+    await pages.aclose()
+
+    assert store.cache.client.keys("*") == []
+
+
+@pytest.mark.asyncio
+async def test_comments_disabled_yields_nothing(youtube_service, store):
+    pages = [page async for page in iter_comment_export(youtube_service, store, "disabled")]
+
+    assert pages == []
+    assert store.cache.client.keys("*") == []
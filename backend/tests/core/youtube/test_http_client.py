@@ -0,0 +1,116 @@
+"""
+YouTubeHTTPClient 단위 테스트
+
+테스트 범위:
+- YouTube Data API 비동기 호출 (httpx.MockTransport)
+  - API 키/파라미터 전달
+  - 일시적 오류(5xx) 재시도
+  - 에러 응답 → YouTubeHTTPError 변환 (quotaExceeded 감지)
+- 이벤트 루프가 바뀌면 이전 루프의 커넥션 풀 종료
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.core.youtube.exceptions import YouTubeHTTPError
+from src.core.youtube.http_client import YouTubeHTTPClient
+
+
+def make_client(handler, max_retries: int = 2) -> YouTubeHTTPClient:
+    """MockTransport 기반 클라이언트 생성 (재시도 대기 없음)"""
+    return YouTubeHTTPClient(
+        transport=httpx.MockTransport(handler),
+        max_retries=max_retries,
+        backoff_factor=0,
+    )
+
+
+class TestYouTubeHTTPClient:
+    """YouTubeHTTPClient 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_success_passes_key_and_params(self):
+        """API 키와 파라미터가 쿼리스트링으로 전달되고 None 값은 제외된다"""
+        captured = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            captured["path"] = request.url.path
+            captured["params"] = dict(request.url.params)
+            return httpx.Response(200, json={"items": [{"id": "abc"}]})
+
+        client = make_client(handler)
+        result = await client.get(
+            "videos", {"part": "snippet", "id": "abc", "pageToken": None}, api_key="KEY"
+        )
+
+        assert result == {"items": [{"id": "abc"}]}
+        assert captured["path"].endswith("/videos")
+        assert captured["params"] == {"part": "snippet", "id": "abc", "key": "KEY"}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_retries_on_server_error(self):
+        """5xx 응답은 재시도 후 성공 응답을 반환한다"""
+        calls = {"count": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls["count"] += 1
+            if calls["count"] < 3:
+                return httpx.Response(503, json={"error": {"message": "backend"}})
+            return httpx.Response(200, json={"items": []})
+
+        client = make_client(handler, max_retries=2)
+        result = await client.get("search", {"q": "test"}, api_key="KEY")
+
+        assert result == {"items": []}
+        assert calls["count"] == 3
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_get_raises_quota_error_without_retry(self):
+        """403 quotaExceeded는 재시도하지 않고 YouTubeHTTPError로 변환된다"""
+        calls = {"count": 0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls["count"] += 1
+            return httpx.Response(
+                403,
+                json={
+                    "error": {
+                        "message": "quota",
+                        "errors": [{"reason": "quotaExceeded"}],
+                    }
+                },
+            )
+
+        client = make_client(handler)
+        with pytest.raises(YouTubeHTTPError) as exc_info:
+            await client.get("search", {"q": "test"}, api_key="KEY")
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.is_quota_exceeded
+        assert calls["count"] == 1
+        await client.close()
+
+
+def test_loop_change_closes_previous_client():
+    """새 이벤트 루프에서 사용하면 이전 루프의 클라이언트를 닫고 새로 만든다"""
+    client = make_client(lambda request: httpx.Response(200, json={}))
+
+    async def current():
+        return client.client
+
+    first = asyncio.run(current())
+
+    async def next_loop():
+        second = client.client
+        await asyncio.sleep(0)
+        return second
+
+    second = asyncio.run(next_loop())
+
+    assert second is not first
+    assert first.is_closed
+    assert not second.is_closed
@@ -0,0 +1,78 @@
+"""
+YouTubeAPIKeyPool 단위 테스트
+
+테스트 범위:
+- 잔여 할당량이 많은 키 우선 선택
+- 쿨다운 키 제외
+- quotaExceeded 발생 시 다음 키로 자동 전환
+"""
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.youtube.http_client import YouTubeHTTPClient
+from src.core.youtube.key_pool import YouTubeAPIKeyPool
+from src.core.youtube.search_service import YouTubeSearchService
+
+
+def make_pool(used: dict, cooldowns: dict = None) -> YouTubeAPIKeyPool:
+    """사용량/쿨다운이 지정된 키 풀 생성"""
+    api_keys = list(used.keys())
+    ledger = MagicMock()
+    ledger.get_used_many.return_value = used
+    ledger.charge.return_value = 1
+    mock_redis = MagicMock()
+    cooldowns = cooldowns or {}
+    mock_redis.mget.return_value = [cooldowns.get(key) for key in api_keys]
+    return YouTubeAPIKeyPool(api_keys, quota_ledger=ledger, redis_client=mock_redis)
+
+
+class TestCandidates:
+    """candidates() 테스트"""
+
+    def test_orders_by_remaining_budget(self):
+        """사용량이 적은(잔여량이 많은) 키가 먼저 온다"""
+        pool = make_pool({"key-a": 9000, "key-b": 100, "key-c": 5000})
+
+        assert pool.candidates() == ["key-b", "key-c", "key-a"]
+
+    def test_excludes_keys_on_cooldown(self):
+        """쿨다운 중인 키는 제외된다"""
+        pool = make_pool({"key-a": 0, "key-b": 100}, cooldowns={"key-a": "quotaExceeded"})
+
+        assert pool.candidates() == ["key-b"]
+
+
+class TestFailover:
+    """키 풀 장애 조치 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_quota_exceeded_fails_over_to_next_key(self):
+        """quotaExceeded를 받은 키는 쿨다운되고 다음 키로 재시도한다"""
+        pool = make_pool({"key-a": 0, "key-b": 500})
+        pool.mark_cooldown = MagicMock()
+        used_keys = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            api_key = request.url.params["key"]
+            used_keys.append(api_key)
+            if api_key == "key-a":
+                return httpx.Response(
+                    403, json={"error": {"errors": [{"reason": "quotaExceeded"}]}}
+                )
+            return httpx.Response(200, json={"items": []})
+
+        service = YouTubeSearchService(
+            api_key="key-a", cache=MagicMock(), quota_ledger=pool.quota_ledger, key_pool=pool
+        )
+        service.http = YouTubeHTTPClient(
+            transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+        )
+
+        videos = await service.search_videos("test")
+
+        assert videos == []
+        assert used_keys == ["key-a", "key-b"]
+        pool.mark_cooldown.assert_called_once_with("key-a", "quotaExceeded")
+        pool.quota_ledger.mark_exhausted.assert_called_once_with("key-a")
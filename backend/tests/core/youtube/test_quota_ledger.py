@@ -0,0 +1,99 @@
+"""
+YouTubeQuotaLedger 단위 테스트
+
+테스트 범위:
+- 리소스별 비용 차감 (search.list 100, videos.list 1)
+- API 키 예산 초과 시 롤백 후 차단
+- 잔여 예산이 적을 때 고비용 호출만 차단 (캐시 전용 모드)
+- 사용자별 일일 한도
+- PT 기준 날짜 계산
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+import redis
+from unittest.mock import MagicMock
+
+from src.core.youtube.exceptions import QuotaBudgetExceededError
+from src.core.youtube.quota_ledger import YouTubeQuotaLedger, quota_day
+
+
+def make_ledger(key_total: int, user_total: int = 0):
+    """INCRBY 결과가 key_total/user_total인 Redis Mock 기반 원장"""
+    mock_redis = MagicMock()
+    pipe = MagicMock()
+    mock_redis.pipeline.return_value = pipe
+    pipe.execute.return_value = [key_total, user_total, True, 1, True, True, 1]
+    ledger = YouTubeQuotaLedger(
+        redis_client=mock_redis, daily_limit=10000, user_daily_limit=2000, reserve=1000
+    )
+    return ledger, pipe
+
+
+class TestCharge:
+    """charge() 테스트"""
+
+    def test_charge_search_costs_100_units(self):
+        """search.list는 100 unit을 차감한다"""
+        ledger, pipe = make_ledger(key_total=100)
+
+        units = ledger.charge("AIzaKEY1234", "search")
+
+        assert units == 100
+        assert pipe.incrby.call_args_list[0].args[1] == 100
+        pipe.decrby.assert_not_called()
+
+    def test_charge_blocks_and_rolls_back_when_key_budget_exceeded(self):
+        """API 키 예산을 넘으면 차감분을 되돌리고 차단한다"""
+        ledger, pipe = make_ledger(key_total=10001)
+
+        with pytest.raises(QuotaBudgetExceededError) as exc_info:
+            ledger.charge("AIzaKEY1234", "videos")
+
+        assert exc_info.value.scope == "key"
+        pipe.decrby.assert_called_once()
+
+    def test_expensive_call_blocked_within_reserve(self):
+        """잔여량이 reserve 미만이면 search.list만 차단한다"""
+        ledger, _ = make_ledger(key_total=9100)
+        with pytest.raises(QuotaBudgetExceededError):
+            ledger.charge("AIzaKEY1234", "search")
+
+        ledger, _ = make_ledger(key_total=9100)
+        assert ledger.charge("AIzaKEY1234", "videos") == 1
+
+    def test_user_daily_limit(self):
+        """사용자 한도를 넘으면 scope=user로 차단한다"""
+        ledger, pipe = make_ledger(key_total=500, user_total=2050)
+
+        with pytest.raises(QuotaBudgetExceededError) as exc_info:
+            ledger.charge("AIzaKEY1234", "search", user_id="user-1")
+
+        assert exc_info.value.scope == "user"
+        assert pipe.decrby.call_count == 2
+
+    def test_key_labels_expire_with_day_bucket(self):
+        """키 라벨은 날짜별 해시에 기록하고 카운터와 함께 만료된다"""
+        ledger, pipe = make_ledger(key_total=1)
+
+        ledger.charge("AIzaKEY1234", "videos")
+
+        labels_key = pipe.hset.call_args.args[0]
+        assert labels_key == f"youtube:quota:{quota_day()}:keys"
+        assert labels_key in [c.args[0] for c in pipe.expire.call_args_list]
+
+    def test_charge_fails_open_when_redis_unavailable(self):
+        """Redis 장애 시에는 호출을 허용한다"""
+        mock_redis = MagicMock()
+        mock_redis.pipeline.return_value.execute.side_effect = redis.ConnectionError("down")
+        ledger = YouTubeQuotaLedger(redis_client=mock_redis)
+
+        assert ledger.charge("AIzaKEY1234", "search") == 100
+
+
+def test_quota_day_uses_pacific_time():
+    """할당량 날짜는 태평양 시간 기준이다"""
+    # 2025-03-10 06:00 UTC == 2025-03-09 23:00 PDT
+    assert quota_day(datetime(2025, 3, 10, 6, 0, tzinfo=timezone.utc)) == "2025-03-09"
+    assert quota_day(datetime(2025, 3, 10, 8, 0, tzinfo=timezone.utc)) == "2025-03-10"
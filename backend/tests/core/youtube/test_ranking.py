@@ -0,0 +1,69 @@
+"""
+영상 순위 계산 단위 테스트
+
+테스트 범위:
+- 지표별 계산 (참여율, 시간당 조회수, 성과도 배율)
+- 상위 k개 선택이 전체 정렬 결과와 일치
+- 계산 불가 지표는 가장 뒤로 정렬
+"""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.youtube.ranking import compute_metric, rank_videos, top_k_indices
+
+NOW = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+
+def video(video_id, views, likes=0, comments=0, hours_ago=24, performance_ratio=None):
+    return {
+        "video_id": video_id,
+        "view_count": views,
+        "like_count": likes,
+        "comment_count": comments,
+        "published_at": (NOW - timedelta(hours=hours_ago)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "performance_ratio": performance_ratio,
+    }
+
+
+def test_metrics():
+    videos = [
+        video("a", 1000, likes=40, comments=10, hours_ago=10),
+        video("b", 0, hours_ago=0.1),
+    ]
+
+    assert list(compute_metric(videos, "engagement_rate")) == [0.05, float("-inf")]
+    # 게시 1시간 미만은 1시간으로 계산
+    assert list(compute_metric(videos, "view_velocity", now=NOW)) == [100.0, 0.0]
+
+
+def test_top_k_matches_full_sort():
+    values = [random.random() for _ in range(1000)]
+
+    assert top_k_indices(values, 10) == top_k_indices(values)[:10]
+
+
+def test_rank_by_performance_ratio_puts_missing_last():
+    videos = [
+        video("a", 100, performance_ratio=None),
+        video("b", 100, performance_ratio=0.5),
+        video("c", 100, performance_ratio=3.0),
+    ]
+
+    ranked = rank_videos(videos, sort_by="performance_ratio", limit=3, now=NOW)
+
+    assert [v["video_id"] for v in ranked] == ["c", "b", "a"]
+    assert ranked[0]["view_velocity"] == pytest.approx(100 / 24)
+
+
+def test_relevance_keeps_order():
+    videos = [video("a", 10), video("b", 1000)]
+
+    assert [v["video_id"] for v in rank_videos(videos, limit=1)] == ["a"]
+
+
+def test_unknown_sort_rejected():
+    with pytest.raises(ValueError):
+        rank_videos([], sort_by="likes")
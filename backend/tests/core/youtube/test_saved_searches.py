@@ -0,0 +1,201 @@
+"""
+저장된 검색 단위 테스트
+
+테스트 범위:
+- 증분 재실행 (publishedAfter = 마지막 실행 시각 - 중첩 구간)
+- 결과 병합 시 처음 발견한 시각 유지 및 신규 결과 조회
+- API 키별 실행 개수 제한과 할당량 예산 부족 시 재예약 (사용자 예산은 해당 사용자만)
+- 확인 표시는 반환한 결과까지만, 실행 중 삭제된 검색은 되살리지 않음
+"""
+
+from collections import Counter
+
+import pytest
+
+from src.core.youtube.exceptions import QuotaBudgetExceededError
+from src.core.youtube.saved_searches import (
+    INCREMENTAL_OVERLAP,
+    SavedSearchStore,
+    run_due_saved_searches,
+    run_saved_search,
+)
+
+
+class FakeSearchService:
+    def __init__(self, pages=None, error=None):
+        self.pages = list(pages or [])
+        self.error = error
+        self.calls = []
+
+    async def search_video_ids(self, query, **kwargs):
+        self.calls.append({"query": query, **kwargs})
+        if self.error:
+            raise self.error
+        return (self.pages.pop(0) if self.pages else []), None
+
+
+@pytest.fixture
+def store(fake_cache):
+    return SavedSearchStore(cache=fake_cache, max_results=3)
+
+
+def create(store, user_id="user-1", fingerprint="pool"):
+    return store.create(
+        user_id=user_id, name="AI", query="  AI   news ", interval=3600,
+        key_fingerprint=fingerprint,
+    )
+
+
+@pytest.mark.asyncio
+async def test_incremental_run_merges_new_results(store):
+    record = create(store)
+    service = FakeSearchService(pages=[["a", "b"], ["b", "c"]])
+
+    assert await run_saved_search(service, store, record, now=1000.0) == 2
+    assert await run_saved_search(service, store, record, now=5000.0) == 1
+
+    # 첫 실행은 전체, 이후에는 마지막 실행 시각부터 (중첩 구간 포함)
+    assert service.calls[0]["published_after"] is None
+    assert service.calls[1]["published_after"].timestamp() == (
+        1000.0 - INCREMENTAL_OVERLAP.total_seconds()
+    )
+    assert service.calls[0]["query"] == "AI news"
+
+    found, new_count = store.results_since(record["id"], since=1001.0, limit=10)
+    assert [video_id for video_id, _ in found] == ["c"]
+    assert new_count == 1
+    assert store.get(record["id"])["next_run_at"] == 5000.0 + 3600
+
+
+@pytest.mark.asyncio
+async def test_results_capped_to_most_recent(store):
+    record = create(store)
+    service = FakeSearchService(pages=[["a", "b"], ["c", "d"]])
+    await run_saved_search(service, store, record, now=1000.0)
+    await run_saved_search(service, store, record, now=2000.0)
+
+    found, _ = store.results_since(record["id"], since=0, limit=10)
+
+    # 같은 실행에서는 검색 결과 상위가 더 최근 발견
+    assert [video_id for video_id, _ in found] == ["c", "d", "a"]
+
+
+@pytest.mark.asyncio
+async def test_due_searches_limited_per_key(store):
+    pool_records = [create(store) for _ in range(3)]
+    own_record = create(store, user_id="user-2", fingerprint="key-2")
+    services = Counter()
+
+    def factory(record):
+        services[record["key_fingerprint"]] += 1
+        return FakeSearchService(pages=[["x"]])
+
+    now = pool_records[-1]["created_at"] + 1
+    summary = await run_due_saved_searches(store, factory, now=now, per_key_limit=2)
+
+    assert summary["executed"] == 3
+    assert summary["deferred"] == 1
+    assert services == {"pool": 2, "key-2": 1}
+    # 실행하지 못한 검색은 다음 주기에 실행
+    assert [r["id"] for r in store.due(now, 10)] == [pool_records[2]["id"]]
+    assert store.get(own_record["id"])["last_run_at"] == now
+
+
+@pytest.mark.asyncio
+async def test_budget_exhausted_reschedules_key_group(store):
+    records = [create(store) for _ in range(2)]
+    now = records[-1]["created_at"] + 1
+
+    summary = await run_due_saved_searches(
+        store,
+        lambda record: FakeSearchService(error=QuotaBudgetExceededError(retry_after=600)),
+        now=now,
+    )
+
+    assert summary["failed"] == 2
+    assert store.due(now, 10) == []
+    assert all(store.get(r["id"])["next_run_at"] == now + 600 for r in records)
+
+
+@pytest.mark.asyncio
+async def test_user_budget_exhausted_defers_only_that_user(store):
+    """서버 키 풀 그룹에서 한 사용자의 예산 부족은 다른 사용자 검색을 막지 않는다"""
+    blocked = [create(store, user_id="user-1") for _ in range(2)]
+    others = [create(store, user_id="user-2") for _ in range(2)]
+    now = others[-1]["created_at"] + 1
+    calls = Counter()
+
+    def factory(record):
+        calls[record["user_id"]] += 1
+        if record["user_id"] == "user-1":
+            return FakeSearchService(
+                error=QuotaBudgetExceededError(scope="user", retry_after=600)
+            )
+        return FakeSearchService(pages=[["x"]])
+
+    summary = await run_due_saved_searches(store, factory, now=now)
+
+    assert summary["executed"] == 2
+    assert summary["failed"] == 2
+    # 예산이 부족한 사용자는 한 번만 시도하고 나머지 검색은 함께 미룸
+    assert calls == {"user-1": 1, "user-2": 2}
+    assert all(store.get(r["id"])["next_run_at"] == now + 600 for r in blocked)
+    assert all(store.get(r["id"])["last_run_at"] == now for r in others)
+
+
+@pytest.mark.asyncio
+async def test_results_in_one_run_get_distinct_found_at(store):
+    record = create(store)
+    await run_saved_search(FakeSearchService(pages=[["a", "b", "c"]]), store, record, now=1000.0)
+
+    found, _ = store.results_since(record["id"], since=0, limit=10)
+
+    # 검색 결과 순서대로 최근 발견, 발견 시각은 모두 다름
+    assert [video_id for video_id, _ in found] == ["a", "b", "c"]
+    assert len({score for _, score in found}) == 3
+
+
+@pytest.mark.asyncio
+async def test_mark_viewed_keeps_unreturned_results_new(store):
+    record = create(store)
+    await run_saved_search(FakeSearchService(pages=[["a", "b", "c"]]), store, record, now=1000.0)
+
+    # 확인 시각 직후부터 2개 → 나머지 1개는 신규로 남음
+    found, new_count = store.results_since(record["id"], since=0.0, limit=2, oldest_first=True)
+    assert [video_id for video_id, _ in found] == ["c", "b"]
+    assert new_count == 3
+    store.mark_viewed(record["id"], max(score for _, score in found))
+
+    last_viewed_at = store.get(record["id"])["last_viewed_at"]
+    found, new_count = store.results_since(record["id"], since=last_viewed_at, limit=10)
+    assert [video_id for video_id, _ in found] == ["a"]
+    assert new_count == 1
+
+    # 확인 시각은 뒤로 가지 않음
+    store.mark_viewed(record["id"], 0.0)
+    assert store.get(record["id"])["last_viewed_at"] == last_viewed_at
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_overwrite_viewed_state(store):
+    record = create(store)
+    store.mark_viewed(record["id"], 1500.0)
+
+    # 조회 이전에 읽은 레코드로 실행해도 확인 시각은 유지
+    await run_saved_search(FakeSearchService(pages=[["a"]]), store, record, now=2000.0)
+
+    assert store.get(record["id"])["last_viewed_at"] == 1500.0
+    assert "last_viewed_at" not in store.cache.client.get(store._key(record["id"]))
+
+
+@pytest.mark.asyncio
+async def test_search_deleted_during_run_is_not_resurrected(store):
+    record = create(store)
+    stale = store.get(record["id"])
+    store.delete(record)
+
+    await run_saved_search(FakeSearchService(pages=[["a"]]), store, stale, now=2000.0)
+
+    assert store.get(record["id"]) is None
+    assert store.due(10**10, 10) == []
+    assert store.results_since(record["id"], since=0, limit=10) == ([], 0)
@@ -0,0 +1,289 @@
+"""
+SearchResponseCache 단위 테스트
+
+테스트 범위:
+- 신선 기간 경과 후 stale 표시
+- 동일 키 동시 갱신 시 loader 1회 호출 (single-flight)
+- 공유 갱신이 호출자 한정 오류(사용자 예산, API 키)로 실패하면 대기자가 직접 갱신
+- 다른 워커가 락을 보유한 경우 갱신 결과 대기, 락은 보유 워커만 해제
+- 기본 검색 키 정규화(로컬 필터 제외, 기간 버킷)와 로컬 필터
+- 검색/필터 조합별 필터 통과율 학습
+- 필터 결과 추가 조회 페이지 캐시
+"""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from src.core.youtube.exceptions import InvalidAPIKeyError, QuotaBudgetExceededError
+from src.core.youtube.search_cache import (
+    RELEASE_LOCK_SCRIPT,
+    SearchResponseCache,
+    build_search_base_key,
+)
+from src.core.youtube.utils import filter_videos
+
+
+@pytest.fixture
+def search_cache(fake_cache):
+    return SearchResponseCache(
+        cache=fake_cache, fresh_ttl=60, stale_ttl=600, wait_timeout=1.0, poll_interval=0.01
+    )
+
+
+class TestStaleWhileRevalidate:
+    """stale 판정 테스트"""
+
+    def test_fresh_entry(self, search_cache):
+        search_cache.set("k", {"video_ids": ["v1"]})
+
+        entry = search_cache.get("k")
+
+        assert entry["video_ids"] == ["v1"]
+        assert entry["stale"] is False
+
+    def test_expired_entry_is_stale(self, search_cache, fake_cache):
+        search_cache.set("k", {"video_ids": ["v1"]})
+        entry = fake_cache.get("k")
+        entry["fresh_until"] = time.time() - 1
+        fake_cache.set("k", entry)
+
+        assert search_cache.get("k")["stale"] is True
+
+    def test_legacy_entry_is_fresh(self, search_cache, fake_cache):
+        fake_cache.set("k", {"video_ids": ["v1"], "cached_at": "2025-01-01T00:00:00"})
+
+        assert search_cache.get("k")["stale"] is False
+
+
+class TestSingleFlight:
+    """동시 갱신 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refresh_calls_loader_once(self, search_cache):
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return {"video_ids": ["v1", "v2"]}
+
+        entries = await asyncio.gather(*[search_cache.refresh("k", loader) for _ in range(5)])
+
+        assert calls == 1
+        assert all(entry["video_ids"] == ["v1", "v2"] for entry in entries)
+        assert search_cache.get("k")["video_ids"] == ["v1", "v2"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [QuotaBudgetExceededError(scope="user"), InvalidAPIKeyError()],
+    )
+    async def test_waiter_retries_with_own_loader_on_caller_error(self, search_cache, error):
+        """첫 호출자의 사용자 예산/키 오류는 다른 사용자에게 전파되지 않는다"""
+        calls = []
+
+        async def user_a_loader():
+            calls.append("a")
+            await asyncio.sleep(0.05)
+            raise error
+
+        async def user_b_loader():
+            calls.append("b")
+            return {"video_ids": ["v1"]}
+
+        first, second = await asyncio.gather(
+            search_cache.refresh("k", user_a_loader),
+            search_cache.refresh("k", user_b_loader),
+            return_exceptions=True,
+        )
+
+        assert first is error
+        assert second["video_ids"] == ["v1"]
+        assert calls == ["a", "b"]
+        assert search_cache.get("k")["video_ids"] == ["v1"]
+
+    @pytest.mark.asyncio
+    async def test_waiter_shares_other_errors(self, search_cache):
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *[search_cache.refresh("k", loader) for _ in range(3)], return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_waits_for_other_worker(self, search_cache, fake_cache):
+        """다른 워커가 락을 보유하면 loader를 호출하지 않고 결과를 기다린다"""
+        lock_key = f"{SearchResponseCache.LOCK_PREFIX}:k"
+        fake_cache.client.set(lock_key, "other-worker")
+
+        async def other_worker():
+            await asyncio.sleep(0.05)
+            search_cache.set("k", {"video_ids": ["v9"]})
+            fake_cache.client.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, "other-worker")
+
+        async def loader():
+            raise AssertionError("loader should not be called")
+
+        entry, _ = await asyncio.gather(search_cache.refresh("k", loader), other_worker())
+
+        assert entry["video_ids"] == ["v9"]
+
+    def test_lock_released_only_by_owner(self, search_cache, fake_cache):
+        """락 만료 후 다른 워커가 다시 잡은 락은 이전 보유 워커가 해제하지 못한다"""
+        lock_key = f"{SearchResponseCache.LOCK_PREFIX}:k"
+        assert search_cache._acquire_lock(lock_key, "worker-1")
+        assert not search_cache._acquire_lock(lock_key, "worker-2")
+
+        fake_cache.client.set(lock_key, "worker-2")
+        search_cache._release_lock(lock_key, "worker-1")
+        assert fake_cache.client.get(lock_key) == "worker-2"
+
+        search_cache._release_lock(lock_key, "worker-2")
+        assert not fake_cache.exists(lock_key)
+
+    @pytest.mark.asyncio
+    async def test_background_refresh_swallows_errors(self, search_cache):
+        async def loader():
+            raise RuntimeError("boom")
+
+        await search_cache.refresh_in_background("k", loader)
+
+        assert search_cache.get("k") is None
+
+
+class TestFillPages:
+    """추가 조회 페이지 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_page_is_cached_per_token_and_single_flight(self, search_cache):
+        calls = []
+
+        def loader(token):
+            async def load():
+                calls.append(token)
+                await asyncio.sleep(0.01)
+                return {"video_ids": [f"{token}-v1"], "next_page_token": f"{token}+"}
+
+            return load
+
+        pages = await asyncio.gather(
+            *[search_cache.get_page("k", "t1", loader("t1")) for _ in range(3)]
+        )
+        again = await search_cache.get_page("k", "t1", loader("t1"))
+        other = await search_cache.get_page("k", "t2", loader("t2"))
+
+        assert calls == ["t1", "t2"]
+        assert all(page["video_ids"] == ["t1-v1"] for page in pages)
+        assert again["next_page_token"] == "t1+"
+        assert other["video_ids"] == ["t2-v1"]
+
+    @pytest.mark.asyncio
+    async def test_stale_page_is_refetched(self, search_cache, fake_cache):
+        async def load():
+            return {"video_ids": ["v1"], "next_page_token": None}
+
+        await search_cache.get_page("k", "t1", load)
+        page_key = f"{SearchResponseCache.PAGE_PREFIX}:k:t1"
+        entry = fake_cache.get(page_key)
+        entry["fresh_until"] = time.time() - 1
+        fake_cache.set(page_key, entry)
+
+        async def reload():
+            return {"video_ids": ["v2"], "next_page_token": None}
+
+        assert (await search_cache.get_page("k", "t1", reload))["video_ids"] == ["v2"]
+
+
+class TestSearchBaseKey:
+    """기본 검색 캐시 키 정규화 테스트"""
+
+    def test_query_formatting_shares_key(self):
+        key_a, _, _ = build_search_base_key("React  Tutorial ", region_code="kr")
+        key_b, _, _ = build_search_base_key("react tutorial", region_code="KR")
+
+        assert key_a == key_b
+
+    def test_date_bounds_are_bucketed(self):
+        key_a, after, before = build_search_base_key(
+            "react",
+            published_after=datetime(2025, 1, 1, 10, 15, 3),
+            published_before=datetime(2025, 1, 2, 10, 15, 3),
+            bucket_seconds=3600,
+        )
+        key_b, _, _ = build_search_base_key(
+            "react",
+            published_after=datetime(2025, 1, 1, 10, 59, 59),
+            published_before=datetime(2025, 1, 2, 10, 0, 1),
+            bucket_seconds=3600,
+        )
+
+        assert key_a == key_b
+        assert after == datetime(2025, 1, 1, 10, tzinfo=timezone.utc)
+        assert before == datetime(2025, 1, 2, 11, tzinfo=timezone.utc)
+
+
+class TestFilterVideos:
+    """캐시된 상위 결과에 대한 로컬 필터 테스트"""
+
+    videos = [
+        {"video_id": "a", "view_count": 100, "subscriber_count": 10, "duration": 30,
+         "published_at": "2025-01-01T09:00:00Z"},
+        {"video_id": "b", "view_count": 5000, "subscriber_count": 2000, "duration": 600,
+         "published_at": "2025-01-01T10:30:00Z"},
+        {"video_id": "c", "view_count": 9000, "subscriber_count": 5000, "duration": 45,
+         "published_at": "2025-01-01T11:00:00Z"},
+    ]
+
+    def test_view_and_subscriber_filters(self):
+        result = filter_videos(self.videos, min_view_count=1000, min_subscriber_count=3000)
+
+        assert [v["video_id"] for v in result] == ["c"]
+
+    def test_shorts_only(self):
+        result = filter_videos(self.videos, shorts_only=True)
+
+        assert [v["video_id"] for v in result] == ["a", "c"]
+
+    def test_exact_date_bounds(self):
+        result = filter_videos(
+            self.videos,
+            published_after=datetime(2025, 1, 1, 10, 15),
+            published_before=datetime(2025, 1, 1, 10, 45),
+        )
+
+        assert [v["video_id"] for v in result] == ["b"]
+
+
+class TestPassRate:
+    """필터 통과율 학습 테스트"""
+
+    def test_record_pass_rate_moving_average(self, search_cache):
+        assert search_cache.get_pass_rate("k", min_view_count=1000) is None
+
+        assert search_cache.record_pass_rate("k", 10, 50, min_view_count=1000) == pytest.approx(0.2)
+        rate = search_cache.record_pass_rate("k", 30, 50, min_view_count=1000)
+
+        assert rate == pytest.approx(0.7 * 0.2 + 0.3 * 0.6)
+        assert search_cache.get_pass_rate("k", min_view_count=1000) == pytest.approx(rate)
+        assert search_cache.get_pass_rate("k", min_view_count=5000) is None
+
+    def test_zero_filters_share_unfiltered_key(self, search_cache):
+        """0인 최소값 필터는 필터 없음과 같은 통과율을 사용한다"""
+        search_cache.record_pass_rate("k", 10, 50)
+
+        assert search_cache.get_pass_rate(
+            "k", min_view_count=0, min_subscriber_count=0
+        ) == pytest.approx(0.2)
@@ -0,0 +1,499 @@
+"""
+YouTubeSearchService 단위 테스트
+
+테스트 범위:
+- 검색 1회당 channels.list 호출 1회 (구독자 수 필터는 통계 재사용)
+- 채널 통계 캐시 히트 시 channels.list 생략
+- 딥 검색 페이지 순회 (결과 수/검색 예산 제한)
+- 필터 결과 적응형 추가 조회
+- ETag 조건부 요청 (304 시 캐시 레코드 재사용)
+- 채널 업로드 재생목록 순회 (search.list 미사용, 이전 크롤링 시점에서 중단)
+- 최근 업로드 조회수 기준선 (performance_ratio 분모, 백그라운드 갱신)
+"""
+
+import asyncio
+import json
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.youtube.exceptions import QuotaBudgetExceededError, QuotaExceededError
+from src.core.youtube.http_client import YouTubeHTTPClient
+from src.core.youtube.search_service import YouTubeSearchService, estimate_fill_page_size
+
+
+def video_item(video_id: str, channel_id: str, views: int = 1000) -> dict:
+    return {
+        "id": video_id,
+        "snippet": {"channelId": channel_id, "title": video_id, "publishedAt": "2025-01-01T00:00:00Z"},
+        "contentDetails": {"duration": "PT1M"},
+        "statistics": {"viewCount": str(views)},
+    }
+
+
+@pytest.fixture
+def api_calls():
+    """리소스별 API 호출 횟수"""
+    return Counter()
+
+
+@pytest.fixture
+def quota_ledger():
+    """할당량 원장 Mock (항상 허용)"""
+    ledger = MagicMock()
+    ledger.charge.return_value = 1
+    return ledger
+
+
+@pytest.fixture
+def search_service(api_calls, fake_cache, quota_ledger):
+    """MockTransport + FakeRedis 캐시 기반 YouTubeSearchService"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rsplit("/", 1)[-1]
+        api_calls[resource] += 1
+        if resource == "search":
+            return httpx.Response(
+                200, json={"items": [{"id": {"videoId": "v1"}}, {"id": {"videoId": "v2"}}]}
+            )
+        if resource == "videos":
+            ids = request.url.params["id"].split(",")
+            channels = {"v1": "c1", "v2": "c2"}
+            return httpx.Response(200, json={"items": [video_item(i, channels.get(i, "c1")) for i in ids]})
+        if resource == "channels":
+            stats = {
+                "c1": {"subscriberCount": "5000", "viewCount": "100000", "videoCount": "10"},
+                "c2": {"subscriberCount": "10", "viewCount": "1000", "videoCount": "10"},
+            }
+            ids = request.url.params["id"].split(",")
+            return httpx.Response(
+                200, json={"items": [{"id": i, "statistics": stats[i]} for i in ids if i in stats]}
+            )
+        return httpx.Response(404, json={"error": {"message": "not found"}})
+
+    service = YouTubeSearchService(
+        api_key="test-key", cache=fake_cache, quota_ledger=quota_ledger, refresh_baselines=False
+    )
+    service.http = YouTubeHTTPClient(
+        transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+    )
+    return service
+
+
+class TestChannelStatsSharing:
+    """채널 통계 공유/캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_subscriber_filter_reuses_channel_stats(self, search_service, api_calls):
+        """구독자 수 필터는 channels.list를 다시 호출하지 않는다"""
+        videos = await search_service.search_videos("test", min_subscriber_count=1000)
+
+        assert [v["video_id"] for v in videos] == ["v1"]
+        assert api_calls["channels"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_channel_stats_skip_api(self, search_service, api_calls):
+        """캐시된 채널 통계가 있으면 channels.list를 호출하지 않는다"""
+        await search_service.search_videos("test")
+        await search_service.search_videos("test")
+
+        assert api_calls["channels"] == 1
+        videos = await search_service.get_video_details(["v1"])
+        assert videos[0]["subscriber_count"] == 5000
+        assert api_calls["channels"] == 1
+
+
+class TestVideoRecordCache:
+    """영상 레코드 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_get_video_details_fetches_only_misses(self, search_service, api_calls):
+        """캐시된 영상은 videos.list에서 제외된다"""
+        await search_service.get_video_details(["v1"])
+        videos = await search_service.get_video_details(["v2", "v1"])
+
+        assert [v["video_id"] for v in videos] == ["v2", "v1"]
+        assert api_calls["videos"] == 2
+
+        await search_service.get_video_details(["v1", "v2"])
+        assert api_calls["videos"] == 2
+
+    @pytest.mark.asyncio
+    async def test_get_video_details_chunks_by_50(self, search_service, api_calls):
+        """50개 초과 ID는 50개 단위로 나누어 조회한다"""
+        video_ids = [f"vid{i}" for i in range(120)]
+
+        videos = await search_service.get_video_details(video_ids)
+
+        assert len(videos) == 120
+        assert api_calls["videos"] == 3
+
+
+class TestQuotaAccounting:
+    """할당량 원장 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_each_api_call_is_charged(self, search_service, quota_ledger):
+        """API 호출마다 리소스와 사용자 기준으로 원장에 기록된다"""
+        service = search_service.for_user("user-1")
+
+        await service.search_videos("test")
+
+        charged = [c.args[1] for c in quota_ledger.charge.call_args_list]
+        assert charged == ["search", "videos", "channels"]
+        assert quota_ledger.charge.call_args_list[0].kwargs["user_id"] == "user-1"
+        assert search_service.user_id is None
+
+    @pytest.mark.asyncio
+    async def test_user_key_not_charged_to_user_budget(self, search_service, quota_ledger):
+        """사용자 지정 키 호출은 사용자별 한도에 집계하지 않는다"""
+        search_service.user_key = True
+        service = search_service.for_user("user-1")
+
+        await service.search_videos("test")
+
+        assert all(c.kwargs["user_id"] is None for c in quota_ledger.charge.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_budget_exceeded_skips_api_call(self, search_service, quota_ledger, api_calls):
+        """예산 부족 시 API를 호출하지 않고 QuotaBudgetExceededError를 전달한다"""
+        quota_ledger.charge.side_effect = QuotaBudgetExceededError()
+
+        with pytest.raises(QuotaBudgetExceededError):
+            await search_service.search_videos("test")
+
+        assert api_calls["search"] == 0
+
+
+class TestQuotaErrors:
+    """YouTube quotaExceeded 응답 처리 테스트"""
+
+    @pytest.fixture
+    def quota_service(self, fake_cache, quota_ledger):
+        def handler(request: httpx.Request) -> httpx.Response:
+            error = {"code": 403, "errors": [{"reason": "quotaExceeded"}], "message": "quota"}
+            return httpx.Response(403, json={"error": error})
+
+        service = YouTubeSearchService(
+            api_key="test-key", cache=fake_cache, quota_ledger=quota_ledger, refresh_baselines=False
+        )
+        service.http = YouTubeHTTPClient(
+            transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_comments_quota_error_is_not_disabled_comments(self, quota_service):
+        """quotaExceeded 403은 댓글 비활성화(빈 목록)가 아니라 할당량 초과로 전달된다"""
+        with pytest.raises(QuotaExceededError):
+            await quota_service.get_video_comments("v1")
+
+    @pytest.mark.asyncio
+    async def test_details_quota_error_is_quota_exceeded(self, quota_service):
+        """영상/채널 상세 조회의 quotaExceeded는 QuotaExceededError로 전달된다"""
+        with pytest.raises(QuotaExceededError):
+            await quota_service.get_video_details(["v1"])
+        with pytest.raises(QuotaExceededError):
+            await quota_service.get_channel_details("c1")
+
+    @pytest.mark.asyncio
+    async def test_budget_error_propagates_from_channel_details(self, search_service, quota_ledger):
+        """예산 부족은 일반 API 오류로 감싸지 않고 그대로 전달된다 (Retry-After 응답용)"""
+        quota_ledger.charge.side_effect = QuotaBudgetExceededError(retry_after=60)
+
+        with pytest.raises(QuotaBudgetExceededError):
+            await search_service.get_channel_details("c1")
+        with pytest.raises(QuotaBudgetExceededError):
+            await search_service.get_video_comments("v1")
+
+
+@pytest.fixture
+def paged_search_service(api_calls, fake_cache, quota_ledger):
+    """search.list가 페이지당 50개와 nextPageToken을 반환하는 서비스"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        resource = request.url.path.rsplit("/", 1)[-1]
+        api_calls[resource] += 1
+        if resource == "search":
+            page = int(request.url.params.get("pageToken") or 0)
+            items = [{"id": {"videoId": f"p{page}v{i}"}} for i in range(50)]
+            return httpx.Response(
+                200, json={"items": items, "nextPageToken": str(page + 1)}
+            )
+        if resource == "videos":
+            ids = request.url.params["id"].split(",")
+            return httpx.Response(200, json={"items": [video_item(i, "c1") for i in ids]})
+        if resource == "channels":
+            stats = {"subscriberCount": "5000", "viewCount": "100000", "videoCount": "10"}
+            return httpx.Response(200, json={"items": [{"id": "c1", "statistics": stats}]})
+        return httpx.Response(404, json={"error": {"message": "not found"}})
+
+    service = YouTubeSearchService(
+        api_key="test-key", cache=fake_cache, quota_ledger=quota_ledger, refresh_baselines=False
+    )
+    service.http = YouTubeHTTPClient(
+        transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+    )
+    return service
+
+
+class TestDeepSearch:
+    """nextPageToken 딥 검색 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_pages_until_max_results(self, paged_search_service, api_calls):
+        """요청한 결과 수만큼 페이지를 순회한다"""
+        pages = [
+            page async for page in paged_search_service.iter_search_pages("test", max_results=120)
+        ]
+
+        assert [len(page) for page in pages] == [50, 50, 20]
+        assert api_calls["search"] == 3
+        assert api_calls["videos"] == 3
+
+    @pytest.mark.asyncio
+    async def test_stops_at_quota_budget(self, paged_search_service, api_calls):
+        """검색 예산(search.list 1회 = 100 unit)을 넘는 페이지는 요청하지 않는다"""
+        pages = [
+            page
+            async for page in paged_search_service.iter_search_pages(
+                "test", max_results=500, quota_budget=250
+            )
+        ]
+
+        assert sum(len(page) for page in pages) == 100
+        assert api_calls["search"] == 2
+
+
+class TestAdaptiveFill:
+    """필터 결과 적응형 추가 조회 테스트"""
+
+    def test_page_size_follows_pass_rate(self):
+        assert estimate_fill_page_size(20, None) == 50
+        assert estimate_fill_page_size(4, 0.5) == 10
+        assert estimate_fill_page_size(10, 0.5) == 25
+        assert estimate_fill_page_size(20, 0.1) == 50
+
+    @pytest.mark.asyncio
+    async def test_fills_until_target(self, paged_search_service, api_calls):
+        """필터 통과 영상이 target개가 되면 추가 조회를 멈춘다"""
+
+        def even_only(videos):
+            return [v for v in videos if int(v["video_id"].rsplit("v", 1)[-1]) % 2 == 0]
+
+        passed, scanned = await paged_search_service.fill_search_results(
+            "test", target=30, video_filter=even_only, page_token="1", max_pages=5
+        )
+
+        assert len(passed) >= 30
+        assert scanned == 100
+        assert api_calls["search"] == 2
+
+    @pytest.mark.asyncio
+    async def test_respects_max_pages(self, paged_search_service, api_calls):
+        passed, _ = await paged_search_service.fill_search_results(
+            "test", target=30, video_filter=lambda videos: [], page_token="1", max_pages=2
+        )
+
+        assert passed == []
+        assert api_calls["search"] == 2
+
+
+    @pytest.mark.asyncio
+    async def test_reuses_cached_pages(self, paged_search_service, api_calls):
+        """page_cache에 있는 페이지는 search.list를 다시 호출하지 않는다"""
+        pages = {}
+
+        async def page_cache(token, loader):
+            if token not in pages:
+                pages[token] = await loader()
+            return pages[token]
+
+        for _ in range(2):
+            passed, _ = await paged_search_service.fill_search_results(
+                "test",
+                target=30,
+                video_filter=lambda videos: videos[:10],
+                page_token="1",
+                max_pages=3,
+                page_cache=page_cache,
+            )
+            assert len(passed) == 30
+
+        assert api_calls["search"] == 3
+
+
+class TestConditionalRequests:
+    """ETag 재검증 테스트"""
+
+    @pytest.fixture
+    def etag_service(self, api_calls, fake_cache, quota_ledger):
+        def handler(request: httpx.Request) -> httpx.Response:
+            resource = request.url.path.rsplit("/", 1)[-1]
+            api_calls[resource] += 1
+            etag = f'"{resource}-v1"'
+            if request.headers.get("If-None-Match") == etag:
+                api_calls[f"{resource}:304"] += 1
+                return httpx.Response(304, headers={"ETag": etag})
+            if resource == "videos":
+                ids = request.url.params["id"].split(",")
+                items = [video_item(i, "c1") for i in ids]
+            elif resource == "channels":
+                stats = {"subscriberCount": "5000", "viewCount": "100000", "videoCount": "10"}
+                items = [{"id": "c1", "statistics": stats}]
+            else:
+                items = []
+            return httpx.Response(200, json={"items": items}, headers={"ETag": etag})
+
+        service = YouTubeSearchService(
+            api_key="test-key",
+            cache=fake_cache,
+            quota_ledger=quota_ledger,
+            refresh_baselines=False,
+        )
+        service.http = YouTubeHTTPClient(
+            transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_expired_records_are_revalidated(self, etag_service, fake_cache, api_calls):
+        """TTL이 지난 레코드는 If-None-Match로 재검증하고 304면 캐시 레코드를 사용한다"""
+        await etag_service.get_video_details(["v1", "v2"])
+        stored = fake_cache.client.get("youtube:video_record:v1")
+        assert json.loads(stored)["etag"] == '"videos-v1"'
+
+        # 신선 기간 만료 (마커 키 삭제)
+        for key in fake_cache.client.keys("*:fresh:*"):
+            fake_cache.delete(key)
+
+        videos = await etag_service.get_video_details(["v1", "v2"])
+
+        assert [v["video_id"] for v in videos] == ["v1", "v2"]
+        assert api_calls["videos"] == 2
+        assert api_calls["videos:304"] == 1
+        assert api_calls["channels:304"] == 1
+        assert fake_cache.client.get("youtube:video_record:v1") == stored
+        assert fake_cache.exists("youtube:video_record:fresh:v1")
+
+
+class TestChannelUploads:
+    """채널 업로드 재생목록 크롤링 테스트"""
+
+    # 최신순 업로드 120개 (1시간 간격)
+    latest = datetime(2025, 1, 10, tzinfo=timezone.utc)
+
+    @pytest.fixture
+    def uploads_service(self, api_calls, fake_cache, quota_ledger):
+        def handler(request: httpx.Request) -> httpx.Response:
+            resource = request.url.path.rsplit("/", 1)[-1]
+            api_calls[resource] += 1
+            params = request.url.params
+            if resource == "channels" and params["part"] == "contentDetails":
+                item = {"id": "c1", "contentDetails": {"relatedPlaylists": {"uploads": "UUc1"}}}
+                return httpx.Response(200, json={"items": [item]})
+            if resource == "playlistItems":
+                assert params["playlistId"] == "UUc1"
+                start = int(params.get("pageToken") or 0)
+                items = [
+                    {
+                        "contentDetails": {
+                            "videoId": f"u{i}",
+                            "videoPublishedAt": (self.latest - timedelta(hours=i)).strftime(
+                                "%Y-%m-%dT%H:%M:%SZ"
+                            ),
+                        }
+                    }
+                    for i in range(start, min(start + 50, 120))
+                ]
+                body = {"items": items}
+                if start + 50 < 120:
+                    body["nextPageToken"] = str(start + 50)
+                return httpx.Response(200, json=body)
+            if resource == "videos":
+                # u{i}의 조회수는 (i + 1) * 100
+                ids = params["id"].split(",")
+                items = [video_item(i, "c1", views=(int(i[1:]) + 1) * 100) for i in ids]
+                return httpx.Response(200, json={"items": items})
+            if resource == "channels":
+                stats = {"subscriberCount": "5000", "viewCount": "120000", "videoCount": "120"}
+                return httpx.Response(200, json={"items": [{"id": "c1", "statistics": stats}]})
+            return httpx.Response(404, json={"error": {"message": "not found"}})
+
+        service = YouTubeSearchService(
+            api_key="test-key",
+            cache=fake_cache,
+            quota_ledger=quota_ledger,
+            refresh_baselines=False,
+        )
+        service.http = YouTubeHTTPClient(
+            transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+        )
+        return service
+
+    @pytest.mark.asyncio
+    async def test_pages_through_uploads_playlist(self, uploads_service, api_calls):
+        """search.list 없이 업로드 재생목록 전체를 순회한다"""
+        pages = [page async for page in uploads_service.iter_channel_uploads("c1")]
+
+        assert [len(page) for page in pages] == [50, 50, 20]
+        assert pages[0][0]["video_id"] == "u0"
+        assert api_calls["playlistItems"] == 3
+        assert api_calls["search"] == 0
+
+    @pytest.mark.asyncio
+    async def test_stops_at_previous_crawl(self, uploads_service, api_calls):
+        """이전 크롤링 시점 이전 영상에 도달하면 다음 페이지를 요청하지 않는다"""
+        await uploads_service.get_uploads_playlist_id("c1")
+        uploads_service.save_crawl_cursor("c1", "user-1", "2025-01-08T00:00:00Z")
+
+        cursor = uploads_service.get_crawl_cursor("c1", "user-1")
+        pages = [
+            page
+            async for page in uploads_service.iter_channel_uploads("c1", published_after=cursor)
+        ]
+
+        assert [v["video_id"] for page in pages for v in page] == [f"u{i}" for i in range(48)]
+        assert api_calls["playlistItems"] == 1
+        # 업로드 재생목록 ID는 캐시에서 재사용
+        assert api_calls["channels"] == 2
+
+    def test_crawl_cursor_is_per_user(self, uploads_service):
+        """재개 시점은 사용자별로 저장된다"""
+        uploads_service.save_crawl_cursor("c1", "user-1", "2025-01-08T00:00:00Z")
+
+        assert uploads_service.get_crawl_cursor("c1", "user-1") is not None
+        assert uploads_service.get_crawl_cursor("c1", "user-2") is None
+
+    @pytest.mark.asyncio
+    async def test_performance_ratio_uses_recent_baseline(self, uploads_service, api_calls):
+        """성과도 배율은 최근 업로드 30개 조회수 중앙값을 기준으로 한다"""
+        baseline = await uploads_service.compute_channel_baseline("c1", sample_size=30)
+
+        assert baseline["median_views"] == 1550
+        assert baseline["sample_size"] == 30
+        assert api_calls["playlistItems"] == 1
+
+        videos = await uploads_service.get_video_details(["u0"])
+
+        assert videos[0]["performance_ratio"] == pytest.approx(100 / 1550)
+
+    @pytest.mark.asyncio
+    async def test_missing_baseline_refreshed_in_background(self, uploads_service, fake_cache):
+        """기준선이 없으면 누적 평균으로 응답하고 기준선은 백그라운드에서 계산한다"""
+        uploads_service.refresh_baselines = True
+
+        videos = await uploads_service.get_video_details(["u0"])
+        # 기준선 없음: 채널 누적 평균 조회수(120000 / 120) 사용
+        assert videos[0]["performance_ratio"] == pytest.approx(100 / 1000)
+
+        for _ in range(100):
+            if uploads_service.baseline_store.get_many(["c1"]):
+                break
+            await asyncio.sleep(0.01)
+
+        videos = await uploads_service.get_video_details(["u0"])
+        assert videos[0]["performance_ratio"] == pytest.approx(100 / 1550)
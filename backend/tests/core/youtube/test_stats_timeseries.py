@@ -0,0 +1,136 @@
+"""
+영상 통계 시계열 단위 테스트
+
+테스트 범위:
+- 스냅샷 추가/보관 개수 제한 (RPUSH + LTRIM)
+- 조회수 증가 속도/가속도 계산
+- 감시 대상 전체 스냅샷 수집 (videos.list 50개당 1회)
+- 사용자별 감시 (다른 사용자의 감시는 해제하지 않음)
+- 할당량 부족 시 배치 중 성공한 청크는 저장
+"""
+
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from unittest.mock import MagicMock
+
+from src.core.youtube.http_client import YouTubeHTTPClient
+from src.core.youtube.search_service import YouTubeSearchService
+from src.core.youtube.stats_timeseries import (
+    VideoStatsTimeSeries,
+    compute_velocity,
+    run_stats_snapshot,
+)
+
+
+@pytest.fixture
+def timeseries(fake_cache):
+    return VideoStatsTimeSeries(cache=fake_cache, retention=3, interval=3600)
+
+
+def test_append_keeps_latest_snapshots(timeseries):
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for hour in range(5):
+        timeseries.append(
+            {"v1": {"view_count": 100 * hour, "like_count": hour, "comment_count": 0}},
+            sampled_at=start + timedelta(hours=hour),
+        )
+
+    points = timeseries.get_series(["v1", "v2"])
+
+    assert [p["view_count"] for p in points["v1"]] == [200, 300, 400]
+    assert points["v2"] == []
+
+
+def test_compute_velocity():
+    points = [
+        {"timestamp": 0, "view_count": 0},
+        {"timestamp": 3600, "view_count": 100},
+        {"timestamp": 7200, "view_count": 300},
+    ]
+
+    result = compute_velocity(points)
+
+    assert result["view_velocity"] == 200
+    assert result["view_acceleration"] == 100
+    assert compute_velocity(points[:1]) == {"view_velocity": None, "view_acceleration": None}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_batches_videos_list_calls(timeseries):
+    api_calls = Counter()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        api_calls[request.url.params["part"]] += 1
+        ids = request.url.params["id"].split(",")
+        items = [
+            {"id": i, "statistics": {"viewCount": "10", "likeCount": "1", "commentCount": "0"}}
+            for i in ids
+            if i != "gone"
+        ]
+        return httpx.Response(200, json={"items": items})
+
+    ledger = MagicMock()
+    ledger.charge.return_value = 1
+    service = YouTubeSearchService(
+        api_key="test-key", cache=MagicMock(), quota_ledger=ledger, refresh_baselines=False
+    )
+    service.http = YouTubeHTTPClient(
+        transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+    )
+    timeseries.watch("user-1", [f"v{i:03d}" for i in range(120)] + ["gone"])
+
+    result = await run_stats_snapshot(service, timeseries, batch_size=100)
+
+    assert result == {"requested": 121, "stored": 120, "missing": 1, "quota_exhausted": False}
+    # 배치 100개 + 21개 → videos.list 2회 + 1회
+    assert api_calls["statistics"] == 3
+    assert timeseries.get_series(["v000"])["v000"][0]["view_count"] == 10
+
+
+def test_unwatch_keeps_videos_watched_by_other_users(timeseries):
+    timeseries.watch("user-1", ["v1", "v2"])
+    timeseries.watch("user-2", ["v2", "v3"])
+
+    # 감시하지 않은 영상 해제는 다른 사용자에게 영향 없음
+    assert timeseries.unwatch("user-1", ["v3"]) == 0
+    assert timeseries.unwatch("user-1", ["v1", "v2"]) == 2
+
+    assert sorted(v for batch in timeseries.iter_watched() for v in batch) == ["v2", "v3"]
+    assert timeseries.watched_count("user-1") == 0
+    assert timeseries.watched_count("user-2") == 2
+
+    timeseries.unwatch("user-2", ["v2"])
+    assert sorted(v for batch in timeseries.iter_watched() for v in batch) == ["v3"]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_keeps_chunks_fetched_before_quota_exhausted(timeseries):
+    def handler(request: httpx.Request) -> httpx.Response:
+        ids = request.url.params["id"].split(",")
+        if "v050" in ids:
+            error = {"code": 403, "errors": [{"reason": "quotaExceeded"}], "message": "quota"}
+            return httpx.Response(403, json={"error": error})
+        items = [
+            {"id": i, "statistics": {"viewCount": "10", "likeCount": "1", "commentCount": "0"}}
+            for i in ids
+        ]
+        return httpx.Response(200, json={"items": items})
+
+    ledger = MagicMock()
+    ledger.charge.return_value = 1
+    service = YouTubeSearchService(
+        api_key="test-key", cache=MagicMock(), quota_ledger=ledger, refresh_baselines=False
+    )
+    service.http = YouTubeHTTPClient(
+        transport=httpx.MockTransport(handler), max_retries=0, backoff_factor=0
+    )
+    timeseries.watch("user-1", [f"v{i:03d}" for i in range(100)])
+
+    result = await run_stats_snapshot(service, timeseries, batch_size=100)
+
+    assert result == {"requested": 50, "stored": 50, "missing": 0, "quota_exhausted": True}
+    assert timeseries.get_series(["v000"])["v000"][0]["view_count"] == 10
+    assert timeseries.get_series(["v050"])["v050"] == []
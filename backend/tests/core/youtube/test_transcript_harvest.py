@@ -0,0 +1,195 @@
+"""
+자막 일괄 수집 단위 테스트
+
+테스트 범위:
+- 영상별 결과 상태 (수집, 이미 저장됨, 자막 비활성화, 언어 없음, ID 해석 실패)
+- 동시 조회 수 제한과 호스트별 요청 간격
+- 요청 차단 시 호스트 대기 후 재시도, 재시작 시 처리된 영상 건너뛰기 (차단된 영상은 다시 조회)
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.youtube.exceptions import (
+    TranscriptRequestBlockedError,
+    TranscriptUnavailableError,
+)
+from src.core.youtube.transcript_harvest import (
+    STATUS_COMPLETED,
+    HostPacer,
+    TranscriptHarvestStore,
+    run_transcript_harvest,
+)
+from src.core.youtube.transcript_negative_cache import TranscriptNegativeCache
+from src.core.youtube.transcript_service import TranscriptService
+
+
+class FakeTranscriptStore:
+    def __init__(self, records=None):
+        self.records = dict(records or {})
+
+    async def find(self, video_id, languages):
+        return self.records.get(video_id)
+
+    async def save(self, record):
+        self.records[record["video_id"]] = record
+
+
+class FakeFetcher:
+    """TranscriptService.fetch_transcript 대체 (호출 시각과 동시 실행 수 기록)"""
+
+    def __init__(self, errors=None, delay=0.01):
+        self.errors = errors or {}
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, video_id, languages=None, negative_cache=None):
+        self.calls.append((video_id, time.monotonic()))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if video_id in self.errors:
+                raise self.errors[video_id]
+            return {
+                "video_id": video_id,
+                "language_code": languages[0],
+                "language": languages[0],
+                "is_generated": False,
+                "segments": [{"text": "hi", "start": 0.0, "duration": 1.0}],
+                "full_text": "hi",
+                "available_languages": languages,
+            }
+        finally:
+            self.in_flight -= 1
+
+
+@pytest.fixture
+def fetcher(monkeypatch):
+    fake = FakeFetcher()
+    monkeypatch.setattr(TranscriptService, "fetch_transcript", staticmethod(fake))
+    return fake
+
+
+@pytest.fixture
+def store(fake_cache):
+    return TranscriptHarvestStore(cache=fake_cache, ttl=60)
+
+
+@pytest.fixture
+def negative_cache(fake_cache):
+    return TranscriptNegativeCache(fake_cache)
+
+
+@pytest.mark.asyncio
+async def test_harvest_records_status_per_video(store, fetcher, negative_cache):
+    fetcher.errors = {
+        "disabled1": TranscriptUnavailableError("off", "disabled1", "disabled"),
+        "nolang1": TranscriptUnavailableError("none", "nolang1", "not_found"),
+    }
+    negative_cache.record(TranscriptUnavailableError("gone", "gone1", "video_unavailable"))
+    videos = [f"vid{i}" for i in range(8)] + ["disabled1", "nolang1", "stored1", "gone1"]
+    transcripts = FakeTranscriptStore({"stored1": {"language_code": "en"}})
+    record = store.create("user-1", videos, ["en"], invalid=["not a url"])
+
+    summary = await run_transcript_harvest(
+        record["id"], store, transcripts, workers=3, pacer=HostPacer(0),
+        negative_cache=negative_cache,
+    )
+
+    assert summary == {
+        "fetched": 8,
+        "disabled": 1,
+        "not_found": 1,
+        "stored": 1,
+        "video_unavailable": 1,
+        "invalid_id": 1,
+    }
+    assert fetcher.max_in_flight == 3
+    # 저장된 자막과 자막 없음 캐시 적중은 YouTube 미호출
+    called = [video_id for video_id, _ in fetcher.calls]
+    assert "stored1" not in called and "gone1" not in called
+    assert set(transcripts.records) == {f"vid{i}" for i in range(8)} | {"stored1"}
+
+    results = store.results(record["id"])
+    assert results["vid0"] == {"status": "fetched", "language_code": "en", "segments": 1}
+    assert results["not a url"] == {"status": "invalid_id"}
+    assert store.get(record["id"])["status"] == STATUS_COMPLETED
+
+
+@pytest.mark.asyncio
+async def test_host_pacing_and_blocked_backoff(store, fetcher, negative_cache):
+    fetcher.delay = 0
+    fetcher.errors = {"b": TranscriptRequestBlockedError()}
+    record = store.create("user-1", ["a", "b", "c"], ["en"])
+
+    summary = await run_transcript_harvest(
+        record["id"], store, FakeTranscriptStore(), workers=3,
+        pacer=HostPacer(0.05), blocked_backoff=0.2, negative_cache=negative_cache,
+        blocked_retries=0,
+    )
+
+    starts = [started for _, started in fetcher.calls]
+    assert summary == {"fetched": 2, "blocked": 1}
+    # 동시 워커 3개여도 요청 시작은 최소 간격 이상 떨어짐
+    assert starts[1] - starts[0] >= 0.045
+    # 차단 응답 후 다음 요청은 대기 시간 이후
+    assert starts[2] - starts[1] >= 0.19
+
+
+@pytest.mark.asyncio
+async def test_restarted_harvest_skips_processed_videos(store, fetcher, negative_cache):
+    record = store.create("user-1", ["a", "b", "c"], ["en"])
+    store.record_result(record["id"], "a", {"status": "fetched", "language_code": "en"})
+
+    await run_transcript_harvest(
+        record["id"], store, FakeTranscriptStore(), workers=2, pacer=HostPacer(0),
+        negative_cache=negative_cache,
+    )
+
+    assert sorted(video_id for video_id, _ in fetcher.calls) == ["b", "c"]
+    assert len(store.results(record["id"])) == 3
+
+
+@pytest.mark.asyncio
+async def test_blocked_video_retried_after_backoff(store, fetcher, negative_cache, monkeypatch):
+    fetcher.delay = 0
+    record = store.create("user-1", ["a", "b"], ["en"])
+    blocked = {"b": 1}
+    original = fetcher.__call__
+
+    async def flaky(video_id, languages=None, negative_cache=None):
+        if blocked.get(video_id):
+            blocked[video_id] -= 1
+            fetcher.calls.append((video_id, time.monotonic()))
+            raise TranscriptRequestBlockedError()
+        return await original(video_id, languages, negative_cache)
+
+    monkeypatch.setattr(TranscriptService, "fetch_transcript", staticmethod(flaky))
+    summary = await run_transcript_harvest(
+        record["id"], store, FakeTranscriptStore(), workers=2,
+        pacer=HostPacer(0), blocked_backoff=0.05, negative_cache=negative_cache,
+        blocked_retries=1,
+    )
+
+    assert summary == {"fetched": 2}
+    assert [video_id for video_id, _ in fetcher.calls].count("b") == 2
+
+
+@pytest.mark.asyncio
+async def test_restarted_harvest_retries_blocked_videos(store, fetcher, negative_cache):
+    record = store.create("user-1", ["a", "b"], ["en"])
+    store.record_result(record["id"], "a", {"status": "fetched", "language_code": "en"})
+    store.record_result(record["id"], "b", {"status": "blocked", "error": "blocked"})
+
+    summary = await run_transcript_harvest(
+        record["id"], store, FakeTranscriptStore(), workers=2, pacer=HostPacer(0),
+        negative_cache=negative_cache,
+    )
+
+    assert [video_id for video_id, _ in fetcher.calls] == ["b"]
+    assert summary == {"fetched": 2}
@@ -0,0 +1,214 @@
+"""
+자막 전문 검색 단위 테스트
+
+테스트 범위:
+- 검색 토큰: 영문 단어, 한글 2글자 n-gram과 마지막 글자
+- 1글자 검색어 접두어 일치
+- Postgres 검색 조건: GIN 인덱스 식(to_tsvector)과 tsquery
+- 자막 저장 시 세그먼트 색인 교체
+- 검색 결과 keyset 페이지네이션, 스니펫, 필터
+- 색인 없는 기존 자막 백필
+"""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.core.youtube.transcript_search import (
+    TranscriptSearchIndex,
+    build_tsquery,
+    decode_cursor,
+    encode_cursor,
+    make_snippet,
+    query_words,
+    search_tokens,
+)
+from src.core.youtube.transcript_store import TranscriptStore
+from src.models.youtube_transcript import YouTubeTranscript, YouTubeTranscriptSegment
+
+
+def _record(video_id, texts, language_code="ko"):
+    segments = [
+        {"text": text, "start": float(i * 2), "duration": 2.0} for i, text in enumerate(texts)
+    ]
+    return {
+        "video_id": video_id,
+        "language_code": language_code,
+        "language": language_code,
+        "is_generated": True,
+        "segments": segments,
+        "full_text": "\n".join(texts),
+        "available_languages": [language_code],
+    }
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'search.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(YouTubeTranscript.__table__.create)
+        await conn.run_sync(YouTubeTranscriptSegment.__table__.create)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.fixture
+def store(session_factory):
+    return TranscriptStore(session_factory)
+
+
+@pytest.fixture
+def index(session_factory):
+    return TranscriptSearchIndex(session_factory)
+
+
+def test_search_tokens_bigrams_korean_and_keeps_ascii_words():
+    assert search_tokens("오늘은 GPT-4o 리뷰!") == "오늘 늘은 은 gpt 4o 리뷰 뷰"
+    assert search_tokens("[음악] 네") == "음악 악 네"
+
+
+def _tsquery_prefix_matches(query: str, text: str) -> bool:
+    """접두어 tsquery(x:*) 1개가 텍스트 토큰과 일치하는지 (to_tsvector('simple') 토큰 기준)"""
+    assert query.endswith(":*")
+    return any(token.startswith(query[:-2]) for token in search_tokens(text).split())
+
+
+@pytest.mark.parametrize(
+    "text, matches",
+    [
+        ("자막을 켜세요", True),  # 단어 첫 글자
+        ("남자 친구", True),  # 단어 마지막 글자
+        ("여자가", True),  # 단어 가운데 글자
+        ("자", True),  # 1글자 단어
+        ("전혀 관계없는 내용", False),
+    ],
+)
+def test_single_syllable_query_matches_any_position(text, matches):
+    query = build_tsquery(query_words("자"))
+    assert query == "자:*"
+    assert _tsquery_prefix_matches(query, text) is matches
+
+
+def test_build_tsquery_matches_korean_word_inside_longer_words():
+    words = query_words("자막생성 AI ai")
+    assert words == ["자막생성", "ai"]
+    assert build_tsquery(words) == "(자막 <-> 막생 <-> 생성) & ai:*"
+    # 검색어 n-gram은 색인 토큰에서 연속 위치
+    assert "자막 막생 생성" in search_tokens("자막생성기로 만든 영상")
+
+
+def test_postgres_match_uses_gin_index_expression():
+    index = TranscriptSearchIndex(session_factory=lambda: None)
+    sql = str(
+        select(YouTubeTranscriptSegment.video_id)
+        .where(index._match("postgresql", ["자막"]))
+        .compile(dialect=postgresql.dialect())
+    )
+    # 인덱스 식 to_tsvector('simple', search_terms)와 같아야 GIN 인덱스 사용
+    assert "to_tsvector('simple', youtube_transcript_segments.search_terms) @@ to_tsquery('simple'," in sql
+
+
+def test_cursor_round_trip_and_invalid_cursor():
+    assert decode_cursor(encode_cursor("abc", "ko", 12)) == ("abc", "ko", 12)
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_make_snippet_centers_on_first_match():
+    text = "가" * 200 + " 키워드 " + "나" * 200
+    snippet = make_snippet(text, ["키워드"], length=60)
+    assert "키워드" in snippet
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert make_snippet("짧은 문장", ["문장"]) == "짧은 문장"
+
+
+async def test_save_replaces_segment_index(store, session_factory):
+    await store.save(_record("vid1", ["첫 번째 자막", "두 번째 자막"]))
+    await store.save(_record("vid1", ["다시 받은 자막"]))
+
+    async with session_factory() as session:
+        rows = (
+            await session.execute(
+                select(YouTubeTranscriptSegment).order_by(YouTubeTranscriptSegment.seq)
+            )
+        ).scalars().all()
+    assert [(row.seq, row.text, row.search_terms) for row in rows] == [
+        (0, "다시 받은 자막", "다시 시 받은 은 자막 막"),
+    ]
+
+
+async def test_search_matches_korean_with_particles(store, index):
+    await store.save(_record("vid1", ["오늘은 유튜브 자막을 요약합니다", "다음 주제"]))
+    await store.save(_record("vid2", ["자막이 없는 영상도 있어요"]))
+    await store.save(_record("vid3", ["전혀 관계없는 내용"]))
+
+    page = await index.search("자막")
+
+    assert [(hit["video_id"], hit["start"]) for hit in page["results"]] == [
+        ("vid1", 0.0),
+        ("vid2", 0.0),
+    ]
+    assert page["results"][0]["snippet"] == "오늘은 유튜브 자막을 요약합니다"
+    assert page["next_cursor"] is None
+
+
+async def test_search_requires_all_words(store, index):
+    await store.save(_record("vid1", ["OpenAI 모델 리뷰", "모델 비교"], language_code="ko"))
+
+    page = await index.search("openai 모델")
+
+    assert [hit["start"] for hit in page["results"]] == [0.0]
+
+
+async def test_search_keyset_pagination(store, index):
+    await store.save(_record("vid1", [f"반복 문장 {i}" for i in range(5)]))
+    await store.save(_record("vid2", [f"반복 문장 {i}" for i in range(3)]))
+
+    seen = []
+    cursor = None
+    while True:
+        page = await index.search("반복", limit=3, cursor=cursor)
+        seen.extend((hit["video_id"], hit["seq"]) for hit in page["results"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert seen == [("vid1", i) for i in range(5)] + [("vid2", i) for i in range(3)]
+
+
+async def test_search_filters_language_and_video(store, index):
+    await store.save(_record("vid1", ["hello transcript"], language_code="en"))
+    await store.save(_record("vid2", ["hello again"], language_code="en"))
+    await store.save(_record("vid3", ["hello 안녕"], language_code="ko"))
+
+    assert [hit["video_id"] for hit in (await index.search("hello", language_code="en"))["results"]] == [
+        "vid1",
+        "vid2",
+    ]
+    assert [hit["video_id"] for hit in (await index.search("hello", video_id="vid3"))["results"]] == [
+        "vid3"
+    ]
+    assert (await index.search("!!"))["results"] == []
+
+
+async def test_backfill_indexes_transcripts_without_segments(store, index, session_factory):
+    await store.save(_record("indexed", ["이미 색인된 자막"]))
+    async with session_factory() as session:
+        # 텍스트 없는 자막이 기본 키 순서로 앞에 있어도 백필은 계속 진행
+        session.add(YouTubeTranscript(**_record("empty", [""])))
+        for video_id in ("old1", "old2"):
+            session.add(YouTubeTranscript(**_record(video_id, ["색인 이전에 저장된 자막"])))
+        await session.commit()
+
+    assert await index.backfill(batch_size=1) == 2
+    assert await index.backfill() == 0
+
+    async with session_factory() as session:
+        count = await session.scalar(select(func.count()).select_from(YouTubeTranscriptSegment))
+    assert count == 3
+    assert {hit["video_id"] for hit in (await index.search("색인"))["results"]} == {
+        "indexed",
+        "old1",
+        "old2",
+    }
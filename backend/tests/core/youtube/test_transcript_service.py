@@ -0,0 +1,176 @@
+"""
+자막 서비스 단위 테스트
+
+테스트 범위:
+- 자막은 요청당 한 번만 조회하고 DB에 저장
+- 재요청은 저장된 자막으로 응답 (YouTube 호출 없음)
+- 선호 언어 선택은 저장 시 기록한 제공 언어 목록 기준
+- 자막 없음 캐시: 사유별 TTL, 캐시된 영상은 YouTube 미호출
+"""
+
+import threading
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from youtube_transcript_api._errors import (
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    VideoUnavailable,
+)
+
+from src.core.youtube.exceptions import TranscriptUnavailableError
+from src.core.youtube.transcript_negative_cache import TranscriptNegativeCache
+from src.core.youtube.transcript_service import TranscriptService
+from src.core.youtube.transcript_store import TranscriptStore, select_language
+from src.models.youtube_transcript import YouTubeTranscript, YouTubeTranscriptSegment
+
+
+@pytest.fixture
+def negative_cache(fake_cache):
+    return TranscriptNegativeCache(
+        fake_cache, ttls={"disabled": 600, "not_found": 60, "video_unavailable": 30}
+    )
+
+
+@pytest.fixture
+async def store(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'transcripts.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(YouTubeTranscript.__table__.create)
+        await conn.run_sync(YouTubeTranscriptSegment.__table__.create)
+    yield TranscriptStore(async_sessionmaker(engine, expire_on_commit=False))
+    await engine.dispose()
+
+
+@pytest.fixture
+def fetch_calls(monkeypatch):
+    calls = []
+
+    def fake_fetch(video_id, languages):
+        calls.append((video_id, list(languages), threading.current_thread()))
+        if video_id == "disabled":
+            raise TranscriptsDisabled(video_id)
+        if "en" not in languages and "ja" not in languages:
+            raise NoTranscriptFound(video_id, languages, None)
+        code = next(code for code in languages if code in ("en", "ja"))
+        segments = [
+            {"text": "hello", "start": 0.0, "duration": 1.5},
+            {"text": "world", "start": 1.5, "duration": 2.0},
+        ]
+        return {
+            "video_id": video_id,
+            "language_code": code,
+            "language": code,
+            "is_generated": False,
+            "segments": segments,
+            "full_text": "hello\nworld",
+            "available_languages": ["en", "ja"],
+        }
+
+    monkeypatch.setattr(TranscriptService, "_fetch_transcript_sync", staticmethod(fake_fetch))
+    return calls
+
+
+def test_select_language():
+    assert select_language(["ko", "en"], ["en", "ja"]) == "en"
+    assert select_language(["ko"], ["en"]) is None
+
+
+@pytest.mark.asyncio
+async def test_store_find_returns_only_chosen_language(store):
+    record = {
+        "video_id": "v1",
+        "language_code": "en",
+        "language": "English",
+        "is_generated": False,
+        "segments": [{"text": "hello", "start": 0.0, "duration": 1.5}],
+        "full_text": "hello",
+        "available_languages": ["ja", "en"],
+    }
+    await store.save(record)
+
+    assert (await store.find("v1", ["ko", "en"]))["segments"] == record["segments"]
+    # YouTube가 고를 일본어 자막이 저장되어 있지 않으면 영어로 대체하지 않음
+    assert await store.find("v1", ["ja", "en"]) is None
+    assert await store.find("v2", ["en"]) is None
+
+
+@pytest.mark.asyncio
+async def test_transcript_fetched_once_and_stored(store, fetch_calls, negative_cache):
+    first = await TranscriptService.get_transcript(
+        "v1", ["ko", "en"], store=store, negative_cache=negative_cache
+    )
+    text = await TranscriptService.get_transcript_text(
+        "v1", ["ko", "en"], store=store, negative_cache=negative_cache
+    )
+
+    assert len(fetch_calls) == 1
+    # 동기 라이브러리 호출은 이벤트 루프 스레드 밖에서 실행
+    assert fetch_calls[0][2] is not threading.main_thread()
+    assert first["language_code"] == "en"
+    assert first["segments"][1]["start"] == 1.5
+    assert text == "hello\nworld"
+
+
+@pytest.mark.asyncio
+async def test_other_language_fetched_separately(store, fetch_calls, negative_cache):
+    await TranscriptService.get_transcript("v1", ["en"], store, negative_cache)
+    japanese = await TranscriptService.get_transcript("v1", ["ja"], store, negative_cache)
+    # 제공 언어 목록에 없는 선호 언어는 건너뛰고 저장된 영어 자막 사용
+    english = await TranscriptService.get_transcript("v1", ["ko", "en"], store, negative_cache)
+
+    assert [call[1] for call in fetch_calls] == [["en"], ["ja"]]
+    assert japanese["language_code"] == "ja"
+    assert english["language_code"] == "en"
+    assert {r["language_code"] for r in await store.get_for_video("v1")} == {"en", "ja"}
+
+
+@pytest.mark.asyncio
+async def test_disabled_transcript_cached_for_all_languages(store, fetch_calls, negative_cache):
+    for languages in (["ko"], ["ko"], ["en"]):
+        with pytest.raises(TranscriptUnavailableError) as exc_info:
+            await TranscriptService.get_transcript("disabled", languages, store, negative_cache)
+        assert exc_info.value.reason == "disabled"
+
+    assert len(fetch_calls) == 1
+    assert negative_cache.cache.client.keys("youtube:transcript:unavailable:*") == [
+        "youtube:transcript:unavailable:disabled"
+    ]
+    assert negative_cache.cache.client.ttl("youtube:transcript:unavailable:disabled") == 600
+
+
+@pytest.mark.asyncio
+async def test_not_found_cached_per_language_list(store, fetch_calls, negative_cache):
+    for _ in range(2):
+        with pytest.raises(TranscriptUnavailableError) as exc_info:
+            await TranscriptService.get_transcript("v2", ["ko"], store, negative_cache)
+        assert exc_info.value.reason == "not_found"
+    english = await TranscriptService.get_transcript("v2", ["ko", "en"], store, negative_cache)
+
+    assert [call[1] for call in fetch_calls] == [["ko"], ["ko", "en"]]
+    assert english["language_code"] == "en"
+    assert negative_cache.cache.client.keys("youtube:transcript:unavailable:*") == [
+        "youtube:transcript:unavailable:v2:ko"
+    ]
+    assert negative_cache.cache.client.ttl("youtube:transcript:unavailable:v2:ko") == 60
+
+
+@pytest.mark.asyncio
+async def test_available_transcripts_short_circuit(monkeypatch, negative_cache):
+    calls = []
+
+    def fake_list(video_id):
+        calls.append(video_id)
+        if video_id == "gone":
+            raise VideoUnavailable(video_id)
+        raise TranscriptsDisabled(video_id)
+
+    monkeypatch.setattr(TranscriptService, "_list_transcripts_sync", staticmethod(fake_list))
+
+    for _ in range(2):
+        assert await TranscriptService.get_available_transcripts("off", negative_cache) == []
+        with pytest.raises(TranscriptUnavailableError) as exc_info:
+            await TranscriptService.get_available_transcripts("gone", negative_cache)
+        assert exc_info.value.reason == "video_unavailable"
+
+    assert calls == ["off", "gone"]
@@ -0,0 +1,26 @@
+"""
+YouTube 유틸리티 단위 테스트
+
+테스트 범위:
+- 영상 ID/URL 해석 (일괄 조회 입력)
+"""
+
+import pytest
+
+from src.core.youtube.utils import resolve_video_id
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        (" dQw4w9WgXcQ ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=10", "dQw4w9WgXcQ"),
+        ("https://youtu.be/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://www.youtube.com/shorts/dQw4w9WgXcQ", "dQw4w9WgXcQ"),
+        ("https://example.com/video", None),
+        ("", None),
+    ],
+)
+def test_resolve_video_id(value, expected):
+    assert resolve_video_id(value) == expected
@@ -0,0 +1,84 @@
+"""
+영상 레코드 단위 테스트
+
+테스트 범위:
+- videos.list 응답 파싱
+- 캐시 저장/복원 (기본 필드만, 요청별 지표 제외)
+- camelCase 응답 직렬화가 Pydantic 스키마 직렬화와 일치
+"""
+
+from src.api.v1.schemas.youtube import (
+    BatchSearchResult,
+    VideoBatchItem,
+    VideoDetail,
+    YouTubeSearchResult,
+)
+from src.core.youtube.video_record import DETAIL_FIELDS, VideoRecord
+
+API_ITEM = {
+    "id": "v1",
+    "snippet": {
+        "title": "제목",
+        "description": "설명",
+        "channelId": "c1",
+        "channelTitle": "채널",
+        "publishedAt": "2025-01-01T00:00:00Z",
+        "thumbnails": {"high": {"url": "https://i.ytimg.com/high.jpg"}},
+        "categoryId": "22",
+    },
+    "contentDetails": {"duration": "PT1M5S"},
+    "statistics": {"viewCount": "1000", "likeCount": "10"},
+}
+
+
+def test_parse_api_item():
+    record = VideoRecord.from_api_item(API_ITEM)
+
+    assert record.video_id == "v1"
+    assert record.duration == 65
+    assert record.thumbnail_url == "https://i.ytimg.com/high.jpg"
+    assert (record.view_count, record.like_count, record.comment_count) == (1000, 10, 0)
+    assert record.tags == []
+    assert record["channel_id"] == "c1"
+    assert record.get("rank_score") is None
+
+
+def test_cache_round_trip_excludes_metrics():
+    record = VideoRecord.from_api_item(API_ITEM)
+    record.performance_ratio = 2.0
+
+    cached = {**record.to_cache(), "etag": "abc"}
+    restored = VideoRecord.from_cache(cached)
+
+    assert "performance_ratio" not in cached
+    assert restored.performance_ratio is None
+    assert restored.etag == "abc"
+    assert restored.to_cache() == record.to_cache()
+
+
+def test_response_matches_schema_serialization():
+    record = VideoRecord.from_api_item(API_ITEM)
+    record.subscriber_count = 5000
+    record.performance_ratio = 1.5
+
+    assert record.to_response() == YouTubeSearchResult(**record).model_dump(
+        by_alias=True, mode="json"
+    )
+    assert record.to_response(DETAIL_FIELDS) == VideoDetail(**record).model_dump(
+        by_alias=True, mode="json"
+    )
+    # 영상 일괄 조회 항목 (라우터가 직접 조립하는 dict와 같은 키)
+    assert VideoBatchItem(
+        input="v1", video_id="v1", video=VideoDetail(**record)
+    ).model_dump(by_alias=True, mode="json") == {
+        "input": "v1",
+        "videoId": "v1",
+        "video": record.to_response(DETAIL_FIELDS),
+        "error": None,
+    }
+
+    # 정의되지 않은 키(배치 검색 순위 정보)는 extras로 직렬화
+    record.update({"rank_score": 0.03, "matched_queries": ["a"], "matched_regions": []})
+    assert record.to_response() == BatchSearchResult(**record).model_dump(
+        by_alias=True, mode="json"
+    )